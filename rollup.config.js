@@ -36,4 +36,28 @@ export default [
       }),
     ],
   },
+  // ES module build of the lazy entry point (for browsers): the shape modules are split
+  // into chunks that are loaded with the views that use them
+  {
+    input: 'src/lazy.ts',
+    output: {
+      dir: 'dist/browser',
+      format: 'es',
+      sourcemap: true,
+      entryFileNames: 'archimate-renderer-lazy.js',
+      chunkFileNames: 'shapes/[name]-[hash].js',
+      plugins: [terser()],
+    },
+    plugins: [
+      resolve(),
+      commonjs(),
+      typescript({
+        tsconfig: './tsconfig.json',
+        // The compiler output has to be inside the output directory of code-split builds
+        outDir: 'dist/browser',
+        declaration: false,
+        declarationMap: false,
+      }),
+    ],
+  },
 ];
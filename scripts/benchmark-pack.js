@@ -0,0 +1,116 @@
+/**
+ * Benchmark opening binary shape packs against parsing the same shapes as JSON.
+ *
+ * Usage:
+ *   python src/utils/svg-shapes/benchmark.py pack --keep-dir packs
+ *   node scripts/benchmark-pack.js [--repeat <n>] [--packs <dir>] [distDir]
+ *
+ * This is the JavaScript side of `benchmark.py pack`, whose --keep-dir writes the
+ * all-shapes-<size>.json files and packs of every library size. For every size the time
+ * to the first shape lookup is measured from the file contents in memory: parsing the
+ * JSON and indexing the shapes by name, as registerShapes() does with shape-data.ts,
+ * against opening the pack with ShapePack and decoding the one shape. Decoding every
+ * shape of the pack is timed as well. The decoded shapes are compared with the JSON
+ * first, so the times are known to be for the same shapes.
+ */
+
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+
+function parseArgs(argv) {
+  const args = {
+    packs: path.join(__dirname, '../packs'),
+    repeat: 20,
+    build: path.join(__dirname, '../dist/cjs'),
+  };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--packs') {
+      args.packs = argv[++i];
+    } else if (argv[i] === '--repeat') {
+      args.repeat = parseInt(argv[++i], 10);
+    } else {
+      args.build = argv[i];
+    }
+  }
+  return args;
+}
+
+function bestOf(repeat, func) {
+  let best = Infinity;
+  for (let i = 0; i < repeat; i++) {
+    const start = process.hrtime.bigint();
+    func();
+    best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  return best;
+}
+
+// The library sizes of the packs in a directory, smallest first
+function packSizes(dir) {
+  return fs
+    .readdirSync(dir)
+    .map((name) => /^all-shapes-(\d+)\.pack$/.exec(name))
+    .filter((match) => match && fs.existsSync(path.join(dir, `all-shapes-${match[1]}.json`)))
+    .map((match) => parseInt(match[1], 10))
+    .sort((a, b) => a - b);
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const { ShapePack } = require(path.resolve(args.build, 'utils/shape-pack.js'));
+  const sizes = fs.existsSync(args.packs) ? packSizes(args.packs) : [];
+  if (sizes.length === 0) {
+    console.error(`No packs in ${args.packs}; write them with benchmark.py pack --keep-dir`);
+    process.exit(1);
+  }
+
+  console.log(`Time to the first shape lookup and to decode all shapes (best of ${args.repeat})`);
+  console.log(
+    ['Shapes', 'JSON bytes', 'Pack bytes', 'JSON load', 'Pack lookup', 'Pack all']
+      .map((title) => title.padStart(12))
+      .join(' '),
+  );
+  for (const size of sizes) {
+    const json = fs.readFileSync(path.join(args.packs, `all-shapes-${size}.json`), 'utf8');
+    const pack = fs.readFileSync(path.join(args.packs, `all-shapes-${size}.pack`));
+    const shapes = JSON.parse(json);
+    // The shape a renderer would look up first, from the middle of the library
+    const probe = shapes[Math.floor(shapes.length / 2)].name;
+
+    const jsonLookup = () => {
+      const shapesByName = new Map();
+      for (const shape of JSON.parse(json)) {
+        shapesByName.set(shape.name, shape);
+      }
+      return shapesByName.get(probe);
+    };
+    const packLookup = () => new ShapePack(pack).getShape(probe);
+    const packAll = () => {
+      const shapePack = new ShapePack(pack);
+      return shapePack.names().map((name) => shapePack.getShape(name));
+    };
+
+    // The pack must reproduce the JSON before its numbers mean anything
+    const decoded = new Map(packAll().map((shape) => [shape.name, shape]));
+    for (const shape of shapes) {
+      assert.deepStrictEqual(decoded.get(shape.name), shape);
+    }
+
+    const jsonTime = bestOf(args.repeat, jsonLookup);
+    const lookupTime = bestOf(args.repeat, packLookup);
+    const allTime = bestOf(args.repeat, packAll);
+    console.log(
+      [
+        String(size).padStart(12),
+        String(Buffer.byteLength(json)).padStart(12),
+        String(pack.length).padStart(12),
+        `${jsonTime.toFixed(2)} ms`.padStart(12),
+        `${lookupTime.toFixed(3)} ms`.padStart(12),
+        `${allTime.toFixed(2)} ms`.padStart(12),
+      ].join(' '),
+    );
+  }
+}
+
+main();
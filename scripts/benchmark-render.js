@@ -0,0 +1,98 @@
+/**
+ * Benchmark the per-view render time of one or more builds of the renderer.
+ *
+ * Usage:
+ *   node scripts/benchmark-render.js [--model <file.xml>] [--repeat <n>] [distDir ...]
+ *
+ * Every view of the model is rendered with each build and the best time of the
+ * repeated runs is reported per view. To compare before and after a change, build the
+ * previous revision in a git worktree and pass both dist/cjs directories, e.g.
+ *   node scripts/benchmark-render.js ../before/dist/cjs dist/cjs
+ * The documents of every build are compared with those of the first one, ignoring
+ * whitespace, so the times are known to be for the same output.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+function parseArgs(argv) {
+  const args = {
+    model: path.join(__dirname, '../examples/archimetal.xml'),
+    repeat: 20,
+    builds: [],
+  };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--model') {
+      args.model = argv[++i];
+    } else if (argv[i] === '--repeat') {
+      args.repeat = parseInt(argv[++i], 10);
+    } else {
+      args.builds.push(argv[i]);
+    }
+  }
+  if (args.builds.length === 0) {
+    args.builds.push(path.join(__dirname, '../dist/cjs'));
+  }
+  return args;
+}
+
+function bestOf(repeat, func) {
+  let best = Infinity;
+  for (let i = 0; i < repeat; i++) {
+    const start = process.hrtime.bigint();
+    func();
+    best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  return best;
+}
+
+// Collapse the whitespace of a document, which differs between serializations
+function normalizeSvg(svg) {
+  return svg.replace(/\s+/g, ' ').replace(/\s*(\/?>)/g, '$1').replace(/>\s*</g, '><');
+}
+
+function benchmarkBuild(buildDir, xmlContent, repeat) {
+  const { ArchiMateRenderer } = require(path.resolve(buildDir, 'index.js'));
+  const renderer = new ArchiMateRenderer().loadXml(xmlContent);
+  const timings = new Map();
+  for (const view of renderer.getViews()) {
+    // Warm up before timing so every build is measured in the same JIT state
+    const svg = renderer.renderView({ id: view.id });
+    timings.set(view.id, {
+      name: view.name,
+      ms: bestOf(repeat, () => renderer.renderView({ id: view.id })),
+      svg: normalizeSvg(svg),
+    });
+  }
+  return timings;
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const xmlContent = fs.readFileSync(args.model, 'utf8');
+  const results = args.builds.map((buildDir) => benchmarkBuild(buildDir, xmlContent, args.repeat));
+
+  console.log(`${path.basename(args.model)}, best of ${args.repeat} runs, times in ms`);
+  console.log(['view', ...args.builds].join('\t'));
+  const totals = args.builds.map(() => 0);
+  const differences = args.builds.map(() => 0);
+  for (const [viewId, { name, svg }] of results[0]) {
+    const row = results.map((timings, i) => {
+      const ms = timings.get(viewId).ms;
+      totals[i] += ms;
+      if (timings.get(viewId).svg !== svg) {
+        differences[i]++;
+      }
+      return ms.toFixed(3);
+    });
+    console.log([name, ...row].join('\t'));
+  }
+  console.log(['total', ...totals.map((ms) => ms.toFixed(3))].join('\t'));
+  console.log(['per view', ...totals.map((ms) => (ms / results[0].size).toFixed(3))].join('\t'));
+  if (totals.length > 1) {
+    console.log(['views rendered differently from the first build', ...differences].join('\t'));
+    console.log(`speedup of the last build over the first: ${(totals[0] / totals[totals.length - 1]).toFixed(2)}x`);
+  }
+}
+
+main();
@@ -0,0 +1,189 @@
+/**
+ * Benchmark orthogonal connection routing.
+ *
+ * Usage:
+ *   node scripts/benchmark-routing.js [--model <file.xml>] [--sizes <n,...>] [--repeat <n>] [distDir]
+ *
+ * Every view of the model is rendered with direct and with orthogonal routing; the
+ * first orthogonal render routes the connections and later renders reuse the cached
+ * routes. Synthetic landscape views with as many connections as elements then time
+ * the router on its own and count the elements that the connections cross.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+function parseArgs(argv) {
+  const args = {
+    model: path.join(__dirname, '../examples/archimetal.xml'),
+    sizes: [1000, 5000, 10000],
+    repeat: 20,
+    build: path.join(__dirname, '../dist/cjs'),
+  };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--model') {
+      args.model = argv[++i];
+    } else if (argv[i] === '--sizes') {
+      args.sizes = argv[++i].split(',').map((size) => parseInt(size, 10));
+    } else if (argv[i] === '--repeat') {
+      args.repeat = parseInt(argv[++i], 10);
+    } else {
+      args.build = argv[i];
+    }
+  }
+  return args;
+}
+
+function timeOf(func) {
+  const start = process.hrtime.bigint();
+  func();
+  return Number(process.hrtime.bigint() - start) / 1e6;
+}
+
+function bestOf(repeat, func) {
+  let best = Infinity;
+  for (let i = 0; i < repeat; i++) {
+    best = Math.min(best, timeOf(func));
+  }
+  return best;
+}
+
+function benchmarkModel(renderer, xmlContent, args) {
+  const direct = new renderer.ArchiMateRenderer().loadXml(xmlContent);
+  const orthogonal = new renderer.ArchiMateRenderer({ routing: 'orthogonal' }).loadXml(xmlContent);
+
+  console.log(`${path.basename(args.model)}, best of ${args.repeat} runs, times in ms`);
+  console.log(['view', 'direct', 'orthogonal first', 'orthogonal cached'].join('\t'));
+  for (const view of direct.getViews()) {
+    direct.renderView({ id: view.id });
+    const first = timeOf(() => orthogonal.renderView({ id: view.id }));
+    console.log([
+      view.name,
+      bestOf(args.repeat, () => direct.renderView({ id: view.id })).toFixed(3),
+      first.toFixed(3),
+      bestOf(args.repeat, () => orthogonal.renderView({ id: view.id })).toFixed(3),
+    ].join('\t'));
+  }
+}
+
+/**
+ * A landscape view like the generated ones: a grid of domains, each holding a grid of
+ * groups of 2-12 elements, with connections that mostly stay within a few groups
+ */
+function syntheticView(count, seed) {
+  let state = seed;
+  const random = () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return state / 0x7fffffff;
+  };
+  const randomInt = (low, high) => low + Math.floor(random() * (high - low + 1));
+
+  const leafWidth = 120, leafHeight = 55, gap = 20;
+  const groupWidth = 4 * (leafWidth + gap) + gap, groupHeight = 3 * (leafHeight + gap) + 40;
+  const domainWidth = 3 * (groupWidth + gap) + gap, domainHeight = 3 * (groupHeight + gap) + 40;
+  const elements = [];
+  const leaves = [];
+  for (let domain = 0; elements.length < count; domain++) {
+    const domainX = (domain % 6) * (domainWidth + 2 * gap);
+    const domainY = Math.floor(domain / 6) * (domainHeight + 2 * gap);
+    elements.push({ elementRef: `domain-${domain}`, x: domainX, y: domainY, width: domainWidth, height: domainHeight });
+    for (let group = randomInt(4, 9) - 1; group >= 0; group--) {
+      const groupX = domainX + gap + (group % 3) * (groupWidth + gap);
+      const groupY = domainY + 40 + Math.floor(group / 3) * (groupHeight + gap);
+      elements.push({ elementRef: `group-${domain}-${group}`, x: groupX, y: groupY, width: groupWidth, height: groupHeight });
+      for (let leaf = randomInt(2, 12) - 1; leaf >= 0; leaf--) {
+        leaves.push(elements.length);
+        elements.push({
+          elementRef: `element-${elements.length}`,
+          x: groupX + gap + (leaf % 4) * (leafWidth + gap),
+          y: groupY + 40 + Math.floor(leaf / 4) * (leafHeight + gap),
+          width: leafWidth,
+          height: leafHeight,
+        });
+      }
+    }
+  }
+  elements.length = count;
+  const inView = leaves.filter((index) => index < count);
+
+  const connections = [];
+  for (let i = 0; i < count; i++) {
+    const from = randomInt(0, inView.length - 1);
+    const to = random() < 0.8
+      ? Math.min(inView.length - 1, Math.max(0, from + randomInt(-20, 20)))
+      : randomInt(0, inView.length - 1);
+    if (to !== from) {
+      connections.push([inView[from], inView[to]]);
+    }
+  }
+  return { elements, connections };
+}
+
+function crossedElements(elements, points, source, target) {
+  let crossed = 0;
+  for (let index = 0; index < elements.length; index++) {
+    const rect = elements[index];
+    if (index === source || index === target || !rect.elementRef.startsWith('element-')) continue;
+    const crosses = points.slice(1).some((end, i) => {
+      const start = points[i];
+      // Sample the segment, which is enough to compare direct and routed connections
+      for (let step = 1; step < 64; step++) {
+        const x = start.x + ((end.x - start.x) * step) / 64;
+        const y = start.y + ((end.y - start.y) * step) / 64;
+        if (x > rect.x && x < rect.x + rect.width && y > rect.y && y < rect.y + rect.height) return true;
+      }
+      return false;
+    });
+    if (crosses) crossed++;
+  }
+  return crossed;
+}
+
+function benchmarkSynthetic(renderer, args) {
+  console.log('\nsynthetic landscape views, times in ms');
+  console.log(['elements', 'connections', 'index', 'routing', 'per connection', 'cached', 'crossings direct', 'crossings orthogonal'].join('\t'));
+  for (const size of args.sizes) {
+    const { elements, connections } = syntheticView(size, 42);
+    let router;
+    const index = timeOf(() => {
+      router = new renderer.OrthogonalRouter(elements);
+    });
+    const routes = [];
+    const routing = timeOf(() => {
+      connections.forEach(([source, target], i) => routes.push(router.route(`${i}`, source, target)));
+    });
+    const cached = timeOf(() => {
+      connections.forEach(([source, target], i) => router.route(`${i}`, source, target));
+    });
+
+    // Counting crossings is quadratic, so it is done on a sample of the connections
+    let direct = 0, orthogonal = 0;
+    const center = (rect) => ({ x: rect.x + rect.width / 2, y: rect.y + rect.height / 2 });
+    connections.slice(0, 500).forEach(([source, target], i) => {
+      const ends = [center(elements[source]), center(elements[target])];
+      direct += crossedElements(elements, ends, source, target);
+      const points = routes[i].length > 0 ? [ends[0], ...routes[i], ends[1]] : ends;
+      orthogonal += crossedElements(elements, points, source, target);
+    });
+
+    console.log([
+      size,
+      connections.length,
+      index.toFixed(1),
+      routing.toFixed(1),
+      ((routing / connections.length) * 1000).toFixed(1) + ' µs',
+      cached.toFixed(2),
+      direct,
+      orthogonal,
+    ].join('\t'));
+  }
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const renderer = require(path.resolve(args.build, 'index.js'));
+  benchmarkModel(renderer, fs.readFileSync(args.model, 'utf8'), args);
+  benchmarkSynthetic(renderer, args);
+}
+
+main();
@@ -9,8 +9,15 @@
 import { Command } from 'commander';
 import * as fs from 'fs-extra';
 import * as path from 'path';
+import { createHash } from 'crypto';
 import chalk from 'chalk';
-import { ArchiMateRenderer, IArchiMateRendererOptions } from './index';
+import {
+  ArchiMateRenderer,
+  ConnectionRouting,
+  IArchiMateRendererOptions,
+  LayerFills,
+  themeData,
+} from './index';
 import { IArchiMateElement, IArchiMateRelationship } from './types';
 import { VERSION } from './version';
 interface IArchiMateView {
@@ -35,15 +42,38 @@ interface IRenderOptions {
   padding: number;
   fontFamily: string;
   fontSize: number;
+  routing: ConnectionRouting;
+  theme: string;
+  layerFills: LayerFills;
 }
 
 interface IRenderAllOptions {
   outputDir: string;
+  incremental: boolean;
   width: number;
   height: number;
   padding: number;
   fontFamily: string;
   fontSize: number;
+  routing: ConnectionRouting;
+  theme: string;
+  layerFills: LayerFills;
+}
+
+// Manifest of the views rendered by render-all --incremental, kept in the output directory
+const MANIFEST_FILE = '.archimate-render-manifest.json';
+
+interface IRenderManifestEntry {
+  // Output file name, relative to the output directory
+  file: string;
+  // SHA-256 of the render inputs of the view
+  hash: string;
+  // Time it took to render and write the view, in milliseconds
+  ms: number;
+}
+
+interface IRenderManifest {
+  views: Record<string, IRenderManifestEntry>;
 }
 
 // Helper to parse numbers from command line options
@@ -55,6 +85,30 @@ const parseNumber = (value: string): number => {
   return result;
 };
 
+// Helper to parse the connection routing from command line options
+const parseRouting = (value: string): ConnectionRouting => {
+  if (value !== 'direct' && value !== 'orthogonal') {
+    throw new Error(`Invalid routing: ${value}`);
+  }
+  return value;
+};
+
+// Helper to parse the layer fills from command line options
+const parseLayerFills = (value: string): LayerFills => {
+  if (value !== 'inline' && value !== 'classes' && value !== 'external') {
+    throw new Error(`Invalid layer fills: ${value}`);
+  }
+  return value;
+};
+
+// Helper to check the theme name from command line options
+const parseTheme = (value: string): string => {
+  if (!themeData[value]) {
+    throw new Error(`Unknown theme: ${value} (available: ${Object.keys(themeData).join(', ')})`);
+  }
+  return value;
+};
+
 // Create the program
 const program = new Command();
 
@@ -99,6 +153,59 @@ function writeSvgFile(filePath: string, svgContent: string): void {
   }
 }
 
+/**
+ * Read the render manifest of an output directory. A missing or unreadable manifest
+ * is treated as empty, so every view is rendered.
+ * @param outputDir - Output directory.
+ * @returns The manifest.
+ */
+function readManifest(outputDir: string): IRenderManifest {
+  try {
+    const manifest = JSON.parse(fs.readFileSync(path.join(outputDir, MANIFEST_FILE), 'utf-8'));
+    if (
+      manifest &&
+      typeof manifest.views === 'object' &&
+      manifest.views !== null &&
+      !Array.isArray(manifest.views)
+    ) {
+      return manifest as IRenderManifest;
+    }
+  } catch {
+    // Render everything
+  }
+  return { views: {} };
+}
+
+/**
+ * Check that a file name from the render manifest is one render-all writes: an SVG file
+ * named after the model, directly in the output directory.
+ *
+ * @param fileName - The file name from the manifest.
+ * @param baseName - The base name of the model file.
+ * @returns Whether the file may be deleted as an orphan.
+ */
+function isRenderedFileName(fileName: unknown, baseName: string): fileName is string {
+  return (
+    typeof fileName === 'string' &&
+    path.basename(fileName) === fileName &&
+    fileName.startsWith(`${baseName}_`) &&
+    fileName.endsWith('.svg')
+  );
+}
+
+/**
+ * Write the render manifest of an output directory.
+ * @param outputDir - Output directory.
+ * @param manifest - The manifest.
+ */
+function writeManifest(outputDir: string, manifest: IRenderManifest): void {
+  fs.writeFileSync(
+    path.join(outputDir, MANIFEST_FILE),
+    `${JSON.stringify(manifest, null, 2)}\n`,
+    'utf-8',
+  );
+}
+
 /**
  * Create a sanitized filename from a string.
  * @param name - The string to sanitize.
@@ -217,6 +324,19 @@ program
   .option('-p, --padding <padding>', 'SVG padding in pixels', parseNumber, 20)
   .option('-f, --font-family <fontFamily>', 'Font family', 'Arial, sans-serif')
   .option('-s, --font-size <fontSize>', 'Font size in pixels', parseNumber, 12)
+  .option(
+    '-r, --routing <routing>',
+    'Routing of connections without bendpoints: direct or orthogonal',
+    parseRouting,
+    'direct',
+  )
+  .option('-t, --theme <theme>', 'Layer color theme', parseTheme, 'default')
+  .option(
+    '-l, --layer-fills <layerFills>',
+    'Layer colors: inline, classes with an embedded stylesheet, or external classes',
+    parseLayerFills,
+    'inline',
+  )
   .action((file: string, options: IRenderOptions) => {
     try {
       const xmlContent = readXmlFile(file);
@@ -226,6 +346,9 @@ program
         padding: options.padding,
         fontFamily: options.fontFamily,
         fontSize: options.fontSize,
+        routing: options.routing,
+        colors: { ...themeData[options.theme] },
+        layerFills: options.layerFills,
       };
 
       const renderer = new ArchiMateRenderer(rendererOptions);
@@ -273,6 +396,24 @@ program
   .option('-p, --padding <padding>', 'SVG padding in pixels', parseNumber, 20)
   .option('-f, --font-family <fontFamily>', 'Font family', 'Arial, sans-serif')
   .option('-s, --font-size <fontSize>', 'Font size in pixels', parseNumber, 12)
+  .option(
+    '-r, --routing <routing>',
+    'Routing of connections without bendpoints: direct or orthogonal',
+    parseRouting,
+    'direct',
+  )
+  .option('-t, --theme <theme>', 'Layer color theme', parseTheme, 'default')
+  .option(
+    '-l, --layer-fills <layerFills>',
+    'Layer colors: inline, classes with an embedded stylesheet, or external classes',
+    parseLayerFills,
+    'inline',
+  )
+  .option(
+    '-i, --incremental',
+    `Only render the views whose inputs changed since the last run, recorded in ${MANIFEST_FILE}`,
+    false,
+  )
   .action((file: string, options: IRenderAllOptions) => {
     try {
       const xmlContent = readXmlFile(file);
@@ -282,6 +423,9 @@ program
         padding: options.padding,
         fontFamily: options.fontFamily,
         fontSize: options.fontSize,
+        routing: options.routing,
+        colors: { ...themeData[options.theme] },
+        layerFills: options.layerFills,
       };
 
       const renderer = new ArchiMateRenderer(rendererOptions);
@@ -305,8 +449,15 @@ program
       fs.ensureDirSync(options.outputDir);
       console.log(chalk.bold(`Rendering ${uniqueViewIds.size} views...`));
 
+      const previousManifest: IRenderManifest = options.incremental
+        ? readManifest(options.outputDir)
+        : { views: {} };
+      const manifest: IRenderManifest = { views: {} };
       let rendered = 0;
+      let skipped = 0;
+      let savedMs = 0;
       for (const viewId of uniqueViewIds) {
+        const previous = previousManifest.views[viewId];
         try {
           const view = internalRenderer.views.get(viewId);
           if (!view) {
@@ -316,21 +467,79 @@ program
 
           const baseName = path.basename(file, path.extname(file));
           const viewName = view.name ? sanitizeFilename(view.name) : sanitizeFilename(viewId);
-          const outputFile = path.join(options.outputDir, `${baseName}_${viewName}.svg`);
+          const fileName = `${baseName}_${viewName}.svg`;
+          const outputFile = path.join(options.outputDir, fileName);
+
+          // Views whose inputs did not change since the last run keep their file
+          const hash = options.incremental
+            ? createHash('sha256')
+                .update(renderer.getViewRenderInputs({ id: viewId }))
+                .digest('hex')
+            : '';
+          if (
+            previous &&
+            previous.hash === hash &&
+            previous.file === fileName &&
+            fs.existsSync(outputFile)
+          ) {
+            manifest.views[viewId] = previous;
+            skipped++;
+            savedMs += previous.ms;
+            continue;
+          }
 
+          const start = process.hrtime.bigint();
           const svgContent = renderer.renderView({ id: viewId });
           writeSvgFile(outputFile, svgContent);
+          const ms = Number(process.hrtime.bigint() - start) / 1e6;
+          manifest.views[viewId] = { file: fileName, hash, ms: Math.round(ms * 1000) / 1000 };
           rendered++;
         } catch (err: unknown) {
           const error = err instanceof Error ? err : new Error(String(err));
           console.warn(chalk.yellow(`Error rendering view ${viewId}:`));
           console.warn(chalk.yellow(error.message));
+          // Keep track of the previous file, but render the view again next time
+          if (previous) {
+            manifest.views[viewId] = { ...previous, hash: '' };
+          }
         }
       }
 
       console.log(
         chalk.green(`\nRendered ${rendered} of ${uniqueViewIds.size} views to ${options.outputDir}`)
       );
+
+      if (options.incremental) {
+        // Delete the files of views that were removed or renamed since the last run
+        const files = new Set(Object.values(manifest.views).map((entry) => entry.file));
+        const baseName = path.basename(file, path.extname(file));
+        let deleted = 0;
+        for (const entry of Object.values(previousManifest.views)) {
+          if (files.has(entry?.file)) {
+            continue;
+          }
+          // Only ever delete files render-all writes, never outside the output directory
+          if (!isRenderedFileName(entry?.file, baseName)) {
+            console.warn(chalk.yellow(`Not deleting ${String(entry?.file)} from ${MANIFEST_FILE}`));
+            continue;
+          }
+          const orphan = path.join(options.outputDir, entry.file);
+          if (fs.existsSync(orphan)) {
+            fs.removeSync(orphan);
+            console.log(chalk.gray(`Deleted ${orphan}`));
+            files.add(entry.file);
+            deleted++;
+          }
+        }
+        writeManifest(options.outputDir, manifest);
+
+        console.log(
+          chalk.green(
+            `Skipped ${skipped} unchanged views, saving about ${Math.round(savedMs)} ms; ` +
+              `deleted ${deleted} orphaned files`,
+          ),
+        );
+      }
     } catch (err: unknown) {
       const error = err instanceof Error ? err : new Error(String(err));
       console.error(chalk.red('Error rendering views:'));
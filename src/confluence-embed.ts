@@ -3,11 +3,23 @@
  * 
  * This module provides the functionality needed to automatically render
  * ArchiMate diagrams when embedded in Confluence pages as HTML macros.
+ * The entry points bind it to their renderer with createDiagramEmbedding(), so the
+ * lazy entry point only loads the shapes of the views on the page.
  */
 
-import { IArchiMateRendererOptions, renderArchiMateView } from './index';
+import type { ArchiMateRenderer, IArchiMateRendererOptions } from './renderer';
+import type { ConnectionRouting } from './utils/connection-router';
+import { DEFAULT_THEME, themeData } from './utils/theme-data';
 
-interface ArchimateEmbedConfig {
+// Theme names that embedding pages may use besides the names of themeData
+const THEME_ALIASES: Record<string, string> = {
+  light: DEFAULT_THEME,
+};
+
+// Routings the render service reproduces; views with other routings are rendered in the browser
+const SERVICE_ROUTINGS: ConnectionRouting[] = ['direct'];
+
+export interface ArchimateEmbedConfig {
   xmlUrl: string;
   viewName?: string;
   viewId?: string;
@@ -17,6 +29,10 @@ interface ArchimateEmbedConfig {
   fontSize?: number;
   theme?: string;
   customColorMapping?: string;
+  routing?: ConnectionRouting;
+  // Render service (svg-shapes/render_service.py) and the hash of the model it serves
+  serviceUrl?: string;
+  modelHash?: string;
 }
 
 /**
@@ -33,9 +49,38 @@ function parseConfigFromElement(element: HTMLElement): ArchimateEmbedConfig {
     fontSize: element.getAttribute('data-font-size') ? parseInt(element.getAttribute('data-font-size') || '0', 10) : undefined,
     theme: element.getAttribute('data-theme') || undefined,
     customColorMapping: element.getAttribute('data-custom-colors') || undefined,
+    routing: element.getAttribute('data-routing') === 'orthogonal' ? 'orthogonal' : undefined,
+    serviceUrl: element.getAttribute('data-service-url') || undefined,
+    modelHash: element.getAttribute('data-model-hash') || undefined,
   };
 }
 
+/**
+ * Get the name of the theme of themeData a configuration selects
+ */
+function resolveThemeName(config: ArchimateEmbedConfig): string | undefined {
+  if (!config.theme) {
+    return undefined;
+  }
+  const name = config.theme.toLowerCase();
+  return THEME_ALIASES[name] || name;
+}
+
+/**
+ * Parse the custom color mapping of a configuration
+ */
+function parseCustomColors(config: ArchimateEmbedConfig): Record<string, string> | undefined {
+  if (!config.customColorMapping) {
+    return undefined;
+  }
+  try {
+    return JSON.parse(config.customColorMapping);
+  } catch (error) {
+    console.error('Failed to parse custom color mapping:', error);
+    return undefined;
+  }
+}
+
 /**
  * Process theme and custom color settings into renderer options
  */
@@ -45,65 +90,23 @@ function processThemeOptions(config: ArchimateEmbedConfig): IArchiMateRendererOp
     height: config.height,
     fontFamily: config.fontFamily,
     fontSize: config.fontSize,
+    routing: config.routing,
   };
 
-  // Apply theme presets
-  if (config.theme) {
-    switch (config.theme.toLowerCase()) {
-      case 'dark':
-        options.colors = {
-          background: '#282c34',
-          stroke: '#ffffff',
-          text: '#ffffff',
-          application: '#61afef',
-          business: '#e5c07b',
-          technology: '#98c379',
-          motivation: '#c678dd',
-          implementation: '#e06c75',
-          strategy: '#d19a66',
-          physical: '#56b6c2',
-        };
-        break;
-      case 'light':
-        options.colors = {
-          background: '#ffffff',
-          stroke: '#000000',
-          text: '#000000',
-          application: '#85C1E9',
-          business: '#F9E79F',
-          technology: '#ABEBC6',
-          motivation: '#D7BDE2',
-          implementation: '#F5CBA7',
-          strategy: '#F1948A',
-          physical: '#D5DBDB',
-        };
-        break;
-      case 'colorful':
-        options.colors = {
-          background: '#ffffff',
-          stroke: '#2c3e50',
-          text: '#2c3e50',
-          application: '#3498db',
-          business: '#f1c40f',
-          technology: '#2ecc71',
-          motivation: '#9b59b6',
-          implementation: '#e67e22',
-          strategy: '#e74c3c',
-          physical: '#1abc9c',
-        };
-        break;
-      // Add more themes as needed
+  // Apply theme presets, the themes of svg-shapes/themes.json
+  const theme = resolveThemeName(config);
+  if (theme) {
+    if (themeData[theme]) {
+      options.colors = { ...themeData[theme] };
+    } else {
+      console.warn(`Unknown theme: ${config.theme}`);
     }
   }
 
   // Apply custom color mapping if provided
-  if (config.customColorMapping) {
-    try {
-      const customColors = JSON.parse(config.customColorMapping);
-      options.colors = { ...(options.colors || {}), ...customColors };
-    } catch (error) {
-      console.error('Failed to parse custom color mapping:', error);
-    }
+  const customColors = parseCustomColors(config);
+  if (customColors) {
+    options.colors = { ...(options.colors || {}), ...customColors };
   }
 
   return options;
@@ -126,70 +129,133 @@ async function fetchArchiMateXml(url: string): Promise<string> {
 }
 
 /**
- * Render an ArchiMate diagram into a container element
+ * Fetch a view rendered by the render service, with the size, font, theme, custom
+ * colors and routing of the configuration. The service answers options it cannot
+ * reproduce with an error.
  */
-async function renderDiagram(container: HTMLElement, config: ArchimateEmbedConfig): Promise<void> {
-  try {
-    if (!config.xmlUrl) {
-      throw new Error('Missing XML URL configuration');
-    }
+async function fetchServiceSvg(config: ArchimateEmbedConfig): Promise<string> {
+  const view = encodeURIComponent(config.viewId || config.viewName || '');
+  const query = new URLSearchParams();
+  if (config.width) query.set('width', String(config.width));
+  if (config.height) query.set('height', String(config.height));
+  if (config.fontFamily) query.set('font-family', config.fontFamily);
+  if (config.fontSize) query.set('font-size', String(config.fontSize));
+  const theme = resolveThemeName(config);
+  if (theme) query.set('theme', theme);
+  const customColors = parseCustomColors(config);
+  if (customColors) query.set('colors', JSON.stringify(customColors));
+  if (config.routing) query.set('routing', config.routing);
+  const baseUrl = (config.serviceUrl || '').replace(/\/+$/, '');
+  const url = `${baseUrl}/model/${encodeURIComponent(config.modelHash || '')}/view/${view}.svg?${query}`;
 
-    if (!config.viewName && !config.viewId) {
-      throw new Error('Either view name or view ID must be specified');
-    }
+  // The service answers repeated requests with 304 Not Modified through the browser cache
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`HTTP error: ${response.status}`);
+  }
+  return await response.text();
+}
+
+/**
+ * Create the embedding functions of an entry point
+ * @param createRenderer Creates the renderer of the entry point, with its shape source registered
+ * @returns renderDiagram() and initializeArchiMateDiagrams() bound to that renderer
+ */
+export function createDiagramEmbedding(
+  createRenderer: (options: IArchiMateRendererOptions) => ArchiMateRenderer,
+): {
+  renderDiagram: (container: HTMLElement, config: ArchimateEmbedConfig) => Promise<void>;
+  initializeArchiMateDiagrams: () => void;
+} {
+  /**
+   * Render an ArchiMate diagram into a container element
+   */
+  async function renderDiagram(container: HTMLElement, config: ArchimateEmbedConfig): Promise<void> {
+    try {
+      // Views whose routing the service cannot reproduce are rendered in the browser
+      const serviceConfigured = Boolean(config.serviceUrl && config.modelHash);
+      const useService = serviceConfigured && SERVICE_ROUTINGS.includes(config.routing || 'direct');
+      if (!config.xmlUrl && !useService) {
+        throw new Error(
+          serviceConfigured
+            ? `The render service does not support ${config.routing} routing; set data-xml-url`
+            : 'Missing XML URL configuration',
+        );
+      }
 
-    // Add loading indicator
-    container.innerHTML = '<div class="archimate-loading">Loading diagram...</div>';
+      if (!config.viewName && !config.viewId) {
+        throw new Error('Either view name or view ID must be specified');
+      }
 
-    // Fetch XML content
-    const xmlContent = await fetchArchiMateXml(config.xmlUrl);
+      // Add loading indicator
+      container.innerHTML = '<div class="archimate-loading">Loading diagram...</div>';
 
-    // Process options
-    const options = processThemeOptions(config);
+      // Views rendered by the service do not need the model in the browser
+      if (useService) {
+        try {
+          container.innerHTML = await fetchServiceSvg(config);
+          return;
+        } catch (error) {
+          // Render in the browser if the service rejects the options or is unavailable
+          if (!config.xmlUrl) {
+            throw error;
+          }
+          console.warn('Render service failed, rendering in the browser:', error);
+        }
+      }
 
-    // Render the view
-    const svg = renderArchiMateView(
-      xmlContent,
-      {
-        id: config.viewId,
-        name: config.viewName,
-      },
-      options
-    );
+      // Fetch XML content
+      const xmlContent = await fetchArchiMateXml(config.xmlUrl);
 
-    // Update the container with the rendered SVG
-    container.innerHTML = svg;
-  } catch (error) {
-    console.error('Error rendering ArchiMate diagram:', error);
-    container.innerHTML = `<div class="archimate-error">Error loading diagram: ${error instanceof Error ? error.message : 'Unknown error'}</div>`;
+      // Process options
+      const options = processThemeOptions(config);
+
+      // Render the view once the shapes of its elements are loaded
+      const svg = await createRenderer(options)
+        .loadXml(xmlContent)
+        .renderViewAsync({
+          id: config.viewId,
+          name: config.viewName,
+        });
+
+      // Update the container with the rendered SVG
+      container.innerHTML = svg;
+    } catch (error) {
+      console.error('Error rendering ArchiMate diagram:', error);
+      container.innerHTML = `<div class="archimate-error">Error loading diagram: ${error instanceof Error ? error.message : 'Unknown error'}</div>`;
+    }
+  }
+
+  /**
+   * Initialize all ArchiMate diagrams on the page
+   */
+  function initializeArchiMateDiagrams(): void {
+    // Find all elements with the archimate-diagram class
+    const diagramContainers = document.querySelectorAll('.archimate-diagram');
+
+    // Process each container
+    diagramContainers.forEach((container) => {
+      if (container instanceof HTMLElement) {
+        const config = parseConfigFromElement(container);
+        void renderDiagram(container, config);
+      }
+    });
   }
+
+  return { renderDiagram, initializeArchiMateDiagrams };
 }
 
 /**
- * Initialize all ArchiMate diagrams on the page
+ * Initialize the diagrams on the page when the DOM is ready
+ * @param initializeArchiMateDiagrams The initialization function of an entry point
  */
-function initializeArchiMateDiagrams(): void {
-  // Find all elements with the archimate-diagram class
-  const diagramContainers = document.querySelectorAll('.archimate-diagram');
-
-  // Process each container
-  diagramContainers.forEach((container) => {
-    if (container instanceof HTMLElement) {
-      const config = parseConfigFromElement(container);
-      void renderDiagram(container, config);
+export function autoInitializeDiagrams(initializeArchiMateDiagrams: () => void): void {
+  if (typeof document !== 'undefined') {
+    if (document.readyState === 'loading') {
+      document.addEventListener('DOMContentLoaded', initializeArchiMateDiagrams);
+    } else {
+      // DOM is already ready
+      initializeArchiMateDiagrams();
     }
-  });
-}
-
-// Auto-initialize when the DOM is ready
-if (typeof document !== 'undefined') {
-  if (document.readyState === 'loading') {
-    document.addEventListener('DOMContentLoaded', initializeArchiMateDiagrams);
-  } else {
-    // DOM is already ready
-    initializeArchiMateDiagrams();
   }
 }
-
-// Export for manual initialization
-export { initializeArchiMateDiagrams, renderDiagram };
@@ -0,0 +1,85 @@
+/* eslint-disable max-len */
+/**
+ * archimate-renderer/lazy
+ * The lazy entry point of archimate-renderer: the same API as index.ts, without the
+ * shape data. The shapes of a view are imported from the per-shape modules generated by
+ * ts-file-gen.py --split when the view is rendered with renderViewAsync(), so a bundle
+ * with code splitting only loads the stencils of the element types on the page.
+ *
+ * renderView() draws the icons of shapes loaded so far only; await loadViewShapes() or
+ * use renderViewAsync().
+ */
+
+import {
+  ArchimateEmbedConfig,
+  autoInitializeDiagrams,
+  createDiagramEmbedding,
+} from './confluence-embed';
+import {
+  ArchiMateRenderer as ArchiMateRendererBase,
+  IArchiMateRendererOptions,
+  IViewIdentifier,
+} from './renderer';
+import { shapeModuleLoaders } from './utils/shape-modules';
+import { registerShapeModuleLoaders } from './utils/shape-store';
+
+// Export the shape pack decoder; packs registered with registerShapePack() serve the
+// shapes before their modules are loaded
+export { ShapePack } from './utils/shape-pack';
+export { registerShapePack } from './utils/shape-store';
+
+// Export shape registry for customization
+export { ArrowHeadGenerator, ElementShapeGenerator, LineStyleGenerator, shapeRegistry } from './utils/shape-registry';
+
+// Export shape templates for reuse
+export * from './utils/shape-templates';
+
+// Export text wrapping utility
+export * from './utils/text-wrapper';
+
+// Export compound element detector utility
+export * from './utils/compound-element-detector';
+
+// Export connection routing utility
+export * from './utils/connection-router';
+
+// Export layer themes
+export * from './utils/theme';
+export * from './utils/theme-data';
+
+// Export the renderer options and embed configuration
+export type { ArchimateEmbedConfig, IArchiMateRendererOptions, IViewIdentifier };
+
+/**
+ * Renderer that loads the shapes of a view from the per-shape modules
+ */
+export class ArchiMateRenderer extends ArchiMateRendererBase {
+  /**
+   * Create a new ArchiMateRenderer instance
+   * @param options Rendering options
+   */
+  constructor(options: IArchiMateRendererOptions = {}) {
+    registerShapeModuleLoaders(shapeModuleLoaders);
+    super(options);
+  }
+}
+
+// Export a convenience function for quick usage
+export function renderArchiMateView(
+  xmlContent: string,
+  viewIdentifier: IViewIdentifier,
+  options?: IArchiMateRendererOptions,
+): Promise<string> {
+  return new ArchiMateRenderer(options).loadXml(xmlContent).renderViewAsync(viewIdentifier);
+}
+
+// Export Confluence embed functionality
+export const { renderDiagram, initializeArchiMateDiagrams } = createDiagramEmbedding(
+  (options) => new ArchiMateRenderer(options),
+);
+
+// Auto-initialize when the DOM is ready
+autoInitializeDiagrams(initializeArchiMateDiagrams);
+
+// Export types
+export * from './types';
@@ -0,0 +1,81 @@
+/* eslint-disable max-len */
+/**
+ * archimate-renderer/packed
+ * The shape pack entry point of archimate-renderer: the same API as index.ts, with the
+ * shapes served from a binary shape pack (ts-file-gen.py --pack) instead of shape-data.ts.
+ * Opening a pack only reads its header, and shapes are decoded when a view first draws
+ * them, so startup does not depend on the size of the shape library.
+ *
+ * Load a pack with loadShapePack() before rendering. Confluence embeds are not
+ * initialized automatically, as the pack has to be loaded first: call
+ * initializeArchiMateDiagrams() once it is.
+ */
+
+import {
+  ArchimateEmbedConfig,
+  createDiagramEmbedding,
+} from './confluence-embed';
+import {
+  ArchiMateRenderer,
+  IArchiMateRendererOptions,
+  IViewIdentifier,
+} from './renderer';
+import { ShapePack } from './utils/shape-pack';
+import { registerShapePack } from './utils/shape-store';
+
+// Export the shape pack decoder
+export { ShapePack, registerShapePack };
+
+// Export shape registry for customization
+export { ArrowHeadGenerator, ElementShapeGenerator, LineStyleGenerator, shapeRegistry } from './utils/shape-registry';
+
+// Export shape templates for reuse
+export * from './utils/shape-templates';
+
+// Export text wrapping utility
+export * from './utils/text-wrapper';
+
+// Export compound element detector utility
+export * from './utils/compound-element-detector';
+
+// Export connection routing utility
+export * from './utils/connection-router';
+
+// Export layer themes
+export * from './utils/theme';
+export * from './utils/theme-data';
+
+// Export the renderer options and embed configuration
+export type { ArchimateEmbedConfig, IArchiMateRendererOptions, IViewIdentifier };
+
+// The renderer draws the shapes of the registered packs
+export { ArchiMateRenderer };
+
+/**
+ * Open a shape pack and serve its shapes to every renderer
+ * @param buffer The contents of the pack file, e.g. a fetched ArrayBuffer or a Node.js Buffer
+ * @returns The shape pack
+ * @throws Error if the buffer does not contain a shape pack of a supported version
+ */
+export function loadShapePack(buffer: ArrayBuffer | Uint8Array): ShapePack {
+  const pack = new ShapePack(buffer);
+  registerShapePack(pack);
+  return pack;
+}
+
+// Export a convenience function for quick usage
+export function renderArchiMateView(
+  xmlContent: string,
+  viewIdentifier: IViewIdentifier,
+  options?: IArchiMateRendererOptions,
+): string {
+  return new ArchiMateRenderer(options).loadXml(xmlContent).renderView(viewIdentifier);
+}
+
+// Export Confluence embed functionality
+export const { renderDiagram, initializeArchiMateDiagrams } = createDiagramEmbedding(
+  (options) => new ArchiMateRenderer(options),
+);
+
+// Export types
+export * from './types';
@@ -0,0 +1,23 @@
+/**
+ * Built-in Shapes
+ *
+ * This module registers every shape of shape-data.ts in the shape store. It is only
+ * imported by index.ts, so bundles of the lazy entry point (lazy.ts) do not contain the
+ * monolithic shape data.
+ */
+
+import { allShapesData, iconFragmentData } from './shape-data';
+import { registerShapes } from './shape-store';
+
+let builtinShapesRegistered = false;
+
+/**
+ * Register all built-in shapes; later calls do nothing
+ */
+export function registerBuiltinShapes(): void {
+  if (builtinShapesRegistered) {
+    return;
+  }
+  builtinShapesRegistered = true;
+  registerShapes(allShapesData, iconFragmentData);
+}
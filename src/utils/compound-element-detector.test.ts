@@ -0,0 +1,193 @@
+import { describe, expect, it } from 'vitest';
+import { IArchiMateViewElement } from '../types';
+import {
+  buildContainmentIndex,
+  IContainmentIndex,
+  identifyCompoundElements,
+  isElementContainedWithin,
+} from './compound-element-detector';
+
+/**
+ * Seeded pseudo-random numbers (mulberry32), so failing views can be reproduced
+ * @param seed The seed
+ * @returns Function returning numbers in [0, 1)
+ */
+function createRandom(seed: number): () => number {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Create a random view of nested, overlapping and identical elements on a coarse grid,
+ * so that shared edges and equal areas are common
+ * @param random Random number generator
+ * @param count Number of elements
+ * @returns The view elements
+ */
+function createRandomView(random: () => number, count: number): IArchiMateViewElement[] {
+  const int = (max: number): number => Math.floor(random() * max);
+  const elements: IArchiMateViewElement[] = [];
+  for (let i = 0; i < count; i++) {
+    const elementRef = `e${int(count)}`;
+    const roll = random();
+    if (roll < 0.15 && elements.length > 0) {
+      // A copy of an earlier element, often of another model element
+      elements.push({ ...elements[int(elements.length)], elementRef });
+    } else if (roll < 0.6 && elements.length > 0) {
+      // An element inside or on the edge of an earlier element
+      const outer = elements[int(elements.length)];
+      const x = outer.x + int(outer.width / 10 + 1) * 10;
+      const y = outer.y + int(outer.height / 10 + 1) * 10;
+      const width = int((outer.x + outer.width - x) / 10 + 1) * 10;
+      const height = int((outer.y + outer.height - y) / 10 + 1) * 10;
+      elements.push({ elementRef, x, y, width, height });
+    } else {
+      elements.push({
+        elementRef,
+        x: int(20) * 10,
+        y: int(20) * 10,
+        width: int(12) * 10,
+        height: int(12) * 10,
+      });
+    }
+  }
+  return elements;
+}
+
+/**
+ * Build the containment index by testing every pair of elements. The parent of an
+ * element is the smallest element that contains it and comes before it in the sweep
+ * order of buildContainmentIndex(), the last one of equal area.
+ * @param viewElements Array of view elements
+ * @returns The containment index
+ */
+function bruteForceContainment(viewElements: IArchiMateViewElement[]): IContainmentIndex {
+  const right = (e: IArchiMateViewElement): number => e.x + e.width;
+  const bottom = (e: IArchiMateViewElement): number => e.y + e.height;
+  const order = viewElements
+    .map((_, i) => i)
+    .sort((a, b) => {
+      const ea = viewElements[a];
+      const eb = viewElements[b];
+      return (
+        ea.x - eb.x || right(eb) - right(ea) || ea.y - eb.y || bottom(eb) - bottom(ea) || a - b
+      );
+    });
+  const position = new Map(order.map((index, i) => [index, i]));
+
+  const parents = viewElements.map((child, index) => {
+    let parent = -1;
+    viewElements.forEach((container, candidate) => {
+      if (
+        position.get(candidate)! < position.get(index)! &&
+        isElementContainedWithin(child, container)
+      ) {
+        const area = container.width * container.height;
+        const parentArea =
+          parent === -1 ? Infinity : viewElements[parent].width * viewElements[parent].height;
+        if (
+          area < parentArea ||
+          (area === parentArea && position.get(candidate)! > position.get(parent)!)
+        ) {
+          parent = candidate;
+        }
+      }
+    });
+    return parent;
+  });
+
+  const compoundRefs = new Set<string>();
+  viewElements.forEach((child, index) => {
+    viewElements.forEach((container, candidate) => {
+      if (
+        candidate !== index &&
+        container.elementRef !== child.elementRef &&
+        isElementContainedWithin(child, container)
+      ) {
+        compoundRefs.add(container.elementRef);
+      }
+    });
+  });
+
+  const children: number[][] = viewElements.map(() => []);
+  const roots: number[] = [];
+  parents.forEach((parent, index) => (parent === -1 ? roots : children[parent]).push(index));
+  return { parents, children, roots, compoundRefs };
+}
+
+describe('buildContainmentIndex', () => {
+  it('nests elements in the smallest element that contains them', () => {
+    const elements: IArchiMateViewElement[] = [
+      { elementRef: 'group', x: 0, y: 0, width: 400, height: 300 },
+      { elementRef: 'node', x: 20, y: 40, width: 200, height: 200 },
+      { elementRef: 'device', x: 40, y: 80, width: 120, height: 55 },
+      { elementRef: 'actor', x: 500, y: 0, width: 120, height: 55 },
+    ];
+
+    const index = buildContainmentIndex(elements);
+
+    expect(index.parents).toEqual([-1, 0, 1, -1]);
+    expect(index.children).toEqual([[1], [2], [], []]);
+    expect(index.roots).toEqual([0, 3]);
+    expect(Array.from(index.compoundRefs).sort()).toEqual(['group', 'node']);
+  });
+
+  it('chains identical elements in view order', () => {
+    const elements: IArchiMateViewElement[] = [
+      { elementRef: 'a', x: 10, y: 10, width: 100, height: 50 },
+      { elementRef: 'b', x: 10, y: 10, width: 100, height: 50 },
+      { elementRef: 'c', x: 10, y: 10, width: 100, height: 50 },
+      { elementRef: 'outer', x: 0, y: 0, width: 200, height: 100 },
+    ];
+
+    const index = buildContainmentIndex(elements);
+
+    expect(index.parents).toEqual([3, 0, 1, -1]);
+    expect(index.roots).toEqual([3]);
+    // Identical elements contain each other, so every one of them is a compound
+    expect(Array.from(index.compoundRefs).sort()).toEqual(['a', 'b', 'c', 'outer']);
+  });
+
+  it('does not make identical elements of one model element compounds', () => {
+    const elements: IArchiMateViewElement[] = [
+      { elementRef: 'a', x: 10, y: 10, width: 100, height: 50 },
+      { elementRef: 'a', x: 10, y: 10, width: 100, height: 50 },
+    ];
+
+    const index = buildContainmentIndex(elements);
+
+    expect(index.parents).toEqual([-1, 0]);
+    expect(index.compoundRefs.size).toBe(0);
+    expect(identifyCompoundElements(elements).get('a')).toBe(false);
+  });
+
+  it('matches the brute-force containment check on random views', () => {
+    const random = createRandom(2024);
+    for (let view = 0; view < 200; view++) {
+      const elements = createRandomView(random, 1 + Math.floor(random() * 60));
+      const expected = bruteForceContainment(elements);
+
+      const index = buildContainmentIndex(elements);
+
+      expect(index.parents).toEqual(expected.parents);
+      expect(index.children).toEqual(expected.children);
+      expect(index.roots).toEqual(expected.roots);
+      expect(Array.from(index.compoundRefs).sort()).toEqual(
+        Array.from(expected.compoundRefs).sort(),
+      );
+    }
+  });
+
+  it('handles views without elements', () => {
+    expect(buildContainmentIndex([])).toEqual({
+      parents: [],
+      children: [],
+      roots: [],
+      compoundRefs: new Set(),
+    });
+  });
+});
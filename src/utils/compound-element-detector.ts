@@ -27,36 +27,142 @@ export function isElementContainedWithin(
 }
 
 /**
- * Identifies compound elements in a view and marks them for top-aligned labels
+ * Nesting of the elements of a view
+ */
+export interface IContainmentIndex {
+  // Index of the innermost element that contains each element, or -1 for top-level elements
+  parents: number[];
+  // Indices of the elements whose innermost container is each element, in view order
+  children: number[][];
+  // Indices of the top-level elements, in view order
+  roots: number[];
+  // References of the elements that contain an element with a different reference
+  compoundRefs: Set<string>;
+}
+
+/**
+ * Build the parent/child nesting of the elements of a view in O(n log n) for views
+ * whose elements do not overlap much.
+ *
+ * The elements are swept from left to right, wider elements first, so every container
+ * is visited before the elements it contains. The elements that may still contain
+ * later ones are kept in a segment tree over their vertical extent, so the containers
+ * of an element are found by walking the tree from the leaf of its top edge to the
+ * root. Elements that end left of the sweep position are dropped from the tree while
+ * it is walked. Of all containers of an element, the one with the smallest area is
+ * its parent; of identical containers, the one visited last, so identical elements
+ * form a chain.
  * @param viewElements Array of view elements
- * @returns A map of element references to boolean indicating if they are compound elements
+ * @returns The containment index
  */
-export function identifyCompoundElements(
-  viewElements: IArchiMateViewElement[],
-): Map<string, boolean> {
-  const compoundElements = new Map<string, boolean>();
+export function buildContainmentIndex(viewElements: IArchiMateViewElement[]): IContainmentIndex {
+  const count = viewElements.length;
+  const right = viewElements.map((element) => element.x + element.width);
+  const bottom = viewElements.map((element) => element.y + element.height);
 
-  // Initialize all elements as non-compound
-  viewElements.forEach((element) => {
-    compoundElements.set(element.elementRef, false);
-  });
+  const order = Array.from({ length: count }, (_, i) => i).sort(
+    (a, b) =>
+      viewElements[a].x - viewElements[b].x ||
+      right[b] - right[a] ||
+      viewElements[a].y - viewElements[b].y ||
+      bottom[b] - bottom[a] ||
+      a - b,
+  );
+  const position = new Array<number>(count);
+  order.forEach((index, i) => (position[index] = i));
+
+  // Leaves of the segment tree are the distinct vertical coordinates
+  const ys = Array.from(new Set([...viewElements.map((element) => element.y), ...bottom])).sort(
+    (a, b) => a - b,
+  );
+  const yIndex = new Map(ys.map((y, i) => [y, i]));
+  let size = 1;
+  while (size < ys.length) {
+    size <<= 1;
+  }
+  const segments: (number[] | undefined)[] = new Array(2 * size);
+
+  const parents = new Array<number>(count).fill(-1);
+  const compoundRefs = new Set<string>();
 
-  // Check each pair of elements to identify parent-child relationships
-  for (const potentialParent of viewElements) {
-    for (const potentialChild of viewElements) {
-      // Skip self-comparison
-      if (potentialParent.elementRef === potentialChild.elementRef) {
+  for (const index of order) {
+    const child = viewElements[index];
+    let parent = -1;
+    let parentArea = Infinity;
+
+    for (let node = yIndex.get(child.y)! + size; node >= 1; node >>= 1) {
+      const candidates = segments[node];
+      if (!candidates) {
         continue;
       }
+      let kept = 0;
+      for (const candidate of candidates) {
+        // Containers start left of the sweep position and span the top edge of the
+        // child; those that end before the sweep position cannot contain anything
+        if (right[candidate] < child.x) {
+          continue;
+        }
+        candidates[kept++] = candidate;
+        if (right[candidate] < right[index] || bottom[candidate] < bottom[index]) {
+          continue;
+        }
+        const container = viewElements[candidate];
+        if (container.elementRef !== child.elementRef) {
+          compoundRefs.add(container.elementRef);
+          // Identical elements contain each other
+          if (
+            container.x === child.x &&
+            container.y === child.y &&
+            right[candidate] === right[index] &&
+            bottom[candidate] === bottom[index]
+          ) {
+            compoundRefs.add(child.elementRef);
+          }
+        }
+        const area = container.width * container.height;
+        if (area < parentArea || (area === parentArea && position[candidate] > position[parent])) {
+          parent = candidate;
+          parentArea = area;
+        }
+      }
+      candidates.length = kept;
+    }
+    parents[index] = parent;
 
-      // Check if the potential child is contained within the potential parent
-      if (isElementContainedWithin(potentialChild, potentialParent)) {
-        // Mark the parent as a compound element
-        compoundElements.set(potentialParent.elementRef, true);
+    // Add the element to the canonical nodes of its vertical extent
+    let low = yIndex.get(child.y)! + size;
+    let high = yIndex.get(bottom[index])! + size + 1;
+    while (low < high) {
+      if (low & 1) {
+        (segments[low++] ??= []).push(index);
       }
+      if (high & 1) {
+        (segments[--high] ??= []).push(index);
+      }
+      low >>= 1;
+      high >>= 1;
     }
   }
 
+  const children: number[][] = Array.from({ length: count }, () => []);
+  const roots: number[] = [];
+  parents.forEach((parent, index) => (parent === -1 ? roots : children[parent]).push(index));
+  return { parents, children, roots, compoundRefs };
+}
+
+/**
+ * Identifies compound elements in a view and marks them for top-aligned labels
+ * @param viewElements Array of view elements
+ * @returns A map of element references to boolean indicating if they are compound elements
+ */
+export function identifyCompoundElements(
+  viewElements: IArchiMateViewElement[],
+): Map<string, boolean> {
+  const { compoundRefs } = buildContainmentIndex(viewElements);
+  const compoundElements = new Map<string, boolean>();
+  viewElements.forEach((element) => {
+    compoundElements.set(element.elementRef, compoundRefs.has(element.elementRef));
+  });
   return compoundElements;
 }
 
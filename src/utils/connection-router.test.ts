@@ -0,0 +1,309 @@
+import { describe, expect, it } from 'vitest';
+import { ArchiMateRenderer } from '../index';
+import { IArchiMateViewElement, IPoint } from '../types';
+import { ObstacleGrid, OrthogonalRouter } from './connection-router';
+import { IRectangle } from './svg-generator';
+
+/**
+ * Seeded pseudo-random numbers (mulberry32), so failing layouts can be reproduced
+ * @param seed The seed
+ * @returns Function returning numbers in [0, 1)
+ */
+function createRandom(seed: number): () => number {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Create a view element of the size of an application component
+ * @param elementRef Reference of the model element
+ * @param x Left of the element
+ * @param y Top of the element
+ * @param width Width of the element
+ * @param height Height of the element
+ * @returns The view element
+ */
+function createElement(
+  elementRef: string,
+  x: number,
+  y: number,
+  width = 120,
+  height = 55,
+): IArchiMateViewElement {
+  return { elementRef, x, y, width, height };
+}
+
+/**
+ * Return the points of a routed connection, from the center of the source to the
+ * center of the target
+ * @param source Source element
+ * @param target Target element
+ * @param bendpoints Bendpoints returned by the router
+ * @returns The points of the polyline
+ */
+function routePoints(source: IRectangle, target: IRectangle, bendpoints: IPoint[]): IPoint[] {
+  const center = (rect: IRectangle): IPoint => ({
+    x: rect.x + rect.width / 2,
+    y: rect.y + rect.height / 2,
+  });
+  return [center(source), ...bendpoints, center(target)];
+}
+
+/**
+ * Check whether a horizontal or vertical segment crosses the interior of a rectangle
+ * @param from Start of the segment
+ * @param to End of the segment
+ * @param rect The rectangle
+ * @returns True if the segment crosses the interior
+ */
+function crossesInterior(from: IPoint, to: IPoint, rect: IRectangle): boolean {
+  const x1 = Math.min(from.x, to.x);
+  const x2 = Math.max(from.x, to.x);
+  const y1 = Math.min(from.y, to.y);
+  const y2 = Math.max(from.y, to.y);
+  return (
+    x1 < rect.x + rect.width &&
+    x2 > rect.x &&
+    y1 < rect.y + rect.height &&
+    y2 > rect.y &&
+    (x1 !== x2 || (x1 > rect.x && x1 < rect.x + rect.width)) &&
+    (y1 !== y2 || (y1 > rect.y && y1 < rect.y + rect.height))
+  );
+}
+
+/**
+ * Create a model of three application components and a flow from the first to the
+ * second. The first view shows the three, the second only the first two.
+ * @param blockerX Left of the third component in the first view
+ * @param blockerY Top of the third component in the first view
+ * @returns The model in the Open Exchange format
+ */
+function createModel(blockerX: number, blockerY: number): string {
+  const node = (id: string, elementRef: string, x: number, y: number): string =>
+    `<node identifier="${id}" elementRef="${elementRef}" xsi:type="Element" ` +
+    `x="${x}" y="${y}" w="120" h="55" />`;
+  const connection = (id: string, source: string, target: string): string =>
+    `<connection identifier="${id}" relationshipRef="flow" xsi:type="Relationship" ` +
+    `source="${source}" target="${target}" />`;
+  return `<?xml version="1.0" encoding="UTF-8"?>
+<model xmlns="http://www.opengroup.org/xsd/archimate/3.0/"
+  xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" identifier="model">
+  <name xml:lang="en">Routing</name>
+  <elements>
+    <element identifier="a" xsi:type="ApplicationComponent"><name xml:lang="en">A</name></element>
+    <element identifier="b" xsi:type="ApplicationComponent"><name xml:lang="en">B</name></element>
+    <element identifier="c" xsi:type="ApplicationComponent"><name xml:lang="en">C</name></element>
+  </elements>
+  <relationships>
+    <relationship identifier="flow" source="a" target="b" xsi:type="Flow" />
+  </relationships>
+  <views>
+    <diagrams>
+      <view identifier="blocked" xsi:type="Diagram">
+        <name xml:lang="en">Blocked</name>
+        ${node('blocked-a', 'a', 0, 0)}
+        ${node('blocked-b', 'b', 400, 0)}
+        ${node('blocked-c', 'c', blockerX, blockerY)}
+        ${connection('blocked-flow', 'blocked-a', 'blocked-b')}
+      </view>
+      <view identifier="clear" xsi:type="Diagram">
+        <name xml:lang="en">Clear</name>
+        ${node('clear-a', 'a', 0, 0)}
+        ${node('clear-b', 'b', 400, 0)}
+        ${connection('clear-flow', 'clear-a', 'clear-b')}
+      </view>
+    </diagrams>
+  </views>
+</model>`;
+}
+
+describe('ObstacleGrid', () => {
+  it('visits every rectangle that overlaps an area once', () => {
+    const random = createRandom(7);
+    const int = (max: number): number => Math.floor(random() * max);
+    const rectangles: IRectangle[] = Array.from({ length: 300 }, () => ({
+      x: int(2000),
+      y: int(2000),
+      width: 1 + int(300),
+      height: 1 + int(100),
+    }));
+    const grid = new ObstacleGrid(rectangles);
+
+    for (let query = 0; query < 200; query++) {
+      const x1 = int(2400) - 200;
+      const y1 = int(2400) - 200;
+      const x2 = x1 + int(400);
+      const y2 = y1 + int(400);
+      const visited: number[] = [];
+      grid.forEachNear(x1, y1, x2, y2, (index) => {
+        visited.push(index);
+      });
+
+      // Rectangles in the cells of the area may be visited too, but only once
+      expect(new Set(visited).size).toBe(visited.length);
+      rectangles.forEach((rect, index) => {
+        if (
+          rect.x <= x2 && rect.x + rect.width >= x1 && rect.y <= y2 && rect.y + rect.height >= y1
+        ) {
+          expect(visited).toContain(index);
+        }
+      });
+    }
+  });
+
+  it('stops when the visit returns true', () => {
+    const grid = new ObstacleGrid([createElement('a', 0, 0), createElement('b', 10, 10)]);
+    let visits = 0;
+
+    const stopped = grid.forEachNear(0, 0, 100, 100, () => ++visits === 1);
+
+    expect(stopped).toBe(true);
+    expect(visits).toBe(1);
+  });
+});
+
+describe('OrthogonalRouter', () => {
+  it('goes around the elements between the source and the target', () => {
+    const elements = [
+      createElement('a', 0, 0),
+      createElement('b', 400, 0),
+      createElement('c', 200, 0),
+      createElement('d', 200, -100),
+    ];
+    const router = new OrthogonalRouter(elements);
+
+    const bendpoints = router.route('flow', 0, 1);
+
+    expect(bendpoints.length).toBeGreaterThan(0);
+    const points = routePoints(elements[0], elements[1], bendpoints);
+    for (let i = 0; i < points.length - 1; i++) {
+      const from = points[i];
+      const to = points[i + 1];
+      expect(from.x === to.x || from.y === to.y).toBe(true);
+      expect(crossesInterior(from, to, elements[2])).toBe(false);
+      expect(crossesInterior(from, to, elements[3])).toBe(false);
+    }
+  });
+
+  it('avoids the elements of random views', () => {
+    const random = createRandom(2024);
+    const int = (max: number): number => Math.floor(random() * max);
+    for (let view = 0; view < 50; view++) {
+      // Elements on a grid of cells, so they never overlap and a clear route exists
+      const cells = new Set<number>();
+      const elements: IArchiMateViewElement[] = [];
+      while (elements.length < 12) {
+        const cell = int(36);
+        if (cells.has(cell)) continue;
+        cells.add(cell);
+        elements.push(
+          createElement(`e${elements.length}`, (cell % 6) * 200, Math.floor(cell / 6) * 120),
+        );
+      }
+      const router = new OrthogonalRouter(elements);
+
+      const bendpoints = router.route('flow', 0, 1);
+
+      if (bendpoints.length === 0) {
+        // Straight lines only join elements in the same row or column
+        expect(elements[0].x === elements[1].x || elements[0].y === elements[1].y).toBe(true);
+      }
+      const points = routePoints(elements[0], elements[1], bendpoints);
+      for (let i = 0; i < points.length - 1; i++) {
+        expect(points[i].x === points[i + 1].x || points[i].y === points[i + 1].y).toBe(true);
+        elements.slice(2).forEach((element) => {
+          expect(crossesInterior(points[i], points[i + 1], element)).toBe(false);
+        });
+      }
+    }
+  });
+
+  it('connects facing elements with nothing between them by a straight line', () => {
+    const router = new OrthogonalRouter([createElement('a', 0, 0), createElement('b', 400, 20)]);
+
+    expect(router.route('flow', 0, 1)).toEqual([]);
+  });
+
+  it('does not route connections of an element to itself', () => {
+    const router = new OrthogonalRouter([createElement('a', 0, 0)]);
+
+    expect(router.route('flow', 0, 0)).toEqual([]);
+  });
+
+  it('passes through elements that contain others', () => {
+    const elements = [
+      createElement('a', 0, 0),
+      createElement('b', 400, 0),
+      createElement('group', 160, -100, 200, 400),
+      createElement('c', 200, 200),
+    ];
+    const router = new OrthogonalRouter(elements);
+
+    expect(router.route('flow', 0, 1)).toEqual([]);
+  });
+
+  it('falls back to the straight line when every route crosses an element', () => {
+    // The target is walled in by overlapping walls, so every route crosses one of them
+    const elements = [
+      createElement('source', 0, 200, 50, 50),
+      createElement('target', 200, 200, 50, 50),
+      createElement('top', 150, 150, 150, 45),
+      createElement('bottom', 150, 255, 150, 45),
+      createElement('left', 150, 190, 40, 70),
+      createElement('right', 260, 190, 40, 70),
+    ];
+    const router = new OrthogonalRouter(elements);
+
+    expect(router.route('flow', 0, 1)).toEqual([]);
+  });
+
+  it('caches the routes of the view by connection key', () => {
+    const elements = [
+      createElement('a', 0, 0),
+      createElement('b', 400, 0),
+      createElement('c', 200, 0),
+    ];
+    const router = new OrthogonalRouter(elements);
+
+    const bendpoints = router.route('flow', 0, 1);
+
+    expect(router.route('flow', 0, 1)).toBe(bendpoints);
+    // The route of a key is not looked up again for other elements
+    expect(router.route('flow', 0, 2)).toBe(bendpoints);
+    expect(new OrthogonalRouter(elements).route('flow', 0, 1)).toEqual(bendpoints);
+  });
+});
+
+describe('ArchiMateRenderer routing', () => {
+  it('routes the connections of each view around the elements of that view', () => {
+    const direct = new ArchiMateRenderer().loadXml(createModel(200, 0));
+    const orthogonal = new ArchiMateRenderer({ routing: 'orthogonal' }).loadXml(
+      createModel(200, 0),
+    );
+
+    const blocked = orthogonal.renderView({ id: 'blocked' });
+    const clear = orthogonal.renderView({ id: 'clear' });
+
+    // Both views show the relationship, but only the first has an element in the way
+    expect(blocked).not.toBe(direct.renderView({ id: 'blocked' }));
+    expect(clear).toBe(direct.renderView({ id: 'clear' }));
+    expect(orthogonal.renderView({ id: 'blocked' })).toBe(blocked);
+  });
+
+  it('routes the connections again when a model is loaded', () => {
+    const direct = new ArchiMateRenderer().loadXml(createModel(200, 300));
+    const renderer = new ArchiMateRenderer({ routing: 'orthogonal' }).loadXml(
+      createModel(200, 0),
+    );
+    const blocked = renderer.renderView({ id: 'blocked' });
+
+    renderer.loadXml(createModel(200, 300));
+
+    expect(renderer.renderView({ id: 'blocked' })).not.toBe(blocked);
+    expect(renderer.renderView({ id: 'blocked' })).toBe(direct.renderView({ id: 'blocked' }));
+  });
+});
@@ -0,0 +1,393 @@
+/**
+ * Connection Router Utility
+ *
+ * This module routes connections without bendpoints as orthogonal polylines that go
+ * around the other elements of a view. The elements are kept in a uniform grid, so a
+ * route only tests the elements near its segments, and the bendpoints of every
+ * connection are cached by the router of the view.
+ */
+
+import { IArchiMateViewElement, IPoint } from '../types';
+import { buildContainmentIndex, isElementContainedWithin } from './compound-element-detector';
+import { IRectangle } from './svg-generator';
+
+/**
+ * How connections without bendpoints are drawn: 'direct' connects the elements with a
+ * straight line, 'orthogonal' routes horizontal and vertical segments around the other
+ * elements
+ */
+export type ConnectionRouting = 'direct' | 'orthogonal';
+
+// Distance kept between a detour and the element it goes around
+const ROUTE_MARGIN = 10;
+
+// Length a bend adds to a route when routes are compared
+const BEND_COST = 2 * ROUTE_MARGIN;
+
+// Number of routes tried before the one that crosses the fewest obstacles is used
+const MAX_ROUTE_ATTEMPTS = 32;
+
+// Number of horizontal and of vertical channels a route may run through
+const MAX_CHANNELS = 16;
+
+/**
+ * Uniform grid over the rectangles of a view. Every rectangle is listed in each cell it
+ * overlaps, so the rectangles near a segment are found by visiting the cells of the
+ * segment's bounding box.
+ */
+export class ObstacleGrid {
+  private readonly cellSize: number;
+  private readonly originX: number;
+  private readonly originY: number;
+  private readonly columns: number;
+  private readonly rows: number;
+  private readonly cells: (number[] | undefined)[];
+  // Query in which each rectangle was last visited, to report it once per query
+  private readonly visited: Uint32Array;
+  private query = 0;
+
+  /**
+   * Create the grid
+   * @param rectangles Rectangles to index
+   * @param cellSize Cell size; by default twice the median rectangle size
+   */
+  constructor(rectangles: IRectangle[], cellSize?: number) {
+    this.visited = new Uint32Array(rectangles.length);
+
+    let minX = Infinity,
+      minY = Infinity,
+      maxX = -Infinity,
+      maxY = -Infinity;
+    for (const rect of rectangles) {
+      minX = Math.min(minX, rect.x);
+      minY = Math.min(minY, rect.y);
+      maxX = Math.max(maxX, rect.x + rect.width);
+      maxY = Math.max(maxY, rect.y + rect.height);
+    }
+    if (rectangles.length === 0) {
+      minX = minY = maxX = maxY = 0;
+    }
+
+    if (cellSize === undefined) {
+      const sizes = rectangles
+        .map((rect) => Math.max(rect.width, rect.height))
+        .sort((a, b) => a - b);
+      cellSize = 2 * (sizes[sizes.length >> 1] || 1);
+      // Large containers around few elements would otherwise make the grid sparse
+      const maxCells = 4 * rectangles.length + 64;
+      const cellCount = (size: number): number =>
+        Math.ceil((maxX - minX + 1) / size) * Math.ceil((maxY - minY + 1) / size);
+      while (cellCount(cellSize) > maxCells) {
+        cellSize *= 2;
+      }
+    }
+    this.cellSize = cellSize;
+    this.originX = minX;
+    this.originY = minY;
+    this.columns = Math.max(1, Math.ceil((maxX - minX + 1) / cellSize));
+    this.rows = Math.max(1, Math.ceil((maxY - minY + 1) / cellSize));
+    this.cells = new Array(this.columns * this.rows);
+
+    rectangles.forEach((rect, index) => {
+      this.forEachCell(rect.x, rect.y, rect.x + rect.width, rect.y + rect.height, (cell) => {
+        (this.cells[cell] ??= []).push(index);
+      });
+    });
+  }
+
+  /**
+   * Call a function once for every rectangle in the cells that overlap an area, until
+   * it returns true
+   * @param x1 Left of the area
+   * @param y1 Top of the area
+   * @param x2 Right of the area
+   * @param y2 Bottom of the area
+   * @param visit Function called with the index of each rectangle
+   * @returns True if the visit was stopped
+   */
+  public forEachNear(
+    x1: number,
+    y1: number,
+    x2: number,
+    y2: number,
+    visit: (index: number) => boolean | void,
+  ): boolean {
+    const query = ++this.query;
+    return this.forEachCell(x1, y1, x2, y2, (cell) => {
+      const indices = this.cells[cell];
+      if (!indices) return false;
+      for (const index of indices) {
+        if (this.visited[index] !== query) {
+          this.visited[index] = query;
+          if (visit(index)) return true;
+        }
+      }
+      return false;
+    });
+  }
+
+  private forEachCell(
+    x1: number,
+    y1: number,
+    x2: number,
+    y2: number,
+    visit: (cell: number) => boolean | void,
+  ): boolean {
+    const clamp = (value: number, count: number): number => Math.max(0, Math.min(count - 1, value));
+    const column1 = clamp(Math.floor((x1 - this.originX) / this.cellSize), this.columns);
+    const column2 = clamp(Math.floor((x2 - this.originX) / this.cellSize), this.columns);
+    const row1 = clamp(Math.floor((y1 - this.originY) / this.cellSize), this.rows);
+    const row2 = clamp(Math.floor((y2 - this.originY) / this.cellSize), this.rows);
+    for (let row = row1; row <= row2; row++) {
+      for (let column = column1; column <= column2; column++) {
+        if (visit(row * this.columns + column)) return true;
+      }
+    }
+    return false;
+  }
+}
+
+/**
+ * A candidate route: its bendpoints and its length with the cost of its bends
+ */
+interface IRouteCandidate {
+  bendpoints: IPoint[];
+  cost: number;
+}
+
+/**
+ * Routes the connections of one view. Routes are cached by connection key, so
+ * rendering the view again reuses them.
+ */
+export class OrthogonalRouter {
+  private readonly elements: IArchiMateViewElement[];
+  private readonly obstacles: number[];
+  private readonly grid: ObstacleGrid;
+  private readonly routes = new Map<string, IPoint[]>();
+
+  /**
+   * Create a router for the elements of a view
+   * @param viewElements Array of view elements
+   */
+  constructor(viewElements: IArchiMateViewElement[]) {
+    this.elements = viewElements;
+    // Connections may pass through elements that contain others, like groups and
+    // locations; they go around the elements that do not
+    const { children } = buildContainmentIndex(viewElements);
+    this.obstacles = [];
+    children.forEach((nested, index) => {
+      if (nested.length === 0) this.obstacles.push(index);
+    });
+    this.grid = new ObstacleGrid(this.obstacles.map((index) => viewElements[index]));
+  }
+
+  /**
+   * Return the bendpoints of a connection, routing it the first time it is asked for
+   * @param key Key of the connection, such as the relationship reference
+   * @param source Index of the source element in the view
+   * @param target Index of the target element in the view
+   * @returns Bendpoints for generateConnectionWithRectangles(), empty for a straight line
+   */
+  public route(key: string, source: number, target: number): IPoint[] {
+    let bendpoints = this.routes.get(key);
+    if (bendpoints === undefined) {
+      bendpoints = this.findRoute(source, target);
+      this.routes.set(key, bendpoints);
+    }
+    return bendpoints;
+  }
+
+  /**
+   * Find the cheapest route that crosses no obstacles. Routes run through channels
+   * beside the source, the target and the obstacles in the way: with no bend when the
+   * elements face each other, one bend when each is outside the extent of the other,
+   * two bends through one channel, or three bends through a channel beside the source
+   * and one beside the target. When none of the routes tried is clear, the one that
+   * crosses the fewest obstacles is used.
+   */
+  private findRoute(source: number, target: number): IPoint[] {
+    if (source === target) return [];
+    const s = this.elements[source];
+    const t = this.elements[target];
+
+    const sourceCenter: IPoint = { x: s.x + s.width / 2, y: s.y + s.height / 2 };
+    const targetCenter: IPoint = { x: t.x + t.width / 2, y: t.y + t.height / 2 };
+
+    const outsideX = (x: number, rect: IRectangle): boolean =>
+      x <= rect.x || x >= rect.x + rect.width;
+    const outsideY = (y: number, rect: IRectangle): boolean =>
+      y <= rect.y || y >= rect.y + rect.height;
+
+    const candidates: IRouteCandidate[] = [];
+    const addCandidate = (bendpoints: IPoint[]): void => {
+      let cost = bendpoints.length * BEND_COST;
+      let previous = sourceCenter;
+      for (const point of bendpoints) {
+        cost += Math.abs(point.x - previous.x) + Math.abs(point.y - previous.y);
+        previous = point;
+      }
+      cost += Math.abs(targetCenter.x - previous.x) + Math.abs(targetCenter.y - previous.y);
+      candidates.push({ bendpoints, cost });
+    };
+
+    // Leave the source vertically to a horizontal channel and enter the target
+    // horizontally from a vertical channel, or the other way around
+    const addTurn = (x: number, y: number): void => {
+      if (outsideY(y, s) && outsideX(x, t) && x !== sourceCenter.x && y !== targetCenter.y) {
+        addCandidate([{ x: sourceCenter.x, y }, { x, y }, { x, y: targetCenter.y }]);
+      }
+      if (outsideX(x, s) && outsideY(y, t) && y !== sourceCenter.y && x !== targetCenter.x) {
+        addCandidate([{ x, y: sourceCenter.y }, { x, y }, { x: targetCenter.x, y }]);
+      }
+    };
+    const channelsX: number[] = [];
+    const channelsY: number[] = [];
+    const addChannelX = (x: number): void => {
+      if (channelsX.length >= MAX_CHANNELS || channelsX.includes(x)) return;
+      channelsX.push(x);
+      // Leave the source and enter the target horizontally
+      if (outsideX(x, s) && outsideX(x, t) && sourceCenter.y !== targetCenter.y) {
+        addCandidate([{ x, y: sourceCenter.y }, { x, y: targetCenter.y }]);
+      }
+      channelsY.forEach((y) => addTurn(x, y));
+    };
+    const addChannelY = (y: number): void => {
+      if (channelsY.length >= MAX_CHANNELS || channelsY.includes(y)) return;
+      channelsY.push(y);
+      // Leave the source and enter the target vertically
+      if (outsideY(y, s) && outsideY(y, t) && sourceCenter.x !== targetCenter.x) {
+        addCandidate([{ x: sourceCenter.x, y }, { x: targetCenter.x, y }]);
+      }
+      channelsX.forEach((x) => addTurn(x, y));
+    };
+    const addChannelsAround = (rect: IRectangle): void => {
+      addChannelX(rect.x - ROUTE_MARGIN);
+      addChannelX(rect.x + rect.width + ROUTE_MARGIN);
+      addChannelY(rect.y - ROUTE_MARGIN);
+      addChannelY(rect.y + rect.height + ROUTE_MARGIN);
+    };
+
+    // Elements that overlap along one axis are joined by a straight line
+    const horizontalOverlap = s.x < t.x + t.width && s.x + s.width > t.x;
+    const verticalOverlap = s.y < t.y + t.height && s.y + s.height > t.y;
+    if (horizontalOverlap || verticalOverlap) {
+      addCandidate([]);
+    }
+    if (outsideX(targetCenter.x, s) && outsideY(sourceCenter.y, t)) {
+      addCandidate([{ x: targetCenter.x, y: sourceCenter.y }]);
+    }
+    if (outsideY(targetCenter.y, s) && outsideX(sourceCenter.x, t)) {
+      addCandidate([{ x: sourceCenter.x, y: targetCenter.y }]);
+    }
+    // The middle of the gap between the elements
+    if (!horizontalOverlap) {
+      addChannelX((Math.max(s.x, t.x) + Math.min(s.x + s.width, t.x + t.width)) / 2);
+    }
+    if (!verticalOverlap) {
+      addChannelY((Math.max(s.y, t.y) + Math.min(s.y + s.height, t.y + t.height)) / 2);
+    }
+    addChannelsAround(s);
+    addChannelsAround(t);
+
+    // Try the cheapest route that has not been tried until one crosses no obstacles
+    let best: IPoint[] = [];
+    let bestBlockers = Infinity;
+    for (let attempt = 0; attempt < MAX_ROUTE_ATTEMPTS && candidates.length > 0; attempt++) {
+      let cheapest = 0;
+      for (let i = 1; i < candidates.length; i++) {
+        if (candidates[i].cost < candidates[cheapest].cost) cheapest = i;
+      }
+      const { bendpoints } = candidates[cheapest];
+      candidates[cheapest] = candidates[candidates.length - 1];
+      candidates.pop();
+
+      const points = this.routePoints(s, t, sourceCenter, targetCenter, bendpoints);
+      const blockers = this.findBlockers(points, s, t, bestBlockers);
+      if (blockers.length === 0) {
+        return bendpoints;
+      }
+      if (blockers.length < bestBlockers) {
+        best = bendpoints;
+        bestBlockers = blockers.length;
+      }
+      // Try channels that pass just beside the obstacles in the way
+      blockers.forEach(addChannelsAround);
+    }
+
+    return best;
+  }
+
+  /**
+   * Return the points of a route as generateConnectionWithRectangles() draws it.
+   * Routes with bendpoints start and end at the centers of the elements, of which the
+   * parts inside the source and target are not drawn.
+   */
+  private routePoints(
+    s: IRectangle,
+    t: IRectangle,
+    sourceCenter: IPoint,
+    targetCenter: IPoint,
+    bendpoints: IPoint[],
+  ): IPoint[] {
+    if (bendpoints.length > 0) {
+      return [sourceCenter, ...bendpoints, targetCenter];
+    }
+    if (s.x < t.x + t.width && s.x + s.width > t.x) {
+      const x = (Math.max(s.x, t.x) + Math.min(s.x + s.width, t.x + t.width)) / 2;
+      return [
+        { x, y: s.y > t.y ? s.y : s.y + s.height },
+        { x, y: t.y > s.y ? t.y : t.y + t.height },
+      ];
+    }
+    const y = (Math.max(s.y, t.y) + Math.min(s.y + s.height, t.y + t.height)) / 2;
+    return [
+      { x: s.x > t.x ? s.x : s.x + s.width, y },
+      { x: t.x > s.x ? t.x : t.x + t.width, y },
+    ];
+  }
+
+  /**
+   * Return the obstacles whose interior the segments of a route cross. The source and
+   * the obstacles in it only count after the segment that leaves it, and the target and
+   * the obstacles in it before the segment that enters it, as those segments are only
+   * drawn from the edge of the element. Stops when the limit is reached, as the route
+   * is then no better than one that was tried before.
+   */
+  private findBlockers(
+    points: IPoint[],
+    s: IArchiMateViewElement,
+    t: IArchiMateViewElement,
+    limit: number,
+  ): IRectangle[] {
+    const blockers = new Set<IRectangle>();
+    const last = points.length - 2;
+    for (let i = 0; i <= last; i++) {
+      const x1 = Math.min(points[i].x, points[i + 1].x);
+      const x2 = Math.max(points[i].x, points[i + 1].x);
+      const y1 = Math.min(points[i].y, points[i + 1].y);
+      const y2 = Math.max(points[i].y, points[i + 1].y);
+      this.grid.forEachNear(x1, y1, x2, y2, (obstacle) => {
+        const rect = this.elements[this.obstacles[obstacle]];
+        const leaving = i === 0 && isElementContainedWithin(rect, s);
+        const entering = i === last && isElementContainedWithin(rect, t);
+        if (leaving || entering) return;
+        // Segments are horizontal or vertical, so they cross the interior when both
+        // extents overlap it; running along an edge does not count
+        const crossesX =
+          x1 === x2
+            ? x1 > rect.x && x1 < rect.x + rect.width
+            : x1 < rect.x + rect.width && x2 > rect.x;
+        const crossesY =
+          y1 === y2
+            ? y1 > rect.y && y1 < rect.y + rect.height
+            : y1 < rect.y + rect.height && y2 > rect.y;
+        if (crossesX && crossesY) {
+          blockers.add(rect);
+        }
+        return blockers.size >= limit;
+      });
+      if (blockers.size >= limit) break;
+    }
+    return Array.from(blockers);
+  }
+}
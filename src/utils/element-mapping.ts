@@ -0,0 +1,458 @@
+/**
+ * Element Mapping
+ *
+ * This file exports the shape interfaces and the mapping of ArchiMate element types to
+ * their base shapes and icons. It holds no stencil geometry, so the icon renderer can
+ * import it without pulling in shape-data.ts.
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py to regenerate this file
+ */
+
+import { ArchiMateElementType } from '../types';
+
+// Define interfaces for the shape data
+export interface ISvgElement {
+  type: string;
+  d?: string;
+  x?: number;
+  y?: number;
+  width?: number;
+  height?: number;
+  stroke?: string;
+  strokeWidth?: number;
+  strokeLinecap?: string;
+  strokeLinejoin?: string;
+  strokeMiterlimit?: string;
+  fill?: string;
+  fillRule?: string;
+  [key: string]: unknown; // Additional properties depend on the element type
+}
+
+// Geometric bounding box of the elements of a shape
+export interface IShapeBounds {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+// Transform that moves the bounds of a shape to the origin and scales their longer side
+// to 1 (x' = scale * x + this.x, y' = scale * y + this.y); width and height are the size
+// of the transformed bounds
+export interface IUnitTransform {
+  scale: number;
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+export interface IShapeDefinition {
+  name: string;
+  width: number;
+  height: number;
+  elements: ISvgElement[];
+  bounds?: IShapeBounds;
+  unitTransform?: IUnitTransform;
+}
+
+export interface IElementMapping {
+  element: string;
+  icon: string;
+  base: string;
+}
+
+export interface IIconFragment {
+  svg: string; // Serialized <g> element with ICON_FILL_PLACEHOLDER for every overridable fill
+  defaultFill: string | null; // Fill used without an override, null if the elements differ
+}
+
+// Element mappings
+export const elementMappingData: IElementMapping[] = [
+  {
+    element: 'Application Collaboration',
+    icon: 'collaboration',
+    base: 'rectangle',
+  },
+  {
+    element: 'Application Component',
+    icon: 'application-component',
+    base: 'rectangle',
+  },
+  {
+    element: 'Application Event',
+    icon: 'event',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Application Function',
+    icon: 'function',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Application Interaction',
+    icon: 'interaction',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Application Interface',
+    icon: 'interface',
+    base: 'rectangle',
+  },
+  {
+    element: 'Application Process',
+    icon: 'process',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Application Service',
+    icon: 'service',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Artifact',
+    icon: 'artifact',
+    base: 'rectangle',
+  },
+  {
+    element: 'Assessment',
+    icon: 'assessment',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Business Actor',
+    icon: 'business-actor',
+    base: 'rectangle',
+  },
+  {
+    element: 'Business Collaboration',
+    icon: 'collaboration',
+    base: 'rectangle',
+  },
+  {
+    element: 'Business Event',
+    icon: 'event',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Business Function',
+    icon: 'function',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Business Interaction',
+    icon: 'interaction',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Business Interface',
+    icon: 'interface',
+    base: 'rectangle',
+  },
+  {
+    element: 'Business Object',
+    icon: 'object',
+    base: 'rectangle',
+  },
+  {
+    element: 'Business Process',
+    icon: 'process',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Business Role',
+    icon: 'role',
+    base: 'rectangle',
+  },
+  {
+    element: 'Business Service',
+    icon: 'service',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Capability',
+    icon: 'capability',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Communication Network',
+    icon: 'communication-network',
+    base: 'rectangle',
+  },
+  {
+    element: 'Constraint',
+    icon: 'constraint',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Contract',
+    icon: 'contract',
+    base: 'rectangle',
+  },
+  {
+    element: 'Course Of Action',
+    icon: 'course-of-action',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Data Object',
+    icon: 'object',
+    base: 'rectangle',
+  },
+  {
+    element: 'Deliverable',
+    icon: 'deliverable',
+    base: 'rectangle',
+  },
+  {
+    element: 'Device',
+    icon: 'device',
+    base: 'rectangle',
+  },
+  {
+    element: 'Distribution Network',
+    icon: 'distribution-network',
+    base: 'rectangle',
+  },
+  {
+    element: 'Driver',
+    icon: 'driver',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Equipment',
+    icon: 'equipment',
+    base: 'rectangle',
+  },
+  {
+    element: 'Facility',
+    icon: 'facility',
+    base: 'rectangle',
+  },
+  {
+    element: 'Gap',
+    icon: 'gap',
+    base: 'rectangle',
+  },
+  {
+    element: 'Goal',
+    icon: 'goal',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Implementation Event',
+    icon: 'event',
+    base: 'rectangle',
+  },
+  {
+    element: 'Location',
+    icon: 'location',
+    base: 'rectangle',
+  },
+  {
+    element: 'Material',
+    icon: 'material',
+    base: 'rectangle',
+  },
+  {
+    element: 'Meaning',
+    icon: 'meaning',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Node',
+    icon: 'node',
+    base: 'rectangle',
+  },
+  {
+    element: 'Outcome',
+    icon: 'outcome',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Path',
+    icon: 'path',
+    base: 'rectangle',
+  },
+  {
+    element: 'Plateau',
+    icon: 'plateau',
+    base: 'rectangle',
+  },
+  {
+    element: 'Principle',
+    icon: 'principle',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Product',
+    icon: 'product',
+    base: 'rectangle',
+  },
+  {
+    element: 'Representation',
+    icon: 'representation',
+    base: 'rectangle',
+  },
+  {
+    element: 'Requirement',
+    icon: 'requirement',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Resource',
+    icon: 'resource',
+    base: 'rectangle',
+  },
+  {
+    element: 'Stakeholder',
+    icon: 'role',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'System Software',
+    icon: 'system-software',
+    base: 'rectangle',
+  },
+  {
+    element: 'Technology Collaboration',
+    icon: 'collaboration',
+    base: 'rectangle',
+  },
+  {
+    element: 'Technology Event',
+    icon: 'event',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Technology Function',
+    icon: 'function',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Technology Interaction',
+    icon: 'interaction',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Technology Interface',
+    icon: 'interface',
+    base: 'rectangle',
+  },
+  {
+    element: 'Technology Process',
+    icon: 'process',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Technology Service',
+    icon: 'service',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Value Stream',
+    icon: 'value-stream',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Value',
+    icon: 'value',
+    base: 'chamfered-rectangle',
+  },
+  {
+    element: 'Work Package',
+    icon: 'work-package',
+    base: 'rounded-rectangle',
+  },
+  {
+    element: 'Relationship',
+    icon: 'path',
+    base: 'rectangle',
+  },
+  {
+    element: 'And Junction',
+    icon: 'none',
+    base: 'circle',
+  },
+  {
+    element: 'Or Junction',
+    icon: 'none',
+    base: 'circle',
+  },
+  {
+    element: 'Group',
+    icon: 'none',
+    base: 'rectangle',
+  },
+];
+
+// Create a mapping from ArchiMateElementType to element name
+export const elementTypeToNameMap: Record<string, string> = {
+  [ArchiMateElementType.BusinessActor]: 'Business Actor',
+  [ArchiMateElementType.BusinessRole]: 'Business Role',
+  [ArchiMateElementType.BusinessCollaboration]: 'Business Collaboration',
+  [ArchiMateElementType.BusinessInterface]: 'Business Interface',
+  [ArchiMateElementType.BusinessProcess]: 'Business Process',
+  [ArchiMateElementType.BusinessFunction]: 'Business Function',
+  [ArchiMateElementType.BusinessInteraction]: 'Business Interaction',
+  [ArchiMateElementType.BusinessEvent]: 'Business Event',
+  [ArchiMateElementType.BusinessService]: 'Business Service',
+  [ArchiMateElementType.BusinessObject]: 'Business Object',
+  [ArchiMateElementType.Contract]: 'Contract',
+  [ArchiMateElementType.Representation]: 'Representation',
+  [ArchiMateElementType.Product]: 'Product',
+  [ArchiMateElementType.ApplicationComponent]: 'Application Component',
+  [ArchiMateElementType.ApplicationCollaboration]: 'Application Collaboration',
+  [ArchiMateElementType.ApplicationInterface]: 'Application Interface',
+  [ArchiMateElementType.ApplicationFunction]: 'Application Function',
+  [ArchiMateElementType.ApplicationInteraction]: 'Application Interaction',
+  [ArchiMateElementType.ApplicationProcess]: 'Application Process',
+  [ArchiMateElementType.ApplicationEvent]: 'Application Event',
+  [ArchiMateElementType.ApplicationService]: 'Application Service',
+  [ArchiMateElementType.DataObject]: 'Data Object',
+  [ArchiMateElementType.Node]: 'Node',
+  [ArchiMateElementType.Device]: 'Device',
+  [ArchiMateElementType.SystemSoftware]: 'System Software',
+  [ArchiMateElementType.TechnologyCollaboration]: 'Technology Collaboration',
+  [ArchiMateElementType.TechnologyInterface]: 'Technology Interface',
+  [ArchiMateElementType.Path]: 'Path',
+  [ArchiMateElementType.CommunicationNetwork]: 'Communication Network',
+  [ArchiMateElementType.TechnologyFunction]: 'Technology Function',
+  [ArchiMateElementType.TechnologyProcess]: 'Technology Process',
+  [ArchiMateElementType.TechnologyInteraction]: 'Technology Interaction',
+  [ArchiMateElementType.TechnologyEvent]: 'Technology Event',
+  [ArchiMateElementType.TechnologyService]: 'Technology Service',
+  [ArchiMateElementType.Artifact]: 'Artifact',
+  [ArchiMateElementType.Equipment]: 'Equipment',
+  [ArchiMateElementType.Facility]: 'Facility',
+  [ArchiMateElementType.DistributionNetwork]: 'Distribution Network',
+  [ArchiMateElementType.Material]: 'Material',
+  [ArchiMateElementType.Stakeholder]: 'Stakeholder',
+  [ArchiMateElementType.Driver]: 'Driver',
+  [ArchiMateElementType.Assessment]: 'Assessment',
+  [ArchiMateElementType.Goal]: 'Goal',
+  [ArchiMateElementType.Outcome]: 'Outcome',
+  [ArchiMateElementType.Principle]: 'Principle',
+  [ArchiMateElementType.Requirement]: 'Requirement',
+  [ArchiMateElementType.Constraint]: 'Constraint',
+  [ArchiMateElementType.Meaning]: 'Meaning',
+  [ArchiMateElementType.Value]: 'Value',
+  [ArchiMateElementType.Resource]: 'Resource',
+  [ArchiMateElementType.Capability]: 'Capability',
+  [ArchiMateElementType.ValueStream]: 'Value Stream',
+  [ArchiMateElementType.CourseOfAction]: 'Course Of Action',
+  [ArchiMateElementType.WorkPackage]: 'Work Package',
+  [ArchiMateElementType.Deliverable]: 'Deliverable',
+  [ArchiMateElementType.ImplementationEvent]: 'Implementation Event',
+  [ArchiMateElementType.Plateau]: 'Plateau',
+  [ArchiMateElementType.Gap]: 'Gap',
+  [ArchiMateElementType.Relationship]: 'Relationship',
+  [ArchiMateElementType.AndJunction]: 'And Junction',
+  [ArchiMateElementType.OrJunction]: 'Or Junction',
+  [ArchiMateElementType.Group]: 'Group',
+  [ArchiMateElementType.Location]: 'Location',
+};
+
+// Placeholder substituted with the fill color when an icon fragment is rendered
+export const ICON_FILL_PLACEHOLDER = '{{fill}}';
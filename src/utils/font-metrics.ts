@@ -0,0 +1,54 @@
+/**
+ * Font Metrics
+ *
+ * This file exports the advance widths and kerning pairs of the label fonts, in font
+ * units, so that text-wrapper.ts can measure text without a browser.
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/font-metrics-gen.py to regenerate this file
+ */
+
+export interface IFontMetrics {
+  unitsPerEm: number;
+  // Advance of characters the tables do not contain
+  missingAdvance: number;
+  // Runs of consecutive characters: the first code point followed by their advances
+  advances: number[][];
+  // Kerning adjustments keyed by the two characters of a pair
+  kerning: Record<string, number>;
+}
+
+// Metrics keyed by the lowercase font family name
+export const fontMetricsData: Record<string, IFontMetrics> = {
+  arial: {
+    unitsPerEm: 1000,
+    missingAdvance: 750,
+    advances: [
+      [32, 278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278, 556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556, 1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556, 333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556, 556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584],
+      [160, 278, 333, 556, 556, 556, 556, 260, 556, 333, 737, 370, 556, 584, 333, 737, 552, 400, 549, 333, 333, 333, 576, 537, 333, 333, 333, 365, 556, 834, 834, 834, 611, 667, 667, 667, 667, 667, 667, 1000, 722, 667, 667, 667, 667, 278, 278, 278, 278, 722, 722, 778, 778, 778, 778, 778, 584, 778, 722, 722, 722, 722, 667, 667, 611, 556, 556, 556, 556, 556, 556, 889, 500, 556, 556, 556, 556, 278, 278, 278, 278, 556, 556, 556, 556, 556, 556, 556, 549, 611, 556, 556, 556, 556, 500, 556, 500, 667, 556, 667, 556, 667, 556, 722, 500, 722, 500, 722, 500, 722, 500, 722, 615, 722, 556, 667, 556, 667, 556, 667, 556, 667, 556, 667, 556, 778, 556, 778, 556, 778, 556, 778, 556, 722, 556, 722, 556, 278, 278, 278, 278, 278, 278, 278, 222, 278, 278, 735, 444, 500, 222, 667, 500, 500, 556, 222, 556, 222, 556, 292, 556, 334, 556, 222, 722, 556, 722, 556, 722, 556, 604, 723, 556, 778, 556, 778, 556, 778, 556, 1000, 944, 722, 333, 722, 333, 722, 333, 667, 500, 667, 500, 667, 500, 667, 500, 611, 278, 611, 375, 611, 278, 722, 556, 722, 556, 722, 556, 722, 556, 722, 556, 722, 556, 944, 722, 667, 500, 667, 611, 500, 611, 500, 611, 500, 222],
+      [8208, 333, 333, 556, 556, 1000, 1000, 418, 552, 222, 222, 222, 222, 333, 333, 333, 333, 556, 556, 350, 350, 278, 517, 1000, 278],
+      [8240, 1000, 1320, 188, 354, 354, 188, 354, 521, 324, 333, 333],
+      [8364, 556],
+    ],
+    kerning: {
+      ' A': -55, ' T': -18, ' Y': -18,
+      '11': -74,
+      'A ': -55, AT: -74, AV: -74, AW: -37, AY: -74, Av: -18, Aw: -18, Ay: -18, 'A’': -74,
+      'F,': -111, 'F.': -111, FA: -55,
+      'L ': -37, LT: -74, LV: -74, LW: -74, LY: -74, Ly: -37, 'L’': -55,
+      'P ': -18, 'P,': -129, 'P.': -129, PA: -74,
+      RT: -18, RV: -18, RW: -18, RY: -18,
+      'T ': -18, 'T,': -111, 'T-': -55, 'T.': -111, 'T:': -111, 'T;': -111, TA: -74, TO: -18, Ta: -111, Tc: -111, Te: -111, Ti: -37, To: -111, Tr: -37, Ts: -111, Tu: -37, Tw: -55, Ty: -55, 'T­': -55,
+      'V,': -92, 'V-': -55, 'V.': -92, 'V:': -37, 'V;': -37, VA: -74, Va: -74, Ve: -55, Vi: -18, Vo: -55, Vr: -37, Vu: -37, Vy: -37, 'V­': -55,
+      'W,': -55, 'W-': -18, 'W.': -55, 'W:': -18, 'W;': -18, WA: -37, Wa: -37, We: -18, Wo: -18, Wr: -18, Wu: -18, Wy: -9, 'W­': -18,
+      'Y ': -18, 'Y,': -129, 'Y-': -92, 'Y.': -129, 'Y:': -55, 'Y;': -65, YA: -74, Ya: -74, Ye: -92, Yi: -37, Yo: -92, Yp: -74, Yq: -92, Yu: -55, Yv: -55, 'Y­': -92,
+      ff: -18, 'f’': 18,
+      'r,': -55, 'r.': -55, 'r’': 37,
+      'v,': -74, 'v.': -74,
+      'w,': -55, 'w.': -55,
+      'y,': -74, 'y.': -74,
+      '‘‘': -18,
+      '’ ': -37, '’s': -18, '’’': -18,
+    },
+  },
+};
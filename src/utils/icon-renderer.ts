@@ -3,12 +3,20 @@
  * Icon Renderer
  *
  * This module provides utilities for rendering ArchiMate element icons
- * using the shape definitions from shape-data.ts.
+ * using the shape definitions registered in the shape store.
  */
 
-import { allShapesData, elementMappingData, elementTypeToNameMap, ISvgElement } from './shape-data';
+import {
+  elementMappingData,
+  elementTypeToNameMap,
+  ICON_FILL_PLACEHOLDER,
+  IElementMapping,
+  IShapeDefinition,
+  ISvgElement,
+} from './element-mapping';
 import { ArchiMateElementType } from '../types';
 import { ElementShapeGenerator } from './shape-registry';
+import { getIconFragment, getShape, loadShapes } from './shape-store';
 import { rectangleShape } from './shapes/rectangle-shapes';
 import { roundedRectangleShape } from './shapes/rounded-rectangle-shapes';
 import { circleShape } from './shapes/circle-shapes';
@@ -18,6 +26,26 @@ import { chamferedRectangleShape } from './shapes/chamfered-rectangle-shapes';
 const ICON_PADDING = 5; // Padding from the edge of the shape
 const ICON_SIZE = 15; // Fixed size for icons in pixels
 const MIN_SHAPE_SIZE_FOR_ICON = 10; // Minimum shape size to show an icon
+const RENDERED_ICON_CACHE_LIMIT = 1024; // Maximum number of memoized icon renderings
+
+// Lookup table built once from the generated element mappings
+const elementMappingsByName = new Map<string, IElementMapping>(
+  elementMappingData.map((mapping) => [mapping.element, mapping]),
+);
+
+// Rendered icons keyed by icon name and fill color
+const renderedIconCache = new Map<string, string>();
+
+// Placement of an icon in the top-right corner of an element: the icon is drawn with
+// translate(width - right, top) scale(scale)
+interface IIconPlacement {
+  scale: number;
+  right: number;
+  top: number;
+}
+
+// Icon placements computed once per shape definition
+const iconPlacementCache = new WeakMap<IShapeDefinition, IIconPlacement>();
 
 // Map of base shape names to their generator functions
 const baseShapeGenerators: Record<string, ElementShapeGenerator> = {
@@ -104,25 +132,88 @@ function renderRectElement(element: ISvgElement, fillColor?: string): string {
   />`;
 }
 
+/**
+ * Render an icon element by element from its shape data
+ * @param iconShape The shape definition of the icon
+ * @param fillColor Optional fill color override
+ * @returns SVG string for the icon
+ */
+function renderIconElements(iconShape: IShapeDefinition, fillColor?: string): string {
+  const svgElements = iconShape.elements
+    .map((element) => renderSvgElement(element, fillColor))
+    .join('\n');
+
+  return `<g>${svgElements}</g>`;
+}
+
 /**
  * Render an icon from shape data
+ *
+ * Icons are rendered from the fragments pre-serialized by ts-file-gen.py by substituting
+ * the fill color, and memoized per icon and fill color. Elements drawn with layer classes
+ * pass LAYER_FILL from theme.ts, so an icon is rendered once for all layers.
  * @param iconName The name of the icon to render
  * @param fillColor Optional fill color override
  * @returns SVG string for the icon or empty string if icon not found
  */
 function renderIcon(iconName: string, fillColor?: string): string {
-  const iconShape = allShapesData.find((shape) => shape.name === iconName);
+  const cacheKey = `${iconName}|${fillColor || ''}`;
+  const cached = renderedIconCache.get(cacheKey);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const iconShape = getShape(iconName);
 
   if (!iconShape) {
     console.warn(`Icon shape not found: ${iconName}`);
     return '';
   }
 
-  const svgElements = iconShape.elements
-    .map((element) => renderSvgElement(element, fillColor))
-    .join('\n');
+  const fragment = getIconFragment(iconName);
+  const fill = fillColor || fragment?.defaultFill;
 
-  return `<g>${svgElements}</g>`;
+  // Fall back to element-wise rendering if there is no fragment for the icon, or if
+  // its elements have different default fills and no override is given
+  const iconSvg =
+    fragment && fill !== null && fill !== undefined
+      ? fragment.svg.split(ICON_FILL_PLACEHOLDER).join(fill)
+      : renderIconElements(iconShape, fillColor);
+
+  if (renderedIconCache.size >= RENDERED_ICON_CACHE_LIMIT) {
+    renderedIconCache.clear();
+  }
+  renderedIconCache.set(cacheKey, iconSvg);
+
+  return iconSvg;
+}
+
+/**
+ * Get the placement of an icon in the top-right corner of an element
+ *
+ * The geometric bounds of the icon are fitted in the icon box using the unit transform
+ * computed by convert.py, so icons whose SVG has padding are not drawn off-center.
+ * Shapes without a unit transform are fitted by their nominal width and height.
+ * @param iconShape The shape definition of the icon
+ * @returns The scale and the offsets of the icon from the top-right corner
+ */
+function getIconPlacement(iconShape: IShapeDefinition): IIconPlacement {
+  let placement = iconPlacementCache.get(iconShape);
+  if (placement === undefined) {
+    const unit = iconShape.unitTransform;
+    if (unit) {
+      placement = {
+        scale: ICON_SIZE * unit.scale,
+        right: ICON_PADDING + ICON_SIZE * (unit.width - unit.x),
+        top: ICON_PADDING + ICON_SIZE * unit.y,
+      };
+    } else {
+      const scale = ICON_SIZE / Math.max(iconShape.width, iconShape.height);
+      placement = { scale, right: ICON_PADDING + iconShape.width * scale, top: ICON_PADDING };
+    }
+    iconPlacementCache.set(iconShape, placement);
+  }
+  return placement;
 }
 
 /**
@@ -142,7 +233,7 @@ function getElementMapping(
   }
 
   // Find the mapping for this element name
-  const mapping = elementMappingData.find((mapping) => mapping.element === elementName);
+  const mapping = elementMappingsByName.get(elementName);
 
   if (!mapping) {
     console.warn(`Element mapping not found for: ${elementName}`);
@@ -177,7 +268,7 @@ function createIconShapeGenerator(
     const baseShape = baseShapeGenerator(x, y, width, height, label, style);
 
     // Find the icon shape
-    const iconShape = allShapesData.find((shape) => shape.name === iconName);
+    const iconShape = getShape(iconName);
 
     if (!iconShape) {
       // If icon not found, just return the base shape
@@ -189,15 +280,11 @@ function createIconShapeGenerator(
       return baseShape;
     }
 
-    // Calculate scale based on fixed icon size instead of shape dimensions
-    const iconScale = ICON_SIZE / Math.max(iconShape.width, iconShape.height);
-
-    // Calculate the scaled dimensions
-    const scaledIconWidth = iconShape.width * iconScale;
-
     // Position the icon in the top-right corner with padding
-    const iconX = width - scaledIconWidth - ICON_PADDING;
-    const iconY = ICON_PADDING;
+    const placement = getIconPlacement(iconShape);
+    const iconScale = placement.scale;
+    const iconX = width - placement.right;
+    const iconY = placement.top;
 
     // Render the icon
     const iconSvg = renderIcon(iconName, style.fillColor as string | undefined);
@@ -227,6 +314,49 @@ function createIconShapeGenerator(
   };
 }
 
+/**
+ * Load the icon shapes of the given ArchiMate element types from their shape modules
+ * @param elementTypes The ArchiMate element types that will be rendered
+ * @returns Promise resolving once the icons of all element types are loaded
+ */
+export function loadElementTypeIcons(
+  elementTypes: Iterable<ArchiMateElementType | string>,
+): Promise<void> {
+  const iconNames: string[] = [];
+  for (const elementType of elementTypes) {
+    const mapping = getElementMapping(elementType);
+    // Junctions and groups have no icon
+    if (mapping && mapping.icon !== mapping.base && mapping.icon !== 'none') {
+      iconNames.push(mapping.icon);
+    }
+  }
+  return loadShapes(iconNames);
+}
+
+/**
+ * Get the shape data the given ArchiMate element types are rendered from: the element
+ * mapping of each type with the shape definition and icon fragment of its icon. The
+ * icons of shapes loaded on demand must be loaded first; see loadElementTypeIcons().
+ * @param elementTypes The ArchiMate element types that will be rendered
+ * @returns The element type, mapping, icon shape and icon fragment of every element type
+ */
+export function getElementTypeIconData(
+  elementTypes: Iterable<ArchiMateElementType | string>,
+): unknown[] {
+  return Array.from(new Set(elementTypes), (elementType) => {
+    const mapping = getElementMapping(elementType);
+    if (!mapping || mapping.icon === mapping.base || mapping.icon === 'none') {
+      return [elementType, mapping ?? null];
+    }
+    return [
+      elementType,
+      mapping,
+      getShape(mapping.icon) ?? null,
+      getIconFragment(mapping.icon) ?? null,
+    ];
+  });
+}
+
 /**
  * Create a shape generator for an ArchiMate element type
  * @param elementType The ArchiMate element type
@@ -1,45 +1,18 @@
 /**
  * Shape Data
  *
- * This file exports the shape definitions and element mappings as TypeScript objects.
+ * This file exports the shape definitions and their icon fragments as TypeScript objects.
  * This approach is more compatible with various build systems than importing JSON directly.
  *
  * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
- * Use generate_shape_data.py to regenerate this file
+ * Use src/utils/svg-shapes/ts-file-gen.py to regenerate this file
  */
 
-import { ArchiMateElementType } from '../types';
+import type { IIconFragment, IShapeDefinition } from './element-mapping';
 
-// Define interfaces for the shape data
-export interface ISvgElement {
-  type: string;
-  d?: string;
-  x?: number;
-  y?: number;
-  width?: number;
-  height?: number;
-  stroke?: string;
-  strokeWidth?: number;
-  strokeLinecap?: string;
-  strokeLinejoin?: string;
-  strokeMiterlimit?: string;
-  fill?: string;
-  fillRule?: string;
-  [key: string]: unknown; // Additional properties depend on the element type
-}
-
-export interface IShapeDefinition {
-  name: string;
-  width: number;
-  height: number;
-  elements: ISvgElement[];
-}
-
-export interface IElementMapping {
-  element: string;
-  icon: string;
-  base: string;
-}
+// The interfaces and element mappings are kept apart, so that code which loads the
+// shapes on demand does not have to import this module
+export * from './element-mapping';
 
 // All shape definitions
 export const allShapesData: IShapeDefinition[] = [
@@ -59,16 +32,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M1.5 5.5 18.5 5.5 18.5 11.5 1.5 11.5Z',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: '#FFFFFF',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M1.5 16.5 18.5 16.5 18.5 22.5 1.5 22.5Z',
+        d: 'M1.5 5.5 18.5 5.5 18.5 11.5 1.5 11.5ZM1.5 16.5 18.5 16.5 18.5 22.5 1.5 22.5Z',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeMiterlimit: '1',
@@ -76,6 +40,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 49.0,
+      height: 31.0,
+    },
+    unitTransform: {
+      scale: 0.020408,
+      x: -0.030612,
+      y: -0.030612,
+      width: 1.0,
+      height: 0.632653,
+    },
   },
   {
     name: 'artifact',
@@ -99,6 +76,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 0.0,
+      width: 42.5,
+      height: 21.5,
+    },
+    unitTransform: {
+      scale: 0.023529,
+      x: -0.023529,
+      y: 0.0,
+      width: 1.0,
+      height: 0.505882,
+    },
   },
   {
     name: 'assessment',
@@ -136,6 +126,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 0.0,
+      width: 34.5,
+      height: 35.5,
+    },
+    unitTransform: {
+      scale: 0.028169,
+      x: -0.028169,
+      y: 0.0,
+      width: 0.971831,
+      height: 1.0,
+    },
   },
   {
     name: 'business-actor',
@@ -184,6 +187,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 18.5,
+      height: 33.5,
+    },
+    unitTransform: {
+      scale: 0.029851,
+      x: -0.029851,
+      y: -0.029851,
+      width: 0.552239,
+      height: 1.0,
+    },
   },
   {
     name: 'capability',
@@ -207,25 +223,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M12.5 21.5 34.5 21.5',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M23.5 11.5 34.5 11.5',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M12.5 21.5 12.5 31.5',
+        d: 'M12.5 21.5 34.5 21.5M23.5 11.5 34.5 11.5',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeMiterlimit: '1',
@@ -234,7 +232,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M23.5 11.5 23.5 31.5',
+        d: 'M12.5 21.5 12.5 31.5M23.5 11.5 23.5 31.5',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeMiterlimit: '1',
@@ -242,6 +240,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 33.5,
+      height: 30.5,
+    },
+    unitTransform: {
+      scale: 0.029851,
+      x: -0.029851,
+      y: -0.029851,
+      width: 1.0,
+      height: 0.910448,
+    },
   },
   {
     name: 'collaboration',
@@ -276,6 +287,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 49.0,
+      height: 29.0,
+    },
+    unitTransform: {
+      scale: 0.020408,
+      x: -0.030612,
+      y: -0.030612,
+      width: 1.0,
+      height: 0.591837,
+    },
   },
   {
     name: 'communication-network',
@@ -357,6 +381,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 4.5,
+      y: 6.0,
+      width: 29.0,
+      height: 18.0,
+    },
+    unitTransform: {
+      scale: 0.034483,
+      x: -0.155172,
+      y: -0.206897,
+      width: 1.0,
+      height: 0.62069,
+    },
   },
   {
     name: 'constraint',
@@ -388,6 +425,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 60.5,
+      height: 27.5,
+    },
+    unitTransform: {
+      scale: 0.016529,
+      x: -0.016529,
+      y: -0.016529,
+      width: 1.0,
+      height: 0.454545,
+    },
   },
   {
     name: 'contract',
@@ -405,26 +455,26 @@ export const allShapesData: IShapeDefinition[] = [
         fill: '#FFFF00',
       },
       {
-        type: 'rect',
-        x: 1.5,
-        y: 1.5,
-        width: 53.0,
-        height: 7.0,
-        stroke: '#002346',
-        strokeWidth: 2.0,
-        fill: '#FFFF00',
-      },
-      {
-        type: 'rect',
-        x: 1.5,
-        y: 21.5,
-        width: 53.0,
-        height: 7.0,
+        type: 'path',
+        d: 'M1.5 1.5H54.5V8.5H1.5ZM1.5 21.5H54.5V28.5H1.5Z',
         stroke: '#002346',
         strokeWidth: 2.0,
         fill: '#FFFF00',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 27.0,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028302,
+      width: 1.0,
+      height: 0.509434,
+    },
   },
   {
     name: 'course-of-action',
@@ -482,6 +532,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 3.0,
+      y: 1.0,
+      width: 48.37,
+      height: 38.0,
+    },
+    unitTransform: {
+      scale: 0.020672,
+      x: -0.062017,
+      y: -0.020774,
+      width: 1.0,
+      height: 0.785451,
+    },
   },
   {
     name: 'deliverable',
@@ -498,6 +561,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 30.93,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028302,
+      width: 1.0,
+      height: 0.58356,
+    },
   },
   {
     name: 'device',
@@ -530,6 +606,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 0.5,
+      width: 45.5,
+      height: 23.0,
+    },
+    unitTransform: {
+      scale: 0.021978,
+      x: -0.021978,
+      y: -0.010989,
+      width: 1.0,
+      height: 0.505495,
+    },
   },
   {
     name: 'distribution-network',
@@ -618,6 +707,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 2.0,
+      y: 2.0,
+      width: 50.0,
+      height: 21.0,
+    },
+    unitTransform: {
+      scale: 0.02,
+      x: -0.04,
+      y: -0.04,
+      width: 1.0,
+      height: 0.42,
+    },
   },
   {
     name: 'driver',
@@ -690,6 +792,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 38.0,
+      height: 38.0,
+    },
+    unitTransform: {
+      scale: 0.026316,
+      x: -0.039474,
+      y: -0.039474,
+      width: 1.0,
+      height: 1.0,
+    },
   },
   {
     name: 'equipment',
@@ -709,18 +824,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M16.34 23.5C17.46 23.51 18.59 23.79 19.75 24.35 21.98 25.43 23.5 28.1 23.23 30.48 23.13 31.32 22.73 32.53 22.32 33.2 21.83 34.01 20.64 35.05 19.68 35.52 18.16 36.27 16.71 36.5 15.19 36.25 13.55 35.98 11.86 35.09 10.95 34.04 10.68 33.73 10.24 33.03 9.97 32.49 8.5 29.53 9.86 25.85 12.99 24.32 14.11 23.77 15.22 23.5 16.34 23.5Z',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeLinecap: 'round',
-        strokeLinejoin: 'round',
-        strokeMiterlimit: '10',
-        fill: '#FFFFFF',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M32.35 7.61C33.4 7.66 33.72 7.74 34.46 8.11 36.21 8.99 37.3 10.57 37.42 12.4 37.5 13.7 37.27 14.6 36.62 15.6 35.36 17.54 32.7 18.5 30.4 17.85 29.36 17.56 28.76 17.19 27.92 16.35 26.87 15.28 26.5 14.36 26.5 12.81 26.5 11.44 26.86 10.43 27.68 9.5 28.94 8.07 30.34 7.5 32.35 7.61Z',
+        d: 'M16.34 23.5C17.46 23.51 18.59 23.79 19.75 24.35 21.98 25.43 23.5 28.1 23.23 30.48 23.13 31.32 22.73 32.53 22.32 33.2 21.83 34.01 20.64 35.05 19.68 35.52 18.16 36.27 16.71 36.5 15.19 36.25 13.55 35.98 11.86 35.09 10.95 34.04 10.68 33.73 10.24 33.03 9.97 32.49 8.5 29.53 9.86 25.85 12.99 24.32 14.11 23.77 15.22 23.5 16.34 23.5ZM32.35 7.61C33.4 7.66 33.72 7.74 34.46 8.11 36.21 8.99 37.3 10.57 37.42 12.4 37.5 13.7 37.27 14.6 36.62 15.6 35.36 17.54 32.7 18.5 30.4 17.85 29.36 17.56 28.76 17.19 27.92 16.35 26.87 15.28 26.5 14.36 26.5 12.81 26.5 11.44 26.86 10.43 27.68 9.5 28.94 8.07 30.34 7.5 32.35 7.61Z',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeLinecap: 'round',
@@ -730,6 +834,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 41.97,
+      height: 42.99,
+    },
+    unitTransform: {
+      scale: 0.023263,
+      x: -0.03496,
+      y: -0.034895,
+      width: 0.976388,
+      height: 1.0,
+    },
   },
   {
     name: 'event',
@@ -746,6 +863,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 0.5,
+      width: 53.0,
+      height: 27.0,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.009434,
+      width: 1.0,
+      height: 0.509434,
+    },
   },
   {
     name: 'facility',
@@ -762,6 +892,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 35.0,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028302,
+      width: 1.0,
+      height: 0.660377,
+    },
   },
   {
     name: 'function',
@@ -778,6 +921,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 49.0,
+      height: 31.0,
+    },
+    unitTransform: {
+      scale: 0.020408,
+      x: -0.030612,
+      y: -0.030612,
+      width: 1.0,
+      height: 0.632653,
+    },
   },
   {
     name: 'gap',
@@ -795,16 +951,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M1.5 10.5 48.5 10.5',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M1.5 20.5 48.5 20.5',
+        d: 'M1.5 10.5 48.5 10.5M1.5 20.5 48.5 20.5',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeMiterlimit: '1',
@@ -812,6 +959,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 47.0,
+      height: 29.0,
+    },
+    unitTransform: {
+      scale: 0.021277,
+      x: -0.031915,
+      y: -0.031915,
+      width: 1.0,
+      height: 0.617021,
+    },
   },
   {
     name: 'goal',
@@ -847,6 +1007,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 37.0,
+      height: 37.0,
+    },
+    unitTransform: {
+      scale: 0.027028,
+      x: -0.040624,
+      y: -0.04057,
+      width: 0.999946,
+      height: 1.0,
+    },
   },
   {
     name: 'interaction',
@@ -855,16 +1028,7 @@ export const allShapesData: IShapeDefinition[] = [
     elements: [
       {
         type: 'path',
-        d: 'M16.5 31.5 16.5 1.5C16.5 1.5 1.5 1.5 1.5 16.5 1.5 31.5 16.5 31.5 16.5 31.5Z',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: '#FFFFFF',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M22.5 31.5 22.5 1.5C22.5 1.5 37.5 1.5 37.5 16.5 37.5 31.5 22.5 31.5 22.5 31.5Z',
+        d: 'M16.5 31.5 16.5 1.5C16.5 1.5 1.5 1.5 1.5 16.5 1.5 31.5 16.5 31.5 16.5 31.5ZM22.5 31.5 22.5 1.5C22.5 1.5 37.5 1.5 37.5 16.5 37.5 31.5 22.5 31.5 22.5 31.5Z',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeMiterlimit: '1',
@@ -872,6 +1036,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 36.0,
+      height: 30.0,
+    },
+    unitTransform: {
+      scale: 0.027778,
+      x: -0.041667,
+      y: -0.041667,
+      width: 1.0,
+      height: 0.833333,
+    },
   },
   {
     name: 'interface',
@@ -897,6 +1074,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 44.0,
+      height: 29.0,
+    },
+    unitTransform: {
+      scale: 0.022727,
+      x: -0.034091,
+      y: -0.034091,
+      width: 1.0,
+      height: 0.659091,
+    },
   },
   {
     name: 'location',
@@ -919,6 +1109,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.05,
+      y: 1.27,
+      width: 23.43,
+      height: 32.23,
+    },
+    unitTransform: {
+      scale: 0.031028,
+      x: -0.03245,
+      y: -0.039445,
+      width: 0.726928,
+      height: 1.0,
+    },
   },
   {
     name: 'material',
@@ -989,6 +1192,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 43.5,
+      height: 34.5,
+    },
+    unitTransform: {
+      scale: 0.022989,
+      x: -0.022989,
+      y: -0.022989,
+      width: 1.0,
+      height: 0.793103,
+    },
   },
   {
     name: 'meaning',
@@ -1041,6 +1257,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.31,
+      width: 58.1,
+      height: 36.19,
+    },
+    unitTransform: {
+      scale: 0.017211,
+      x: -0.017211,
+      y: -0.022568,
+      width: 1.0,
+      height: 0.622849,
+    },
   },
   {
     name: 'node',
@@ -1087,6 +1316,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 46.5,
+      height: 23.5,
+    },
+    unitTransform: {
+      scale: 0.021505,
+      x: -0.021505,
+      y: -0.021505,
+      width: 1.0,
+      height: 0.505376,
+    },
   },
   {
     name: 'object',
@@ -1114,6 +1356,19 @@ export const allShapesData: IShapeDefinition[] = [
         fill: '#FFFFFF',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 27.0,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028302,
+      width: 1.0,
+      height: 0.509434,
+    },
   },
   {
     name: 'outcome',
@@ -1185,6 +1440,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 2.5,
+      width: 43.0,
+      height: 43.0,
+    },
+    unitTransform: {
+      scale: 0.023256,
+      x: -0.034908,
+      y: -0.058141,
+      width: 1.0,
+      height: 1.0,
+    },
   },
   {
     name: 'path',
@@ -1193,16 +1461,7 @@ export const allShapesData: IShapeDefinition[] = [
     elements: [
       {
         type: 'path',
-        d: 'M14.5 2.5C14.5 2.5 2.5 8.75 2.5 10.0 2.5 11.25 14.5 17.5 14.5 17.5',
-        stroke: 'black',
-        strokeWidth: 2.6,
-        strokeMiterlimit: '1',
-        fill: '#FFFFFF',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M27.5 2.5C27.5 2.5 38.5 8.75 38.5 10.0 38.5 11.25 27.5 17.5 27.5 17.5',
+        d: 'M14.5 2.5C14.5 2.5 2.5 8.75 2.5 10.0 2.5 11.25 14.5 17.5 14.5 17.5M27.5 2.5C27.5 2.5 38.5 8.75 38.5 10.0 38.5 11.25 27.5 17.5 27.5 17.5',
         stroke: 'black',
         strokeWidth: 2.6,
         strokeMiterlimit: '1',
@@ -1211,16 +1470,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M12.5 10.5 17.5 10.5',
-        stroke: 'black',
-        strokeWidth: 2.6,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M23.5 10.5 29.5 10.5',
+        d: 'M12.5 10.5 17.5 10.5M23.5 10.5 29.5 10.5',
         stroke: 'black',
         strokeWidth: 2.6,
         strokeMiterlimit: '1',
@@ -1228,6 +1478,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 2.5,
+      y: 2.5,
+      width: 36.0,
+      height: 15.0,
+    },
+    unitTransform: {
+      scale: 0.027778,
+      x: -0.069444,
+      y: -0.069444,
+      width: 1.0,
+      height: 0.416667,
+    },
   },
   {
     name: 'plateau',
@@ -1236,25 +1499,7 @@ export const allShapesData: IShapeDefinition[] = [
     elements: [
       {
         type: 'path',
-        d: 'M10.5 3.5 41.5 3.5',
-        stroke: 'black',
-        strokeWidth: 5.42,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M6.5 15.5 37.5 15.5',
-        stroke: 'black',
-        strokeWidth: 5.42,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M0.5 27.5 32.5 27.5',
+        d: 'M10.5 3.5 41.5 3.5M6.5 15.5 37.5 15.5M0.5 27.5 32.5 27.5',
         stroke: 'black',
         strokeWidth: 5.42,
         strokeMiterlimit: '1',
@@ -1262,6 +1507,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 0.5,
+      y: 3.5,
+      width: 41.0,
+      height: 24.0,
+    },
+    unitTransform: {
+      scale: 0.02439,
+      x: -0.012195,
+      y: -0.085366,
+      width: 1.0,
+      height: 0.585366,
+    },
   },
   {
     name: 'principle',
@@ -1308,6 +1566,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.77,
+      y: 1.0,
+      width: 38.96,
+      height: 33.83,
+    },
+    unitTransform: {
+      scale: 0.025666,
+      x: -0.04541,
+      y: -0.025666,
+      width: 1.0,
+      height: 0.868216,
+    },
   },
   {
     name: 'process',
@@ -1324,6 +1595,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 51.0,
+      height: 26.0,
+    },
+    unitTransform: {
+      scale: 0.019608,
+      x: -0.029412,
+      y: -0.029412,
+      width: 1.0,
+      height: 0.509804,
+    },
   },
   {
     name: 'product',
@@ -1351,6 +1635,19 @@ export const allShapesData: IShapeDefinition[] = [
         fill: '#FFFF00',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 27.0,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028302,
+      width: 1.0,
+      height: 0.509434,
+    },
   },
   {
     name: 'representation',
@@ -1376,6 +1673,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 27.0,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028302,
+      width: 1.0,
+      height: 0.509434,
+    },
   },
   {
     name: 'requirement',
@@ -1398,6 +1708,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 66.5,
+      height: 30.5,
+    },
+    unitTransform: {
+      scale: 0.015038,
+      x: -0.015038,
+      y: -0.015038,
+      width: 1.0,
+      height: 0.458647,
+    },
   },
   {
     name: 'resource',
@@ -1432,25 +1755,7 @@ export const allShapesData: IShapeDefinition[] = [
       },
       {
         type: 'path',
-        d: 'M10.5 6.5 10.5 19.5',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M19.5 6.5 19.5 19.5',
-        stroke: 'black',
-        strokeWidth: 2.0,
-        strokeMiterlimit: '1',
-        fill: 'none',
-        fillRule: 'evenodd',
-      },
-      {
-        type: 'path',
-        d: 'M27.5 6.5 27.5 19.5',
+        d: 'M10.5 6.5 10.5 19.5M19.5 6.5 19.5 19.5M27.5 6.5 27.5 19.5',
         stroke: 'black',
         strokeWidth: 2.0,
         strokeMiterlimit: '1',
@@ -1458,6 +1763,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.52,
+      width: 53.0,
+      height: 23.96,
+    },
+    unitTransform: {
+      scale: 0.018868,
+      x: -0.028302,
+      y: -0.028638,
+      width: 1.0,
+      height: 0.452156,
+    },
   },
   {
     name: 'role',
@@ -1489,6 +1807,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.0,
+      width: 60.0,
+      height: 30.5,
+    },
+    unitTransform: {
+      scale: 0.016667,
+      x: -0.025,
+      y: -0.016667,
+      width: 1.0,
+      height: 0.508333,
+    },
   },
   {
     name: 'service',
@@ -1505,6 +1836,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 0.5,
+      width: 51.0,
+      height: 26.0,
+    },
+    unitTransform: {
+      scale: 0.019608,
+      x: -0.029412,
+      y: -0.009804,
+      width: 1.0,
+      height: 0.509804,
+    },
   },
   {
     name: 'system-software',
@@ -1536,6 +1880,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.55,
+      width: 34.58,
+      height: 30.95,
+    },
+    unitTransform: {
+      scale: 0.028916,
+      x: -0.028916,
+      y: -0.044828,
+      width: 1.0,
+      height: 0.894944,
+    },
   },
   {
     name: 'value-stream',
@@ -1552,6 +1909,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.5,
+      y: 1.5,
+      width: 58.0,
+      height: 29.0,
+    },
+    unitTransform: {
+      scale: 0.017241,
+      x: -0.025862,
+      y: -0.025862,
+      width: 1.0,
+      height: 0.5,
+    },
   },
   {
     name: 'value',
@@ -1574,6 +1944,19 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 1.0,
+      y: 1.0,
+      width: 60.5,
+      height: 30.5,
+    },
+    unitTransform: {
+      scale: 0.016529,
+      x: -0.016529,
+      y: -0.016529,
+      width: 1.0,
+      height: 0.504132,
+    },
   },
   {
     name: 'work-package',
@@ -1605,391 +1988,190 @@ export const allShapesData: IShapeDefinition[] = [
         fillRule: 'evenodd',
       },
     ],
+    bounds: {
+      x: 2.25,
+      y: 2.1,
+      width: 38.75,
+      height: 32.9,
+    },
+    unitTransform: {
+      scale: 0.025809,
+      x: -0.058159,
+      y: -0.054175,
+      width: 1.0,
+      height: 0.849132,
+    },
   },
 ];
 
-// Element mappings
-export const elementMappingData: IElementMapping[] = [
-  {
-    element: 'Application Collaboration',
-    icon: 'collaboration',
-    base: 'rectangle',
-  },
-  {
-    element: 'Application Component',
-    icon: 'application-component',
-    base: 'rectangle',
-  },
-  {
-    element: 'Application Event',
-    icon: 'event',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Application Function',
-    icon: 'function',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Application Interaction',
-    icon: 'interaction',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Application Interface',
-    icon: 'interface',
-    base: 'rectangle',
-  },
-  {
-    element: 'Application Process',
-    icon: 'process',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Application Service',
-    icon: 'service',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Artifact',
-    icon: 'artifact',
-    base: 'rectangle',
-  },
-  {
-    element: 'Assessment',
-    icon: 'assessment',
-    base: 'chamfered-rectangle',
-  },
-  {
-    element: 'Business Actor',
-    icon: 'business-actor',
-    base: 'rectangle',
-  },
-  {
-    element: 'Business Collaboration',
-    icon: 'collaboration',
-    base: 'rectangle',
-  },
-  {
-    element: 'Business Event',
-    icon: 'event',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Business Function',
-    icon: 'function',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Business Interaction',
-    icon: 'interaction',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Business Interface',
-    icon: 'interface',
-    base: 'rectangle',
-  },
-  {
-    element: 'Business Object',
-    icon: 'object',
-    base: 'rectangle',
-  },
-  {
-    element: 'Business Process',
-    icon: 'process',
-    base: 'rounded-rectangle',
-  },
-  {
-    element: 'Business Role',
-    icon: 'role',
-    base: 'rectangle',
+// Pre-serialized SVG fragments for every icon shape
+export const iconFragmentData: Record<string, IIconFragment> = {
+  'application-component': {
+    svg: '<g><path d="M10.5 1.5 50.5 1.5 50.5 32.5 10.5 32.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 5.5 18.5 5.5 18.5 11.5 1.5 11.5ZM1.5 16.5 18.5 16.5 18.5 22.5 1.5 22.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Business Service',
-    icon: 'service',
-    base: 'rounded-rectangle',
+  artifact: {
+    svg: '<g><path d="M1.0 0.0 35.12 0.0 43.0 7.88 43.0 21.0 1.0 21.0 1.0 0.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M43.5 8.38 43.5 21.5 1.5 21.5 1.5 0.5 35.62 0.5 43.5 8.38 35.62 8.38 35.62 0.5Z" stroke="black" stroke-width="2" stroke-linejoin="bevel" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Capability',
-    icon: 'capability',
-    base: 'rounded-rectangle',
+  assessment: {
+    svg: '<g><path d="M22.0 0.0C29.18 0.0 35.0 5.6 35.0 12.5 35.0 19.4 29.18 25.0 22.0 25.0 14.82 25.0 9.0 19.4 9.0 12.5 9.0 5.6 14.82 0.0 22.0 0.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M35.5 13.0C35.5 19.9 29.68 25.5 22.5 25.5 15.32 25.5 9.5 19.9 9.5 13.0 9.5 6.1 15.32 0.5 22.5 0.5 29.68 0.5 35.5 6.1 35.5 13.0Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.0 35.0 13.0 22.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.5 22.5 1.5 35.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Communication Network',
-    icon: 'communication-network',
-    base: 'rectangle',
+  'business-actor': {
+    svg: '<g><path d="M9.4 16.0C10.16 16.22 9.77 16.24 10.6 16.0L10.6 17.8 19.0 17.8 19.0 18.4 10.6 18.4 10.6 23.8 19.0 33.4 18.4 34.0 10.0 24.4 1.6 34.0 1.0 33.4 9.4 23.8 9.4 18.4 1.0 18.4 1.0 17.8 9.4 17.8 9.4 16.0Z" fill-rule="evenodd"/><path d="M9.9 16.5C10.66 16.72 10.27 16.74 11.1 16.5L11.1 18.3 19.5 18.3 19.5 18.9 11.1 18.9 11.1 24.3 19.5 33.9 18.9 34.5 10.5 24.9 2.1 34.5 1.5 33.9 9.9 24.3 9.9 18.9 1.5 18.9 1.5 18.3 9.9 18.3 9.9 16.5Z" stroke="black" stroke-width="1.1" stroke-miterlimit="1" fill-rule="evenodd"/><path d="M10.0 1.0C13.87 1.0 17.0 4.13 17.0 8.0L17.0 8.0C17.0 11.87 13.87 15.0 10.0 15.0 6.13 15.0 3.0 11.87 3.0 8.0L3.0 8.0C3.0 4.13 6.13 1.0 10.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M17.5 8.5C17.5 12.37 14.37 15.5 10.5 15.5 6.63 15.5 3.5 12.37 3.5 8.5L3.5 8.5C3.5 4.63 6.63 1.5 10.5 1.5 14.37 1.5 17.5 4.63 17.5 8.5L17.5 8.5Z" stroke="black" stroke-width="1.1" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M10.0 16.0 11.0 16.0 11.0 23.0 10.0 23.0 10.0 16.0" fill-rule="evenodd"/><path d="M10.5 23.5 11.5 23.5 11.5 16.5 10.5 16.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Constraint',
-    icon: 'constraint',
-    base: 'chamfered-rectangle',
+  capability: {
+    svg: '<g><path d="M23.0 1.0 34.0 1.0 34.0 31.0 1.0 31.0 1.0 21.0 12.0 21.0 12.0 11.0 23.0 11.0 23.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 21.5 12.5 21.5 12.5 11.5 23.5 11.5 23.5 1.5 34.5 1.5 34.5 31.5 1.5 31.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.5 21.5 34.5 21.5M23.5 11.5 34.5 11.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M12.5 21.5 12.5 31.5M23.5 11.5 23.5 31.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Contract',
-    icon: 'contract',
-    base: 'rectangle',
+  collaboration: {
+    svg: '<g><path d="M18.0 1.5C27.11 1.5 34.5 7.99 34.5 16.0 34.5 24.01 27.11 30.5 18.0 30.5 8.89 30.5 1.5 24.01 1.5 16.0 1.5 7.99 8.89 1.5 18.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M34.5 1.5C43.34 1.5 50.5 7.99 50.5 16.0 50.5 24.01 43.34 30.5 34.5 30.5 25.66 30.5 18.5 24.01 18.5 16.0 18.5 7.99 25.66 1.5 34.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M26.16 3.5C18.21 7.5 15.5 16.34 20.11 23.25 21.57 25.43 23.65 27.24 26.16 28.5 31.31 25.92 34.49 21.16 34.5 16.0 34.49 10.84 31.32 6.08 26.16 3.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Course Of Action',
-    icon: 'course-of-action',
-    base: 'rounded-rectangle',
+  'communication-network': {
+    svg: '<g><path d="M4.5 23.5 23.92 23.5 33.5 6.5 14.08 6.5Z" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M7.0 24.0 6.0 23.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M6.0 23.0 7.0 24.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M14.0 7.0 13.0 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.0 6.0 14.0 7.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M33.0 7.0 32.0 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M32.0 6.0 33.0 7.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M26.0 24.0 25.0 23.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M25.0 23.0 26.0 24.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Data Object',
-    icon: 'object',
-    base: 'rectangle',
+  constraint: {
+    svg: '<g><path d="M8.06 1.0 61.0 1.0 53.94 28.0 1.0 28.0 8.06 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 28.5 54.44 28.5 61.5 1.5 8.56 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.5 1.5 5.5 28.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Deliverable',
-    icon: 'deliverable',
-    base: 'rectangle',
+  contract: {
+    svg: '<g><rect x="1.5" y="1.5" width="53" height="27" stroke="#002346" stroke-width="2" fill="{{fill}}"/><path d="M1.5 1.5H54.5V8.5H1.5ZM1.5 21.5H54.5V28.5H1.5Z" stroke="#002346" stroke-width="2" fill="{{fill}}"/></g>',
+    defaultFill: '#FFFF00',
   },
-  {
-    element: 'Device',
-    icon: 'device',
-    base: 'rectangle',
+  'course-of-action': {
+    svg: '<g><path d="M38.41 1.0C40.62 1.01 41.9 1.28 43.87 2.16 47.64 3.84 50.11 6.98 50.76 10.94 51.0 12.37 50.85 14.0 50.34 15.63 49.12 19.5 46.06 22.31 41.83 23.44 36.0 25.0 29.89 22.5 27.26 17.47 26.3 15.65 26.01 14.48 26.0 12.44 26.0 10.41 26.29 9.25 27.26 7.4 28.5 5.03 30.37 3.31 32.95 2.16 34.96 1.26 36.21 1.0 38.41 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M42.33 23.94C46.56 22.81 49.62 20.0 50.84 16.13 51.35 14.5 51.5 12.87 51.26 11.44 50.61 7.48 48.14 4.34 44.37 2.66 42.4 1.78 41.12 1.51 38.91 1.5 36.71 1.5 35.46 1.76 33.45 2.66 30.87 3.81 29.0 5.53 27.76 7.9 26.79 9.75 26.5 10.91 26.5 12.94 26.51 14.98 26.8 16.15 27.76 17.97 30.39 23.0 36.5 25.5 42.33 23.94Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M3.0 39.0C3.0 39.0 13.5 14.0 24.0 17.57L12.8 15.43C12.8 15.43 19.8 22.57 17.7 28.29L24.0 17.57" stroke="black" stroke-width="5.54" stroke-linejoin="round" stroke-miterlimit="10" fill="none" fill-rule="evenodd"/><path d="M40.0 13.0 39.0 12.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M39.0 12.0 40.0 13.0" stroke="black" stroke-width="5.54" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M41.0 19.53C43.53 18.82 45.37 17.06 46.1 14.64 46.41 13.62 46.5 12.61 46.36 11.71 45.97 9.24 44.49 7.27 42.22 6.22 41.04 5.68 40.27 5.51 38.95 5.5 37.62 5.5 36.87 5.67 35.67 6.22 34.12 6.94 33.0 8.02 32.25 9.5 31.67 10.66 31.5 11.38 31.5 12.65 31.51 13.92 31.68 14.66 32.25 15.79 33.83 18.94 37.5 20.5 41.0 19.53Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: null,
   },
-  {
-    element: 'Distribution Network',
-    icon: 'distribution-network',
-    base: 'rectangle',
+  deliverable: {
+    svg: '<g><path d="M1.5 1.5 54.5 1.5 54.5 25.5C28.0 1.5 28.0 49.5 1.5 25.5L1.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1.27" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Driver',
-    icon: 'driver',
-    base: 'chamfered-rectangle',
+  device: {
+    svg: '<g><path d="M4.31 0.5 43.69 0.5C45.24 0.5 46.5 1.77 46.5 3.33L46.5 14.67C46.5 16.23 45.24 17.5 43.69 17.5L4.31 17.5C2.76 17.5 1.5 16.23 1.5 14.67L1.5 3.33C1.5 1.77 2.76 0.5 4.31 0.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M6.62 17.0 40.38 17.0 46.0 23.0 1.0 23.0 6.62 17.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M7.12 17.5 1.5 23.5 46.5 23.5 40.88 17.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Equipment',
-    icon: 'equipment',
-    base: 'rectangle',
+  'distribution-network': {
+    svg: '<g><path d="M8.28 8.0 45.11 8.0 52.0 12.97 46.24 17.0 8.28 16.73 2.0 12.57 8.28 8.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M2.0 12.57 8.28 8.0 45.11 8.0 52.0 12.97 46.24 17.0 8.28 16.73Z" stroke="black" stroke-width="1.96" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 8.0 15.0 2.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 8.0 15.0 2.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M15.0 22.0 8.0 17.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 17.0 15.0 22.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M39.0 23.0 47.0 17.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M47.0 17.0 39.0 23.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M46.0 8.0 40.0 3.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M46.0 8.0 40.0 3.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Facility',
-    icon: 'facility',
-    base: 'rectangle',
-  },
-  {
-    element: 'Gap',
-    icon: 'gap',
-    base: 'rectangle',
-  },
-  {
-    element: 'Goal',
-    icon: 'goal',
-    base: 'chamfered-rectangle',
-  },
-  {
-    element: 'Implementation Event',
-    icon: 'event',
-    base: 'rectangle',
+  driver: {
+    svg: '<g><path d="M21.0 6.0C28.73 6.0 35.0 12.27 35.0 20.0 35.0 27.73 28.73 34.0 21.0 34.0 13.27 34.0 7.0 27.73 7.0 20.0 7.0 12.27 13.27 6.0 21.0 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.0 6.0C28.73 6.0 35.0 12.27 35.0 20.0 35.0 27.73 28.73 34.0 21.0 34.0 13.27 34.0 7.0 27.73 7.0 20.0 7.0 12.27 13.27 6.0 21.0 6.0Z" stroke="black" stroke-width="3.69" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M20.5 16.0C22.43 16.0 24.0 17.57 24.0 19.5 24.0 21.43 22.43 23.0 20.5 23.0 18.57 23.0 17.0 21.43 17.0 19.5 17.0 17.57 18.57 16.0 20.5 16.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.0 16.5C22.93 16.5 24.5 18.07 24.5 20.0 24.5 21.93 22.93 23.5 21.0 23.5 19.07 23.5 17.5 21.93 17.5 20.0 17.5 18.07 19.07 16.5 21.0 16.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill-rule="evenodd"/><path d="M35.5 34.5 7.5 6.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M7.5 34.5 35.5 6.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M39.5 20.5 1.5 20.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M21.5 1.5 21.5 39.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Location',
-    icon: 'location',
-    base: 'rectangle',
+  equipment: {
+    svg: '<g><path d="M31.85 1.5C33.22 1.5 33.64 1.54 33.73 1.69 33.8 1.79 33.88 2.28 33.93 2.78 34.1 4.46 34.11 4.49 34.64 4.65 34.91 4.73 35.39 4.9 35.72 5.04L36.32 5.28 37.37 4.44C37.94 3.98 38.5 3.61 38.6 3.61 39.0 3.61 41.24 5.76 41.24 6.14 41.24 6.26 40.85 6.81 40.37 7.36L39.5 8.37 39.91 9.3C40.14 9.81 40.32 10.29 40.32 10.37 40.32 10.46 40.79 10.55 41.47 10.61 43.28 10.74 43.3 10.75 43.4 11.33 43.5 11.98 43.5 13.46 43.4 14.1L43.32 14.6 42.44 14.68C41.96 14.73 41.31 14.8 40.98 14.84L40.39 14.91 39.97 15.93 39.55 16.95 40.46 17.98C40.96 18.55 41.37 19.08 41.37 19.16 41.37 19.42 39.04 21.69 38.77 21.69 38.63 21.69 38.03 21.31 37.44 20.86L36.36 20.03 35.61 20.37C35.2 20.55 34.7 20.74 34.51 20.79 34.13 20.88 34.1 20.99 33.93 22.81 33.82 23.93 33.89 23.9 31.62 23.84L29.97 23.8 30.21 24.2C30.34 24.43 30.45 24.7 30.45 24.82 30.44 24.93 29.76 25.5 28.92 26.09 27.52 27.08 27.41 27.19 27.47 27.52 27.51 27.71 27.62 28.4 27.71 29.04L27.87 30.2 29.56 30.8C30.5 31.13 31.29 31.44 31.32 31.5 31.54 31.86 30.43 35.79 30.08 35.93 29.91 36.0 27.04 35.63 26.49 35.48 26.37 35.44 26.23 35.54 26.14 35.75 26.06 35.93 25.67 36.48 25.26 36.96L24.54 37.85 25.27 39.43C25.67 40.29 25.97 41.08 25.93 41.19 25.82 41.49 24.34 42.47 23.13 43.05 22.52 43.34 21.98 43.58 21.92 43.58 21.86 43.58 21.34 42.95 20.78 42.18 20.21 41.42 19.71 40.74 19.66 40.68 19.61 40.63 19.19 40.67 18.73 40.78 18.26 40.9 17.54 40.99 17.12 40.99 16.5 40.99 16.33 41.04 16.29 41.23 16.08 42.01 14.96 44.46 14.79 44.49 14.68 44.5 14.07 44.4 13.43 44.26 11.77 43.89 10.45 43.46 10.37 43.25 10.31 43.1 10.55 41.32 10.79 40.1 10.86 39.7 10.83 39.65 10.13 39.24 9.72 39.01 9.15 38.59 8.86 38.32L8.34 37.83 6.73 38.53C5.84 38.92 5.01 39.23 4.89 39.23 4.48 39.23 2.42 36.02 2.42 35.4 2.42 35.3 3.09 34.74 3.91 34.17L5.41 33.13 5.24 32.2C5.14 31.69 5.02 30.97 4.96 30.61L4.86 29.94 3.18 29.33C1.51 28.73 1.5 28.72 1.5 28.3 1.51 27.65 1.98 25.6 2.3 24.83 2.64 24.01 2.53 24.03 4.78 24.41 5.67 24.56 6.42 24.67 6.43 24.65 6.58 24.34 7.33 23.38 7.8 22.88L8.4 22.23 7.65 20.67C7.23 19.81 6.89 19.03 6.89 18.93 6.89 18.52 10.14 16.66 10.85 16.66 11.14 16.66 11.38 16.91 12.23 18.05 12.79 18.82 13.27 19.46 13.29 19.49 13.3 19.51 13.57 19.46 13.89 19.38 14.2 19.3 14.95 19.19 15.56 19.13L16.65 19.04 17.27 17.41C17.79 16.04 17.94 15.77 18.19 15.73 18.83 15.64 22.42 16.59 22.61 16.9 22.63 16.96 22.53 17.8 22.37 18.78L22.08 20.57 22.8 21.01C23.2 21.26 23.75 21.67 24.02 21.93L24.52 22.39 26.08 21.7C26.94 21.32 27.76 21.01 27.91 21.01 28.22 21.01 28.37 21.17 29.27 22.5 29.65 23.06 29.93 23.43 29.89 23.3 29.85 23.18 29.77 22.6 29.72 22.0L29.63 20.92 29.02 20.75C28.69 20.66 28.18 20.48 27.89 20.35L27.36 20.11 26.31 20.97C25.73 21.44 25.2 21.82 25.12 21.82 24.74 21.82 22.42 19.65 22.42 19.29 22.42 19.2 22.81 18.67 23.28 18.11L24.14 17.1 23.73 16.17C23.51 15.65 23.28 15.14 23.22 15.03 23.15 14.88 22.74 14.79 21.77 14.69 20.81 14.59 20.4 14.49 20.33 14.35 20.06 13.82 20.07 11.16 20.34 10.88 20.37 10.85 21.04 10.74 21.83 10.65L23.25 10.47 23.48 9.77C23.61 9.39 23.81 8.92 23.94 8.73L24.16 8.37 23.21 7.29 22.27 6.2 22.53 5.82C23.07 5.05 24.67 3.61 24.99 3.61 25.08 3.61 25.64 4.0 26.24 4.47L27.32 5.33 28.33 4.88C28.88 4.63 29.4 4.43 29.48 4.43 29.57 4.42 29.69 3.86 29.78 3.04 29.86 2.28 29.96 1.62 30.0 1.58 30.05 1.54 30.88 1.5 31.85 1.5Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M16.34 23.5C17.46 23.51 18.59 23.79 19.75 24.35 21.98 25.43 23.5 28.1 23.23 30.48 23.13 31.32 22.73 32.53 22.32 33.2 21.83 34.01 20.64 35.05 19.68 35.52 18.16 36.27 16.71 36.5 15.19 36.25 13.55 35.98 11.86 35.09 10.95 34.04 10.68 33.73 10.24 33.03 9.97 32.49 8.5 29.53 9.86 25.85 12.99 24.32 14.11 23.77 15.22 23.5 16.34 23.5ZM32.35 7.61C33.4 7.66 33.72 7.74 34.46 8.11 36.21 8.99 37.3 10.57 37.42 12.4 37.5 13.7 37.27 14.6 36.62 15.6 35.36 17.54 32.7 18.5 30.4 17.85 29.36 17.56 28.76 17.19 27.92 16.35 26.87 15.28 26.5 14.36 26.5 12.81 26.5 11.44 26.86 10.43 27.68 9.5 28.94 8.07 30.34 7.5 32.35 7.61Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Material',
-    icon: 'material',
-    base: 'rectangle',
+  event: {
+    svg: '<g><path d="M1.5 0.5 41.25 0.5C48.57 0.5 54.5 6.54 54.5 14.0 54.5 21.46 48.57 27.5 41.25 27.5L1.5 27.5 8.12 14.0 1.5 0.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Meaning',
-    icon: 'meaning',
-    base: 'chamfered-rectangle',
+  facility: {
+    svg: '<g><path d="M1.5 1.5 9.04 1.5 9.04 12.9C9.04 19.16 9.06 24.29 9.08 24.29 9.1 24.29 12.45 22.91 16.53 21.22 20.61 19.53 24.01 18.13 24.09 18.11 24.21 18.07 24.23 18.48 24.23 21.21 24.23 22.95 24.25 24.36 24.28 24.36 24.32 24.36 37.89 18.77 39.01 18.29L39.31 18.16 39.34 21.29 39.36 24.42 46.25 21.56C50.04 19.99 53.44 18.58 53.82 18.43L54.5 18.14 54.5 36.5 1.5 36.5 1.5 19.0 1.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Node',
-    icon: 'node',
-    base: 'rectangle',
+  function: {
+    svg: '<g><path d="M26.0 1.5 50.5 11.46 50.5 32.5 26.0 22.54 1.5 32.5 1.5 11.46 26.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Outcome',
-    icon: 'outcome',
-    base: 'chamfered-rectangle',
+  gap: {
+    svg: '<g><path d="M38.5 16.0C38.5 24.01 32.23 30.5 24.5 30.5 16.77 30.5 10.5 24.01 10.5 16.0 10.5 7.99 16.77 1.5 24.5 1.5 32.23 1.5 38.5 7.99 38.5 16.0Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 10.5 48.5 10.5M1.5 20.5 48.5 20.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Path',
-    icon: 'path',
-    base: 'rectangle',
+  goal: {
+    svg: '<g><path d="M20.0 1.5C30.21 1.5 38.48 9.77 38.5 19.97L38.5 20.0C38.5 30.21 30.22 38.5 20.0 38.5 9.79 38.5 1.5 30.22 1.5 20.0 1.5 9.79 9.78 1.5 20.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M20.5 8.5C27.12 8.5 32.49 13.87 32.5 20.49L32.5 20.5C32.5 27.13 27.13 32.5 20.5 32.5 13.87 32.5 8.5 27.13 8.5 20.5 8.5 13.87 13.87 8.5 20.5 8.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M20.5 20.5 21.5 20.5" stroke="black" stroke-width="15.46" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '',
   },
-  {
-    element: 'Plateau',
-    icon: 'plateau',
-    base: 'rectangle',
+  interaction: {
+    svg: '<g><path d="M16.5 31.5 16.5 1.5C16.5 1.5 1.5 1.5 1.5 16.5 1.5 31.5 16.5 31.5 16.5 31.5ZM22.5 31.5 22.5 1.5C22.5 1.5 37.5 1.5 37.5 16.5 37.5 31.5 22.5 31.5 22.5 31.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Principle',
-    icon: 'principle',
-    base: 'chamfered-rectangle',
+  interface: {
+    svg: '<g><path d="M16.5 16.5 1.5 16.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M31.0 1.5C39.01 1.5 45.5 7.99 45.5 16.0 45.5 24.01 39.01 30.5 31.0 30.5 22.99 30.5 16.5 24.01 16.5 16.0 16.5 7.99 22.99 1.5 31.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Product',
-    icon: 'product',
-    base: 'rectangle',
+  location: {
+    svg: '<g><path d="M10.71 1.38C13.68 1.0 16.46 1.65 18.43 2.63 20.04 3.44 21.29 4.52 22.24 5.79 23.23 7.11 23.91 8.68 23.97 10.72 24.0 11.76 23.8 12.73 23.52 13.54 23.23 14.35 22.77 15.03 22.36 15.76 21.57 17.17 20.57 18.47 19.56 19.77 16.57 23.64 13.77 27.59 12.54 33.0 11.69 29.44 10.19 26.47 8.38 23.72 7.03 21.68 5.48 19.8 4.03 17.82 3.55 17.16 3.14 16.46 2.68 15.77 1.75 14.4 1.0 12.81 1.05 10.75 1.09 8.74 1.78 7.12 2.76 5.8 4.37 3.63 7.08 1.85 10.71 1.38Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.04 33.5C12.19 29.94 10.69 26.97 8.88 24.22 7.54 22.18 5.98 20.3 4.53 18.32 4.05 17.66 3.64 16.96 3.18 16.27 2.25 14.9 1.5 13.31 1.55 11.25 1.59 9.24 2.28 7.62 3.26 6.3 4.87 4.13 7.58 2.35 11.21 1.88 14.18 1.5 16.96 2.15 18.93 3.13 20.54 3.94 21.79 5.02 22.74 6.29 23.73 7.61 24.41 9.18 24.47 11.22 24.5 12.26 24.3 13.23 24.02 14.04 23.73 14.85 23.27 15.53 22.86 16.26 22.07 17.67 21.07 18.97 20.06 20.27 17.07 24.14 14.27 28.09 13.04 33.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Representation',
-    icon: 'representation',
-    base: 'rectangle',
+  material: {
+    svg: '<g><path d="M33.58 1.0 44.0 17.88 33.05 34.76 12.22 35.0 1.0 17.88 11.68 1.24 33.58 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 18.38 12.18 1.74 34.08 1.5 44.5 18.38 33.55 35.26 12.72 35.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 19.0 17.0 5.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.5 19.5 17.5 5.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.0 29.0 31.0 28.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.5 29.5 31.5 28.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M36.0 19.0 27.0 5.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M27.5 5.5 36.5 19.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Requirement',
-    icon: 'requirement',
-    base: 'chamfered-rectangle',
+  meaning: {
+    svg: '<g><path d="M26.54 1.33C29.05 1.48 31.56 2.37 32.28 3.56 36.59 1.19 49.51 1.19 49.51 3.56 58.13 1.19 61.0 10.67 55.26 13.04 61.0 13.04 58.22 19.63 55.26 22.52 55.26 32.0 43.77 29.63 38.03 27.26 32.28 29.63 9.31 32.0 15.05 24.89 6.44 24.89 7.87 10.67 12.18 10.67 5.0 3.56 15.05 0.0 20.79 3.56 21.51 1.78 24.03 1.19 26.54 1.33Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.68 11.17C5.5 4.06 15.55 0.5 21.29 4.06 22.73 0.5 31.35 1.69 32.78 4.06 37.09 1.69 50.01 1.69 50.01 4.06 58.63 1.69 61.5 11.17 55.76 13.54 61.5 13.54 58.72 20.13 55.76 23.02 55.76 32.5 44.27 30.13 38.53 27.76 32.78 30.13 9.81 32.5 15.55 25.39 6.94 25.39 8.37 11.17 12.68 11.17Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 25.0C10.21 25.0 12.0 26.57 12.0 28.5 12.0 30.43 10.21 32.0 8.0 32.0 5.79 32.0 4.0 30.43 4.0 28.5 4.0 26.57 5.79 25.0 8.0 25.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.5 25.5C10.71 25.5 12.5 27.07 12.5 29.0 12.5 30.93 10.71 32.5 8.5 32.5 6.29 32.5 4.5 30.93 4.5 29.0 4.5 27.07 6.29 25.5 8.5 25.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M4.0 32.0C5.66 32.0 7.0 33.12 7.0 34.5 7.0 35.88 5.66 37.0 4.0 37.0 2.34 37.0 1.0 35.88 1.0 34.5 1.0 33.12 2.34 32.0 4.0 32.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M4.5 32.5C6.16 32.5 7.5 33.62 7.5 35.0 7.5 36.38 6.16 37.5 4.5 37.5 2.84 37.5 1.5 36.38 1.5 35.0 1.5 33.62 2.84 32.5 4.5 32.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Resource',
-    icon: 'resource',
-    base: 'rectangle',
+  node: {
+    svg: '<g><path d="M6.75 1.0 47.0 1.0 47.0 18.25 41.25 24.0 1.0 24.0 1.0 6.75 6.75 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 7.25 7.25 1.5 47.5 1.5 47.5 18.75 41.75 24.5 1.5 24.5Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 7.5 41.5 7.5 41.5 24.5" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M41.5 7.5 47.5 1.5" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Stakeholder',
-    icon: 'role',
-    base: 'chamfered-rectangle',
+  object: {
+    svg: '<g><rect x="1.5" y="1.5" width="53" height="27" stroke="#002346" stroke-width="2" fill="{{fill}}"/><rect x="1.5" y="1.5" width="53" height="7" stroke="#002346" stroke-width="2" fill="{{fill}}"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'System Software',
-    icon: 'system-software',
-    base: 'rectangle',
+  outcome: {
+    svg: '<g><path d="M33.5 29.5C33.5 38.33 26.34 45.5 17.5 45.5 8.67 45.5 1.5 38.34 1.5 29.5 1.5 20.67 8.66 13.5 17.5 13.5 26.33 13.5 33.49 20.65 33.5 29.48" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M27.5 29.0C27.5 34.8 22.8 39.5 17.0 39.5 11.2 39.5 6.5 34.8 6.5 29.0 6.5 23.2 11.2 18.5 17.0 18.5 22.79 18.5 27.49 23.19 27.5 28.99" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M22.5 29.0C22.5 32.03 20.26 34.5 17.5 34.5 14.74 34.5 12.5 32.04 12.5 29.0 12.5 25.97 14.74 23.5 17.5 23.5 20.25 23.5 22.49 25.96 22.5 28.99" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M38.0 8.0 19.0 27.0" stroke="black" stroke-width="3.98" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M44.5 10.8 31.5 15.5 34.42 2.5" stroke="black" stroke-width="2.63" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="none" fill-rule="evenodd"/><path d="M18.11 20.0 26.0 27.3 16.0 29.0 18.11 20.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M16.5 29.5 26.5 27.8 18.61 20.5Z" stroke="black" stroke-width="5.1" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill-rule="evenodd"/></g>',
+    defaultFill: '#CCCCFF',
   },
-  {
-    element: 'Technology Collaboration',
-    icon: 'collaboration',
-    base: 'rectangle',
+  path: {
+    svg: '<g><path d="M14.5 2.5C14.5 2.5 2.5 8.75 2.5 10.0 2.5 11.25 14.5 17.5 14.5 17.5M27.5 2.5C27.5 2.5 38.5 8.75 38.5 10.0 38.5 11.25 27.5 17.5 27.5 17.5" stroke="black" stroke-width="2.6" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.5 10.5 17.5 10.5M23.5 10.5 29.5 10.5" stroke="black" stroke-width="2.6" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Technology Event',
-    icon: 'event',
-    base: 'rounded-rectangle',
+  plateau: {
+    svg: '<g><path d="M10.5 3.5 41.5 3.5M6.5 15.5 37.5 15.5M0.5 27.5 32.5 27.5" stroke="black" stroke-width="5.42" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '',
   },
-  {
-    element: 'Technology Function',
-    icon: 'function',
-    base: 'rounded-rectangle',
+  principle: {
+    svg: '<g><path d="M21.0 1.0C28.69 1.0 36.38 1.67 37.92 3.0 41.0 5.67 41.0 29.67 37.92 32.33 34.85 35.0 7.15 35.0 4.08 32.33 1.0 29.67 1.0 5.67 4.08 3.0 5.62 1.67 13.31 1.0 21.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M4.58 3.19C7.65 0.5 35.35 0.5 38.42 3.19 41.5 5.88 41.5 30.12 38.42 32.81 35.35 35.5 7.65 35.5 4.58 32.81 1.5 30.12 1.5 5.88 4.58 3.19Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.0 7.0 23.0 7.0C21.67 25.0 21.0 25.0 21.0 7.0Z" stroke="black" stroke-width="1.89" stroke-miterlimit="1" fill-rule="evenodd"/><path d="M22.0 28.0 21.0 27.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.5 27.5 22.5 28.5" stroke="black" stroke-width="4.6" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Technology Interaction',
-    icon: 'interaction',
-    base: 'rounded-rectangle',
+  process: {
+    svg: '<g><path d="M1.5 8.0 33.38 8.0 33.38 1.5 52.5 14.5 33.38 27.5 33.38 21.0 1.5 21.0 1.5 8.0" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Technology Interface',
-    icon: 'interface',
-    base: 'rectangle',
+  product: {
+    svg: '<g><rect x="1.5" y="1.5" width="53" height="27" stroke="#002346" stroke-width="2" fill="{{fill}}"/><rect x="1.5" y="1.5" width="32" height="7" stroke="#002346" stroke-width="2" fill="{{fill}}"/></g>',
+    defaultFill: '#FFFF00',
   },
-  {
-    element: 'Technology Process',
-    icon: 'process',
-    base: 'rounded-rectangle',
+  representation: {
+    svg: '<g><path d="M1.5 1.5 54.5 1.5 54.5 21.75C54.5 21.75 50.08 15.0 41.25 15.0 32.42 15.0 28.0 21.75 28.0 21.75 28.0 21.75 23.58 28.5 14.75 28.5 5.92 28.5 1.5 21.75 1.5 21.75L1.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 8.5 54.5 8.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Technology Service',
-    icon: 'service',
-    base: 'rounded-rectangle',
+  requirement: {
+    svg: '<g><path d="M10.6 1.0 67.0 1.0 57.4 31.0 1.0 31.0 10.6 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M11.1 1.5 67.5 1.5 57.9 31.5 1.5 31.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Value Stream',
-    icon: 'value-stream',
-    base: 'rounded-rectangle',
+  resource: {
+    svg: '<g><path d="M25.5 1.52C35.52 1.54 45.49 1.67 46.31 1.88 48.51 2.44 49.11 3.38 49.25 6.54L49.38 9.31 51.33 9.31C54.26 9.31 54.5 9.64 54.5 13.55 54.5 17.39 54.26 17.69 51.23 17.69L49.31 17.69 49.31 20.13C49.31 23.05 48.65 24.29 46.72 25.01 45.53 25.46 43.76 25.5 25.41 25.48 14.4 25.46 4.86 25.34 4.21 25.19 3.56 25.05 2.69 24.61 2.26 24.21 1.53 23.5 1.5 23.15 1.5 13.5 1.5 3.86 1.53 3.5 2.26 2.8 2.68 2.4 3.65 1.94 4.41 1.79 5.42 1.58 15.49 1.5 25.5 1.52Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M49.0 17.0 50.0 8.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M50.5 8.5 49.5 17.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M10.5 6.5 10.5 19.5M19.5 6.5 19.5 19.5M27.5 6.5 27.5 19.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Value',
-    icon: 'value',
-    base: 'chamfered-rectangle',
+  role: {
+    svg: '<g><path d="M8.93 1.5 53.5 1.5 53.5 31.5 8.93 31.5C4.83 31.5 1.5 24.78 1.5 16.5 1.5 8.22 4.83 1.5 8.93 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M53.5 1.0C57.64 1.0 61.0 7.72 61.0 16.0 61.0 24.28 57.64 31.0 53.5 31.0 49.36 31.0 46.0 24.28 46.0 16.0 46.0 7.72 49.36 1.0 53.5 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M54.0 1.5C58.14 1.5 61.5 8.22 61.5 16.5 61.5 24.78 58.14 31.5 54.0 31.5 49.86 31.5 46.5 24.78 46.5 16.5 46.5 8.22 49.86 1.5 54.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Work Package',
-    icon: 'work-package',
-    base: 'rounded-rectangle',
+  service: {
+    svg: '<g><path d="M14.25 26.5C14.25 26.5 1.5 26.5 1.5 13.5 1.5 0.5 14.25 0.5 14.25 0.5L39.75 0.5C39.75 0.5 52.5 0.5 52.5 13.5 52.5 26.5 39.75 26.5 39.75 26.5L14.25 26.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Relationship',
-    icon: 'path',
-    base: 'rectangle',
+  'system-software': {
+    svg: '<g><path d="M21.62 1.57C26.04 1.78 30.4 3.66 32.81 7.06 35.6 10.75 36.5 15.69 34.51 19.85 33.5 22.19 31.74 24.41 29.15 25.5L7.5 8.87C9.15 5.23 13.19 2.98 17.24 1.92 18.66 1.62 20.14 1.5 21.62 1.57Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M15.5 6.0C23.51 6.0 30.0 11.82 30.0 19.0 30.0 26.18 23.51 32.0 15.5 32.0 7.49 32.0 1.0 26.18 1.0 19.0 1.0 11.82 7.49 6.0 15.5 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M30.5 19.5C30.5 26.68 24.01 32.5 16.0 32.5 7.99 32.5 1.5 26.68 1.5 19.5 1.5 12.32 7.99 6.5 16.0 6.5 24.01 6.5 30.5 12.32 30.5 19.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'And Junction',
-    icon: 'none',
-    base: 'circle',
+  'value-stream': {
+    svg: '<g><path d="M1.5 1.5 37.75 1.5 59.5 16.0 37.75 30.5 1.5 30.5 23.25 16.0 1.5 1.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Or Junction',
-    icon: 'none',
-    base: 'circle',
+  value: {
+    svg: '<g><path d="M31.0 1.0C47.57 1.0 61.0 7.72 61.0 16.0 61.0 24.28 47.57 31.0 31.0 31.0 14.43 31.0 1.0 24.28 1.0 16.0 1.0 7.72 14.43 1.0 31.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M31.5 1.5C48.07 1.5 61.5 8.22 61.5 16.5 61.5 24.78 48.07 31.5 31.5 31.5 14.93 31.5 1.5 24.78 1.5 16.5 1.5 8.22 14.93 1.5 31.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+    defaultFill: '#FFFFFF',
   },
-  {
-    element: 'Group',
-    icon: 'none',
-    base: 'rectangle',
+  'work-package': {
+    svg: '<g><path d="M21.51 25.91C24.53 24.09 26.72 20.82 27.36 17.22 28.0 13.61 27.07 9.73 24.88 6.88 22.64 3.98 19.17 2.21 15.62 2.1 12.08 2.0 8.53 3.55 6.05 6.22 4.24 8.16 2.98 10.68 2.49 13.36 2.0 16.04 2.28 18.87 3.27 21.39 4.26 23.91 5.98 26.11 8.13 27.63 10.28 29.15 12.86 29.99 15.45 30.0" stroke="black" stroke-width="3.59" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M15.0 30.0 30.0 30.0" stroke="black" stroke-width="3.59" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M30.0 23.0 41.0 29.67 32.21 35.0 30.0 35.0 30.0 23.0Z" fill-rule="evenodd"/></g>',
+    defaultFill: '',
   },
-];
-
-// Create a mapping from ArchiMateElementType to element name
-export const elementTypeToNameMap: Record<string, string> = {
-  [ArchiMateElementType.BusinessActor]: 'Business Actor',
-  [ArchiMateElementType.BusinessRole]: 'Business Role',
-  [ArchiMateElementType.BusinessCollaboration]: 'Business Collaboration',
-  [ArchiMateElementType.BusinessInterface]: 'Business Interface',
-  [ArchiMateElementType.BusinessProcess]: 'Business Process',
-  [ArchiMateElementType.BusinessFunction]: 'Business Function',
-  [ArchiMateElementType.BusinessInteraction]: 'Business Interaction',
-  [ArchiMateElementType.BusinessEvent]: 'Business Event',
-  [ArchiMateElementType.BusinessService]: 'Business Service',
-  [ArchiMateElementType.BusinessObject]: 'Business Object',
-  [ArchiMateElementType.Contract]: 'Contract',
-  [ArchiMateElementType.Representation]: 'Representation',
-  [ArchiMateElementType.Product]: 'Product',
-  [ArchiMateElementType.ApplicationComponent]: 'Application Component',
-  [ArchiMateElementType.ApplicationCollaboration]: 'Application Collaboration',
-  [ArchiMateElementType.ApplicationInterface]: 'Application Interface',
-  [ArchiMateElementType.ApplicationFunction]: 'Application Function',
-  [ArchiMateElementType.ApplicationInteraction]: 'Application Interaction',
-  [ArchiMateElementType.ApplicationProcess]: 'Application Process',
-  [ArchiMateElementType.ApplicationEvent]: 'Application Event',
-  [ArchiMateElementType.ApplicationService]: 'Application Service',
-  [ArchiMateElementType.DataObject]: 'Data Object',
-  [ArchiMateElementType.Node]: 'Node',
-  [ArchiMateElementType.Device]: 'Device',
-  [ArchiMateElementType.SystemSoftware]: 'System Software',
-  [ArchiMateElementType.TechnologyCollaboration]: 'Technology Collaboration',
-  [ArchiMateElementType.TechnologyInterface]: 'Technology Interface',
-  [ArchiMateElementType.Path]: 'Path',
-  [ArchiMateElementType.CommunicationNetwork]: 'Communication Network',
-  [ArchiMateElementType.TechnologyFunction]: 'Technology Function',
-  [ArchiMateElementType.TechnologyProcess]: 'Technology Process',
-  [ArchiMateElementType.TechnologyInteraction]: 'Technology Interaction',
-  [ArchiMateElementType.TechnologyEvent]: 'Technology Event',
-  [ArchiMateElementType.TechnologyService]: 'Technology Service',
-  [ArchiMateElementType.Artifact]: 'Artifact',
-  [ArchiMateElementType.Equipment]: 'Equipment',
-  [ArchiMateElementType.Facility]: 'Facility',
-  [ArchiMateElementType.DistributionNetwork]: 'Distribution Network',
-  [ArchiMateElementType.Material]: 'Material',
-  [ArchiMateElementType.Stakeholder]: 'Stakeholder',
-  [ArchiMateElementType.Driver]: 'Driver',
-  [ArchiMateElementType.Assessment]: 'Assessment',
-  [ArchiMateElementType.Goal]: 'Goal',
-  [ArchiMateElementType.Outcome]: 'Outcome',
-  [ArchiMateElementType.Principle]: 'Principle',
-  [ArchiMateElementType.Requirement]: 'Requirement',
-  [ArchiMateElementType.Constraint]: 'Constraint',
-  [ArchiMateElementType.Meaning]: 'Meaning',
-  [ArchiMateElementType.Value]: 'Value',
-  [ArchiMateElementType.Resource]: 'Resource',
-  [ArchiMateElementType.Capability]: 'Capability',
-  [ArchiMateElementType.ValueStream]: 'Value Stream',
-  [ArchiMateElementType.CourseOfAction]: 'Course Of Action',
-  [ArchiMateElementType.WorkPackage]: 'Work Package',
-  [ArchiMateElementType.Deliverable]: 'Deliverable',
-  [ArchiMateElementType.ImplementationEvent]: 'Implementation Event',
-  [ArchiMateElementType.Plateau]: 'Plateau',
-  [ArchiMateElementType.Gap]: 'Gap',
-  [ArchiMateElementType.Relationship]: 'Relationship',
-  [ArchiMateElementType.AndJunction]: 'And Junction',
-  [ArchiMateElementType.OrJunction]: 'Or Junction',
-  [ArchiMateElementType.Group]: 'Group',
-  [ArchiMateElementType.Location]: 'Location',
 };
@@ -0,0 +1,50 @@
+/**
+ * Shape Module: artifact
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'artifact',
+  width: 44,
+  height: 22,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.0 0.0 35.12 0.0 43.0 7.88 43.0 21.0 1.0 21.0 1.0 0.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M43.5 8.38 43.5 21.5 1.5 21.5 1.5 0.5 35.62 0.5 43.5 8.38 35.62 8.38 35.62 0.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinejoin: 'bevel',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 0.0,
+    width: 42.5,
+    height: 21.5,
+  },
+  unitTransform: {
+    scale: 0.023529,
+    x: -0.023529,
+    y: 0.0,
+    width: 1.0,
+    height: 0.505882,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.0 0.0 35.12 0.0 43.0 7.88 43.0 21.0 1.0 21.0 1.0 0.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M43.5 8.38 43.5 21.5 1.5 21.5 1.5 0.5 35.62 0.5 43.5 8.38 35.62 8.38 35.62 0.5Z" stroke="black" stroke-width="2" stroke-linejoin="bevel" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
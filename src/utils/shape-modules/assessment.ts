@@ -0,0 +1,64 @@
+/**
+ * Shape Module: assessment
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'assessment',
+  width: 36,
+  height: 36,
+  elements: [
+    {
+      type: 'path',
+      d: 'M22.0 0.0C29.18 0.0 35.0 5.6 35.0 12.5 35.0 19.4 29.18 25.0 22.0 25.0 14.82 25.0 9.0 19.4 9.0 12.5 9.0 5.6 14.82 0.0 22.0 0.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M35.5 13.0C35.5 19.9 29.68 25.5 22.5 25.5 15.32 25.5 9.5 19.9 9.5 13.0 9.5 6.1 15.32 0.5 22.5 0.5 29.68 0.5 35.5 6.1 35.5 13.0Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.0 35.0 13.0 22.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M13.5 22.5 1.5 35.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 0.0,
+    width: 34.5,
+    height: 35.5,
+  },
+  unitTransform: {
+    scale: 0.028169,
+    x: -0.028169,
+    y: 0.0,
+    width: 0.971831,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M22.0 0.0C29.18 0.0 35.0 5.6 35.0 12.5 35.0 19.4 29.18 25.0 22.0 25.0 14.82 25.0 9.0 19.4 9.0 12.5 9.0 5.6 14.82 0.0 22.0 0.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M35.5 13.0C35.5 19.9 29.68 25.5 22.5 25.5 15.32 25.5 9.5 19.9 9.5 13.0 9.5 6.1 15.32 0.5 22.5 0.5 29.68 0.5 35.5 6.1 35.5 13.0Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.0 35.0 13.0 22.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.5 22.5 1.5 35.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,75 @@
+/**
+ * Shape Module: business-actor
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'business-actor',
+  width: 21,
+  height: 36,
+  elements: [
+    {
+      type: 'path',
+      d: 'M9.4 16.0C10.16 16.22 9.77 16.24 10.6 16.0L10.6 17.8 19.0 17.8 19.0 18.4 10.6 18.4 10.6 23.8 19.0 33.4 18.4 34.0 10.0 24.4 1.6 34.0 1.0 33.4 9.4 23.8 9.4 18.4 1.0 18.4 1.0 17.8 9.4 17.8 9.4 16.0Z',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M9.9 16.5C10.66 16.72 10.27 16.74 11.1 16.5L11.1 18.3 19.5 18.3 19.5 18.9 11.1 18.9 11.1 24.3 19.5 33.9 18.9 34.5 10.5 24.9 2.1 34.5 1.5 33.9 9.9 24.3 9.9 18.9 1.5 18.9 1.5 18.3 9.9 18.3 9.9 16.5Z',
+      stroke: 'black',
+      strokeWidth: 1.1,
+      strokeMiterlimit: '1',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M10.0 1.0C13.87 1.0 17.0 4.13 17.0 8.0L17.0 8.0C17.0 11.87 13.87 15.0 10.0 15.0 6.13 15.0 3.0 11.87 3.0 8.0L3.0 8.0C3.0 4.13 6.13 1.0 10.0 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M17.5 8.5C17.5 12.37 14.37 15.5 10.5 15.5 6.63 15.5 3.5 12.37 3.5 8.5L3.5 8.5C3.5 4.63 6.63 1.5 10.5 1.5 14.37 1.5 17.5 4.63 17.5 8.5L17.5 8.5Z',
+      stroke: 'black',
+      strokeWidth: 1.1,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M10.0 16.0 11.0 16.0 11.0 23.0 10.0 23.0 10.0 16.0',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M10.5 23.5 11.5 23.5 11.5 16.5 10.5 16.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 18.5,
+    height: 33.5,
+  },
+  unitTransform: {
+    scale: 0.029851,
+    x: -0.029851,
+    y: -0.029851,
+    width: 0.552239,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M9.4 16.0C10.16 16.22 9.77 16.24 10.6 16.0L10.6 17.8 19.0 17.8 19.0 18.4 10.6 18.4 10.6 23.8 19.0 33.4 18.4 34.0 10.0 24.4 1.6 34.0 1.0 33.4 9.4 23.8 9.4 18.4 1.0 18.4 1.0 17.8 9.4 17.8 9.4 16.0Z" fill-rule="evenodd"/><path d="M9.9 16.5C10.66 16.72 10.27 16.74 11.1 16.5L11.1 18.3 19.5 18.3 19.5 18.9 11.1 18.9 11.1 24.3 19.5 33.9 18.9 34.5 10.5 24.9 2.1 34.5 1.5 33.9 9.9 24.3 9.9 18.9 1.5 18.9 1.5 18.3 9.9 18.3 9.9 16.5Z" stroke="black" stroke-width="1.1" stroke-miterlimit="1" fill-rule="evenodd"/><path d="M10.0 1.0C13.87 1.0 17.0 4.13 17.0 8.0L17.0 8.0C17.0 11.87 13.87 15.0 10.0 15.0 6.13 15.0 3.0 11.87 3.0 8.0L3.0 8.0C3.0 4.13 6.13 1.0 10.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M17.5 8.5C17.5 12.37 14.37 15.5 10.5 15.5 6.63 15.5 3.5 12.37 3.5 8.5L3.5 8.5C3.5 4.63 6.63 1.5 10.5 1.5 14.37 1.5 17.5 4.63 17.5 8.5L17.5 8.5Z" stroke="black" stroke-width="1.1" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M10.0 16.0 11.0 16.0 11.0 23.0 10.0 23.0 10.0 16.0" fill-rule="evenodd"/><path d="M10.5 23.5 11.5 23.5 11.5 16.5 10.5 16.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,67 @@
+/**
+ * Shape Module: capability
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'capability',
+  width: 35,
+  height: 32,
+  elements: [
+    {
+      type: 'path',
+      d: 'M23.0 1.0 34.0 1.0 34.0 31.0 1.0 31.0 1.0 21.0 12.0 21.0 12.0 11.0 23.0 11.0 23.0 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 21.5 12.5 21.5 12.5 11.5 23.5 11.5 23.5 1.5 34.5 1.5 34.5 31.5 1.5 31.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M12.5 21.5 34.5 21.5M23.5 11.5 34.5 11.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M12.5 21.5 12.5 31.5M23.5 11.5 23.5 31.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 33.5,
+    height: 30.5,
+  },
+  unitTransform: {
+    scale: 0.029851,
+    x: -0.029851,
+    y: -0.029851,
+    width: 1.0,
+    height: 0.910448,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M23.0 1.0 34.0 1.0 34.0 31.0 1.0 31.0 1.0 21.0 12.0 21.0 12.0 11.0 23.0 11.0 23.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 21.5 12.5 21.5 12.5 11.5 23.5 11.5 23.5 1.5 34.5 1.5 34.5 31.5 1.5 31.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.5 21.5 34.5 21.5M23.5 11.5 34.5 11.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M12.5 21.5 12.5 31.5M23.5 11.5 23.5 31.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,61 @@
+/**
+ * Shape Module: collaboration
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'collaboration',
+  width: 51,
+  height: 32,
+  elements: [
+    {
+      type: 'path',
+      d: 'M18.0 1.5C27.11 1.5 34.5 7.99 34.5 16.0 34.5 24.01 27.11 30.5 18.0 30.5 8.89 30.5 1.5 24.01 1.5 16.0 1.5 7.99 8.89 1.5 18.0 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M34.5 1.5C43.34 1.5 50.5 7.99 50.5 16.0 50.5 24.01 43.34 30.5 34.5 30.5 25.66 30.5 18.5 24.01 18.5 16.0 18.5 7.99 25.66 1.5 34.5 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M26.16 3.5C18.21 7.5 15.5 16.34 20.11 23.25 21.57 25.43 23.65 27.24 26.16 28.5 31.31 25.92 34.49 21.16 34.5 16.0 34.49 10.84 31.32 6.08 26.16 3.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 49.0,
+    height: 29.0,
+  },
+  unitTransform: {
+    scale: 0.020408,
+    x: -0.030612,
+    y: -0.030612,
+    width: 1.0,
+    height: 0.591837,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M18.0 1.5C27.11 1.5 34.5 7.99 34.5 16.0 34.5 24.01 27.11 30.5 18.0 30.5 8.89 30.5 1.5 24.01 1.5 16.0 1.5 7.99 8.89 1.5 18.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M34.5 1.5C43.34 1.5 50.5 7.99 50.5 16.0 50.5 24.01 43.34 30.5 34.5 30.5 25.66 30.5 18.5 24.01 18.5 16.0 18.5 7.99 25.66 1.5 34.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M26.16 3.5C18.21 7.5 15.5 16.34 20.11 23.25 21.57 25.43 23.65 27.24 26.16 28.5 31.31 25.92 34.49 21.16 34.5 16.0 34.49 10.84 31.32 6.08 26.16 3.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
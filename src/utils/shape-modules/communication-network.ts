@@ -0,0 +1,108 @@
+/**
+ * Shape Module: communication-network
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'communication-network',
+  width: 37,
+  height: 29,
+  elements: [
+    {
+      type: 'path',
+      d: 'M4.5 23.5 23.92 23.5 33.5 6.5 14.08 6.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M7.0 24.0 6.0 23.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M6.0 23.0 7.0 24.0',
+      stroke: 'black',
+      strokeWidth: 9.92,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M14.0 7.0 13.0 6.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M13.0 6.0 14.0 7.0',
+      stroke: 'black',
+      strokeWidth: 9.92,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M33.0 7.0 32.0 6.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M32.0 6.0 33.0 7.0',
+      stroke: 'black',
+      strokeWidth: 9.92,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M26.0 24.0 25.0 23.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M25.0 23.0 26.0 24.0',
+      stroke: 'black',
+      strokeWidth: 9.92,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 4.5,
+    y: 6.0,
+    width: 29.0,
+    height: 18.0,
+  },
+  unitTransform: {
+    scale: 0.034483,
+    x: -0.155172,
+    y: -0.206897,
+    width: 1.0,
+    height: 0.62069,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M4.5 23.5 23.92 23.5 33.5 6.5 14.08 6.5Z" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M7.0 24.0 6.0 23.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M6.0 23.0 7.0 24.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M14.0 7.0 13.0 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.0 6.0 14.0 7.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M33.0 7.0 32.0 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M32.0 6.0 33.0 7.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M26.0 24.0 25.0 23.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M25.0 23.0 26.0 24.0" stroke="black" stroke-width="9.92" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,58 @@
+/**
+ * Shape Module: constraint
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'constraint',
+  width: 62,
+  height: 29,
+  elements: [
+    {
+      type: 'path',
+      d: 'M8.06 1.0 61.0 1.0 53.94 28.0 1.0 28.0 8.06 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 28.5 54.44 28.5 61.5 1.5 8.56 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M12.5 1.5 5.5 28.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 60.5,
+    height: 27.5,
+  },
+  unitTransform: {
+    scale: 0.016529,
+    x: -0.016529,
+    y: -0.016529,
+    width: 1.0,
+    height: 0.454545,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M8.06 1.0 61.0 1.0 53.94 28.0 1.0 28.0 8.06 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 28.5 54.44 28.5 61.5 1.5 8.56 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.5 1.5 5.5 28.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,84 @@
+/**
+ * Shape Module: course-of-action
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'course-of-action',
+  width: 52,
+  height: 41,
+  elements: [
+    {
+      type: 'path',
+      d: 'M38.41 1.0C40.62 1.01 41.9 1.28 43.87 2.16 47.64 3.84 50.11 6.98 50.76 10.94 51.0 12.37 50.85 14.0 50.34 15.63 49.12 19.5 46.06 22.31 41.83 23.44 36.0 25.0 29.89 22.5 27.26 17.47 26.3 15.65 26.01 14.48 26.0 12.44 26.0 10.41 26.29 9.25 27.26 7.4 28.5 5.03 30.37 3.31 32.95 2.16 34.96 1.26 36.21 1.0 38.41 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M42.33 23.94C46.56 22.81 49.62 20.0 50.84 16.13 51.35 14.5 51.5 12.87 51.26 11.44 50.61 7.48 48.14 4.34 44.37 2.66 42.4 1.78 41.12 1.51 38.91 1.5 36.71 1.5 35.46 1.76 33.45 2.66 30.87 3.81 29.0 5.53 27.76 7.9 26.79 9.75 26.5 10.91 26.5 12.94 26.51 14.98 26.8 16.15 27.76 17.97 30.39 23.0 36.5 25.5 42.33 23.94Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M3.0 39.0C3.0 39.0 13.5 14.0 24.0 17.57L12.8 15.43C12.8 15.43 19.8 22.57 17.7 28.29L24.0 17.57',
+      stroke: 'black',
+      strokeWidth: 5.54,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M40.0 13.0 39.0 12.0Z',
+      fill: '#F5DEAA',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M39.0 12.0 40.0 13.0',
+      stroke: 'black',
+      strokeWidth: 5.54,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M41.0 19.53C43.53 18.82 45.37 17.06 46.1 14.64 46.41 13.62 46.5 12.61 46.36 11.71 45.97 9.24 44.49 7.27 42.22 6.22 41.04 5.68 40.27 5.51 38.95 5.5 37.62 5.5 36.87 5.67 35.67 6.22 34.12 6.94 33.0 8.02 32.25 9.5 31.67 10.66 31.5 11.38 31.5 12.65 31.51 13.92 31.68 14.66 32.25 15.79 33.83 18.94 37.5 20.5 41.0 19.53Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 3.0,
+    y: 1.0,
+    width: 48.37,
+    height: 38.0,
+  },
+  unitTransform: {
+    scale: 0.020672,
+    x: -0.062017,
+    y: -0.020774,
+    width: 1.0,
+    height: 0.785451,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M38.41 1.0C40.62 1.01 41.9 1.28 43.87 2.16 47.64 3.84 50.11 6.98 50.76 10.94 51.0 12.37 50.85 14.0 50.34 15.63 49.12 19.5 46.06 22.31 41.83 23.44 36.0 25.0 29.89 22.5 27.26 17.47 26.3 15.65 26.01 14.48 26.0 12.44 26.0 10.41 26.29 9.25 27.26 7.4 28.5 5.03 30.37 3.31 32.95 2.16 34.96 1.26 36.21 1.0 38.41 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M42.33 23.94C46.56 22.81 49.62 20.0 50.84 16.13 51.35 14.5 51.5 12.87 51.26 11.44 50.61 7.48 48.14 4.34 44.37 2.66 42.4 1.78 41.12 1.51 38.91 1.5 36.71 1.5 35.46 1.76 33.45 2.66 30.87 3.81 29.0 5.53 27.76 7.9 26.79 9.75 26.5 10.91 26.5 12.94 26.51 14.98 26.8 16.15 27.76 17.97 30.39 23.0 36.5 25.5 42.33 23.94Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M3.0 39.0C3.0 39.0 13.5 14.0 24.0 17.57L12.8 15.43C12.8 15.43 19.8 22.57 17.7 28.29L24.0 17.57" stroke="black" stroke-width="5.54" stroke-linejoin="round" stroke-miterlimit="10" fill="none" fill-rule="evenodd"/><path d="M40.0 13.0 39.0 12.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M39.0 12.0 40.0 13.0" stroke="black" stroke-width="5.54" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M41.0 19.53C43.53 18.82 45.37 17.06 46.1 14.64 46.41 13.62 46.5 12.61 46.36 11.71 45.97 9.24 44.49 7.27 42.22 6.22 41.04 5.68 40.27 5.51 38.95 5.5 37.62 5.5 36.87 5.67 35.67 6.22 34.12 6.94 33.0 8.02 32.25 9.5 31.67 10.66 31.5 11.38 31.5 12.65 31.51 13.92 31.68 14.66 32.25 15.79 33.83 18.94 37.5 20.5 41.0 19.53Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: null,
+};
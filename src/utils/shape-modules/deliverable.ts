@@ -0,0 +1,43 @@
+/**
+ * Shape Module: deliverable
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'deliverable',
+  width: 55,
+  height: 33,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.5 1.5 54.5 1.5 54.5 25.5C28.0 1.5 28.0 49.5 1.5 25.5L1.5 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1.27',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 53.0,
+    height: 30.93,
+  },
+  unitTransform: {
+    scale: 0.018868,
+    x: -0.028302,
+    y: -0.028302,
+    width: 1.0,
+    height: 0.58356,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.5 1.5 54.5 1.5 54.5 25.5C28.0 1.5 28.0 49.5 1.5 25.5L1.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1.27" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
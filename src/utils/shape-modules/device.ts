@@ -0,0 +1,59 @@
+/**
+ * Shape Module: device
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'device',
+  width: 47,
+  height: 24,
+  elements: [
+    {
+      type: 'path',
+      d: 'M4.31 0.5 43.69 0.5C45.24 0.5 46.5 1.77 46.5 3.33L46.5 14.67C46.5 16.23 45.24 17.5 43.69 17.5L4.31 17.5C2.76 17.5 1.5 16.23 1.5 14.67L1.5 3.33C1.5 1.77 2.76 0.5 4.31 0.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M6.62 17.0 40.38 17.0 46.0 23.0 1.0 23.0 6.62 17.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M7.12 17.5 1.5 23.5 46.5 23.5 40.88 17.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 0.5,
+    width: 45.5,
+    height: 23.0,
+  },
+  unitTransform: {
+    scale: 0.021978,
+    x: -0.021978,
+    y: -0.010989,
+    width: 1.0,
+    height: 0.505495,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M4.31 0.5 43.69 0.5C45.24 0.5 46.5 1.77 46.5 3.33L46.5 14.67C46.5 16.23 45.24 17.5 43.69 17.5L4.31 17.5C2.76 17.5 1.5 16.23 1.5 14.67L1.5 3.33C1.5 1.77 2.76 0.5 4.31 0.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M6.62 17.0 40.38 17.0 46.0 23.0 1.0 23.0 6.62 17.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M7.12 17.5 1.5 23.5 46.5 23.5 40.88 17.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
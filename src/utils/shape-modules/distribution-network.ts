@@ -0,0 +1,115 @@
+/**
+ * Shape Module: distribution-network
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'distribution-network',
+  width: 54,
+  height: 25,
+  elements: [
+    {
+      type: 'path',
+      d: 'M8.28 8.0 45.11 8.0 52.0 12.97 46.24 17.0 8.28 16.73 2.0 12.57 8.28 8.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M2.0 12.57 8.28 8.0 45.11 8.0 52.0 12.97 46.24 17.0 8.28 16.73Z',
+      stroke: 'black',
+      strokeWidth: 1.96,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.0 8.0 15.0 2.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.0 8.0 15.0 2.0',
+      stroke: 'black',
+      strokeWidth: 1.96,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M15.0 22.0 8.0 17.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.0 17.0 15.0 22.0',
+      stroke: 'black',
+      strokeWidth: 1.96,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M39.0 23.0 47.0 17.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M47.0 17.0 39.0 23.0',
+      stroke: 'black',
+      strokeWidth: 1.96,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M46.0 8.0 40.0 3.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M46.0 8.0 40.0 3.0',
+      stroke: 'black',
+      strokeWidth: 1.96,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 2.0,
+    y: 2.0,
+    width: 50.0,
+    height: 21.0,
+  },
+  unitTransform: {
+    scale: 0.02,
+    x: -0.04,
+    y: -0.04,
+    width: 1.0,
+    height: 0.42,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M8.28 8.0 45.11 8.0 52.0 12.97 46.24 17.0 8.28 16.73 2.0 12.57 8.28 8.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M2.0 12.57 8.28 8.0 45.11 8.0 52.0 12.97 46.24 17.0 8.28 16.73Z" stroke="black" stroke-width="1.96" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 8.0 15.0 2.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 8.0 15.0 2.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M15.0 22.0 8.0 17.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 17.0 15.0 22.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M39.0 23.0 47.0 17.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M47.0 17.0 39.0 23.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M46.0 8.0 40.0 3.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M46.0 8.0 40.0 3.0" stroke="black" stroke-width="1.96" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,99 @@
+/**
+ * Shape Module: driver
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'driver',
+  width: 40,
+  height: 40,
+  elements: [
+    {
+      type: 'path',
+      d: 'M21.0 6.0C28.73 6.0 35.0 12.27 35.0 20.0 35.0 27.73 28.73 34.0 21.0 34.0 13.27 34.0 7.0 27.73 7.0 20.0 7.0 12.27 13.27 6.0 21.0 6.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M21.0 6.0C28.73 6.0 35.0 12.27 35.0 20.0 35.0 27.73 28.73 34.0 21.0 34.0 13.27 34.0 7.0 27.73 7.0 20.0 7.0 12.27 13.27 6.0 21.0 6.0Z',
+      stroke: 'black',
+      strokeWidth: 3.69,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M20.5 16.0C22.43 16.0 24.0 17.57 24.0 19.5 24.0 21.43 22.43 23.0 20.5 23.0 18.57 23.0 17.0 21.43 17.0 19.5 17.0 17.57 18.57 16.0 20.5 16.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M21.0 16.5C22.93 16.5 24.5 18.07 24.5 20.0 24.5 21.93 22.93 23.5 21.0 23.5 19.07 23.5 17.5 21.93 17.5 20.0 17.5 18.07 19.07 16.5 21.0 16.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M35.5 34.5 7.5 6.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M7.5 34.5 35.5 6.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M39.5 20.5 1.5 20.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M21.5 1.5 21.5 39.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 38.0,
+    height: 38.0,
+  },
+  unitTransform: {
+    scale: 0.026316,
+    x: -0.039474,
+    y: -0.039474,
+    width: 1.0,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M21.0 6.0C28.73 6.0 35.0 12.27 35.0 20.0 35.0 27.73 28.73 34.0 21.0 34.0 13.27 34.0 7.0 27.73 7.0 20.0 7.0 12.27 13.27 6.0 21.0 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.0 6.0C28.73 6.0 35.0 12.27 35.0 20.0 35.0 27.73 28.73 34.0 21.0 34.0 13.27 34.0 7.0 27.73 7.0 20.0 7.0 12.27 13.27 6.0 21.0 6.0Z" stroke="black" stroke-width="3.69" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M20.5 16.0C22.43 16.0 24.0 17.57 24.0 19.5 24.0 21.43 22.43 23.0 20.5 23.0 18.57 23.0 17.0 21.43 17.0 19.5 17.0 17.57 18.57 16.0 20.5 16.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.0 16.5C22.93 16.5 24.5 18.07 24.5 20.0 24.5 21.93 22.93 23.5 21.0 23.5 19.07 23.5 17.5 21.93 17.5 20.0 17.5 18.07 19.07 16.5 21.0 16.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill-rule="evenodd"/><path d="M35.5 34.5 7.5 6.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M7.5 34.5 35.5 6.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M39.5 20.5 1.5 20.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M21.5 1.5 21.5 39.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
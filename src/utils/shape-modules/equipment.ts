@@ -0,0 +1,56 @@
+/**
+ * Shape Module: equipment
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'equipment',
+  width: 45,
+  height: 45,
+  elements: [
+    {
+      type: 'path',
+      d: 'M31.85 1.5C33.22 1.5 33.64 1.54 33.73 1.69 33.8 1.79 33.88 2.28 33.93 2.78 34.1 4.46 34.11 4.49 34.64 4.65 34.91 4.73 35.39 4.9 35.72 5.04L36.32 5.28 37.37 4.44C37.94 3.98 38.5 3.61 38.6 3.61 39.0 3.61 41.24 5.76 41.24 6.14 41.24 6.26 40.85 6.81 40.37 7.36L39.5 8.37 39.91 9.3C40.14 9.81 40.32 10.29 40.32 10.37 40.32 10.46 40.79 10.55 41.47 10.61 43.28 10.74 43.3 10.75 43.4 11.33 43.5 11.98 43.5 13.46 43.4 14.1L43.32 14.6 42.44 14.68C41.96 14.73 41.31 14.8 40.98 14.84L40.39 14.91 39.97 15.93 39.55 16.95 40.46 17.98C40.96 18.55 41.37 19.08 41.37 19.16 41.37 19.42 39.04 21.69 38.77 21.69 38.63 21.69 38.03 21.31 37.44 20.86L36.36 20.03 35.61 20.37C35.2 20.55 34.7 20.74 34.51 20.79 34.13 20.88 34.1 20.99 33.93 22.81 33.82 23.93 33.89 23.9 31.62 23.84L29.97 23.8 30.21 24.2C30.34 24.43 30.45 24.7 30.45 24.82 30.44 24.93 29.76 25.5 28.92 26.09 27.52 27.08 27.41 27.19 27.47 27.52 27.51 27.71 27.62 28.4 27.71 29.04L27.87 30.2 29.56 30.8C30.5 31.13 31.29 31.44 31.32 31.5 31.54 31.86 30.43 35.79 30.08 35.93 29.91 36.0 27.04 35.63 26.49 35.48 26.37 35.44 26.23 35.54 26.14 35.75 26.06 35.93 25.67 36.48 25.26 36.96L24.54 37.85 25.27 39.43C25.67 40.29 25.97 41.08 25.93 41.19 25.82 41.49 24.34 42.47 23.13 43.05 22.52 43.34 21.98 43.58 21.92 43.58 21.86 43.58 21.34 42.95 20.78 42.18 20.21 41.42 19.71 40.74 19.66 40.68 19.61 40.63 19.19 40.67 18.73 40.78 18.26 40.9 17.54 40.99 17.12 40.99 16.5 40.99 16.33 41.04 16.29 41.23 16.08 42.01 14.96 44.46 14.79 44.49 14.68 44.5 14.07 44.4 13.43 44.26 11.77 43.89 10.45 43.46 10.37 43.25 10.31 43.1 10.55 41.32 10.79 40.1 10.86 39.7 10.83 39.65 10.13 39.24 9.72 39.01 9.15 38.59 8.86 38.32L8.34 37.83 6.73 38.53C5.84 38.92 5.01 39.23 4.89 39.23 4.48 39.23 2.42 36.02 2.42 35.4 2.42 35.3 3.09 34.74 3.91 34.17L5.41 33.13 5.24 32.2C5.14 31.69 5.02 30.97 4.96 30.61L4.86 29.94 3.18 29.33C1.51 28.73 1.5 28.72 1.5 28.3 1.51 27.65 1.98 25.6 2.3 24.83 2.64 24.01 2.53 24.03 4.78 24.41 5.67 24.56 6.42 24.67 6.43 24.65 6.58 24.34 7.33 23.38 7.8 22.88L8.4 22.23 7.65 20.67C7.23 19.81 6.89 19.03 6.89 18.93 6.89 18.52 10.14 16.66 10.85 16.66 11.14 16.66 11.38 16.91 12.23 18.05 12.79 18.82 13.27 19.46 13.29 19.49 13.3 19.51 13.57 19.46 13.89 19.38 14.2 19.3 14.95 19.19 15.56 19.13L16.65 19.04 17.27 17.41C17.79 16.04 17.94 15.77 18.19 15.73 18.83 15.64 22.42 16.59 22.61 16.9 22.63 16.96 22.53 17.8 22.37 18.78L22.08 20.57 22.8 21.01C23.2 21.26 23.75 21.67 24.02 21.93L24.52 22.39 26.08 21.7C26.94 21.32 27.76 21.01 27.91 21.01 28.22 21.01 28.37 21.17 29.27 22.5 29.65 23.06 29.93 23.43 29.89 23.3 29.85 23.18 29.77 22.6 29.72 22.0L29.63 20.92 29.02 20.75C28.69 20.66 28.18 20.48 27.89 20.35L27.36 20.11 26.31 20.97C25.73 21.44 25.2 21.82 25.12 21.82 24.74 21.82 22.42 19.65 22.42 19.29 22.42 19.2 22.81 18.67 23.28 18.11L24.14 17.1 23.73 16.17C23.51 15.65 23.28 15.14 23.22 15.03 23.15 14.88 22.74 14.79 21.77 14.69 20.81 14.59 20.4 14.49 20.33 14.35 20.06 13.82 20.07 11.16 20.34 10.88 20.37 10.85 21.04 10.74 21.83 10.65L23.25 10.47 23.48 9.77C23.61 9.39 23.81 8.92 23.94 8.73L24.16 8.37 23.21 7.29 22.27 6.2 22.53 5.82C23.07 5.05 24.67 3.61 24.99 3.61 25.08 3.61 25.64 4.0 26.24 4.47L27.32 5.33 28.33 4.88C28.88 4.63 29.4 4.43 29.48 4.43 29.57 4.42 29.69 3.86 29.78 3.04 29.86 2.28 29.96 1.62 30.0 1.58 30.05 1.54 30.88 1.5 31.85 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M16.34 23.5C17.46 23.51 18.59 23.79 19.75 24.35 21.98 25.43 23.5 28.1 23.23 30.48 23.13 31.32 22.73 32.53 22.32 33.2 21.83 34.01 20.64 35.05 19.68 35.52 18.16 36.27 16.71 36.5 15.19 36.25 13.55 35.98 11.86 35.09 10.95 34.04 10.68 33.73 10.24 33.03 9.97 32.49 8.5 29.53 9.86 25.85 12.99 24.32 14.11 23.77 15.22 23.5 16.34 23.5ZM32.35 7.61C33.4 7.66 33.72 7.74 34.46 8.11 36.21 8.99 37.3 10.57 37.42 12.4 37.5 13.7 37.27 14.6 36.62 15.6 35.36 17.54 32.7 18.5 30.4 17.85 29.36 17.56 28.76 17.19 27.92 16.35 26.87 15.28 26.5 14.36 26.5 12.81 26.5 11.44 26.86 10.43 27.68 9.5 28.94 8.07 30.34 7.5 32.35 7.61Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 41.97,
+    height: 42.99,
+  },
+  unitTransform: {
+    scale: 0.023263,
+    x: -0.03496,
+    y: -0.034895,
+    width: 0.976388,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M31.85 1.5C33.22 1.5 33.64 1.54 33.73 1.69 33.8 1.79 33.88 2.28 33.93 2.78 34.1 4.46 34.11 4.49 34.64 4.65 34.91 4.73 35.39 4.9 35.72 5.04L36.32 5.28 37.37 4.44C37.94 3.98 38.5 3.61 38.6 3.61 39.0 3.61 41.24 5.76 41.24 6.14 41.24 6.26 40.85 6.81 40.37 7.36L39.5 8.37 39.91 9.3C40.14 9.81 40.32 10.29 40.32 10.37 40.32 10.46 40.79 10.55 41.47 10.61 43.28 10.74 43.3 10.75 43.4 11.33 43.5 11.98 43.5 13.46 43.4 14.1L43.32 14.6 42.44 14.68C41.96 14.73 41.31 14.8 40.98 14.84L40.39 14.91 39.97 15.93 39.55 16.95 40.46 17.98C40.96 18.55 41.37 19.08 41.37 19.16 41.37 19.42 39.04 21.69 38.77 21.69 38.63 21.69 38.03 21.31 37.44 20.86L36.36 20.03 35.61 20.37C35.2 20.55 34.7 20.74 34.51 20.79 34.13 20.88 34.1 20.99 33.93 22.81 33.82 23.93 33.89 23.9 31.62 23.84L29.97 23.8 30.21 24.2C30.34 24.43 30.45 24.7 30.45 24.82 30.44 24.93 29.76 25.5 28.92 26.09 27.52 27.08 27.41 27.19 27.47 27.52 27.51 27.71 27.62 28.4 27.71 29.04L27.87 30.2 29.56 30.8C30.5 31.13 31.29 31.44 31.32 31.5 31.54 31.86 30.43 35.79 30.08 35.93 29.91 36.0 27.04 35.63 26.49 35.48 26.37 35.44 26.23 35.54 26.14 35.75 26.06 35.93 25.67 36.48 25.26 36.96L24.54 37.85 25.27 39.43C25.67 40.29 25.97 41.08 25.93 41.19 25.82 41.49 24.34 42.47 23.13 43.05 22.52 43.34 21.98 43.58 21.92 43.58 21.86 43.58 21.34 42.95 20.78 42.18 20.21 41.42 19.71 40.74 19.66 40.68 19.61 40.63 19.19 40.67 18.73 40.78 18.26 40.9 17.54 40.99 17.12 40.99 16.5 40.99 16.33 41.04 16.29 41.23 16.08 42.01 14.96 44.46 14.79 44.49 14.68 44.5 14.07 44.4 13.43 44.26 11.77 43.89 10.45 43.46 10.37 43.25 10.31 43.1 10.55 41.32 10.79 40.1 10.86 39.7 10.83 39.65 10.13 39.24 9.72 39.01 9.15 38.59 8.86 38.32L8.34 37.83 6.73 38.53C5.84 38.92 5.01 39.23 4.89 39.23 4.48 39.23 2.42 36.02 2.42 35.4 2.42 35.3 3.09 34.74 3.91 34.17L5.41 33.13 5.24 32.2C5.14 31.69 5.02 30.97 4.96 30.61L4.86 29.94 3.18 29.33C1.51 28.73 1.5 28.72 1.5 28.3 1.51 27.65 1.98 25.6 2.3 24.83 2.64 24.01 2.53 24.03 4.78 24.41 5.67 24.56 6.42 24.67 6.43 24.65 6.58 24.34 7.33 23.38 7.8 22.88L8.4 22.23 7.65 20.67C7.23 19.81 6.89 19.03 6.89 18.93 6.89 18.52 10.14 16.66 10.85 16.66 11.14 16.66 11.38 16.91 12.23 18.05 12.79 18.82 13.27 19.46 13.29 19.49 13.3 19.51 13.57 19.46 13.89 19.38 14.2 19.3 14.95 19.19 15.56 19.13L16.65 19.04 17.27 17.41C17.79 16.04 17.94 15.77 18.19 15.73 18.83 15.64 22.42 16.59 22.61 16.9 22.63 16.96 22.53 17.8 22.37 18.78L22.08 20.57 22.8 21.01C23.2 21.26 23.75 21.67 24.02 21.93L24.52 22.39 26.08 21.7C26.94 21.32 27.76 21.01 27.91 21.01 28.22 21.01 28.37 21.17 29.27 22.5 29.65 23.06 29.93 23.43 29.89 23.3 29.85 23.18 29.77 22.6 29.72 22.0L29.63 20.92 29.02 20.75C28.69 20.66 28.18 20.48 27.89 20.35L27.36 20.11 26.31 20.97C25.73 21.44 25.2 21.82 25.12 21.82 24.74 21.82 22.42 19.65 22.42 19.29 22.42 19.2 22.81 18.67 23.28 18.11L24.14 17.1 23.73 16.17C23.51 15.65 23.28 15.14 23.22 15.03 23.15 14.88 22.74 14.79 21.77 14.69 20.81 14.59 20.4 14.49 20.33 14.35 20.06 13.82 20.07 11.16 20.34 10.88 20.37 10.85 21.04 10.74 21.83 10.65L23.25 10.47 23.48 9.77C23.61 9.39 23.81 8.92 23.94 8.73L24.16 8.37 23.21 7.29 22.27 6.2 22.53 5.82C23.07 5.05 24.67 3.61 24.99 3.61 25.08 3.61 25.64 4.0 26.24 4.47L27.32 5.33 28.33 4.88C28.88 4.63 29.4 4.43 29.48 4.43 29.57 4.42 29.69 3.86 29.78 3.04 29.86 2.28 29.96 1.62 30.0 1.58 30.05 1.54 30.88 1.5 31.85 1.5Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M16.34 23.5C17.46 23.51 18.59 23.79 19.75 24.35 21.98 25.43 23.5 28.1 23.23 30.48 23.13 31.32 22.73 32.53 22.32 33.2 21.83 34.01 20.64 35.05 19.68 35.52 18.16 36.27 16.71 36.5 15.19 36.25 13.55 35.98 11.86 35.09 10.95 34.04 10.68 33.73 10.24 33.03 9.97 32.49 8.5 29.53 9.86 25.85 12.99 24.32 14.11 23.77 15.22 23.5 16.34 23.5ZM32.35 7.61C33.4 7.66 33.72 7.74 34.46 8.11 36.21 8.99 37.3 10.57 37.42 12.4 37.5 13.7 37.27 14.6 36.62 15.6 35.36 17.54 32.7 18.5 30.4 17.85 29.36 17.56 28.76 17.19 27.92 16.35 26.87 15.28 26.5 14.36 26.5 12.81 26.5 11.44 26.86 10.43 27.68 9.5 28.94 8.07 30.34 7.5 32.35 7.61Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
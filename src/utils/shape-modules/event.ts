@@ -0,0 +1,43 @@
+/**
+ * Shape Module: event
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'event',
+  width: 55,
+  height: 28,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.5 0.5 41.25 0.5C48.57 0.5 54.5 6.54 54.5 14.0 54.5 21.46 48.57 27.5 41.25 27.5L1.5 27.5 8.12 14.0 1.5 0.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 0.5,
+    width: 53.0,
+    height: 27.0,
+  },
+  unitTransform: {
+    scale: 0.018868,
+    x: -0.028302,
+    y: -0.009434,
+    width: 1.0,
+    height: 0.509434,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.5 0.5 41.25 0.5C48.57 0.5 54.5 6.54 54.5 14.0 54.5 21.46 48.57 27.5 41.25 27.5L1.5 27.5 8.12 14.0 1.5 0.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,43 @@
+/**
+ * Shape Module: facility
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'facility',
+  width: 55,
+  height: 37,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.5 1.5 9.04 1.5 9.04 12.9C9.04 19.16 9.06 24.29 9.08 24.29 9.1 24.29 12.45 22.91 16.53 21.22 20.61 19.53 24.01 18.13 24.09 18.11 24.21 18.07 24.23 18.48 24.23 21.21 24.23 22.95 24.25 24.36 24.28 24.36 24.32 24.36 37.89 18.77 39.01 18.29L39.31 18.16 39.34 21.29 39.36 24.42 46.25 21.56C50.04 19.99 53.44 18.58 53.82 18.43L54.5 18.14 54.5 36.5 1.5 36.5 1.5 19.0 1.5 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 53.0,
+    height: 35.0,
+  },
+  unitTransform: {
+    scale: 0.018868,
+    x: -0.028302,
+    y: -0.028302,
+    width: 1.0,
+    height: 0.660377,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.5 1.5 9.04 1.5 9.04 12.9C9.04 19.16 9.06 24.29 9.08 24.29 9.1 24.29 12.45 22.91 16.53 21.22 20.61 19.53 24.01 18.13 24.09 18.11 24.21 18.07 24.23 18.48 24.23 21.21 24.23 22.95 24.25 24.36 24.28 24.36 24.32 24.36 37.89 18.77 39.01 18.29L39.31 18.16 39.34 21.29 39.36 24.42 46.25 21.56C50.04 19.99 53.44 18.58 53.82 18.43L54.5 18.14 54.5 36.5 1.5 36.5 1.5 19.0 1.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,43 @@
+/**
+ * Shape Module: function
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'function',
+  width: 51,
+  height: 33,
+  elements: [
+    {
+      type: 'path',
+      d: 'M26.0 1.5 50.5 11.46 50.5 32.5 26.0 22.54 1.5 32.5 1.5 11.46 26.0 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 49.0,
+    height: 31.0,
+  },
+  unitTransform: {
+    scale: 0.020408,
+    x: -0.030612,
+    y: -0.030612,
+    width: 1.0,
+    height: 0.632653,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M26.0 1.5 50.5 11.46 50.5 32.5 26.0 22.54 1.5 32.5 1.5 11.46 26.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
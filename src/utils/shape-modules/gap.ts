@@ -0,0 +1,52 @@
+/**
+ * Shape Module: gap
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'gap',
+  width: 49,
+  height: 31,
+  elements: [
+    {
+      type: 'path',
+      d: 'M38.5 16.0C38.5 24.01 32.23 30.5 24.5 30.5 16.77 30.5 10.5 24.01 10.5 16.0 10.5 7.99 16.77 1.5 24.5 1.5 32.23 1.5 38.5 7.99 38.5 16.0Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 10.5 48.5 10.5M1.5 20.5 48.5 20.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 47.0,
+    height: 29.0,
+  },
+  unitTransform: {
+    scale: 0.021277,
+    x: -0.031915,
+    y: -0.031915,
+    width: 1.0,
+    height: 0.617021,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M38.5 16.0C38.5 24.01 32.23 30.5 24.5 30.5 16.77 30.5 10.5 24.01 10.5 16.0 10.5 7.99 16.77 1.5 24.5 1.5 32.23 1.5 38.5 7.99 38.5 16.0Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 10.5 48.5 10.5M1.5 20.5 48.5 20.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,62 @@
+/**
+ * Shape Module: goal
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'goal',
+  width: 40,
+  height: 40,
+  elements: [
+    {
+      type: 'path',
+      d: 'M20.0 1.5C30.21 1.5 38.48 9.77 38.5 19.97L38.5 20.0C38.5 30.21 30.22 38.5 20.0 38.5 9.79 38.5 1.5 30.22 1.5 20.0 1.5 9.79 9.78 1.5 20.0 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M20.5 8.5C27.12 8.5 32.49 13.87 32.5 20.49L32.5 20.5C32.5 27.13 27.13 32.5 20.5 32.5 13.87 32.5 8.5 27.13 8.5 20.5 8.5 13.87 13.87 8.5 20.5 8.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M20.5 20.5 21.5 20.5',
+      stroke: 'black',
+      strokeWidth: 15.46,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 37.0,
+    height: 37.0,
+  },
+  unitTransform: {
+    scale: 0.027028,
+    x: -0.040624,
+    y: -0.04057,
+    width: 0.999946,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M20.0 1.5C30.21 1.5 38.48 9.77 38.5 19.97L38.5 20.0C38.5 30.21 30.22 38.5 20.0 38.5 9.79 38.5 1.5 30.22 1.5 20.0 1.5 9.79 9.78 1.5 20.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M20.5 8.5C27.12 8.5 32.49 13.87 32.5 20.49L32.5 20.5C32.5 27.13 27.13 32.5 20.5 32.5 13.87 32.5 8.5 27.13 8.5 20.5 8.5 13.87 13.87 8.5 20.5 8.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M20.5 20.5 21.5 20.5" stroke="black" stroke-width="15.46" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '',
+};
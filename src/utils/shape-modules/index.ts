@@ -0,0 +1,59 @@
+/**
+ * Shape Module: index
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export interface IShapeModule {
+  shape: IShapeDefinition;
+  iconFragment: IIconFragment | null;
+}
+
+// Loaders for the shape modules, keyed by shape name
+export const shapeModuleLoaders: Record<string, () => Promise<IShapeModule>> = {
+  'application-component': () => import('./application-component'),
+  artifact: () => import('./artifact'),
+  assessment: () => import('./assessment'),
+  'business-actor': () => import('./business-actor'),
+  capability: () => import('./capability'),
+  collaboration: () => import('./collaboration'),
+  'communication-network': () => import('./communication-network'),
+  constraint: () => import('./constraint'),
+  contract: () => import('./contract'),
+  'course-of-action': () => import('./course-of-action'),
+  deliverable: () => import('./deliverable'),
+  device: () => import('./device'),
+  'distribution-network': () => import('./distribution-network'),
+  driver: () => import('./driver'),
+  equipment: () => import('./equipment'),
+  event: () => import('./event'),
+  facility: () => import('./facility'),
+  function: () => import('./function'),
+  gap: () => import('./gap'),
+  goal: () => import('./goal'),
+  interaction: () => import('./interaction'),
+  interface: () => import('./interface'),
+  location: () => import('./location'),
+  material: () => import('./material'),
+  meaning: () => import('./meaning'),
+  node: () => import('./node'),
+  object: () => import('./object'),
+  outcome: () => import('./outcome'),
+  path: () => import('./path'),
+  plateau: () => import('./plateau'),
+  principle: () => import('./principle'),
+  process: () => import('./process'),
+  product: () => import('./product'),
+  representation: () => import('./representation'),
+  requirement: () => import('./requirement'),
+  resource: () => import('./resource'),
+  role: () => import('./role'),
+  service: () => import('./service'),
+  'system-software': () => import('./system-software'),
+  'value-stream': () => import('./value-stream'),
+  value: () => import('./value'),
+  'work-package': () => import('./work-package'),
+};
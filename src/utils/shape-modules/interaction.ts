@@ -0,0 +1,43 @@
+/**
+ * Shape Module: interaction
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'interaction',
+  width: 38,
+  height: 32,
+  elements: [
+    {
+      type: 'path',
+      d: 'M16.5 31.5 16.5 1.5C16.5 1.5 1.5 1.5 1.5 16.5 1.5 31.5 16.5 31.5 16.5 31.5ZM22.5 31.5 22.5 1.5C22.5 1.5 37.5 1.5 37.5 16.5 37.5 31.5 22.5 31.5 22.5 31.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 36.0,
+    height: 30.0,
+  },
+  unitTransform: {
+    scale: 0.027778,
+    x: -0.041667,
+    y: -0.041667,
+    width: 1.0,
+    height: 0.833333,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M16.5 31.5 16.5 1.5C16.5 1.5 1.5 1.5 1.5 16.5 1.5 31.5 16.5 31.5 16.5 31.5ZM22.5 31.5 22.5 1.5C22.5 1.5 37.5 1.5 37.5 16.5 37.5 31.5 22.5 31.5 22.5 31.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
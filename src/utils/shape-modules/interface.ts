@@ -0,0 +1,52 @@
+/**
+ * Shape Module: interface
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'interface',
+  width: 46,
+  height: 31,
+  elements: [
+    {
+      type: 'path',
+      d: 'M16.5 16.5 1.5 16.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M31.0 1.5C39.01 1.5 45.5 7.99 45.5 16.0 45.5 24.01 39.01 30.5 31.0 30.5 22.99 30.5 16.5 24.01 16.5 16.0 16.5 7.99 22.99 1.5 31.0 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 44.0,
+    height: 29.0,
+  },
+  unitTransform: {
+    scale: 0.022727,
+    x: -0.034091,
+    y: -0.034091,
+    width: 1.0,
+    height: 0.659091,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M16.5 16.5 1.5 16.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M31.0 1.5C39.01 1.5 45.5 7.99 45.5 16.0 45.5 24.01 39.01 30.5 31.0 30.5 22.99 30.5 16.5 24.01 16.5 16.0 16.5 7.99 22.99 1.5 31.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
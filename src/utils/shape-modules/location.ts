@@ -0,0 +1,49 @@
+/**
+ * Shape Module: location
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'location',
+  width: 26,
+  height: 34,
+  elements: [
+    {
+      type: 'path',
+      d: 'M10.71 1.38C13.68 1.0 16.46 1.65 18.43 2.63 20.04 3.44 21.29 4.52 22.24 5.79 23.23 7.11 23.91 8.68 23.97 10.72 24.0 11.76 23.8 12.73 23.52 13.54 23.23 14.35 22.77 15.03 22.36 15.76 21.57 17.17 20.57 18.47 19.56 19.77 16.57 23.64 13.77 27.59 12.54 33.0 11.69 29.44 10.19 26.47 8.38 23.72 7.03 21.68 5.48 19.8 4.03 17.82 3.55 17.16 3.14 16.46 2.68 15.77 1.75 14.4 1.0 12.81 1.05 10.75 1.09 8.74 1.78 7.12 2.76 5.8 4.37 3.63 7.08 1.85 10.71 1.38Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M13.04 33.5C12.19 29.94 10.69 26.97 8.88 24.22 7.54 22.18 5.98 20.3 4.53 18.32 4.05 17.66 3.64 16.96 3.18 16.27 2.25 14.9 1.5 13.31 1.55 11.25 1.59 9.24 2.28 7.62 3.26 6.3 4.87 4.13 7.58 2.35 11.21 1.88 14.18 1.5 16.96 2.15 18.93 3.13 20.54 3.94 21.79 5.02 22.74 6.29 23.73 7.61 24.41 9.18 24.47 11.22 24.5 12.26 24.3 13.23 24.02 14.04 23.73 14.85 23.27 15.53 22.86 16.26 22.07 17.67 21.07 18.97 20.06 20.27 17.07 24.14 14.27 28.09 13.04 33.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.05,
+    y: 1.27,
+    width: 23.43,
+    height: 32.23,
+  },
+  unitTransform: {
+    scale: 0.031028,
+    x: -0.03245,
+    y: -0.039445,
+    width: 0.726928,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M10.71 1.38C13.68 1.0 16.46 1.65 18.43 2.63 20.04 3.44 21.29 4.52 22.24 5.79 23.23 7.11 23.91 8.68 23.97 10.72 24.0 11.76 23.8 12.73 23.52 13.54 23.23 14.35 22.77 15.03 22.36 15.76 21.57 17.17 20.57 18.47 19.56 19.77 16.57 23.64 13.77 27.59 12.54 33.0 11.69 29.44 10.19 26.47 8.38 23.72 7.03 21.68 5.48 19.8 4.03 17.82 3.55 17.16 3.14 16.46 2.68 15.77 1.75 14.4 1.0 12.81 1.05 10.75 1.09 8.74 1.78 7.12 2.76 5.8 4.37 3.63 7.08 1.85 10.71 1.38Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.04 33.5C12.19 29.94 10.69 26.97 8.88 24.22 7.54 22.18 5.98 20.3 4.53 18.32 4.05 17.66 3.64 16.96 3.18 16.27 2.25 14.9 1.5 13.31 1.55 11.25 1.59 9.24 2.28 7.62 3.26 6.3 4.87 4.13 7.58 2.35 11.21 1.88 14.18 1.5 16.96 2.15 18.93 3.13 20.54 3.94 21.79 5.02 22.74 6.29 23.73 7.61 24.41 9.18 24.47 11.22 24.5 12.26 24.3 13.23 24.02 14.04 23.73 14.85 23.27 15.53 22.86 16.26 22.07 17.67 21.07 18.97 20.06 20.27 17.07 24.14 14.27 28.09 13.04 33.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
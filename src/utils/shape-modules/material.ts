@@ -0,0 +1,97 @@
+/**
+ * Shape Module: material
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'material',
+  width: 45,
+  height: 36,
+  elements: [
+    {
+      type: 'path',
+      d: 'M33.58 1.0 44.0 17.88 33.05 34.76 12.22 35.0 1.0 17.88 11.68 1.24 33.58 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 18.38 12.18 1.74 34.08 1.5 44.5 18.38 33.55 35.26 12.72 35.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.0 19.0 17.0 5.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.5 19.5 17.5 5.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M13.0 29.0 31.0 28.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M13.5 29.5 31.5 28.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M36.0 19.0 27.0 5.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M27.5 5.5 36.5 19.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 43.5,
+    height: 34.5,
+  },
+  unitTransform: {
+    scale: 0.022989,
+    x: -0.022989,
+    y: -0.022989,
+    width: 1.0,
+    height: 0.793103,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M33.58 1.0 44.0 17.88 33.05 34.76 12.22 35.0 1.0 17.88 11.68 1.24 33.58 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 18.38 12.18 1.74 34.08 1.5 44.5 18.38 33.55 35.26 12.72 35.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 19.0 17.0 5.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.5 19.5 17.5 5.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.0 29.0 31.0 28.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M13.5 29.5 31.5 28.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M36.0 19.0 27.0 5.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M27.5 5.5 36.5 19.5" stroke="black" stroke-width="2" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,79 @@
+/**
+ * Shape Module: meaning
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'meaning',
+  width: 60,
+  height: 38,
+  elements: [
+    {
+      type: 'path',
+      d: 'M26.54 1.33C29.05 1.48 31.56 2.37 32.28 3.56 36.59 1.19 49.51 1.19 49.51 3.56 58.13 1.19 61.0 10.67 55.26 13.04 61.0 13.04 58.22 19.63 55.26 22.52 55.26 32.0 43.77 29.63 38.03 27.26 32.28 29.63 9.31 32.0 15.05 24.89 6.44 24.89 7.87 10.67 12.18 10.67 5.0 3.56 15.05 0.0 20.79 3.56 21.51 1.78 24.03 1.19 26.54 1.33Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M12.68 11.17C5.5 4.06 15.55 0.5 21.29 4.06 22.73 0.5 31.35 1.69 32.78 4.06 37.09 1.69 50.01 1.69 50.01 4.06 58.63 1.69 61.5 11.17 55.76 13.54 61.5 13.54 58.72 20.13 55.76 23.02 55.76 32.5 44.27 30.13 38.53 27.76 32.78 30.13 9.81 32.5 15.55 25.39 6.94 25.39 8.37 11.17 12.68 11.17Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.0 25.0C10.21 25.0 12.0 26.57 12.0 28.5 12.0 30.43 10.21 32.0 8.0 32.0 5.79 32.0 4.0 30.43 4.0 28.5 4.0 26.57 5.79 25.0 8.0 25.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M8.5 25.5C10.71 25.5 12.5 27.07 12.5 29.0 12.5 30.93 10.71 32.5 8.5 32.5 6.29 32.5 4.5 30.93 4.5 29.0 4.5 27.07 6.29 25.5 8.5 25.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M4.0 32.0C5.66 32.0 7.0 33.12 7.0 34.5 7.0 35.88 5.66 37.0 4.0 37.0 2.34 37.0 1.0 35.88 1.0 34.5 1.0 33.12 2.34 32.0 4.0 32.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M4.5 32.5C6.16 32.5 7.5 33.62 7.5 35.0 7.5 36.38 6.16 37.5 4.5 37.5 2.84 37.5 1.5 36.38 1.5 35.0 1.5 33.62 2.84 32.5 4.5 32.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.31,
+    width: 58.1,
+    height: 36.19,
+  },
+  unitTransform: {
+    scale: 0.017211,
+    x: -0.017211,
+    y: -0.022568,
+    width: 1.0,
+    height: 0.622849,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M26.54 1.33C29.05 1.48 31.56 2.37 32.28 3.56 36.59 1.19 49.51 1.19 49.51 3.56 58.13 1.19 61.0 10.67 55.26 13.04 61.0 13.04 58.22 19.63 55.26 22.52 55.26 32.0 43.77 29.63 38.03 27.26 32.28 29.63 9.31 32.0 15.05 24.89 6.44 24.89 7.87 10.67 12.18 10.67 5.0 3.56 15.05 0.0 20.79 3.56 21.51 1.78 24.03 1.19 26.54 1.33Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.68 11.17C5.5 4.06 15.55 0.5 21.29 4.06 22.73 0.5 31.35 1.69 32.78 4.06 37.09 1.69 50.01 1.69 50.01 4.06 58.63 1.69 61.5 11.17 55.76 13.54 61.5 13.54 58.72 20.13 55.76 23.02 55.76 32.5 44.27 30.13 38.53 27.76 32.78 30.13 9.81 32.5 15.55 25.39 6.94 25.39 8.37 11.17 12.68 11.17Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.0 25.0C10.21 25.0 12.0 26.57 12.0 28.5 12.0 30.43 10.21 32.0 8.0 32.0 5.79 32.0 4.0 30.43 4.0 28.5 4.0 26.57 5.79 25.0 8.0 25.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M8.5 25.5C10.71 25.5 12.5 27.07 12.5 29.0 12.5 30.93 10.71 32.5 8.5 32.5 6.29 32.5 4.5 30.93 4.5 29.0 4.5 27.07 6.29 25.5 8.5 25.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M4.0 32.0C5.66 32.0 7.0 33.12 7.0 34.5 7.0 35.88 5.66 37.0 4.0 37.0 2.34 37.0 1.0 35.88 1.0 34.5 1.0 33.12 2.34 32.0 4.0 32.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M4.5 32.5C6.16 32.5 7.5 33.62 7.5 35.0 7.5 36.38 6.16 37.5 4.5 37.5 2.84 37.5 1.5 36.38 1.5 35.0 1.5 33.62 2.84 32.5 4.5 32.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
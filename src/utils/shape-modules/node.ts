@@ -0,0 +1,73 @@
+/**
+ * Shape Module: node
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'node',
+  width: 48,
+  height: 25,
+  elements: [
+    {
+      type: 'path',
+      d: 'M6.75 1.0 47.0 1.0 47.0 18.25 41.25 24.0 1.0 24.0 1.0 6.75 6.75 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 7.25 7.25 1.5 47.5 1.5 47.5 18.75 41.75 24.5 1.5 24.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 7.5 41.5 7.5 41.5 24.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M41.5 7.5 47.5 1.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 46.5,
+    height: 23.5,
+  },
+  unitTransform: {
+    scale: 0.021505,
+    x: -0.021505,
+    y: -0.021505,
+    width: 1.0,
+    height: 0.505376,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M6.75 1.0 47.0 1.0 47.0 18.25 41.25 24.0 1.0 24.0 1.0 6.75 6.75 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 7.25 7.25 1.5 47.5 1.5 47.5 18.75 41.75 24.5 1.5 24.5Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 7.5 41.5 7.5 41.5 24.5" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M41.5 7.5 47.5 1.5" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,98 @@
+/**
+ * Shape Module: outcome
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'outcome',
+  width: 46,
+  height: 46,
+  elements: [
+    {
+      type: 'path',
+      d: 'M33.5 29.5C33.5 38.33 26.34 45.5 17.5 45.5 8.67 45.5 1.5 38.34 1.5 29.5 1.5 20.67 8.66 13.5 17.5 13.5 26.33 13.5 33.49 20.65 33.5 29.48',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M27.5 29.0C27.5 34.8 22.8 39.5 17.0 39.5 11.2 39.5 6.5 34.8 6.5 29.0 6.5 23.2 11.2 18.5 17.0 18.5 22.79 18.5 27.49 23.19 27.5 28.99',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M22.5 29.0C22.5 32.03 20.26 34.5 17.5 34.5 14.74 34.5 12.5 32.04 12.5 29.0 12.5 25.97 14.74 23.5 17.5 23.5 20.25 23.5 22.49 25.96 22.5 28.99',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M38.0 8.0 19.0 27.0',
+      stroke: 'black',
+      strokeWidth: 3.98,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M44.5 10.8 31.5 15.5 34.42 2.5',
+      stroke: 'black',
+      strokeWidth: 2.63,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M18.11 20.0 26.0 27.3 16.0 29.0 18.11 20.0Z',
+      fill: '#CCCCFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M16.5 29.5 26.5 27.8 18.61 20.5Z',
+      stroke: 'black',
+      strokeWidth: 5.1,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 2.5,
+    width: 43.0,
+    height: 43.0,
+  },
+  unitTransform: {
+    scale: 0.023256,
+    x: -0.034908,
+    y: -0.058141,
+    width: 1.0,
+    height: 1.0,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M33.5 29.5C33.5 38.33 26.34 45.5 17.5 45.5 8.67 45.5 1.5 38.34 1.5 29.5 1.5 20.67 8.66 13.5 17.5 13.5 26.33 13.5 33.49 20.65 33.5 29.48" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M27.5 29.0C27.5 34.8 22.8 39.5 17.0 39.5 11.2 39.5 6.5 34.8 6.5 29.0 6.5 23.2 11.2 18.5 17.0 18.5 22.79 18.5 27.49 23.19 27.5 28.99" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M22.5 29.0C22.5 32.03 20.26 34.5 17.5 34.5 14.74 34.5 12.5 32.04 12.5 29.0 12.5 25.97 14.74 23.5 17.5 23.5 20.25 23.5 22.49 25.96 22.5 28.99" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M38.0 8.0 19.0 27.0" stroke="black" stroke-width="3.98" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M44.5 10.8 31.5 15.5 34.42 2.5" stroke="black" stroke-width="2.63" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="none" fill-rule="evenodd"/><path d="M18.11 20.0 26.0 27.3 16.0 29.0 18.11 20.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M16.5 29.5 26.5 27.8 18.61 20.5Z" stroke="black" stroke-width="5.1" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill-rule="evenodd"/></g>',
+  defaultFill: '#CCCCFF',
+};
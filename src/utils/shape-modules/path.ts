@@ -0,0 +1,52 @@
+/**
+ * Shape Module: path
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'path',
+  width: 40,
+  height: 20,
+  elements: [
+    {
+      type: 'path',
+      d: 'M14.5 2.5C14.5 2.5 2.5 8.75 2.5 10.0 2.5 11.25 14.5 17.5 14.5 17.5M27.5 2.5C27.5 2.5 38.5 8.75 38.5 10.0 38.5 11.25 27.5 17.5 27.5 17.5',
+      stroke: 'black',
+      strokeWidth: 2.6,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M12.5 10.5 17.5 10.5M23.5 10.5 29.5 10.5',
+      stroke: 'black',
+      strokeWidth: 2.6,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 2.5,
+    y: 2.5,
+    width: 36.0,
+    height: 15.0,
+  },
+  unitTransform: {
+    scale: 0.027778,
+    x: -0.069444,
+    y: -0.069444,
+    width: 1.0,
+    height: 0.416667,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M14.5 2.5C14.5 2.5 2.5 8.75 2.5 10.0 2.5 11.25 14.5 17.5 14.5 17.5M27.5 2.5C27.5 2.5 38.5 8.75 38.5 10.0 38.5 11.25 27.5 17.5 27.5 17.5" stroke="black" stroke-width="2.6" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M12.5 10.5 17.5 10.5M23.5 10.5 29.5 10.5" stroke="black" stroke-width="2.6" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
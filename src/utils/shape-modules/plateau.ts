@@ -0,0 +1,43 @@
+/**
+ * Shape Module: plateau
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'plateau',
+  width: 44,
+  height: 30,
+  elements: [
+    {
+      type: 'path',
+      d: 'M10.5 3.5 41.5 3.5M6.5 15.5 37.5 15.5M0.5 27.5 32.5 27.5',
+      stroke: 'black',
+      strokeWidth: 5.42,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 0.5,
+    y: 3.5,
+    width: 41.0,
+    height: 24.0,
+  },
+  unitTransform: {
+    scale: 0.02439,
+    x: -0.012195,
+    y: -0.085366,
+    width: 1.0,
+    height: 0.585366,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M10.5 3.5 41.5 3.5M6.5 15.5 37.5 15.5M0.5 27.5 32.5 27.5" stroke="black" stroke-width="5.42" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '',
+};
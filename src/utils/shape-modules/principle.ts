@@ -0,0 +1,73 @@
+/**
+ * Shape Module: principle
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'principle',
+  width: 42,
+  height: 36,
+  elements: [
+    {
+      type: 'path',
+      d: 'M21.0 1.0C28.69 1.0 36.38 1.67 37.92 3.0 41.0 5.67 41.0 29.67 37.92 32.33 34.85 35.0 7.15 35.0 4.08 32.33 1.0 29.67 1.0 5.67 4.08 3.0 5.62 1.67 13.31 1.0 21.0 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M4.58 3.19C7.65 0.5 35.35 0.5 38.42 3.19 41.5 5.88 41.5 30.12 38.42 32.81 35.35 35.5 7.65 35.5 4.58 32.81 1.5 30.12 1.5 5.88 4.58 3.19Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M21.0 7.0 23.0 7.0C21.67 25.0 21.0 25.0 21.0 7.0Z',
+      stroke: 'black',
+      strokeWidth: 1.89,
+      strokeMiterlimit: '1',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M22.0 28.0 21.0 27.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M21.5 27.5 22.5 28.5',
+      stroke: 'black',
+      strokeWidth: 4.6,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.77,
+    y: 1.0,
+    width: 38.96,
+    height: 33.83,
+  },
+  unitTransform: {
+    scale: 0.025666,
+    x: -0.04541,
+    y: -0.025666,
+    width: 1.0,
+    height: 0.868216,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M21.0 1.0C28.69 1.0 36.38 1.67 37.92 3.0 41.0 5.67 41.0 29.67 37.92 32.33 34.85 35.0 7.15 35.0 4.08 32.33 1.0 29.67 1.0 5.67 4.08 3.0 5.62 1.67 13.31 1.0 21.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M4.58 3.19C7.65 0.5 35.35 0.5 38.42 3.19 41.5 5.88 41.5 30.12 38.42 32.81 35.35 35.5 7.65 35.5 4.58 32.81 1.5 30.12 1.5 5.88 4.58 3.19Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.0 7.0 23.0 7.0C21.67 25.0 21.0 25.0 21.0 7.0Z" stroke="black" stroke-width="1.89" stroke-miterlimit="1" fill-rule="evenodd"/><path d="M22.0 28.0 21.0 27.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M21.5 27.5 22.5 28.5" stroke="black" stroke-width="4.6" stroke-linecap="round" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,43 @@
+/**
+ * Shape Module: process
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'process',
+  width: 53,
+  height: 28,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.5 8.0 33.38 8.0 33.38 1.5 52.5 14.5 33.38 27.5 33.38 21.0 1.5 21.0 1.5 8.0',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 51.0,
+    height: 26.0,
+  },
+  unitTransform: {
+    scale: 0.019608,
+    x: -0.029412,
+    y: -0.029412,
+    width: 1.0,
+    height: 0.509804,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.5 8.0 33.38 8.0 33.38 1.5 52.5 14.5 33.38 27.5 33.38 21.0 1.5 21.0 1.5 8.0" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,54 @@
+/**
+ * Shape Module: product
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'product',
+  width: 55,
+  height: 29,
+  elements: [
+    {
+      type: 'rect',
+      x: 1.5,
+      y: 1.5,
+      width: 53.0,
+      height: 27.0,
+      stroke: '#002346',
+      strokeWidth: 2.0,
+      fill: '#FFFF00',
+    },
+    {
+      type: 'rect',
+      x: 1.5,
+      y: 1.5,
+      width: 32.0,
+      height: 7.0,
+      stroke: '#002346',
+      strokeWidth: 2.0,
+      fill: '#FFFF00',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 53.0,
+    height: 27.0,
+  },
+  unitTransform: {
+    scale: 0.018868,
+    x: -0.028302,
+    y: -0.028302,
+    width: 1.0,
+    height: 0.509434,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><rect x="1.5" y="1.5" width="53" height="27" stroke="#002346" stroke-width="2" fill="{{fill}}"/><rect x="1.5" y="1.5" width="32" height="7" stroke="#002346" stroke-width="2" fill="{{fill}}"/></g>',
+  defaultFill: '#FFFF00',
+};
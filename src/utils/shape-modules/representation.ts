@@ -0,0 +1,52 @@
+/**
+ * Shape Module: representation
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'representation',
+  width: 55,
+  height: 29,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.5 1.5 54.5 1.5 54.5 21.75C54.5 21.75 50.08 15.0 41.25 15.0 32.42 15.0 28.0 21.75 28.0 21.75 28.0 21.75 23.58 28.5 14.75 28.5 5.92 28.5 1.5 21.75 1.5 21.75L1.5 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M1.5 8.5 54.5 8.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 53.0,
+    height: 27.0,
+  },
+  unitTransform: {
+    scale: 0.018868,
+    x: -0.028302,
+    y: -0.028302,
+    width: 1.0,
+    height: 0.509434,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.5 1.5 54.5 1.5 54.5 21.75C54.5 21.75 50.08 15.0 41.25 15.0 32.42 15.0 28.0 21.75 28.0 21.75 28.0 21.75 23.58 28.5 14.75 28.5 5.92 28.5 1.5 21.75 1.5 21.75L1.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M1.5 8.5 54.5 8.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,49 @@
+/**
+ * Shape Module: requirement
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'requirement',
+  width: 68,
+  height: 32,
+  elements: [
+    {
+      type: 'path',
+      d: 'M10.6 1.0 67.0 1.0 57.4 31.0 1.0 31.0 10.6 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M11.1 1.5 67.5 1.5 57.9 31.5 1.5 31.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 66.5,
+    height: 30.5,
+  },
+  unitTransform: {
+    scale: 0.015038,
+    x: -0.015038,
+    y: -0.015038,
+    width: 1.0,
+    height: 0.458647,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M10.6 1.0 67.0 1.0 57.4 31.0 1.0 31.0 10.6 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M11.1 1.5 67.5 1.5 57.9 31.5 1.5 31.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
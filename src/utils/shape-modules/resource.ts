@@ -0,0 +1,69 @@
+/**
+ * Shape Module: resource
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'resource',
+  width: 55,
+  height: 26,
+  elements: [
+    {
+      type: 'path',
+      d: 'M25.5 1.52C35.52 1.54 45.49 1.67 46.31 1.88 48.51 2.44 49.11 3.38 49.25 6.54L49.38 9.31 51.33 9.31C54.26 9.31 54.5 9.64 54.5 13.55 54.5 17.39 54.26 17.69 51.23 17.69L49.31 17.69 49.31 20.13C49.31 23.05 48.65 24.29 46.72 25.01 45.53 25.46 43.76 25.5 25.41 25.48 14.4 25.46 4.86 25.34 4.21 25.19 3.56 25.05 2.69 24.61 2.26 24.21 1.53 23.5 1.5 23.15 1.5 13.5 1.5 3.86 1.53 3.5 2.26 2.8 2.68 2.4 3.65 1.94 4.41 1.79 5.42 1.58 15.49 1.5 25.5 1.52Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeLinecap: 'round',
+      strokeLinejoin: 'round',
+      strokeMiterlimit: '10',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M49.0 17.0 50.0 8.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M50.5 8.5 49.5 17.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M10.5 6.5 10.5 19.5M19.5 6.5 19.5 19.5M27.5 6.5 27.5 19.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.52,
+    width: 53.0,
+    height: 23.96,
+  },
+  unitTransform: {
+    scale: 0.018868,
+    x: -0.028302,
+    y: -0.028638,
+    width: 1.0,
+    height: 0.452156,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M25.5 1.52C35.52 1.54 45.49 1.67 46.31 1.88 48.51 2.44 49.11 3.38 49.25 6.54L49.38 9.31 51.33 9.31C54.26 9.31 54.5 9.64 54.5 13.55 54.5 17.39 54.26 17.69 51.23 17.69L49.31 17.69 49.31 20.13C49.31 23.05 48.65 24.29 46.72 25.01 45.53 25.46 43.76 25.5 25.41 25.48 14.4 25.46 4.86 25.34 4.21 25.19 3.56 25.05 2.69 24.61 2.26 24.21 1.53 23.5 1.5 23.15 1.5 13.5 1.5 3.86 1.53 3.5 2.26 2.8 2.68 2.4 3.65 1.94 4.41 1.79 5.42 1.58 15.49 1.5 25.5 1.52Z" stroke="black" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" stroke-miterlimit="10" fill="{{fill}}" fill-rule="evenodd"/><path d="M49.0 17.0 50.0 8.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M50.5 8.5 49.5 17.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M10.5 6.5 10.5 19.5M19.5 6.5 19.5 19.5M27.5 6.5 27.5 19.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
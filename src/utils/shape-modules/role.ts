@@ -0,0 +1,58 @@
+/**
+ * Shape Module: role
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'role',
+  width: 62,
+  height: 32,
+  elements: [
+    {
+      type: 'path',
+      d: 'M8.93 1.5 53.5 1.5 53.5 31.5 8.93 31.5C4.83 31.5 1.5 24.78 1.5 16.5 1.5 8.22 4.83 1.5 8.93 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M53.5 1.0C57.64 1.0 61.0 7.72 61.0 16.0 61.0 24.28 57.64 31.0 53.5 31.0 49.36 31.0 46.0 24.28 46.0 16.0 46.0 7.72 49.36 1.0 53.5 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M54.0 1.5C58.14 1.5 61.5 8.22 61.5 16.5 61.5 24.78 58.14 31.5 54.0 31.5 49.86 31.5 46.5 24.78 46.5 16.5 46.5 8.22 49.86 1.5 54.0 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.0,
+    width: 60.0,
+    height: 30.5,
+  },
+  unitTransform: {
+    scale: 0.016667,
+    x: -0.025,
+    y: -0.016667,
+    width: 1.0,
+    height: 0.508333,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M8.93 1.5 53.5 1.5 53.5 31.5 8.93 31.5C4.83 31.5 1.5 24.78 1.5 16.5 1.5 8.22 4.83 1.5 8.93 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M53.5 1.0C57.64 1.0 61.0 7.72 61.0 16.0 61.0 24.28 57.64 31.0 53.5 31.0 49.36 31.0 46.0 24.28 46.0 16.0 46.0 7.72 49.36 1.0 53.5 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M54.0 1.5C58.14 1.5 61.5 8.22 61.5 16.5 61.5 24.78 58.14 31.5 54.0 31.5 49.86 31.5 46.5 24.78 46.5 16.5 46.5 8.22 49.86 1.5 54.0 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,43 @@
+/**
+ * Shape Module: service
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'service',
+  width: 53,
+  height: 27,
+  elements: [
+    {
+      type: 'path',
+      d: 'M14.25 26.5C14.25 26.5 1.5 26.5 1.5 13.5 1.5 0.5 14.25 0.5 14.25 0.5L39.75 0.5C39.75 0.5 52.5 0.5 52.5 13.5 52.5 26.5 39.75 26.5 39.75 26.5L14.25 26.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 0.5,
+    width: 51.0,
+    height: 26.0,
+  },
+  unitTransform: {
+    scale: 0.019608,
+    x: -0.029412,
+    y: -0.009804,
+    width: 1.0,
+    height: 0.509804,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M14.25 26.5C14.25 26.5 1.5 26.5 1.5 13.5 1.5 0.5 14.25 0.5 14.25 0.5L39.75 0.5C39.75 0.5 52.5 0.5 52.5 13.5 52.5 26.5 39.75 26.5 39.75 26.5L14.25 26.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,58 @@
+/**
+ * Shape Module: system-software
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'system-software',
+  width: 37,
+  height: 33,
+  elements: [
+    {
+      type: 'path',
+      d: 'M21.62 1.57C26.04 1.78 30.4 3.66 32.81 7.06 35.6 10.75 36.5 15.69 34.51 19.85 33.5 22.19 31.74 24.41 29.15 25.5L7.5 8.87C9.15 5.23 13.19 2.98 17.24 1.92 18.66 1.62 20.14 1.5 21.62 1.57Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M15.5 6.0C23.51 6.0 30.0 11.82 30.0 19.0 30.0 26.18 23.51 32.0 15.5 32.0 7.49 32.0 1.0 26.18 1.0 19.0 1.0 11.82 7.49 6.0 15.5 6.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M30.5 19.5C30.5 26.68 24.01 32.5 16.0 32.5 7.99 32.5 1.5 26.68 1.5 19.5 1.5 12.32 7.99 6.5 16.0 6.5 24.01 6.5 30.5 12.32 30.5 19.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.55,
+    width: 34.58,
+    height: 30.95,
+  },
+  unitTransform: {
+    scale: 0.028916,
+    x: -0.028916,
+    y: -0.044828,
+    width: 1.0,
+    height: 0.894944,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M21.62 1.57C26.04 1.78 30.4 3.66 32.81 7.06 35.6 10.75 36.5 15.69 34.51 19.85 33.5 22.19 31.74 24.41 29.15 25.5L7.5 8.87C9.15 5.23 13.19 2.98 17.24 1.92 18.66 1.62 20.14 1.5 21.62 1.57Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/><path d="M15.5 6.0C23.51 6.0 30.0 11.82 30.0 19.0 30.0 26.18 23.51 32.0 15.5 32.0 7.49 32.0 1.0 26.18 1.0 19.0 1.0 11.82 7.49 6.0 15.5 6.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M30.5 19.5C30.5 26.68 24.01 32.5 16.0 32.5 7.99 32.5 1.5 26.68 1.5 19.5 1.5 12.32 7.99 6.5 16.0 6.5 24.01 6.5 30.5 12.32 30.5 19.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
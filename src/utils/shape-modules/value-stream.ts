@@ -0,0 +1,43 @@
+/**
+ * Shape Module: value-stream
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'value-stream',
+  width: 60,
+  height: 31,
+  elements: [
+    {
+      type: 'path',
+      d: 'M1.5 1.5 37.75 1.5 59.5 16.0 37.75 30.5 1.5 30.5 23.25 16.0 1.5 1.5',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.5,
+    y: 1.5,
+    width: 58.0,
+    height: 29.0,
+  },
+  unitTransform: {
+    scale: 0.017241,
+    x: -0.025862,
+    y: -0.025862,
+    width: 1.0,
+    height: 0.5,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M1.5 1.5 37.75 1.5 59.5 16.0 37.75 30.5 1.5 30.5 23.25 16.0 1.5 1.5" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
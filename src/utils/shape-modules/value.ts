@@ -0,0 +1,49 @@
+/**
+ * Shape Module: value
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'value',
+  width: 62,
+  height: 32,
+  elements: [
+    {
+      type: 'path',
+      d: 'M31.0 1.0C47.57 1.0 61.0 7.72 61.0 16.0 61.0 24.28 47.57 31.0 31.0 31.0 14.43 31.0 1.0 24.28 1.0 16.0 1.0 7.72 14.43 1.0 31.0 1.0Z',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M31.5 1.5C48.07 1.5 61.5 8.22 61.5 16.5 61.5 24.78 48.07 31.5 31.5 31.5 14.93 31.5 1.5 24.78 1.5 16.5 1.5 8.22 14.93 1.5 31.5 1.5Z',
+      stroke: 'black',
+      strokeWidth: 2.0,
+      strokeMiterlimit: '1',
+      fill: '#FFFFFF',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 1.0,
+    y: 1.0,
+    width: 60.5,
+    height: 30.5,
+  },
+  unitTransform: {
+    scale: 0.016529,
+    x: -0.016529,
+    y: -0.016529,
+    width: 1.0,
+    height: 0.504132,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M31.0 1.0C47.57 1.0 61.0 7.72 61.0 16.0 61.0 24.28 47.57 31.0 31.0 31.0 14.43 31.0 1.0 24.28 1.0 16.0 1.0 7.72 14.43 1.0 31.0 1.0Z" fill="{{fill}}" fill-rule="evenodd"/><path d="M31.5 1.5C48.07 1.5 61.5 8.22 61.5 16.5 61.5 24.78 48.07 31.5 31.5 31.5 14.93 31.5 1.5 24.78 1.5 16.5 1.5 8.22 14.93 1.5 31.5 1.5Z" stroke="black" stroke-width="2" stroke-miterlimit="1" fill="{{fill}}" fill-rule="evenodd"/></g>',
+  defaultFill: '#FFFFFF',
+};
@@ -0,0 +1,58 @@
+/**
+ * Shape Module: work-package
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from '../element-mapping';
+
+export const shape: IShapeDefinition = {
+  name: 'work-package',
+  width: 42,
+  height: 36,
+  elements: [
+    {
+      type: 'path',
+      d: 'M21.51 25.91C24.53 24.09 26.72 20.82 27.36 17.22 28.0 13.61 27.07 9.73 24.88 6.88 22.64 3.98 19.17 2.21 15.62 2.1 12.08 2.0 8.53 3.55 6.05 6.22 4.24 8.16 2.98 10.68 2.49 13.36 2.0 16.04 2.28 18.87 3.27 21.39 4.26 23.91 5.98 26.11 8.13 27.63 10.28 29.15 12.86 29.99 15.45 30.0',
+      stroke: 'black',
+      strokeWidth: 3.59,
+      strokeLinecap: 'round',
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M15.0 30.0 30.0 30.0',
+      stroke: 'black',
+      strokeWidth: 3.59,
+      strokeMiterlimit: '1',
+      fill: 'none',
+      fillRule: 'evenodd',
+    },
+    {
+      type: 'path',
+      d: 'M30.0 23.0 41.0 29.67 32.21 35.0 30.0 35.0 30.0 23.0Z',
+      fillRule: 'evenodd',
+    },
+  ],
+  bounds: {
+    x: 2.25,
+    y: 2.1,
+    width: 38.75,
+    height: 32.9,
+  },
+  unitTransform: {
+    scale: 0.025809,
+    x: -0.058159,
+    y: -0.054175,
+    width: 1.0,
+    height: 0.849132,
+  },
+};
+
+export const iconFragment: IIconFragment | null = {
+  svg: '<g><path d="M21.51 25.91C24.53 24.09 26.72 20.82 27.36 17.22 28.0 13.61 27.07 9.73 24.88 6.88 22.64 3.98 19.17 2.21 15.62 2.1 12.08 2.0 8.53 3.55 6.05 6.22 4.24 8.16 2.98 10.68 2.49 13.36 2.0 16.04 2.28 18.87 3.27 21.39 4.26 23.91 5.98 26.11 8.13 27.63 10.28 29.15 12.86 29.99 15.45 30.0" stroke="black" stroke-width="3.59" stroke-linecap="round" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M15.0 30.0 30.0 30.0" stroke="black" stroke-width="3.59" stroke-miterlimit="1" fill="none" fill-rule="evenodd"/><path d="M30.0 23.0 41.0 29.67 32.21 35.0 30.0 35.0 30.0 23.0Z" fill-rule="evenodd"/></g>',
+  defaultFill: '',
+};
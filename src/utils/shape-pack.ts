@@ -0,0 +1,327 @@
+/* eslint-disable max-len */
+/**
+ * Shape Pack
+ *
+ * This module decodes the binary shape packs written by src/utils/svg-shapes/shape_pack.py
+ * (ts-file-gen.py --pack), whose docstring describes the layout. A pack is read straight
+ * from an ArrayBuffer: opening it only reads the header, shapes are found by binary search
+ * in the sorted name index and decoded the first time they are requested, so startup does
+ * not depend on the size of the shape library.
+ */
+
+import type { IIconFragment, IShapeDefinition, ISvgElement } from './element-mapping';
+
+const MAGIC = 'ASPK';
+const VERSION = 1;
+
+// Flags of the header
+const FLAG_FLOAT64 = 1;
+
+// Flags of a shape record; JavaScript numbers need not know whether a size was an integer
+const SHAPE_BOUNDS = 4;
+const SHAPE_UNIT_TRANSFORM = 8;
+const SHAPE_FRAGMENT = 16;
+
+// Tags of style values
+const VALUE_STRING = 0;
+
+// Stands for "no string", e.g. the template of a rect or a null default fill
+const NO_STRING = 0xffffffff;
+
+// Sizes of the fixed-size structures in bytes
+const HEADER_SIZE = 40;
+const SHAPE_SIZE = 24;
+const ELEMENT_SIZE = 20;
+const INDEX_ENTRY_SIZE = 8;
+const BOUNDS_SIZE = 32;
+const UNIT_TRANSFORM_SIZE = 40;
+const FRAGMENT_SIZE = 8;
+
+// Coordinate markers of a path template: a number followed by a space, a number ending a
+// segment, and an arc flag followed by a space
+const NUMBER_MARKER = 0;
+const LAST_NUMBER_MARKER = 1;
+const FLAG_MARKER = 2;
+
+const textDecoder = new TextDecoder();
+const textEncoder = new TextEncoder();
+
+/**
+ * Format a coordinate like the Python tools write it, e.g. "16.0" or "24.01"
+ * @param value The coordinate
+ * @returns The coordinate as a string
+ */
+function formatCoordinate(value: number): string {
+  if (Object.is(value, -0)) {
+    return '-0.0';
+  }
+  return Number.isInteger(value) ? value.toFixed(1) : String(value);
+}
+
+/**
+ * Compare two byte sequences like Python compares bytes
+ * @returns A negative number, zero or a positive number
+ */
+function compareBytes(a: Uint8Array, b: Uint8Array): number {
+  const length = Math.min(a.length, b.length);
+  for (let i = 0; i < length; i++) {
+    if (a[i] !== b[i]) {
+      return a[i] - b[i];
+    }
+  }
+  return a.length - b.length;
+}
+
+/**
+ * Lazily decoded binary shape pack
+ */
+export class ShapePack {
+  private readonly view: DataView;
+  private readonly bytes: Uint8Array;
+  private readonly float64: boolean;
+  private readonly shapeCount: number;
+  private readonly stringsOffset: number;
+  private readonly stringData: number;
+  private readonly stylesOffset: number;
+  private readonly indexOffset: number;
+  private readonly coordsOffset: number;
+
+  private readonly strings = new Map<number, string>();
+  private readonly styles = new Map<number, [string, string | number][]>();
+  private readonly shapes = new Map<string, IShapeDefinition | null>();
+
+  /**
+   * Open a shape pack
+   * @param buffer The contents of the pack file, e.g. a fetched ArrayBuffer or a Node.js Buffer
+   * @throws Error if the buffer does not contain a shape pack of a supported version
+   */
+  constructor(buffer: ArrayBuffer | Uint8Array) {
+    // Node.js Buffers are views of a larger, shared ArrayBuffer
+    this.bytes = buffer instanceof Uint8Array ? buffer : new Uint8Array(buffer);
+    this.view = new DataView(this.bytes.buffer, this.bytes.byteOffset, this.bytes.byteLength);
+    if (this.bytes.byteLength < HEADER_SIZE || textDecoder.decode(this.bytes.subarray(0, 4)) !== MAGIC) {
+      throw new Error('Not a shape pack');
+    }
+    const version = this.view.getUint16(4, true);
+    if (version !== VERSION) {
+      throw new Error(`Unsupported shape pack version ${version}`);
+    }
+    this.float64 = (this.view.getUint16(6, true) & FLAG_FLOAT64) !== 0;
+    this.shapeCount = this.view.getUint32(8, true);
+    const stringCount = this.view.getUint32(12, true);
+    this.stringsOffset = this.view.getUint32(20, true);
+    this.stylesOffset = this.view.getUint32(24, true);
+    this.indexOffset = this.view.getUint32(28, true);
+    this.coordsOffset = this.view.getUint32(32, true);
+    this.stringData = this.stringsOffset + (stringCount + 1) * 4;
+  }
+
+  /**
+   * The number of shapes in the pack
+   */
+  get size(): number {
+    return this.shapeCount;
+  }
+
+  /**
+   * Get the names of all shapes, sorted by their UTF-8 bytes
+   * @returns The shape names
+   */
+  names(): string[] {
+    const names: string[] = [];
+    for (let position = 0; position < this.shapeCount; position++) {
+      names.push(this.string(this.view.getUint32(this.indexOffset + position * INDEX_ENTRY_SIZE, true)));
+    }
+    return names;
+  }
+
+  /**
+   * Check whether the pack contains a shape
+   * @param name The name of the shape
+   * @returns True if the pack contains the shape
+   */
+  has(name: string): boolean {
+    return this.find(name) !== undefined;
+  }
+
+  /**
+   * Get a shape definition, decoding it on first access
+   * @param name The name of the shape
+   * @returns The shape definition or undefined if the pack does not contain the shape
+   */
+  getShape(name: string): IShapeDefinition | undefined {
+    let shape = this.shapes.get(name);
+    if (shape === undefined) {
+      const offset = this.find(name);
+      shape = offset === undefined ? null : this.decodeShape(offset);
+      this.shapes.set(name, shape);
+    }
+    return shape || undefined;
+  }
+
+  /**
+   * Get the pre-serialized icon fragment of a shape
+   * @param name The name of the shape
+   * @returns The icon fragment, null if the shape has none, or undefined if the pack does not contain the shape
+   */
+  getIconFragment(name: string): IIconFragment | null | undefined {
+    let offset = this.find(name);
+    if (offset === undefined) {
+      return undefined;
+    }
+    const flags = this.view.getUint8(offset + 4);
+    if (!(flags & SHAPE_FRAGMENT)) {
+      return null;
+    }
+    offset += SHAPE_SIZE;
+    if (flags & SHAPE_BOUNDS) offset += BOUNDS_SIZE;
+    if (flags & SHAPE_UNIT_TRANSFORM) offset += UNIT_TRANSFORM_SIZE;
+    const defaultFill = this.view.getUint32(offset + 4, true);
+    return {
+      svg: this.string(this.view.getUint32(offset, true)),
+      defaultFill: defaultFill === NO_STRING ? null : this.string(defaultFill),
+    };
+  }
+
+  private stringBytes(id: number): Uint8Array {
+    const start = this.view.getUint32(this.stringsOffset + id * 4, true);
+    const end = this.view.getUint32(this.stringsOffset + id * 4 + 4, true);
+    return this.bytes.subarray(this.stringData + start, this.stringData + end);
+  }
+
+  private string(id: number): string {
+    let value = this.strings.get(id);
+    if (value === undefined) {
+      value = textDecoder.decode(this.stringBytes(id));
+      this.strings.set(id, value);
+    }
+    return value;
+  }
+
+  /**
+   * Find the record of a shape by binary search in the name index
+   * @returns The offset of the shape record or undefined if there is none
+   */
+  private find(name: string): number | undefined {
+    const key = textEncoder.encode(name);
+    let low = 0;
+    let high = this.shapeCount;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      const entry = this.indexOffset + middle * INDEX_ENTRY_SIZE;
+      const order = compareBytes(this.stringBytes(this.view.getUint32(entry, true)), key);
+      if (order === 0) {
+        return this.view.getUint32(entry + 4, true);
+      }
+      if (order < 0) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+    return undefined;
+  }
+
+  private style(id: number): [string, string | number][] {
+    let style = this.styles.get(id);
+    if (style === undefined) {
+      let offset = this.view.getUint32(this.stylesOffset + id * 4, true);
+      const count = this.view.getUint16(offset, true);
+      offset += 2;
+      style = [];
+      for (let i = 0; i < count; i++) {
+        const key = this.string(this.view.getUint32(offset, true));
+        const tag = this.view.getUint8(offset + 4);
+        offset += 5;
+        if (tag === VALUE_STRING) {
+          style.push([key, this.string(this.view.getUint32(offset, true))]);
+          offset += 4;
+        } else {
+          style.push([key, this.view.getFloat64(offset, true)]);
+          offset += 8;
+        }
+      }
+      this.styles.set(id, style);
+    }
+    return style;
+  }
+
+  private coordinate(index: number): number {
+    if (this.float64) {
+      return this.view.getFloat64(this.coordsOffset + index * 8, true);
+    }
+    // The writer only uses float32 if every coordinate reads back as its shortest decimal
+    return Number(this.view.getFloat32(this.coordsOffset + index * 4, true).toPrecision(7));
+  }
+
+  private pathData(template: string, start: number): string {
+    let d = '';
+    let index = start;
+    for (let i = 0; i < template.length; i++) {
+      const code = template.charCodeAt(i);
+      if (code === NUMBER_MARKER) {
+        d += `${formatCoordinate(this.coordinate(index++))} `;
+      } else if (code === LAST_NUMBER_MARKER) {
+        d += formatCoordinate(this.coordinate(index++));
+      } else if (code === FLAG_MARKER) {
+        d += `${Math.trunc(this.coordinate(index++))} `;
+      } else {
+        d += template[i];
+      }
+    }
+    return d;
+  }
+
+  private decodeShape(offset: number): IShapeDefinition {
+    const flags = this.view.getUint8(offset + 4);
+    const elementCount = this.view.getUint16(offset + 6, true);
+    const shape: IShapeDefinition = {
+      name: this.string(this.view.getUint32(offset, true)),
+      width: this.view.getFloat64(offset + 8, true),
+      height: this.view.getFloat64(offset + 16, true),
+      elements: [],
+    };
+    offset += SHAPE_SIZE;
+    if (flags & SHAPE_BOUNDS) {
+      shape.bounds = {
+        x: this.view.getFloat64(offset, true),
+        y: this.view.getFloat64(offset + 8, true),
+        width: this.view.getFloat64(offset + 16, true),
+        height: this.view.getFloat64(offset + 24, true),
+      };
+      offset += BOUNDS_SIZE;
+    }
+    if (flags & SHAPE_UNIT_TRANSFORM) {
+      shape.unitTransform = {
+        scale: this.view.getFloat64(offset, true),
+        x: this.view.getFloat64(offset + 8, true),
+        y: this.view.getFloat64(offset + 16, true),
+        width: this.view.getFloat64(offset + 24, true),
+        height: this.view.getFloat64(offset + 32, true),
+      };
+      offset += UNIT_TRANSFORM_SIZE;
+    }
+    if (flags & SHAPE_FRAGMENT) {
+      offset += FRAGMENT_SIZE;
+    }
+
+    for (let i = 0; i < elementCount; i++, offset += ELEMENT_SIZE) {
+      const template = this.view.getUint32(offset + 8, true);
+      const start = this.view.getUint32(offset + 12, true);
+      const element: ISvgElement = { type: this.string(this.view.getUint32(offset, true)) };
+      if (template === NO_STRING) {
+        element.x = this.coordinate(start);
+        element.y = this.coordinate(start + 1);
+        element.width = this.coordinate(start + 2);
+        element.height = this.coordinate(start + 3);
+      } else {
+        element.d = this.pathData(this.string(template), start);
+      }
+      for (const [key, value] of this.style(this.view.getUint32(offset + 4, true))) {
+        element[key] = value;
+      }
+      shape.elements.push(element);
+    }
+    return shape;
+  }
+}
@@ -0,0 +1,156 @@
+/* eslint-disable max-len */
+/**
+ * Shape Store
+ *
+ * This module holds the shape definitions and icon fragments used by the icon renderer.
+ * Shapes are either registered all at once from shape-data.ts, or loaded on demand from
+ * the per-shape modules generated by ts-file-gen.py --split, so bundles that only need
+ * a few element types do not have to parse every stencil at startup. Shapes can also be
+ * served from binary shape packs, which are decoded one shape at a time on first use.
+ *
+ * The store imports none of these sources itself; the entry points register the one
+ * they use, so a bundle only contains the shape data of its own entry point.
+ */
+
+import type { IIconFragment, IShapeDefinition } from './element-mapping';
+import type { ShapePack } from './shape-pack';
+import type { IShapeModule } from './shape-modules';
+
+// Registered shapes keyed by shape name
+const shapeModules = new Map<string, IShapeModule>();
+
+// Loaders of the per-shape modules keyed by shape name, see registerShapeModuleLoaders()
+let shapeModuleLoaders: Record<string, () => Promise<IShapeModule>> = {};
+
+// Shape packs consulted for shapes that are not registered, most recently added first
+const shapePacks: ShapePack[] = [];
+
+// Pending and completed loads keyed by shape name, so each module is imported once
+const shapeLoads = new Map<string, Promise<IShapeDefinition | undefined>>();
+
+/**
+ * Register a shape definition and its pre-serialized icon fragment
+ * @param shape The shape definition
+ * @param iconFragment The icon fragment of the shape, if any
+ */
+export function registerShape(shape: IShapeDefinition, iconFragment: IIconFragment | null = null): void {
+  shapeModules.set(shape.name, { shape, iconFragment });
+}
+
+/**
+ * Register all shape definitions at once
+ * @param shapes The shape definitions
+ * @param iconFragments The icon fragments keyed by shape name
+ */
+export function registerShapes(
+  shapes: IShapeDefinition[],
+  iconFragments: Record<string, IIconFragment> = {},
+): void {
+  for (const shape of shapes) {
+    registerShape(shape, iconFragments[shape.name] || null);
+  }
+}
+
+/**
+ * Load shapes that are not registered from their generated modules
+ * @param loaders The shapeModuleLoaders of shape-modules/index.ts, keyed by shape name
+ */
+export function registerShapeModuleLoaders(
+  loaders: Record<string, () => Promise<IShapeModule>>,
+): void {
+  shapeModuleLoaders = loaders;
+}
+
+/**
+ * Serve shapes that are not registered from a shape pack
+ * @param pack The shape pack; packs added later take precedence
+ */
+export function registerShapePack(pack: ShapePack): void {
+  shapePacks.unshift(pack);
+}
+
+/**
+ * Get a registered shape, registering it from a shape pack on first use
+ * @param name The name of the shape
+ * @returns The shape module or undefined if the shape is neither registered nor packed
+ */
+function resolveShapeModule(name: string): IShapeModule | undefined {
+  const registered = shapeModules.get(name);
+  if (registered || shapePacks.length === 0) {
+    return registered;
+  }
+  for (const pack of shapePacks) {
+    const shape = pack.getShape(name);
+    if (shape) {
+      registerShape(shape, pack.getIconFragment(name) || null);
+      return shapeModules.get(name);
+    }
+  }
+  return undefined;
+}
+
+/**
+ * Get a registered shape definition
+ * @param name The name of the shape
+ * @returns The shape definition or undefined if the shape is not registered
+ */
+export function getShape(name: string): IShapeDefinition | undefined {
+  return resolveShapeModule(name)?.shape;
+}
+
+/**
+ * Get the pre-serialized icon fragment of a registered shape
+ * @param name The name of the shape
+ * @returns The icon fragment or undefined if there is none
+ */
+export function getIconFragment(name: string): IIconFragment | undefined {
+  return resolveShapeModule(name)?.iconFragment || undefined;
+}
+
+/**
+ * Load a shape from its generated module and register it
+ * @param name The name of the shape
+ * @returns Promise resolving to the shape definition, or undefined if there is no module for it
+ */
+export function loadShape(name: string): Promise<IShapeDefinition | undefined> {
+  const registered = resolveShapeModule(name);
+  if (registered) {
+    return Promise.resolve(registered.shape);
+  }
+
+  let load = shapeLoads.get(name);
+  if (!load) {
+    const loader = shapeModuleLoaders[name];
+    if (!loader) {
+      console.warn(`Shape module not found: ${name}`);
+      return Promise.resolve(undefined);
+    }
+
+    load = loader().then(
+      (module) => {
+        // A shape registered while the module was loading takes precedence
+        if (!shapeModules.has(name)) {
+          registerShape(module.shape, module.iconFragment);
+        }
+        return getShape(name);
+      },
+      (error) => {
+        // Forget failed loads so they can be retried
+        shapeLoads.delete(name);
+        throw error;
+      },
+    );
+    shapeLoads.set(name, load);
+  }
+
+  return load;
+}
+
+/**
+ * Load several shapes concurrently
+ * @param names The names of the shapes
+ * @returns Promise resolving once every shape is loaded
+ */
+export async function loadShapes(names: Iterable<string>): Promise<void> {
+  await Promise.all(Array.from(new Set(names), (name) => loadShape(name)));
+}
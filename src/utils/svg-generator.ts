@@ -698,6 +698,7 @@ export function generateConnection(
  * @param width SVG width
  * @param height SVG height
  * @param backgroundColor Background color
+ * @param stylesheet Optional stylesheet to embed, such as the theme of layer classes
  * @returns Complete SVG document as string
  */
 export function generateSvgDocument(
@@ -705,9 +706,11 @@ export function generateSvgDocument(
   width: number = 800,
   height: number = 600,
   backgroundColor: string = '#FFFFFF',
+  stylesheet?: string,
 ): string {
   return `
     <svg xmlns="http://www.w3.org/2000/svg" width="${width}" height="${height}" viewBox="0 0 ${width} ${height}">
+      ${stylesheet ? `<style>\n${stylesheet}\n</style>` : ''}
       <rect width="100%" height="100%" fill="${backgroundColor}"/>
       ${content}
     </svg>
@@ -0,0 +1,677 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the svg-shapes build tooling.
+
+Usage:
+    python benchmark.py path-data [--paths 10000] [--repeat 5]
+    python benchmark.py poster [--copies 20] [--repeat 5]
+    python benchmark.py model [--model examples/archimetal.xml] [--copies 16]
+    python benchmark.py shapes [--shapes 10000] [--repeat 5]
+    python benchmark.py pack [--sizes 100,1000,10000,50000] [--repeat 5] [--keep-dir packs]
+    python benchmark.py containment [--sizes 100,1000,5000,20000] [--pairwise-max 5000]
+    python benchmark.py suite [--sizes 100,1000,10000,50000] [--output results.json] [--baseline baseline.json]
+"""
+
+import argparse
+import copy
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+
+from containment import ContainmentIndex
+from convert import process_svg_file, transform_path_d
+from exchange_model import ViewNode, load_model
+from path_data import PathData, np, translate
+from poster import layout_poster, render_shape, render_shape_elements, write_poster_page
+from shape_pack import ShapePack, build_shape_pack
+from shape_records import Shape, dump_shapes, load_shapes
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def legacy_transform_path_d(d, tx, ty):
+    """The regex-based transform that convert.py used before the PathData engine."""
+    counter = 0
+    def repl(match):
+        nonlocal counter
+        value = float(match.group(0))
+        new_val = value + (tx if counter % 2 == 0 else ty)
+        counter += 1
+        return str(round(new_val, 2))
+    return re.sub(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", repl, d)
+
+
+def synthetic_path(rng, segments=12):
+    """Build an absolute path similar to the exported stencils (lines and cubic curves)."""
+    def point():
+        return f"{rng.uniform(200, 1200):.3f} {rng.uniform(100, 500):.3f}"
+    parts = [f"M{point()}"]
+    for _ in range(segments):
+        if rng.random() < 0.4:
+            parts.append(f"C{point()} {point()} {point()}")
+        else:
+            parts.append(f" {point()}" if parts[-1][0] in "ML " else f"L{point()}")
+    parts.append("Z")
+    return "".join(parts)
+
+
+def synthetic_paths(count, seed=42):
+    """Return a reproducible list of synthetic path data strings."""
+    rng = random.Random(seed)
+    return [synthetic_path(rng, rng.randint(4, 24)) for _ in range(count)]
+
+
+def best_of(repeat, func):
+    """Run func repeatedly and return the fastest wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_path_data(args):
+    paths = synthetic_paths(args.paths)
+    numbers = sum(len(re.findall(r"[-+]?\d*\.?\d+", d)) for d in paths)
+    tx, ty = -263.0, -102.0
+    matrix = translate(tx, ty)
+
+    # Both implementations must agree before their timings mean anything
+    for d in paths[:200]:
+        if legacy_transform_path_d(d, tx, ty) != PathData.parse(d).transform(matrix).format(2):
+            raise SystemExit(f"Mismatch between implementations for path: {d[:60]}...")
+
+    legacy = best_of(args.repeat, lambda: [legacy_transform_path_d(d, tx, ty) for d in paths])
+    engine = best_of(args.repeat, lambda: [PathData.parse(d).transform(matrix).format(2) for d in paths])
+
+    # NumPy only speeds up transforms, which are a small part of the time; the margin
+    # comes from parsing with whitespace splits and formatting with one %-operation
+    backend = 'NumPy' if np is not None else 'array, no NumPy'
+    print(f"{len(paths)} paths, {numbers} numbers (best of {args.repeat}, {backend})")
+    print(f"  regex transform_path_d: {legacy * 1000:8.1f} ms")
+    print(f"  PathData engine:        {engine * 1000:8.1f} ms")
+    print(f"  speedup:                {legacy / engine:8.2f}x")
+
+
+def bench_poster(args):
+    def load(name):
+        with open(os.path.join(SCRIPT_DIR, name), 'r') as f:
+            return json.load(f)
+    all_shapes = load('all-shapes.json')
+    layer_by_element = {item['element']: item for item in load('layer-mapping.json')}
+
+    # A larger library that places every element several times, like a poster of a
+    # stencil library with many specializations of the same element types
+    element_mapping = []
+    layer_mapping = []
+    for copy in range(args.copies):
+        for item in load('element-mapping.json'):
+            name = f"{item['element']} {copy + 1}"
+            element_mapping.append(dict(item, element=name))
+            if item['element'] in layer_by_element:
+                layer_mapping.append(dict(layer_by_element[item['element']], element=name))
+
+    results = {}
+    for label, use_symbols in (('inline shapes', False), ('symbol/use', True)):
+        def render():
+            out = io.StringIO()
+            for page in layout_poster(element_mapping, all_shapes, layer_mapping):
+                write_poster_page(out, page, use_symbols)
+            return out.tell()
+        size = render()
+        seconds = best_of(args.repeat, render)
+        results[label] = (seconds, size)
+
+    print(f"{len(element_mapping)} poster elements (best of {args.repeat})")
+    for label, (seconds, size) in results.items():
+        print(f"  {label + ':':<15} {seconds * 1000:8.1f} ms {size:>10} bytes")
+    (inline_time, inline_size), (symbol_time, symbol_size) = results.values()
+    print(f"  speedup:        {inline_time / symbol_time:8.2f}x {inline_size / symbol_size:>9.2f}x smaller")
+
+
+def dom_load_model(path):
+    """
+    Load a model the way ArchiMateRenderer.parseModel() does: parse the whole document
+    into a DOM, keep it, and query it with getElementsByTagName for every record.
+    """
+    doc = minidom.parse(path)
+
+    def text(node, tag):
+        children = node.getElementsByTagName(tag)
+        return children[0].firstChild.data if children and children[0].firstChild else None
+
+    elements = {}
+    for node in doc.getElementsByTagName('element'):
+        if node.getAttribute('identifier'):
+            elements[node.getAttribute('identifier')] = {
+                'type': node.getAttribute('xsi:type') or 'Unknown',
+                'name': text(node, 'name'),
+            }
+    relationships = {}
+    for node in doc.getElementsByTagName('relationship'):
+        if node.getAttribute('identifier') and node.getAttribute('source') and node.getAttribute('target'):
+            relationships[node.getAttribute('identifier')] = {
+                'type': node.getAttribute('xsi:type') or 'Association',
+                'source': node.getAttribute('source'),
+                'target': node.getAttribute('target'),
+            }
+    views = {}
+    for view in doc.getElementsByTagName('view'):
+        nodes = [
+            {key: node.getAttribute(key) for key in ('elementRef', 'x', 'y', 'w', 'h')}
+            for node in view.getElementsByTagName('node') if node.getAttribute('elementRef')
+        ]
+        connections = [
+            {
+                'relationshipRef': connection.getAttribute('relationshipRef'),
+                'bendpoints': [(int(b.getAttribute('x')), int(b.getAttribute('y')))
+                               for b in connection.getElementsByTagName('bendpoint')],
+            }
+            for connection in view.getElementsByTagName('connection') if connection.getAttribute('relationshipRef')
+        ]
+        views[view.getAttribute('identifier')] = {'name': text(view, 'name'), 'nodes': nodes, 'connections': connections}
+    return doc, elements, relationships, views
+
+
+def write_large_model(path, copies, target):
+    """Write a model that repeats every element, relationship and view copies times."""
+    ET.register_namespace('', 'http://www.opengroup.org/xsd/archimate/3.0/')
+    ET.register_namespace('xsi', 'http://www.w3.org/2001/XMLSchema-instance')
+    tree = ET.parse(path)
+    reference_attributes = ('identifier', 'source', 'target', 'elementRef', 'relationshipRef', 'identifierRef')
+    sections = [
+        container for container in tree.iter()
+        if container.tag.endswith(('}elements', '}relationships', '}views')) and container.tag != tree.getroot().tag
+    ]
+    for container in sections:
+        originals = list(container)
+        for copy_index in range(1, copies):
+            for original in originals:
+                duplicate = copy.deepcopy(original)
+                for node in duplicate.iter():
+                    for key in reference_attributes:
+                        if key in node.attrib:
+                            node.set(key, f"{node.get(key)}-{copy_index}")
+                container.append(duplicate)
+    tree.write(target, encoding='UTF-8', xml_declaration=True)
+
+
+def measure(func):
+    """
+    Return (result, seconds, peak traced memory in bytes) of func. The time is taken
+    from a separate run, as tracing slows the allocations down.
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def bench_model(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'model.xml')
+        write_large_model(args.model, args.copies, path)
+        size = os.path.getsize(path)
+
+        model, stream_time, stream_peak = measure(lambda: load_model(path))
+        (_, elements, relationships, views), dom_time, dom_peak = measure(lambda: dom_load_model(path))
+
+    # Both loaders must find the same model before their numbers mean anything
+    if (len(model.elements), len(model.relationships), len(model.views)) != (len(elements), len(relationships), len(views)):
+        raise SystemExit('The streaming and DOM loaders disagree about the model contents')
+
+    print(f"{os.path.basename(args.model)} x {args.copies}: {size / 1e6:.1f} MB, {len(model.elements)} elements, "
+          f"{len(model.relationships)} relationships, {len(model.views)} views")
+    print(f"  DOM (minidom):        {dom_time * 1000:8.1f} ms {dom_peak / 1e6:8.1f} MB peak")
+    print(f"  streaming iterparse:  {stream_time * 1000:8.1f} ms {stream_peak / 1e6:8.1f} MB peak")
+    print(f"  improvement:          {dom_time / stream_time:8.2f}x {dom_peak / stream_peak:8.2f}x less memory")
+
+
+def measure_retained(func):
+    """Return (result, seconds, bytes still allocated by the result) of func."""
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    result = func()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, seconds, retained
+
+
+def bench_shapes(args):
+    with open(os.path.join(SCRIPT_DIR, 'all-shapes.json'), 'r') as f:
+        library = json.load(f)
+    # A library of args.shapes shapes, cycling through the real stencils
+    shapes = [
+        dict(library[index % len(library)], name=f"{library[index % len(library)]['name']}-{index}")
+        for index in range(args.shapes)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'all-shapes.json')
+        with open(path, 'w') as f:
+            json.dump(shapes, f, indent=2)
+
+        def load_dicts():
+            with open(path, 'r') as f:
+                return json.load(f)
+
+        dicts, dict_time, dict_memory = measure_retained(load_dicts)
+        records, record_time, record_memory = measure_retained(lambda: load_shapes(path))
+
+    # The records must reproduce the JSON before their numbers mean anything
+    out = io.StringIO()
+    dump_shapes(records, out)
+    if json.loads(out.getvalue()) != dicts:
+        raise SystemExit('The shape records do not round-trip to the JSON schema')
+    if any(record.render_elements('#FF0000') != render_shape_elements(shape, '#FF0000')
+           for record, shape in zip(records, dicts)):
+        raise SystemExit('The shape records render differently from the shape dicts')
+
+    dump_time = best_of(args.repeat, lambda: dump_shapes(records, io.StringIO()))
+    # Every shape is rendered in every layer color, as on a poster or in a model with
+    # elements of all layers. The records format their numbers on their first
+    # rendering only, so freshly created records are timed for it.
+    fills = ('#FFFFAE', '#AEFFFF', '#AEFFAE', '#CCCCFF')
+    dict_render = best_of(args.repeat, lambda: [
+        render_shape_elements(shape, fill) for fill in fills for shape in dicts
+    ])
+    record_first = float('inf')
+    for _ in range(args.repeat):
+        fresh = [Shape.from_dict(shape) for shape in dicts]
+        start = time.perf_counter()
+        [record.render_elements(fill) for fill in fills for record in fresh]
+        record_first = min(record_first, time.perf_counter() - start)
+    record_render = best_of(args.repeat, lambda: [
+        record.render_elements(fill) for fill in fills for record in records
+    ])
+    # The markup is kept by the records once they are rendered
+    def rendered_records():
+        fresh = [Shape.from_dict(shape) for shape in dicts]
+        for record in fresh:
+            record.markup()
+        return fresh
+    _, _, rendered_memory = measure_retained(rendered_records)
+
+    per_10k = 10000 / len(records)
+    elements = sum(len(shape['elements']) for shape in dicts)
+    print(f"{len(records)} shapes, {elements} elements (best of {args.repeat})")
+    print(f"  shape dicts:    {dict_memory * per_10k / 1e6:8.2f} MB per 10k shapes, "
+          f"load {dict_time * 1000:8.1f} ms, render {dict_render * 1000:8.1f} ms")
+    print(f"  shape records:  {record_memory * per_10k / 1e6:8.2f} MB per 10k shapes, "
+          f"load {record_time * 1000:8.1f} ms, render {record_first * 1000:8.1f} ms first, "
+          f"{record_render * 1000:8.1f} ms again, dump {dump_time * 1000:8.1f} ms")
+    print(f"  once rendered:  {rendered_memory * per_10k / 1e6:8.2f} MB per 10k shapes, with their markup")
+    print(f"  improvement:    {dict_memory / record_memory:8.2f}x less memory, "
+          f"{dict_render / record_first:.2f}x faster first and {dict_render / record_render:.2f}x faster later rendering")
+
+
+def bench_pack(args):
+    with open(os.path.join(SCRIPT_DIR, 'all-shapes.json'), 'r') as f:
+        library = json.load(f)
+    # The shape a renderer would look up first, from the middle of the library
+    probe = library[len(library) // 2]['name']
+
+    # Loading the JSON decodes every shape, so it is compared with both a single lookup
+    # in a freshly opened pack and with decoding the whole pack
+    print(f"Time to the first shape lookup and to decode all shapes (best of {args.repeat})")
+    print(f"{'Shapes':>8} {'JSON bytes':>12} {'Pack bytes':>12} {'JSON load':>12} {'Pack lookup':>12} {'Pack all':>12}")
+    for size in (int(size) for size in args.sizes.split(',')):
+        shapes = [
+            dict(library[index % len(library)], name=f"{library[index % len(library)]['name']}-{index}")
+            for index in range(size)
+        ]
+        name = f'{probe}-{len(library) // 2}'
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files_dir = args.keep_dir or tmp_dir
+            os.makedirs(files_dir, exist_ok=True)
+            json_path = os.path.join(files_dir, f'all-shapes-{size}.json')
+            pack_path = os.path.join(files_dir, f'all-shapes-{size}.pack')
+            with open(json_path, 'w') as f:
+                json.dump(shapes, f, indent=2)
+            with open(pack_path, 'wb') as f:
+                f.write(build_shape_pack(shapes))
+
+            def json_lookup():
+                with open(json_path, 'r') as f:
+                    shapes_by_name = {shape['name']: shape for shape in json.load(f)}
+                return shapes_by_name[name]
+
+            def pack_lookup():
+                with ShapePack(pack_path) as pack:
+                    return pack[name]
+
+            def pack_all():
+                with ShapePack(pack_path) as pack:
+                    return pack.shapes()
+
+            # The pack must reproduce the JSON before its numbers mean anything
+            if pack_lookup() != json_lookup() or pack_all() != shapes:
+                raise SystemExit('The shape pack does not reproduce the JSON shapes')
+
+            json_time = best_of(args.repeat, json_lookup)
+            pack_time = best_of(args.repeat, pack_lookup)
+            pack_all_time = best_of(args.repeat, pack_all)
+            json_size, pack_size = os.path.getsize(json_path), os.path.getsize(pack_path)
+
+        print(f"{size:>8} {json_size:>12} {pack_size:>12} {json_time * 1000:>9.2f} ms "
+              f"{pack_time * 1000:>9.3f} ms {pack_all_time * 1000:>9.2f} ms")
+
+
+def synthetic_landscape(count, seed=42):
+    """
+    Return the nodes of a landscape view like the generated ones: a grid of domains,
+    each holding a grid of groups of 2-12 elements, listed parents first.
+    """
+    rng = random.Random(seed)
+    leaf_width, leaf_height, gap = 120, 55, 20
+    group_width, group_height = 4 * (leaf_width + gap) + gap, 3 * (leaf_height + gap) + 40
+    domain_width, domain_height = 3 * (group_width + gap) + gap, 3 * (group_height + gap) + 40
+    nodes = []
+    domain = 0
+    while len(nodes) < count:
+        domain_x = (domain % 6) * (domain_width + 2 * gap)
+        domain_y = (domain // 6) * (domain_height + 2 * gap)
+        nodes.append(ViewNode(f'domain-{domain}', domain_x, domain_y, domain_width, domain_height))
+        for group in range(rng.randint(4, 9)):
+            group_x = domain_x + gap + (group % 3) * (group_width + gap)
+            group_y = domain_y + 40 + (group // 3) * (group_height + gap)
+            nodes.append(ViewNode(f'group-{domain}-{group}', group_x, group_y, group_width, group_height))
+            for leaf in range(rng.randint(2, 12)):
+                leaf_x = group_x + gap + (leaf % 4) * (leaf_width + gap)
+                leaf_y = group_y + 40 + (leaf // 4) * (leaf_height + gap)
+                nodes.append(ViewNode(f'element-{len(nodes)}', leaf_x, leaf_y, leaf_width, leaf_height))
+        domain += 1
+    return nodes[:count]
+
+
+def legacy_compound_node_refs(nodes):
+    """The pairwise comparison that render_views.py used before the containment index."""
+    compound = set()
+    for parent in nodes:
+        if parent.element_ref in compound:
+            continue
+        for child in nodes:
+            if (child.element_ref != parent.element_ref
+                    and child.x >= parent.x and child.y >= parent.y
+                    and child.x + child.width <= parent.x + parent.width
+                    and child.y + child.height <= parent.y + parent.height):
+                compound.add(parent.element_ref)
+                break
+    return compound
+
+
+def bench_containment(args):
+    print(f"Compound node detection on synthetic landscape views (best of {args.repeat})")
+    print(f"{'Nodes':>8} {'Pairwise':>12} {'Index':>12} {'Speedup':>9} {'Compound':>9} {'Depth':>6}")
+    for size in (int(size) for size in args.sizes.split(',')):
+        nodes = synthetic_landscape(size)
+        index = ContainmentIndex(nodes)
+        index_time = best_of(args.repeat, lambda: ContainmentIndex(nodes))
+
+        depth = 0
+        for node in range(len(nodes)):
+            node_depth = 0
+            while index.parents[node] != -1:
+                node, node_depth = index.parents[node], node_depth + 1
+            depth = max(depth, node_depth)
+
+        if size <= args.pairwise_max:
+            # The index must agree with the pairwise comparison before its numbers mean anything
+            if legacy_compound_node_refs(nodes) != index.compound_refs:
+                raise SystemExit('The containment index does not reproduce the pairwise comparison')
+            pairwise_time = best_of(args.repeat, lambda: legacy_compound_node_refs(nodes))
+            pairwise = f'{pairwise_time * 1000:>9.1f} ms'
+            speedup = f'{pairwise_time / index_time:>8.1f}x'
+        else:
+            pairwise, speedup = f"{'skipped':>12}", f"{'':>9}"
+        print(f"{size:>8} {pairwise} {index_time * 1000:>9.1f} ms {speedup} {len(index.compound_refs):>9} {depth:>6}")
+
+
+def load_ts_file_gen():
+    """Import ts-file-gen.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location('ts_file_gen', os.path.join(SCRIPT_DIR, 'ts-file-gen.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_stencil(rng):
+    """
+    Return the SVG of a stencil like the ones exported to source/: a translated group
+    of filled and stroked paths, with the occasional rect.
+    """
+    width, height = rng.randint(20, 60), rng.randint(20, 40)
+    elements = []
+    for _ in range(rng.randint(2, 8)):
+        if rng.random() < 0.1:
+            elements.append(
+                f'<rect x="{rng.uniform(200, 1200):.3f}" y="{rng.uniform(100, 500):.3f}" '
+                f'width="{rng.randint(5, 50)}" height="{rng.randint(5, 30)}" stroke="#002346" stroke-width="1.5" fill="#FFFFFF"/>'
+            )
+        elif rng.random() < 0.5:
+            elements.append(f'<path d="{synthetic_path(rng, rng.randint(4, 24))}" fill="#FFFFFF" fill-rule="evenodd"/>')
+        else:
+            elements.append(
+                f'<path d="{synthetic_path(rng, rng.randint(4, 24))}" stroke="#000000" stroke-width="{rng.uniform(0.5, 2):.5f}" '
+                f'stroke-miterlimit="1" fill="none" fill-rule="evenodd"/>'
+            )
+    return (
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg" overflow="hidden">'
+        f'<g transform="translate(-{rng.randint(150, 250)} -{rng.randint(50, 150)})">{"".join(elements)}</g></svg>'
+    )
+
+
+def write_stencil_set(directory, count, seed=42):
+    """Write count synthetic stencils to directory and return their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f'shape-{index:05d}.svg')
+        with open(path, 'w') as f:
+            f.write(synthetic_stencil(rng))
+        paths.append(path)
+    return paths
+
+
+def suite_stages(file_paths, ts_file_gen, element_mappings, element_type_names):
+    """Return (name, func) for every stage of the pipeline, each run over the whole stencil set."""
+    # The inputs of the later stages are prepared up front so only the stage itself is timed
+    shapes = [process_svg_file(path) for path in file_paths]
+    path_data = []
+    for path in file_paths:
+        for node in ET.parse(path).iter('{http://www.w3.org/2000/svg}path'):
+            path_data.append(node.get('d'))
+    matrix = translate(-200.0, -100.0)
+
+    def write_shape_data():
+        out = io.StringIO()
+        ts_file_gen.write_element_mapping(out, element_mappings, element_type_names)
+        ts_file_gen.write_shape_data(out, shapes)
+        return out.tell()
+
+    return [
+        ('process_svg_file', lambda: [process_svg_file(path) for path in file_paths]),
+        ('transform_path_d', lambda: [transform_path_d(d, matrix) for d in path_data]),
+        ('write_shape_data', write_shape_data),
+        ('render_shape', lambda: [render_shape(shape, 0, 0, 1.0, '#FFFFFF') for shape in shapes]),
+    ]
+
+
+# Differences below these are treated as measurement noise, whatever their ratio
+NOISE_FLOOR = {'seconds': 0.01, 'peak_bytes': 64 * 1024}
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    Print how every stage compares with the baseline and return the list of
+    regressions, i.e. stages more than tolerance slower or larger than before.
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            previous = baseline.get(size, {}).get(stage)
+            if previous is None:
+                continue
+            for metric, unit, scale in (('seconds', 'ms', 1000), ('peak_bytes', 'MB', 1e-6)):
+                ratio = current[metric] / previous[metric] if previous[metric] else 1.0
+                status = 'ok'
+                if ratio > 1 + tolerance and current[metric] - previous[metric] > NOISE_FLOOR[metric]:
+                    status = 'REGRESSION'
+                    regressions.append(f'{stage} at {size} shapes: {metric} {ratio:.2f}x the baseline')
+                print(f"  {size:>6} {stage:<18} {metric:<10} {previous[metric] * scale:10.1f} -> "
+                      f"{current[metric] * scale:10.1f} {unit} {ratio:6.2f}x  {status}")
+    return regressions
+
+
+def bench_suite(args):
+    sizes = [int(size) for size in args.sizes.split(',')]
+    ts_file_gen = load_ts_file_gen()
+    with open(os.path.join(SCRIPT_DIR, 'element-mapping.json'), 'r') as f:
+        element_mappings = json.load(f)
+    element_type_names = ts_file_gen.load_element_type_names(os.path.join(SCRIPT_DIR, '..', '..', 'types.ts'))
+
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_paths = write_stencil_set(tmp_dir, size)
+            stages = suite_stages(file_paths, ts_file_gen, element_mappings, element_type_names)
+            results[str(size)] = {}
+            print(f"{size} shapes (best of {args.repeat})")
+            for stage, func in stages:
+                seconds = best_of(args.repeat, func)
+                _, _, peak = measure(func)
+                results[str(size)][stage] = {'seconds': seconds, 'peak_bytes': peak}
+                print(f"  {stage:<18} {seconds * 1000:10.1f} ms {seconds / size * 1e6:8.1f} us/shape "
+                      f"{peak / 1e6:8.1f} MB peak")
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np is not None,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        print(f"Comparison with {args.baseline} (tolerance {args.tolerance:.0%})")
+        regressions = compare_with_baseline(results, baseline['results'], args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks for the svg-shapes tooling')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    path_parser = subparsers.add_parser('path-data', help='Compare path transform implementations')
+    path_parser.add_argument('--paths', type=int, default=10000, help='Number of synthetic paths (default: 10000)')
+    path_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs (default: 5)')
+    path_parser.set_defaults(func=bench_path_data)
+
+    poster_parser = subparsers.add_parser('poster', help='Compare inline and symbol/use poster rendering')
+    poster_parser.add_argument('--copies', type=int, default=20, help='Number of times every element is placed (default: 20)')
+    poster_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs (default: 5)')
+    poster_parser.set_defaults(func=bench_poster)
+
+    model_parser = subparsers.add_parser('model', help='Compare the streaming model loader with a DOM parse')
+    model_parser.add_argument(
+        '--model',
+        default=os.path.join(SCRIPT_DIR, '..', '..', '..', 'examples', 'archimetal.xml'),
+        help='Open Exchange model to enlarge (default: examples/archimetal.xml)'
+    )
+    model_parser.add_argument('--copies', type=int, default=16, help='Number of copies of the model contents (default: 16)')
+    model_parser.set_defaults(func=bench_model)
+
+    shapes_parser = subparsers.add_parser('shapes', help='Compare the memory of shape dicts and compact shape records')
+    shapes_parser.add_argument('--shapes', type=int, default=10000, help='Number of shapes in the library (default: 10000)')
+    shapes_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs (default: 5)')
+    shapes_parser.set_defaults(func=bench_shapes)
+
+    pack_parser = subparsers.add_parser('pack', help='Compare loading all-shapes.json with opening a shape pack')
+    pack_parser.add_argument(
+        '--sizes',
+        default='100,1000,10000,50000',
+        help='Comma-separated numbers of shapes in the library (default: 100,1000,10000,50000)'
+    )
+    pack_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs (default: 5)')
+    pack_parser.add_argument(
+        '--keep-dir',
+        default=None,
+        help='Keep the JSON files and packs of every size in this directory, for scripts/benchmark-pack.js (default: off)'
+    )
+    pack_parser.set_defaults(func=bench_pack)
+
+    containment_parser = subparsers.add_parser('containment', help='Compare pairwise compound detection with the containment index')
+    containment_parser.add_argument(
+        '--sizes',
+        default='100,1000,5000,20000',
+        help='Comma-separated numbers of nodes in the view (default: 100,1000,5000,20000)'
+    )
+    containment_parser.add_argument(
+        '--pairwise-max',
+        type=int,
+        default=5000,
+        help='Largest view that is also timed with the pairwise comparison (default: 5000)'
+    )
+    containment_parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs (default: 3)')
+    containment_parser.set_defaults(func=bench_containment)
+
+    suite_parser = subparsers.add_parser('suite', help='Time every pipeline stage on synthetic stencil sets')
+    suite_parser.add_argument(
+        '--sizes',
+        default='100,1000,10000,50000',
+        help='Comma-separated numbers of synthetic stencils (default: 100,1000,10000,50000)'
+    )
+    suite_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs per stage (default: 5)')
+    suite_parser.add_argument(
+        '--output', '-o',
+        default='benchmark-results.json',
+        help='JSON file for the results, which can serve as a later baseline (default: benchmark-results.json)'
+    )
+    suite_parser.add_argument(
+        '--baseline', '-b',
+        default=None,
+        help='Results of an earlier run to compare with; exits with status 1 on a regression (default: no comparison)'
+    )
+    suite_parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='Allowed slowdown or memory growth over the baseline before a stage counts as a regression (default: 0.25)'
+    )
+    suite_parser.set_defaults(func=bench_suite)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Containment index: the parent/child nesting of the nodes of a view.
+
+A node is compound when it wholly contains another node, as compound-element-detector.ts
+decides it; comparing every node with every other one is quadratic in the size of the
+view. ContainmentIndex sweeps the nodes from left to right, wider nodes first, so every
+container is visited before the nodes it contains. The nodes that may still contain
+later ones are kept in a segment tree over their vertical extent, and the containers
+of a node are found on the path from the leaf of its top edge to the root. Nodes that
+end left of the sweep position are dropped while the tree is walked, so a view whose
+nodes do not overlap much is indexed in O(n log n).
+
+buildContainmentIndex() in compound-element-detector.ts implements the same sweep.
+"""
+
+
+class ContainmentIndex:
+    """
+    The nesting of a list of nodes with element_ref, x, y, width and height attributes.
+
+    parents[i] is the index of the innermost node that contains node i, or -1 for
+    top-level nodes; of identical containers, the one swept last, so identical nodes form
+    a chain. children[i] and roots hold node indices in view order. compound_refs is the
+    set of element references of the nodes that contain a node with another reference.
+    """
+    __slots__ = ('parents', 'children', 'roots', 'compound_refs')
+
+    def __init__(self, nodes):
+        count = len(nodes)
+        right = [node.x + node.width for node in nodes]
+        bottom = [node.y + node.height for node in nodes]
+
+        order = sorted(range(count), key=lambda i: (nodes[i].x, -right[i], nodes[i].y, -bottom[i], i))
+        position = [0] * count
+        for i, index in enumerate(order):
+            position[index] = i
+
+        # Leaves of the segment tree are the distinct vertical coordinates
+        ys = sorted({node.y for node in nodes} | set(bottom))
+        y_index = {y: i for i, y in enumerate(ys)}
+        size = 1
+        while size < len(ys):
+            size <<= 1
+        segments = [None] * (2 * size)
+
+        parents = [-1] * count
+        compound_refs = set()
+
+        for index in order:
+            child = nodes[index]
+            child_right, child_bottom = right[index], bottom[index]
+            parent = -1
+            parent_key = None
+
+            node = y_index[child.y] + size
+            while node >= 1:
+                candidates = segments[node]
+                node >>= 1
+                if not candidates:
+                    continue
+                # Containers start left of the sweep position and span the top edge of
+                # the child; those that end before the sweep position cannot contain anything
+                candidates[:] = [candidate for candidate in candidates if right[candidate] >= child.x]
+                for candidate in candidates:
+                    if right[candidate] < child_right or bottom[candidate] < child_bottom:
+                        continue
+                    container = nodes[candidate]
+                    if container.element_ref != child.element_ref:
+                        compound_refs.add(container.element_ref)
+                        # Identical nodes contain each other
+                        if (container.x == child.x and container.y == child.y
+                                and right[candidate] == child_right and bottom[candidate] == child_bottom):
+                            compound_refs.add(child.element_ref)
+                    key = (container.width * container.height, -position[candidate])
+                    if parent_key is None or key < parent_key:
+                        parent, parent_key = candidate, key
+            parents[index] = parent
+
+            # Add the node to the canonical segments of its vertical extent
+            low = y_index[child.y] + size
+            high = y_index[child_bottom] + size + 1
+            while low < high:
+                if low & 1:
+                    if segments[low] is None:
+                        segments[low] = []
+                    segments[low].append(index)
+                    low += 1
+                if high & 1:
+                    high -= 1
+                    if segments[high] is None:
+                        segments[high] = []
+                    segments[high].append(index)
+                low >>= 1
+                high >>= 1
+
+        self.parents = parents
+        self.children = [[] for _ in range(count)]
+        self.roots = []
+        for index, parent in enumerate(parents):
+            (self.roots if parent == -1 else self.children[parent]).append(index)
+        self.compound_refs = compound_refs
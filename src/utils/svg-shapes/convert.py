@@ -1,81 +1,42 @@
 #!/usr/bin/env python3
 import os
-import re
 import json
+import hashlib
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from metrics import NULL_METRICS, ItemMetrics, create_metrics, profiled
+from optimize import coalesce_style_runs
+from path_data import IDENTITY, PathData, apply_to_point, parse_transform
+from theme import mapping_layer_color, theme_colors
 
 # Minimum stroke width to use if value is less than 1
 MIN_STROKE_WIDTH = 2.0
 
-# Mapping provided by the user.
-ELEMENT_MAPPING = [
-  {"element": "Stakeholder", "layer": "Motivation", "color": "#800080"},
-  {"element": "Driver", "layer": "Motivation", "color": "#800080"},
-  {"element": "Assessment", "layer": "Motivation", "color": "#800080"},
-  {"element": "Goal", "layer": "Motivation", "color": "#800080"},
-  {"element": "Outcome", "layer": "Motivation", "color": "#800080"},
-  {"element": "Principle", "layer": "Motivation", "color": "#800080"},
-  {"element": "Requirement", "layer": "Motivation", "color": "#800080"},
-  {"element": "Constraint", "layer": "Motivation", "color": "#800080"},
-  {"element": "Meaning", "layer": "Motivation", "color": "#800080"},
-  {"element": "Value", "layer": "Motivation", "color": "#800080"},
-  {"element": "Resource", "layer": "Strategy", "color": "#A52A2A"},
-  {"element": "Capability", "layer": "Strategy", "color": "#A52A2A"},
-  {"element": "Value Stream", "layer": "Strategy", "color": "#A52A2A"},
-  {"element": "Course of Action", "layer": "Strategy", "color": "#A52A2A"},
-  {"element": "Business Actor", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Role", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Collaboration", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Interface", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Process", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Function", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Interaction", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Event", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Service", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Business Object", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Contract", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Representation", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Product", "layer": "Business", "color": "#FFFF00"},
-  {"element": "Application Component", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Collaboration", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Interface", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Function", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Interaction", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Process", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Event", "layer": "Application", "color": "#0000FF"},
-  {"element": "Application Service", "layer": "Application", "color": "#0000FF"},
-  {"element": "Data Object", "layer": "Application", "color": "#0000FF"},
-  {"element": "Node", "layer": "Technology", "color": "#008000"},
-  {"element": "Device", "layer": "Technology", "color": "#008000"},
-  {"element": "System Software", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Collaboration", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Interface", "layer": "Technology", "color": "#008000"},
-  {"element": "Path", "layer": "Technology", "color": "#008000"},
-  {"element": "Communication Network", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Function", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Process", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Interaction", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Event", "layer": "Technology", "color": "#008000"},
-  {"element": "Technology Service", "layer": "Technology", "color": "#008000"},
-  {"element": "Artifact", "layer": "Technology", "color": "#008000"},
-  {"element": "Equipment", "layer": "Technology", "color": "#008000"},
-  {"element": "Facility", "layer": "Technology", "color": "#008000"},
-  {"element": "Distribution Network", "layer": "Technology", "color": "#008000"},
-  {"element": "Material", "layer": "Technology", "color": "#008000"},
-  {"element": "Work Package", "layer": "Implementation and Migration", "color": "#FFC0CB"},
-  {"element": "Deliverable", "layer": "Implementation and Migration", "color": "#FFC0CB"},
-  {"element": "Implementation Event", "layer": "Implementation and Migration", "color": "#FFC0CB"},
-  {"element": "Plateau", "layer": "Implementation and Migration", "color": "#FFC0CB"},
-  {"element": "Gap", "layer": "Implementation and Migration", "color": "#FFC0CB"},
-  {"element": "Grouping", "layer": "Composite", "color": "#808080"},
-  {"element": "Location", "layer": "Composite", "color": "#808080"}
-]
+# Bump this whenever process_svg_file changes its output so stale cache entries are ignored.
+CACHE_VERSION = 3
+
+# The rectangles of a stencil are filled with the color of its element's layer in this
+# theme of themes.json
+STENCIL_THEME = 'stencil'
+LAYER_MAPPING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'layer-mapping.json')
+
+def load_element_colors(theme=STENCIL_THEME):
+    """
+    Return the fill color of every element of layer-mapping.json by lowercase name:
+    the color of its layer in a theme.
+    """
+    with open(LAYER_MAPPING_PATH, 'r') as f:
+        layer_mapping = json.load(f)
+    colors = theme_colors(theme)
+    return {
+        entry["element"].lower(): mapping_layer_color(colors, entry["layer"])
+        for entry in layer_mapping
+    }
 
 # Create a lookup dictionary for fast color retrieval.
-ELEMENT_COLOR_LOOKUP = {
-    entry["element"].lower(): entry["color"]
-    for entry in ELEMENT_MAPPING
-}
+ELEMENT_COLOR_LOOKUP = load_element_colors()
 
 def get_fill_color(shape_name):
     """
@@ -85,142 +46,334 @@ def get_fill_color(shape_name):
     normalized = shape_name.lower().replace('-', ' ').strip()
     return ELEMENT_COLOR_LOOKUP.get(normalized)
 
-def parse_transform(transform_str):
+def transform_path_d(d, matrix):
     """
-    Parse a transform attribute of the form 'translate(tx ty)' and return (tx, ty).
-    If not found, return (0, 0).
+    Apply an affine transform matrix to the 'd' attribute.
+    The path is tokenized into a PathData representation, transformed in one batched
+    step and written back with every coordinate rounded to 2 decimal places.
     """
-    m = re.search(r"translate\(\s*([-+]?\d*\.?\d+)[,\s]+([-+]?\d*\.?\d+)\s*\)", transform_str)
-    if m:
-        return float(m.group(1)), float(m.group(2))
-    return 0.0, 0.0
+    return PathData.parse(d).transform(matrix).format(2)
+
+def transform_rect(x, y, width, height, matrix):
+    """
+    Apply an affine transform matrix to a rectangle.
+    Returns (x, y, width, height), or None when the matrix rotates or skews the
+    rectangle so that it can only be represented as a path.
+    """
+    a, b, c, d, e, f = matrix
+    if b != 0 or c != 0:
+        return None
+    new_x, new_y = apply_to_point(matrix, x, y)
+    new_width, new_height = width * a, height * d
+    # Negative scales mirror the rectangle; keep a positive width and height
+    if new_width < 0:
+        new_x, new_width = new_x + new_width, -new_width
+    if new_height < 0:
+        new_y, new_height = new_y + new_height, -new_height
+    return new_x, new_y, new_width, new_height
+
+def union_bounds(boxes):
+    """Return the box (min_x, min_y, max_x, max_y) enclosing all boxes, or None if there are none."""
+    boxes = [box for box in boxes if box is not None]
+    if not boxes:
+        return None
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+def geometry_metadata(box):
+    """
+    Return the "bounds" and "unitTransform" entries of a shape whose elements cover box.
+    The unit transform scales and translates the content so that its longer side is 1
+    and its top-left corner is at the origin: x' = x * scale + unitTransform.x, and
+    likewise for y.
+    It also gives the size of the normalized content, so a renderer can fit an icon in
+    a box of any size with a few multiplications.
+    """
+    min_x, min_y, max_x, max_y = box
+    width, height = max_x - min_x, max_y - min_y
+    size = max(width, height)
+    scale = 1 / size if size else 1.0
+    return {
+        "bounds": {
+            "x": round(min_x, 2),
+            "y": round(min_y, 2),
+            "width": round(width, 2),
+            "height": round(height, 2)
+        },
+        # Adding 0.0 turns the -0.0 of content at the origin into 0.0
+        "unitTransform": {
+            "scale": round(scale, 6),
+            "x": round(-min_x * scale, 6) + 0.0,
+            "y": round(-min_y * scale, 6) + 0.0,
+            "width": round(width * scale, 6),
+            "height": round(height * scale, 6)
+        }
+    }
+
+def stroke_width_value(value):
+    """Return a stroke width rounded to 2 decimals, widening hairlines to MIN_STROKE_WIDTH."""
+    stroke_width = float(value)
+    if stroke_width < 1:
+        stroke_width = MIN_STROKE_WIDTH
+    return round(stroke_width, 2)
 
-def transform_path_d(d, tx, ty):
+def normalize_path_attributes(elem, element_data):
+    """Copy the presentation attributes of a <path> into its shape element."""
+    # Add stroke attribute if present or if it's black
+    if "stroke" in elem.attrib:
+        if elem.attrib.get("stroke", "").lower() in ["#000000", "black"]:
+            element_data["stroke"] = "black"
+        else:
+            element_data["stroke"] = elem.attrib.get("stroke")
+    
+    # Add stroke-width if present
+    if "stroke-width" in elem.attrib:
+        element_data["strokeWidth"] = stroke_width_value(elem.attrib.get("stroke-width"))
+    
+    # Add other stroke attributes only if present
+    if "stroke-linecap" in elem.attrib:
+        element_data["strokeLinecap"] = elem.attrib.get("stroke-linecap")
+    
+    if "stroke-linejoin" in elem.attrib:
+        element_data["strokeLinejoin"] = elem.attrib.get("stroke-linejoin")
+    
+    if "stroke-miterlimit" in elem.attrib:
+        element_data["strokeMiterlimit"] = elem.attrib.get("stroke-miterlimit")
+    
+    # Explicitly handle fill="none" to ensure it's preserved
+    if "fill" in elem.attrib:
+        fill_value = elem.attrib.get("fill")
+        element_data["fill"] = fill_value
+    
+    # Add fill-rule if present
+    if "fill-rule" in elem.attrib:
+        element_data["fillRule"] = elem.attrib.get("fill-rule")
+
+def normalize_rect_attributes(elem, element_data, fill_color):
+    """Copy the presentation attributes of a <rect> into its shape element."""
+    # Add stroke attribute if present
+    if "stroke" in elem.attrib:
+        element_data["stroke"] = elem.attrib.get("stroke")
+    
+    # Add stroke-width if present
+    if "stroke-width" in elem.attrib:
+        element_data["strokeWidth"] = stroke_width_value(elem.attrib.get("stroke-width"))
+    
+    # Add fill attribute (from element color or from SVG)
+    if fill_color is not None:
+        element_data["fill"] = fill_color
+    elif "fill" in elem.attrib:
+        element_data["fill"] = elem.attrib.get("fill")
+
+def process_svg_file(file_path, metrics=NULL_METRICS):
     """
-    Adjust all numeric coordinates in the 'd' attribute by applying the translation.
-    Each coordinate is updated and rounded to 2 decimal places.
+    Convert an SVG stencil to a shape definition, or return None if it cannot be read.
+    The geometric bounding box of all elements, with the extrema of curves and arcs, is
+    stored as "bounds" together with the "unitTransform" that normalizes it.
+    The time spent parsing, transforming, normalizing attributes and serializing is
+    recorded in metrics, together with the element and path-number counts.
     """
-    counter = 0
-    def repl(match):
-        nonlocal counter
-        value = float(match.group(0))
-        new_val = value + (tx if counter % 2 == 0 else ty)
-        counter += 1
-        return str(round(new_val, 2))
-    return re.sub(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", repl, d)
-
-def process_svg_file(file_path):
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        # Get width and height from the <svg> element.
-        width = float(root.attrib.get("width", "0"))
-        height = float(root.attrib.get("height", "0"))
-        # Use the file name (without extension) as the shape (element) name.
-        shape_name = os.path.splitext(os.path.basename(file_path))[0]
-        # Determine the fill color based on the element name.
-        fill_color = get_fill_color(shape_name)
-
-        # Find the first <g> element (considering possible namespaces).
-        g = root.find(".//{http://www.w3.org/2000/svg}g")
-        if g is None:
-            g = root.find("g")
-
-        # Default translation (if no transform is provided)
-        tx, ty = 0.0, 0.0
-        if g is not None and "transform" in g.attrib:
-            tx, ty = parse_transform(g.attrib["transform"])
+        with metrics.stage("parse"):
+            tree = ET.parse(file_path)
+            root = tree.getroot()
+            # Get width and height from the <svg> element.
+            width = float(root.attrib.get("width", "0"))
+            height = float(root.attrib.get("height", "0"))
+            # Use the file name (without extension) as the shape (element) name.
+            shape_name = os.path.splitext(os.path.basename(file_path))[0]
+            # Determine the fill color based on the element name.
+            fill_color = get_fill_color(shape_name)
+
+            # Find the first <g> element (considering possible namespaces).
+            g = root.find(".//{http://www.w3.org/2000/svg}g")
+            if g is None:
+                g = root.find("g")
+
+            # Default transform (if no transform is provided)
+            matrix = IDENTITY
+            if g is not None and "transform" in g.attrib:
+                matrix = parse_transform(g.attrib["transform"])
 
         elements = []
+        boxes = []
         if g is not None:
             for elem in g:
                 # Remove namespace from tag name if present.
                 tag = elem.tag.split("}")[-1]
                 if tag == "path":
-                    d = elem.attrib.get("d", "")
-                    new_d = transform_path_d(d, tx, ty)
-                    # Start with required attributes
-                    element_data = {
-                        "type": tag,
-                        "d": new_d
-                    }
-                    
-                    # Add stroke attribute if present or if it's black
-                    if "stroke" in elem.attrib:
-                        if elem.attrib.get("stroke", "").lower() in ["#000000", "black"]:
-                            element_data["stroke"] = "black"
-                        else:
-                            element_data["stroke"] = elem.attrib.get("stroke")
-                    
-                    # Add stroke-width if present
-                    if "stroke-width" in elem.attrib:
-                        stroke_width = float(elem.attrib.get("stroke-width"))
-                        if stroke_width < 1:
-                            stroke_width = MIN_STROKE_WIDTH
-                        element_data["strokeWidth"] = round(stroke_width, 2)
-                    
-                    # Add other stroke attributes only if present
-                    if "stroke-linecap" in elem.attrib:
-                        element_data["strokeLinecap"] = elem.attrib.get("stroke-linecap")
-                    
-                    if "stroke-linejoin" in elem.attrib:
-                        element_data["strokeLinejoin"] = elem.attrib.get("stroke-linejoin")
-                    
-                    if "stroke-miterlimit" in elem.attrib:
-                        element_data["strokeMiterlimit"] = elem.attrib.get("stroke-miterlimit")
-                    
-                    # Explicitly handle fill="none" to ensure it's preserved
-                    if "fill" in elem.attrib:
-                        fill_value = elem.attrib.get("fill")
-                        element_data["fill"] = fill_value
-                    
-                    # Add fill-rule if present
-                    if "fill-rule" in elem.attrib:
-                        element_data["fillRule"] = elem.attrib.get("fill-rule")
+                    with metrics.stage("transform"):
+                        path = PathData.parse(elem.attrib.get("d", "")).transform(matrix)
+                        new_d = path.format(2)
+                    with metrics.stage("bounds"):
+                        boxes.append(path.bounds())
+                    metrics.count("path_numbers", len(path.coords))
+                    with metrics.stage("normalize"):
+                        # Start with required attributes
+                        element_data = {
+                            "type": tag,
+                            "d": new_d
+                        }
+                        normalize_path_attributes(elem, element_data)
                     elements.append(element_data)
                 elif tag == "rect":
                     x = float(elem.attrib.get("x", "0"))
                     y = float(elem.attrib.get("y", "0"))
-                    new_x = round(x + tx, 2)
-                    new_y = round(y + ty, 2)
-                    # Start with required attributes for rectangle
-                    element_data = {
-                        "type": tag,
-                        "x": new_x,
-                        "y": new_y,
-                        "width": round(float(elem.attrib.get("width", "0")), 2),
-                        "height": round(float(elem.attrib.get("height", "0")), 2)
-                    }
-                    
-                    # Add stroke attribute if present
-                    if "stroke" in elem.attrib:
-                        element_data["stroke"] = elem.attrib.get("stroke")
-                    
-                    # Add stroke-width if present
-                    if "stroke-width" in elem.attrib:
-                        stroke_width = float(elem.attrib.get("stroke-width"))
-                        if stroke_width < 1:
-                            stroke_width = MIN_STROKE_WIDTH
-                        element_data["strokeWidth"] = round(stroke_width, 2)
-                    
-                    # Add fill attribute (from element color or from SVG)
-                    if fill_color is not None:
-                        element_data["fill"] = fill_color
-                    elif "fill" in elem.attrib:
-                        element_data["fill"] = elem.attrib.get("fill")
+                    rect_width = float(elem.attrib.get("width", "0"))
+                    rect_height = float(elem.attrib.get("height", "0"))
+                    with metrics.stage("transform"):
+                        rect = transform_rect(x, y, rect_width, rect_height, matrix)
+                        if rect is None:
+                            # Rotated or skewed rectangles are emitted as closed paths
+                            right, bottom = x + rect_width, y + rect_height
+                            corners = f"M{x} {y} {right} {y} {right} {bottom} {x} {bottom}Z"
+                            new_d = transform_path_d(corners, matrix)
+                    with metrics.stage("bounds"):
+                        if rect is not None:
+                            boxes.append((rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3]))
+                        else:
+                            boxes.append(PathData.parse(new_d).bounds())
+                    with metrics.stage("normalize"):
+                        if rect is not None:
+                            # Start with required attributes for rectangle
+                            element_data = {
+                                "type": tag,
+                                "x": round(rect[0], 2),
+                                "y": round(rect[1], 2),
+                                "width": round(rect[2], 2),
+                                "height": round(rect[3], 2)
+                            }
+                        else:
+                            element_data = {
+                                "type": "path",
+                                "d": new_d
+                            }
+                        normalize_rect_attributes(elem, element_data, fill_color)
                     elements.append(element_data)
                 # Additional SVG element types can be handled here.
+        metrics.count("elements", len(elements))
         shape_data = {
             "name": shape_name,
             "width": int(width),
             "height": int(height),
             "elements": elements
         }
+        box = union_bounds(boxes)
+        if box is not None:
+            shape_data.update(geometry_metadata(box))
+        if metrics.enabled:
+            # The size of the shape's record in all-shapes.json
+            with metrics.stage("serialize"):
+                metrics.count("output_bytes", len(json.dumps(shape_data, indent=2)))
         return shape_data
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
+        metrics.fail(e)
         return None
 
+def convert_file(file_path, collect_metrics=False):
+    """
+    Convert one SVG file, returning (shape, metrics record). The record is None unless
+    collect_metrics is set; it is a plain dict so it can come back from a worker process.
+    """
+    metrics = ItemMetrics(os.path.basename(file_path)) if collect_metrics else NULL_METRICS
+    shape = process_svg_file(file_path, metrics)
+    return shape, metrics.finish()
+
+def converter_fingerprint():
+    """
+    Return a digest of every setting that influences the output of process_svg_file.
+    Cache entries written under a different fingerprint are never reused.
+    """
+    settings = {
+        "version": CACHE_VERSION,
+        "min_stroke_width": MIN_STROKE_WIDTH,
+        "element_colors": ELEMENT_COLOR_LOOKUP,
+    }
+    encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+def cache_key(file_path, fingerprint):
+    """
+    Build the cache key for an SVG file from its content hash, its name (the shape
+    name is derived from the file name) and the converter fingerprint.
+    """
+    digest = hashlib.sha256()
+    digest.update(fingerprint.encode("utf-8"))
+    digest.update(os.path.basename(file_path).encode("utf-8"))
+    with open(file_path, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+def load_cached_shape(cache_dir, key):
+    """Return the cached shape for the given key, or None on a cache miss."""
+    cache_path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def store_cached_shape(cache_dir, key, shape):
+    """Write a shape to the cache. The file is renamed into place so readers never see partial entries."""
+    cache_path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(shape, f)
+    os.replace(tmp_path, cache_path)
+
+def convert_files(file_paths, jobs=1, cache_dir=None, metrics=NULL_METRICS):
+    """
+    Convert the given SVG files and return (shapes, cached_count).
+
+    Shapes are returned in the order of file_paths regardless of how the work was
+    scheduled. Files whose content and converter settings are unchanged are read
+    from cache_dir (if given) instead of being parsed again; the remaining files are
+    processed serially or, when jobs > 1, across a process pool. Every converted
+    file is added to metrics as an item.
+    """
+    results = [None] * len(file_paths)
+    keys = [None] * len(file_paths)
+    pending = []
+
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        fingerprint = converter_fingerprint()
+        with metrics.stage("cache"):
+            for index, file_path in enumerate(file_paths):
+                keys[index] = cache_key(file_path, fingerprint)
+                results[index] = load_cached_shape(cache_dir, keys[index])
+                if results[index] is None:
+                    pending.append(index)
+    else:
+        pending = list(range(len(file_paths)))
+
+    cached_count = len(file_paths) - len(pending)
+    metrics.count("cached_files", cached_count)
+    pending_paths = [file_paths[index] for index in pending]
+    convert = partial(convert_file, collect_metrics=metrics.enabled)
+
+    if jobs > 1 and len(pending_paths) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            converted = list(executor.map(convert, pending_paths))
+    else:
+        converted = [convert(file_path) for file_path in pending_paths]
+
+    for index, (shape, record) in zip(pending, converted):
+        results[index] = shape
+        if record is not None:
+            metrics.add_item(record)
+        # Failed conversions are not cached so they are retried on the next run
+        if cache_dir and shape is not None:
+            with metrics.stage("cache"):
+                store_cached_shape(cache_dir, keys[index], shape)
+
+    return results, cached_count
+
 def main():
     import argparse
     
@@ -238,6 +391,32 @@ def main():
         default='all-shapes.json', 
         help='Output JSON file path (default: all-shapes.json)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes; 0 uses all CPU cores (default: 1)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the incremental conversion cache (default: no cache)'
+    )
+    parser.add_argument(
+        '--metrics-out',
+        default=None,
+        help='Write wall/CPU time per stage and per file, counts and output sizes to this JSON file (default: off)'
+    )
+    parser.add_argument(
+        '--profile',
+        default=None,
+        help='Write cProfile stats of the conversion loop to this file; implies --jobs 1 (default: off)'
+    )
+    parser.add_argument(
+        '--no-coalesce',
+        action='store_true',
+        help='Keep every element separate instead of merging same-style elements into compound paths'
+    )
     
     args = parser.parse_args()
     
@@ -247,25 +426,50 @@ def main():
         print(f"Error: Source directory '{source_dir}' does not exist")
         return
     
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.profile:
+        # cProfile only sees this process, so the conversion must run here
+        jobs = 1
+    metrics = create_metrics('convert.py', args.metrics_out)
+    
+    # Sort the file list so the output order does not depend on the file system
+    files = sorted(file for file in os.listdir(source_dir) if file.endswith(".svg"))
+    file_paths = [os.path.join(source_dir, file) for file in files]
+    
+    with profiled(args.profile):
+        results, cached_count = convert_files(file_paths, jobs=jobs, cache_dir=args.cache_dir, metrics=metrics)
+    
     shapes = []
-    # Process all .svg files in the source directory
-    for file in os.listdir(source_dir):
-        if file.endswith(".svg"):
-            file_path = os.path.join(source_dir, file)
-            shape = process_svg_file(file_path)
-            if shape:
-                shapes.append(shape)
+    elements_before = elements_after = 0
+    for file, shape in zip(files, results):
+        if shape:
+            shapes.append(shape)
+            if args.no_coalesce:
                 print(f"Processed: {file}")
+                continue
+            with metrics.stage("coalesce"):
+                before, after = coalesce_style_runs(shape)
+            elements_before += before
+            elements_after += after
+            print(f"Processed: {file}" + (f" ({before} -> {after} elements)" if after < before else ""))
     
     if not shapes:
         print(f"Warning: No SVG files found in '{source_dir}'")
         return
     
     # Write the JSON output to the specified file
-    with open(args.output, "w") as out_file:
-        json.dump(shapes, out_file, indent=2)
+    with metrics.stage("write"):
+        with open(args.output, "w") as out_file:
+            json.dump(shapes, out_file, indent=2)
+    metrics.count("output_file_bytes", os.path.getsize(args.output))
     
+    if elements_after < elements_before:
+        print(f"Merged same-style elements: {elements_before} -> {elements_after} elements")
+    if args.cache_dir:
+        print(f"Reused {cached_count} cached shapes, converted {len(files) - cached_count}")
     print(f"Successfully processed {len(shapes)} shapes and saved to '{args.output}'")
+    if args.metrics_out:
+        metrics.write(args.metrics_out)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Streaming loader for ArchiMate Open Exchange models.
+
+The model is read with iterparse and every XML node is cleared as soon as its data
+has been copied into compact __slots__ records, so the document tree is never held
+in memory. Elements, relationships and views are indexed by identifier (and views
+also by name) for O(1) lookups.
+
+The records follow the model built by ArchiMateRenderer in index.ts: view nodes and
+connections are flattened per view with absolute bounds, node and connection styles
+are converted to the same CSS color strings, and nodes without an element reference
+or without bounds are skipped.
+"""
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+XSI_TYPE = '{http://www.w3.org/2001/XMLSchema-instance}type'
+
+
+class ModelElement:
+    """An ArchiMate element."""
+    __slots__ = ('id', 'type', 'name', 'documentation', 'properties')
+
+    def __init__(self, id, type):
+        self.id = id
+        self.type = type
+        self.name = None
+        self.documentation = None
+        self.properties = None
+
+
+class ModelRelationship:
+    """An ArchiMate relationship between two elements (or relationships)."""
+    __slots__ = ('id', 'type', 'source', 'target', 'access_type', 'name', 'documentation', 'properties')
+
+    def __init__(self, id, type, source, target, access_type=None):
+        self.id = id
+        self.type = type
+        self.source = source
+        self.target = target
+        self.access_type = access_type
+        self.name = None
+        self.documentation = None
+        self.properties = None
+
+
+class Style:
+    """Style of a view node or connection, with colors as CSS rgb() strings."""
+    __slots__ = ('fill_color', 'stroke_color', 'stroke_width', 'font_family', 'font_size')
+
+    def __init__(self):
+        self.fill_color = None
+        self.stroke_color = None
+        self.stroke_width = None
+        self.font_family = None
+        self.font_size = None
+
+
+class ViewNode:
+    """An element placed on a view, with absolute bounds."""
+    __slots__ = ('element_ref', 'x', 'y', 'width', 'height', 'style')
+
+    def __init__(self, element_ref, x, y, width, height):
+        self.element_ref = element_ref
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.style = None
+
+
+class ViewConnection:
+    """A relationship drawn on a view, with its bendpoints as (x, y) tuples."""
+    __slots__ = ('relationship_ref', 'bendpoints', 'style')
+
+    def __init__(self, relationship_ref):
+        self.relationship_ref = relationship_ref
+        self.bendpoints = None
+        self.style = None
+
+
+class View:
+    """A view (diagram) with its nodes and connections in document order."""
+    __slots__ = ('id', 'name', 'documentation', 'viewpoint', 'nodes', 'connections', 'properties')
+
+    def __init__(self, id, viewpoint=None):
+        self.id = id
+        self.name = None
+        self.documentation = None
+        self.viewpoint = viewpoint
+        self.nodes = []
+        self.connections = []
+        self.properties = None
+
+
+class ExchangeModel:
+    """An ArchiMate model with identifier indexes for elements, relationships and views."""
+    __slots__ = ('name', 'elements', 'relationships', 'views', 'views_by_name')
+
+    def __init__(self):
+        self.name = None
+        self.elements = {}
+        self.relationships = {}
+        self.views = {}
+        self.views_by_name = {}
+
+    def get_view(self, identifier):
+        """Return a view by identifier or name, or None if there is no such view."""
+        return self.views.get(identifier) or self.views_by_name.get(identifier)
+
+
+def _int(value, default=0):
+    """Parse an integer attribute the way parseInt() does for well-formed numbers."""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(float(value))
+        except ValueError:
+            return default
+
+
+def _rgb(attrib, default):
+    """Return the CSS rgb() string of a color node."""
+    r, g, b = (_int(attrib.get(channel), default) for channel in ('r', 'g', 'b'))
+    return f'rgb({r}, {g}, {b})'
+
+
+def _local_name(tag):
+    """Strip the namespace from an ElementTree tag."""
+    return tag[tag.rfind('}') + 1:]
+
+
+def _create_record(tag, attrib, parent_record):
+    """Create the record for an XML node that starts one, otherwise return None."""
+    if parent_record is None:
+        return _create_model_record(tag, attrib)
+    if isinstance(parent_record, (View, ViewNode)):
+        return _create_view_record(tag, attrib)
+    return None
+
+
+def _create_model_record(tag, attrib):
+    """Create the record for an element, relationship or view node."""
+    if tag == 'element':
+        identifier = attrib.get('identifier')
+        if identifier:
+            return ModelElement(identifier, sys.intern(attrib.get(XSI_TYPE) or 'Unknown'))
+    elif tag == 'relationship':
+        identifier = attrib.get('identifier')
+        source = attrib.get('source')
+        target = attrib.get('target')
+        if identifier and source and target:
+            rel_type = sys.intern(attrib.get(XSI_TYPE) or 'Association')
+            access_type = attrib.get('accessType') if rel_type == 'Access' else None
+            return ModelRelationship(identifier, rel_type, source, target, access_type)
+    elif tag == 'view':
+        identifier = attrib.get('identifier')
+        if identifier:
+            return View(identifier, attrib.get('viewpoint'))
+    return None
+
+
+def _create_view_record(tag, attrib):
+    """Create the record for a node or connection of a view."""
+    if tag == 'node':
+        element_ref = attrib.get('elementRef')
+        if element_ref:
+            # Archi writes the bounds as x, y, w and h attributes
+            return ViewNode(
+                element_ref,
+                _int(attrib.get('x')),
+                _int(attrib.get('y')),
+                _int(attrib.get('w') or attrib.get('width')),
+                _int(attrib.get('h') or attrib.get('height')),
+            )
+    elif tag == 'connection':
+        relationship_ref = attrib.get('relationshipRef')
+        if relationship_ref:
+            return ViewConnection(relationship_ref)
+    return None
+
+
+def _apply_style(style, tag, attrib):
+    """Copy a fillColor, lineColor, lineWidth or font style node into a Style."""
+    if tag == 'fillColor':
+        style.fill_color = _rgb(attrib, 255)
+    elif tag == 'lineColor':
+        style.stroke_color = _rgb(attrib, 0)
+    elif tag == 'lineWidth':
+        style.stroke_width = _int(attrib.get('value'), 1)
+    elif tag == 'font':
+        style.font_family = attrib.get('name')
+        if attrib.get('size'):
+            style.font_size = _int(attrib.get('size'))
+
+
+# Style nodes that are read for view nodes and connections
+NODE_STYLE_TAGS = ('fillColor', 'lineColor', 'font')
+CONNECTION_STYLE_TAGS = ('lineColor', 'lineWidth', 'font')
+
+
+def load_model(source):
+    """
+    Load an Open Exchange model from a file name or binary file object.
+    Returns an ExchangeModel.
+    """
+    model = ExchangeModel()
+    property_definitions = {}
+    records_with_properties = []
+
+    # One (tag, record, owner, node) entry for every open XML node, where record is
+    # the nearest enclosing model record and owner tells if this node created it.
+    # Attributes are read when a node starts and text when it ends.
+    stack = []
+    current_view = None
+    property_definition = property_key = property_value = None
+
+    for event, node in ET.iterparse(source, events=('start', 'end')):
+        tag = _local_name(node.tag)
+
+        if event == 'start':
+            parent_tag, parent_record, parent_owner, _ = stack[-1] if stack else (None, None, False, None)
+            record = _create_record(tag, node.attrib, parent_record)
+            if record is not None:
+                stack.append((tag, record, True, node))
+                if isinstance(record, View):
+                    current_view = record
+                elif isinstance(record, ViewNode):
+                    # Nodes are kept in document order, so parents are drawn before their children
+                    current_view.nodes.append(record)
+                continue
+
+            stack.append((tag, parent_record, False, node))
+            record = parent_record
+            if tag == 'propertyDefinition':
+                property_definition = node.get('identifier')
+            elif tag == 'property':
+                property_key = node.get('key') or node.get('propertyDefinitionRef')
+                property_value = node.get('value')
+            elif isinstance(record, ViewNode):
+                if tag == 'bounds' and parent_owner:
+                    # Older exchange files nest the bounds in their own element
+                    record.x = _int(node.get('x'))
+                    record.y = _int(node.get('y'))
+                    record.width = _int(node.get('width'))
+                    record.height = _int(node.get('height'))
+                elif tag in NODE_STYLE_TAGS and parent_tag == 'style' and stack[-3][2]:
+                    if record.style is None:
+                        record.style = Style()
+                    _apply_style(record.style, tag, node.attrib)
+            elif isinstance(record, ViewConnection):
+                if tag == 'bendpoint' and parent_owner:
+                    if record.bendpoints is None:
+                        record.bendpoints = []
+                    record.bendpoints.append((_int(node.get('x')), _int(node.get('y'))))
+                elif tag in CONNECTION_STYLE_TAGS and parent_tag == 'style' and stack[-3][2]:
+                    if record.style is None:
+                        record.style = Style()
+                    _apply_style(record.style, tag, node.attrib)
+            continue
+
+        _, record, owner, _ = stack.pop()
+        parent_tag, _, parent_owner, parent_node = stack[-1] if stack else (None, None, False, None)
+
+        if owner:
+            if isinstance(record, ModelElement):
+                model.elements[record.id] = record
+            elif isinstance(record, ModelRelationship):
+                model.relationships[record.id] = record
+            elif isinstance(record, View):
+                # Skip nodes whose position and size could not be determined
+                record.nodes = [n for n in record.nodes if n.x or n.y or n.width or n.height]
+                model.views[record.id] = record
+                if record.name:
+                    model.views_by_name[record.name] = record
+                current_view = None
+            elif isinstance(record, ViewConnection):
+                current_view.connections.append(record)
+        elif tag in ('name', 'documentation'):
+            text = node.text or ''
+            if parent_owner and isinstance(record, (ModelElement, ModelRelationship, View)):
+                setattr(record, tag, text)
+            elif parent_tag == 'model' and tag == 'name':
+                model.name = text
+            elif parent_tag == 'propertyDefinition' and tag == 'name':
+                property_definitions[property_definition] = text
+        elif tag == 'value' and parent_tag == 'property':
+            property_value = node.text
+        elif tag == 'property':
+            if parent_tag == 'properties' and isinstance(record, (ModelElement, ModelRelationship, View)):
+                if property_key and property_value:
+                    if record.properties is None:
+                        record.properties = {}
+                        records_with_properties.append(record)
+                    record.properties[property_key] = property_value
+
+        # Everything of interest has been copied at this point, so release the node
+        # and detach it from its parent
+        node.clear()
+        if parent_node is not None:
+            parent_node.clear()
+
+    # Properties refer to their definitions, which may come after the records
+    for record in records_with_properties:
+        record.properties = {
+            property_definitions.get(key, key): value for key, value in record.properties.items()
+        }
+
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Load an ArchiMate Open Exchange model and report its contents'
+    )
+    parser.add_argument('model', help='Open Exchange XML file')
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='List every view with its number of nodes and connections'
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        model = load_model(args.model)
+    except (OSError, ET.ParseError) as e:
+        print(f"Error: Could not load '{args.model}': {e}")
+        return
+    elapsed = time.perf_counter() - start
+
+    print(f"Model: {model.name}")
+    print(f"  {len(model.elements)} elements, {len(model.relationships)} relationships, {len(model.views)} views")
+    print(f"  loaded in {elapsed * 1000:.1f} ms")
+    if args.verbose:
+        for view in model.views.values():
+            print(f"  {view.name or view.id}: {len(view.nodes)} nodes, {len(view.connections)} connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Generate font-metrics.ts from the fonts that labels are set in.
+
+text-wrapper.ts measures labels to wrap them. Without metrics it has to assume that
+every character is 0.6 times as wide as the font size, which makes labels overflow or
+wrap too early. This script reads the advance widths and kerning pairs of the
+configured font families from their TrueType/OpenType files (see font_metrics.py)
+and writes them as compact tables, so measuring a word is a table lookup per
+character.
+
+font-metrics.json lists the character ranges to include and, for every family, the
+metrics file to generate from, relative to the configuration file. The committed
+fonts/arial-metrics.afm holds the advance widths and kerning pairs of Arimo, which is
+metric-compatible with Arial and Liberation Sans, so the tables are the same on every
+machine whatever fonts it has installed. A font file of the build machine is only used
+when it is given with --font, and --write-afm turns a font file into an AFM file that
+can be committed in place of the configured one.
+
+The same tables are written to font-metrics-data.json, which render_views.py reads to
+wrap labels exactly like text-wrapper.ts.
+
+Usage:
+    python font-metrics-gen.py [--font "Arial=/path/to/arial.ttf"] [--output ../font-metrics.ts]
+                               [--json-output font-metrics-data.json]
+    python font-metrics-gen.py --font "Arial=/path/to/Arimo[wght].ttf" --write-afm "Arial=fonts/arial-metrics.afm"
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+
+from font_metrics import FontError, load_font_metrics, write_afm
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FILE_HEADER = """/**
+ * Font Metrics
+ *
+ * This file exports the advance widths and kerning pairs of the label fonts, in font
+ * units, so that text-wrapper.ts can measure text without a browser.
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/font-metrics-gen.py to regenerate this file
+ */
+
+export interface IFontMetrics {
+  unitsPerEm: number;
+  // Advance of characters the tables do not contain
+  missingAdvance: number;
+  // Runs of consecutive characters: the first code point followed by their advances
+  advances: number[][];
+  // Kerning adjustments keyed by the two characters of a pair
+  kerning: Record<string, number>;
+}
+"""
+
+
+def load_ts_file_gen():
+    """Import ts-file-gen.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location('ts_file_gen', os.path.join(SCRIPT_DIR, 'ts-file-gen.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_ranges(ranges):
+    """Return the sorted code points of ranges such as "0020-007E"."""
+    code_points = set()
+    for code_range in ranges:
+        first, _, last = code_range.partition('-')
+        code_points.update(range(int(first, 16), int(last or first, 16) + 1))
+    return sorted(code_points)
+
+
+def advance_runs(font, code_points):
+    """Return [first code point, advance, ...] runs of the characters the font has."""
+    runs = []
+    previous = None
+    for code_point in code_points:
+        if code_point not in font.cmap:
+            continue
+        if previous is None or code_point != previous + 1:
+            runs.append([code_point])
+        runs[-1].append(font.advance(code_point))
+        previous = code_point
+    return runs
+
+
+def family_metrics(font, code_points):
+    """Return the metrics of a font restricted to the given characters."""
+    kerning = font.kerning_pairs(code_points)
+    return {
+        'unitsPerEm': font.units_per_em,
+        'missingAdvance': font.missing_advance,
+        'advances': advance_runs(font, code_points),
+        'kerning': {chr(left) + chr(right): kerning[left, right] for left, right in sorted(kerning)},
+    }
+
+
+def write_font_metrics(out, metrics_by_family, ts_key):
+    """
+    Write the font-metrics.ts module. Runs and kerning pairs are written on as few
+    lines as is readable, as the tables are long.
+    """
+    out.write(FILE_HEADER)
+    out.write('\n// Metrics keyed by the lowercase font family name\n')
+    out.write('export const fontMetricsData: Record<string, IFontMetrics> = ')
+    if not metrics_by_family:
+        out.write('{};\n')
+        return
+    out.write('{\n')
+    for family, metrics in metrics_by_family.items():
+        out.write(f'  {ts_key(family.lower())}: {{\n')
+        out.write(f"    unitsPerEm: {metrics['unitsPerEm']},\n")
+        out.write(f"    missingAdvance: {metrics['missingAdvance']},\n")
+        out.write('    advances: [\n')
+        for run in metrics['advances']:
+            out.write(f"      [{', '.join(map(str, run))}],\n")
+        out.write('    ],\n')
+        out.write('    kerning: {')
+        pairs = list(metrics['kerning'].items())
+        if pairs:
+            out.write('\n')
+            # One line per first character
+            line, left = [], None
+            for pair, value in pairs + [(None, None)]:
+                if line and (pair is None or pair[0] != left):
+                    out.write(f"      {', '.join(line)},\n")
+                    line = []
+                if pair is not None:
+                    left = pair[0]
+                    line.append(f'{ts_key(pair)}: {value}')
+            out.write('    ')
+        out.write('},\n')
+        out.write('  },\n')
+    out.write('};\n')
+
+
+def afm_comments(font, path):
+    """Return the comments of an AFM file written from a font file: its source and notices."""
+    comments = [
+        f'Advance widths and kerning pairs of {os.path.basename(path)}, for the characters',
+        'of font-metrics.json. Written by font-metrics-gen.py --write-afm.',
+    ]
+    # Keep the copyright, version and license notices of the font
+    for name_id in (0, 5, 13):
+        notice = font.name(name_id) if hasattr(font, 'name') else None
+        if notice:
+            comments.extend(' '.join(line.split()) for line in notice.splitlines() if line.strip())
+    return comments
+
+
+def write_font_metrics_json(out, metrics_by_family):
+    """Write the tables of font-metrics.ts as JSON, keyed by the lowercase family name."""
+    json.dump(
+        {family.lower(): metrics for family, metrics in metrics_by_family.items()},
+        out, separators=(',', ':')
+    )
+    out.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate font-metrics.ts from the TrueType/OpenType files of the label fonts'
+    )
+    parser.add_argument(
+        '--config', '-c',
+        default=os.path.join(SCRIPT_DIR, 'font-metrics.json'),
+        help='Font families and character ranges (default: font-metrics.json next to this script)'
+    )
+    parser.add_argument(
+        '--font', '-f',
+        action='append',
+        default=[],
+        metavar='FAMILY=PATH',
+        help='Use this font file, such as an installed font, for a family instead of the configured '
+             'metrics file; can be repeated'
+    )
+    parser.add_argument(
+        '--write-afm',
+        metavar='FAMILY=PATH',
+        help='Write the metrics of a family as an AFM file instead of generating the tables'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(SCRIPT_DIR, '..', 'font-metrics.ts'),
+        help='Output TypeScript file (default: src/utils/font-metrics.ts)'
+    )
+    parser.add_argument(
+        '--json-output', '-j',
+        default=os.path.join(SCRIPT_DIR, 'font-metrics-data.json'),
+        help='Output JSON file for render_views.py (default: font-metrics-data.json next to this script)'
+    )
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        config = json.load(f)
+    code_points = parse_ranges(config.get('ranges', ['0020-007E']))
+    config_dir = os.path.dirname(os.path.abspath(args.config))
+    font_files = {
+        family: os.path.join(config_dir, path) for family, path in config.get('families', {}).items()
+    }
+    for option in args.font:
+        family, separator, path = option.partition('=')
+        if not separator or not family or not path:
+            print(f"Error: --font expects FAMILY=PATH, got '{option}'")
+            return
+        font_files[family] = path
+
+    fonts = {}
+    for family, path in font_files.items():
+        try:
+            fonts[family] = load_font_metrics(path)
+        except (FontError, OSError) as e:
+            print(f"Error: Cannot read '{path}' for '{family}': {e}")
+            return
+
+    if args.write_afm:
+        family, separator, path = args.write_afm.partition('=')
+        if not separator or family not in fonts or not path:
+            print(f"Error: --write-afm expects FAMILY=PATH of a configured family, got '{args.write_afm}'")
+            return
+        with open(path, 'w', encoding='latin-1') as out:
+            write_afm(
+                out, fonts[family], code_points, family.replace(' ', '') + '-Metrics', family,
+                afm_comments(fonts[family], font_files[family])
+            )
+        print(f"Wrote the metrics of {family} from {font_files[family]} to {path}")
+        return
+
+    metrics_by_family = {}
+    for family, font in fonts.items():
+        metrics_by_family[family] = family_metrics(font, code_points)
+        print(f"{family}: {font_files[family]} ({sum(len(run) - 1 for run in metrics_by_family[family]['advances'])} "
+              f"characters, {len(metrics_by_family[family]['kerning'])} kerning pairs)")
+
+    ts_file_gen = load_ts_file_gen()
+    changed, size = ts_file_gen.write_if_changed(
+        args.output, lambda out: write_font_metrics(out, metrics_by_family, ts_file_gen.ts_key)
+    )
+    state = 'Generated' if changed else 'Unchanged'
+    print(f"{state} {os.path.basename(args.output)} with {len(metrics_by_family)} font families ({size} bytes)")
+
+    changed, size = ts_file_gen.write_if_changed(
+        args.json_output, lambda out: write_font_metrics_json(out, metrics_by_family)
+    )
+    state = 'Generated' if changed else 'Unchanged'
+    print(f"{state} {os.path.basename(args.json_output)} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
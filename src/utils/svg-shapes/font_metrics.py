@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+Horizontal metrics of TrueType and OpenType fonts, read with the standard library.
+
+Label wrapping only needs to know how far each character advances the pen and how
+much the pairs of characters are kerned, so this module reads just the tables that
+hold those numbers:
+
+    head    units per em
+    hhea    the number of entries of hmtx
+    hmtx    the advance width of every glyph
+    cmap    the glyph of every character (formats 4 and 12, Unicode subtables)
+    kern    pair kerning of the classic kern table (format 0 subtables)
+    GPOS    pair kerning of the 'kern' feature (pair adjustment formats 1 and 2), which
+            most current fonts use instead of the kern table
+
+All values are in font units; divide by units_per_em and multiply by the font size to
+get pixels. Font collections (.ttc) are read by face index.
+
+Adobe Font Metrics files (.afm) hold the same numbers as text: the advance width of
+every named glyph and the kerning pairs. AfmMetrics reads them and offers the interface
+of FontMetrics, so metrics can also be taken from fonts that are only available as AFM,
+such as the PDF core fonts. write_afm() writes the metrics of a font as AFM, so the few
+numbers label wrapping needs can be committed instead of the font file.
+"""
+
+import struct
+import unicodedata
+
+# Versions of a single font in the sfnt header
+TRUETYPE_VERSIONS = (b'\x00\x01\x00\x00', b'true', b'OTTO')
+COLLECTION_TAG = b'ttcf'
+
+# (platform, encoding) pairs of the cmap subtables that map Unicode, in order of preference
+UNICODE_SUBTABLES = ((3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0))
+
+# Coverage bits of a classic kern subtable
+KERN_HORIZONTAL = 0x1
+KERN_MINIMUM = 0x2
+KERN_CROSS_STREAM = 0x4
+KERN_OVERRIDE = 0x8
+
+# GPOS lookup types
+GPOS_PAIR_ADJUSTMENT = 2
+GPOS_EXTENSION = 9
+
+# Value format bits of a GPOS value record, in the order their fields are stored
+VALUE_X_ADVANCE = 0x4
+
+
+class FontError(ValueError):
+    """Raised when a file is not a font or lacks the tables that metrics need."""
+
+
+def _value_record_size(value_format):
+    """Return the size in bytes of a GPOS value record with the given format."""
+    return 2 * bin(value_format & 0xFF).count('1')
+
+
+def _x_advance(data, offset, value_format):
+    """Return the XAdvance field of a GPOS value record, or 0 if it has none."""
+    if not value_format & VALUE_X_ADVANCE:
+        return 0
+    # XPlacement and YPlacement come before XAdvance
+    skip = 2 * bin(value_format & 0x3).count('1')
+    return struct.unpack_from('>h', data, offset + skip)[0]
+
+
+class FontMetrics:
+    """
+    The horizontal metrics of one font face. advances holds the advance width of every
+    glyph, cmap maps code points to glyphs and kerning maps (left glyph, right glyph)
+    pairs to their adjustments, all in font units.
+    """
+
+    def __init__(self, data, face_index=0):
+        self.data = data
+        self.tables = self._read_table_directory(face_index)
+        self.units_per_em = self._read_units_per_em()
+        self.advances = self._read_advances()
+        self.cmap = self._read_cmap()
+        self._kerning = None
+
+    @classmethod
+    def from_file(cls, path, face_index=0):
+        """Read the metrics of a font file."""
+        with open(path, 'rb') as f:
+            return cls(f.read(), face_index)
+
+    def _read_table_directory(self, face_index):
+        data = self.data
+        if len(data) < 12:
+            raise FontError("File is too short to be a font")
+        offset = 0
+        if data[:4] == COLLECTION_TAG:
+            face_count = struct.unpack_from('>I', data, 8)[0]
+            if not 0 <= face_index < face_count:
+                raise FontError(f"Font collection has no face {face_index}")
+            offset = struct.unpack_from('>I', data, 12 + 4 * face_index)[0]
+        if data[offset:offset + 4] not in TRUETYPE_VERSIONS:
+            raise FontError("Not a TrueType or OpenType font")
+        table_count = struct.unpack_from('>H', data, offset + 4)[0]
+        tables = {}
+        for i in range(table_count):
+            tag, _, table_offset, length = struct.unpack_from('>4sIII', data, offset + 12 + 16 * i)
+            tables[tag.decode('latin-1')] = (table_offset, length)
+        for required in ('head', 'hhea', 'hmtx', 'cmap'):
+            if required not in tables:
+                raise FontError(f"Font has no '{required}' table")
+        return tables
+
+    def table(self, tag):
+        """Return the offset of a table, or None if the font does not have it."""
+        entry = self.tables.get(tag)
+        return entry[0] if entry else None
+
+    def _read_units_per_em(self):
+        return struct.unpack_from('>H', self.data, self.table('head') + 18)[0]
+
+    def _read_advances(self):
+        metric_count = struct.unpack_from('>H', self.data, self.table('hhea') + 34)[0]
+        glyph_count = metric_count
+        if self.table('maxp') is not None:
+            glyph_count = max(metric_count, struct.unpack_from('>H', self.data, self.table('maxp') + 4)[0])
+        hmtx = self.table('hmtx')
+        # Each long metric is (advance width, left side bearing)
+        advances = list(struct.unpack_from(f'>{metric_count * 2}H', self.data, hmtx)[::2])
+        # The remaining glyphs share the last advance width
+        advances.extend([advances[-1]] * (glyph_count - metric_count))
+        return advances
+
+    def _read_cmap(self):
+        data = self.data
+        cmap = self.table('cmap')
+        subtable_count = struct.unpack_from('>H', data, cmap + 2)[0]
+        subtables = {}
+        for i in range(subtable_count):
+            platform, encoding, offset = struct.unpack_from('>HHI', data, cmap + 4 + 8 * i)
+            subtables.setdefault((platform, encoding), cmap + offset)
+        for key in UNICODE_SUBTABLES:
+            if key in subtables:
+                mapping = self._read_cmap_subtable(subtables[key])
+                if mapping is not None:
+                    return mapping
+        raise FontError("Font has no Unicode cmap subtable of format 4 or 12")
+
+    def _read_cmap_subtable(self, offset):
+        data = self.data
+        subtable_format = struct.unpack_from('>H', data, offset)[0]
+        mapping = {}
+        if subtable_format == 4:
+            segment_count = struct.unpack_from('>H', data, offset + 6)[0] // 2
+            ends_at = offset + 14
+            starts_at = ends_at + 2 * segment_count + 2
+            deltas_at = starts_at + 2 * segment_count
+            range_offsets_at = deltas_at + 2 * segment_count
+            ends = struct.unpack_from(f'>{segment_count}H', data, ends_at)
+            starts = struct.unpack_from(f'>{segment_count}H', data, starts_at)
+            deltas = struct.unpack_from(f'>{segment_count}H', data, deltas_at)
+            range_offsets = struct.unpack_from(f'>{segment_count}H', data, range_offsets_at)
+            for i, (start, end, delta, range_offset) in enumerate(zip(starts, ends, deltas, range_offsets)):
+                if start == 0xFFFF:
+                    continue
+                for code_point in range(start, end + 1):
+                    if range_offset == 0:
+                        glyph = (code_point + delta) & 0xFFFF
+                    else:
+                        # The range offset is relative to its own position in the array
+                        glyph_at = range_offsets_at + 2 * i + range_offset + 2 * (code_point - start)
+                        glyph = struct.unpack_from('>H', data, glyph_at)[0]
+                        if glyph:
+                            glyph = (glyph + delta) & 0xFFFF
+                    if glyph:
+                        mapping[code_point] = glyph
+            return mapping
+        if subtable_format == 12:
+            group_count = struct.unpack_from('>I', data, offset + 12)[0]
+            for i in range(group_count):
+                start, end, glyph = struct.unpack_from('>III', data, offset + 16 + 12 * i)
+                for code_point in range(start, end + 1):
+                    mapping[code_point] = glyph + code_point - start
+            return mapping
+        return None
+
+    def name(self, name_id):
+        """
+        Return a string of the name table, such as 0 for the copyright notice or 5 for
+        the version, or None if the font does not have it. English Windows names are
+        preferred over Macintosh names.
+        """
+        data = self.data
+        table = self.table('name')
+        if table is None:
+            return None
+        record_count, strings = struct.unpack_from('>HH', data, table + 2)
+        found = {}
+        for i in range(record_count):
+            platform, encoding, language, record_id, length, offset = struct.unpack_from(
+                '>6H', data, table + 6 + 12 * i
+            )
+            if record_id != name_id:
+                continue
+            raw = data[table + strings + offset:table + strings + offset + length]
+            if (platform, encoding, language) == (3, 1, 0x409):
+                found.setdefault(0, raw.decode('utf-16-be'))
+            elif (platform, encoding, language) == (1, 0, 0):
+                found.setdefault(1, raw.decode('mac-roman'))
+        return found[min(found)] if found else None
+
+    @property
+    def kerning(self):
+        """
+        The pair kerning of the font as {(left glyph, right glyph): adjustment}, read on
+        first use. GPOS pairs take precedence over the classic kern table, like text
+        engines apply GPOS kerning when a font has it.
+        """
+        if self._kerning is None:
+            kerning = self._read_kern_table()
+            kerning.update(self._read_gpos_kerning())
+            self._kerning = {pair: value for pair, value in kerning.items() if value}
+        return self._kerning
+
+    def _read_kern_table(self):
+        data = self.data
+        kern = self.table('kern')
+        pairs = {}
+        if kern is None:
+            return pairs
+        version, subtable_count = struct.unpack_from('>HH', data, kern)
+        if version != 0:
+            # Apple's version 1 kern tables are only used by legacy Mac fonts
+            return pairs
+        offset = kern + 4
+        for _ in range(subtable_count):
+            _, length, subtable_format, coverage = struct.unpack_from('>HHBB', data, offset)
+            horizontal = coverage & KERN_HORIZONTAL and not coverage & (KERN_MINIMUM | KERN_CROSS_STREAM)
+            if subtable_format == 0 and horizontal:
+                pair_count = struct.unpack_from('>H', data, offset + 6)[0]
+                for i in range(pair_count):
+                    left, right, value = struct.unpack_from('>HHh', data, offset + 14 + 6 * i)
+                    if coverage & KERN_OVERRIDE:
+                        pairs[left, right] = value
+                    else:
+                        pairs[left, right] = pairs.get((left, right), 0) + value
+            offset += length
+        return pairs
+
+    def _coverage(self, offset):
+        """Return the glyphs of a coverage table in coverage index order."""
+        data = self.data
+        coverage_format, count = struct.unpack_from('>HH', data, offset)
+        if coverage_format == 1:
+            return list(struct.unpack_from(f'>{count}H', data, offset + 4))
+        glyphs = []
+        for i in range(count):
+            start, end, _ = struct.unpack_from('>HHH', data, offset + 4 + 6 * i)
+            glyphs.extend(range(start, end + 1))
+        return glyphs
+
+    def _class_definitions(self, offset):
+        """Return {glyph: class} of a class definition table; unlisted glyphs are class 0."""
+        data = self.data
+        class_format = struct.unpack_from('>H', data, offset)[0]
+        classes = {}
+        if class_format == 1:
+            start, count = struct.unpack_from('>HH', data, offset + 2)
+            for i, value in enumerate(struct.unpack_from(f'>{count}H', data, offset + 6)):
+                if value:
+                    classes[start + i] = value
+        elif class_format == 2:
+            count = struct.unpack_from('>H', data, offset + 2)[0]
+            for i in range(count):
+                start, end, value = struct.unpack_from('>HHH', data, offset + 4 + 6 * i)
+                if value:
+                    for glyph in range(start, end + 1):
+                        classes[glyph] = value
+        return classes
+
+    def _kern_feature_lookups(self, gpos):
+        """Return the indices of the lookups of all 'kern' features of a GPOS table."""
+        data = self.data
+        feature_list = gpos + struct.unpack_from('>H', data, gpos + 6)[0]
+        feature_count = struct.unpack_from('>H', data, feature_list)[0]
+        lookups = set()
+        for i in range(feature_count):
+            tag, feature_offset = struct.unpack_from('>4sH', data, feature_list + 2 + 6 * i)
+            if tag != b'kern':
+                continue
+            feature = feature_list + feature_offset
+            lookup_count = struct.unpack_from('>H', data, feature + 2)[0]
+            lookups.update(struct.unpack_from(f'>{lookup_count}H', data, feature + 4))
+        return sorted(lookups)
+
+    def _read_gpos_kerning(self):
+        data = self.data
+        gpos = self.table('GPOS')
+        pairs = {}
+        if gpos is None:
+            return pairs
+        lookup_list = gpos + struct.unpack_from('>H', data, gpos + 8)[0]
+        for lookup_index in self._kern_feature_lookups(gpos):
+            lookup = lookup_list + struct.unpack_from('>H', data, lookup_list + 2 + 2 * lookup_index)[0]
+            lookup_type, _, subtable_count = struct.unpack_from('>HHH', data, lookup)
+            for i in range(subtable_count):
+                subtable = lookup + struct.unpack_from('>H', data, lookup + 6 + 2 * i)[0]
+                subtable_type = lookup_type
+                if lookup_type == GPOS_EXTENSION:
+                    subtable_type, extension_offset = struct.unpack_from('>HI', data, subtable + 2)
+                    subtable += extension_offset
+                if subtable_type == GPOS_PAIR_ADJUSTMENT:
+                    # Earlier subtables of a lookup take precedence over later ones
+                    for pair, value in self._read_pair_adjustment(subtable).items():
+                        pairs.setdefault(pair, value)
+        return pairs
+
+    def _read_pair_adjustment(self, offset):
+        """Return {(left glyph, right glyph): XAdvance of the first glyph} of a PairPos subtable."""
+        data = self.data
+        pos_format, coverage_offset, format1, format2 = struct.unpack_from('>HHHH', data, offset)
+        first_glyphs = self._coverage(offset + coverage_offset)
+        record_size = _value_record_size(format1) + _value_record_size(format2)
+        pairs = {}
+        if pos_format == 1:
+            set_count = struct.unpack_from('>H', data, offset + 8)[0]
+            set_offsets = struct.unpack_from(f'>{set_count}H', data, offset + 10)
+            for left, set_offset in zip(first_glyphs, set_offsets):
+                pair_set = offset + set_offset
+                pair_count = struct.unpack_from('>H', data, pair_set)[0]
+                for j in range(pair_count):
+                    record = pair_set + 2 + j * (2 + record_size)
+                    right = struct.unpack_from('>H', data, record)[0]
+                    pairs[left, right] = _x_advance(data, record + 2, format1)
+        elif pos_format == 2:
+            class_def1, class_def2, class1_count, class2_count = struct.unpack_from('>HHHH', data, offset + 8)
+            first_classes = self._class_definitions(offset + class_def1)
+            second_classes = self._class_definitions(offset + class_def2)
+            glyphs_by_class = {}
+            for glyph, value in second_classes.items():
+                glyphs_by_class.setdefault(value, []).append(glyph)
+            records = offset + 16
+            for left in first_glyphs:
+                class1 = first_classes.get(left, 0)
+                if class1 >= class1_count:
+                    continue
+                row = records + class1 * class2_count * record_size
+                # Class 0 holds every glyph that is not listed, which is not worth expanding
+                for class2 in range(1, class2_count):
+                    value = _x_advance(data, row + class2 * record_size, format1)
+                    if value:
+                        for right in glyphs_by_class.get(class2, ()):
+                            pairs[left, right] = value
+        return pairs
+
+    @property
+    def missing_advance(self):
+        """Advance width of the missing glyph, which is glyph 0."""
+        return self.advances[0]
+
+    def advance(self, code_point):
+        """Return the advance width of a character, or of the missing glyph if the font has none."""
+        return self.advances[self.cmap.get(code_point, 0)]
+
+    def kerning_pairs(self, code_points):
+        """Return {(left code point, right code point): adjustment} for pairs of the given characters."""
+        glyphs = {}
+        for code_point in code_points:
+            if code_point in self.cmap:
+                glyphs.setdefault(self.cmap[code_point], []).append(code_point)
+        pairs = {}
+        for (left, right), value in self.kerning.items():
+            if left in glyphs and right in glyphs:
+                for left_code_point in glyphs[left]:
+                    for right_code_point in glyphs[right]:
+                        pairs[left_code_point, right_code_point] = value
+        return pairs
+
+
+# ===== AFM =====
+
+# Glyph names of the Adobe Glyph List that are not a letter, or a letter with one of
+# the accents of ACCENT_NAMES
+GLYPH_NAMES = {
+    'space': 0x20, 'exclam': 0x21, 'quotedbl': 0x22, 'numbersign': 0x23, 'dollar': 0x24,
+    'percent': 0x25, 'ampersand': 0x26, 'quotesingle': 0x27, 'parenleft': 0x28,
+    'parenright': 0x29, 'asterisk': 0x2A, 'plus': 0x2B, 'comma': 0x2C, 'hyphen': 0x2D,
+    'period': 0x2E, 'slash': 0x2F, 'zero': 0x30, 'one': 0x31, 'two': 0x32, 'three': 0x33,
+    'four': 0x34, 'five': 0x35, 'six': 0x36, 'seven': 0x37, 'eight': 0x38, 'nine': 0x39,
+    'colon': 0x3A, 'semicolon': 0x3B, 'less': 0x3C, 'equal': 0x3D, 'greater': 0x3E,
+    'question': 0x3F, 'at': 0x40, 'bracketleft': 0x5B, 'backslash': 0x5C,
+    'bracketright': 0x5D, 'asciicircum': 0x5E, 'underscore': 0x5F, 'grave': 0x60,
+    'braceleft': 0x7B, 'bar': 0x7C, 'braceright': 0x7D, 'asciitilde': 0x7E,
+    'exclamdown': 0xA1, 'cent': 0xA2, 'sterling': 0xA3, 'currency': 0xA4, 'yen': 0xA5,
+    'brokenbar': 0xA6, 'section': 0xA7, 'dieresis': 0xA8, 'copyright': 0xA9,
+    'ordfeminine': 0xAA, 'guillemotleft': 0xAB, 'logicalnot': 0xAC, 'registered': 0xAE,
+    'macron': 0xAF, 'degree': 0xB0, 'plusminus': 0xB1, 'twosuperior': 0xB2,
+    'threesuperior': 0xB3, 'acute': 0xB4, 'mu': 0xB5, 'paragraph': 0xB6,
+    'periodcentered': 0xB7, 'cedilla': 0xB8, 'onesuperior': 0xB9, 'ordmasculine': 0xBA,
+    'guillemotright': 0xBB, 'onequarter': 0xBC, 'onehalf': 0xBD, 'threequarters': 0xBE,
+    'questiondown': 0xBF, 'AE': 0xC6, 'Eth': 0xD0, 'multiply': 0xD7, 'Oslash': 0xD8,
+    'Thorn': 0xDE, 'germandbls': 0xDF, 'ae': 0xE6, 'eth': 0xF0, 'divide': 0xF7,
+    'oslash': 0xF8, 'thorn': 0xFE, 'dotlessi': 0x131, 'Lslash': 0x141, 'lslash': 0x142,
+    'OE': 0x152, 'oe': 0x153, 'endash': 0x2013, 'emdash': 0x2014, 'quoteleft': 0x2018,
+    'quoteright': 0x2019, 'quotesinglbase': 0x201A, 'quotedblleft': 0x201C,
+    'quotedblright': 0x201D, 'quotedblbase': 0x201E, 'dagger': 0x2020, 'daggerdbl': 0x2021,
+    'bullet': 0x2022, 'ellipsis': 0x2026, 'perthousand': 0x2030, 'guilsinglleft': 0x2039,
+    'guilsinglright': 0x203A, 'Euro': 0x20AC,
+}
+
+# Glyph name suffixes of the combining accents, as in "agrave" or "Ccedilla"
+ACCENT_NAMES = {
+    0x300: 'grave', 0x301: 'acute', 0x302: 'circumflex', 0x303: 'tilde', 0x304: 'macron',
+    0x306: 'breve', 0x307: 'dotaccent', 0x308: 'dieresis', 0x30A: 'ring', 0x30B: 'hungarumlaut',
+    0x30C: 'caron', 0x327: 'cedilla', 0x328: 'ogonek',
+}
+
+# Names of the glyphs with a code point below LATIN_LIMIT, built on first use
+_latin_glyph_names = None
+# Names of the glyphs of GLYPH_NAMES by code point, built on first use
+_glyph_names_by_code_point = None
+LATIN_LIMIT = 0x250
+
+
+def glyph_code_point(name):
+    """Return the code point of an Adobe glyph name, or None if the name is not known."""
+    global _latin_glyph_names
+    if name.startswith('uni') and len(name) == 7:
+        try:
+            return int(name[3:], 16)
+        except ValueError:
+            return None
+    if name in GLYPH_NAMES:
+        return GLYPH_NAMES[name]
+    if len(name) == 1 and name.isascii() and name.isalpha():
+        return ord(name)
+    if _latin_glyph_names is None:
+        # Letters with one accent are named after their letter and accent
+        _latin_glyph_names = {}
+        for code_point in range(0xC0, LATIN_LIMIT):
+            decomposed = unicodedata.normalize('NFD', chr(code_point))
+            if len(decomposed) == 2 and decomposed[0].isascii() and ord(decomposed[1]) in ACCENT_NAMES:
+                _latin_glyph_names[decomposed[0] + ACCENT_NAMES[ord(decomposed[1])]] = code_point
+    return _latin_glyph_names.get(name)
+
+
+def glyph_name(code_point):
+    """Return the Adobe glyph name of a code point, or its uniXXXX name if it has none."""
+    global _glyph_names_by_code_point
+    if _glyph_names_by_code_point is None:
+        _glyph_names_by_code_point = {value: name for name, value in GLYPH_NAMES.items()}
+    name = _glyph_names_by_code_point.get(code_point)
+    if name is None and code_point < LATIN_LIMIT:
+        character = chr(code_point)
+        if character.isascii() and character.isalpha():
+            name = character
+        else:
+            decomposed = unicodedata.normalize('NFD', character)
+            if len(decomposed) == 2 and decomposed[0].isascii() and ord(decomposed[1]) in ACCENT_NAMES:
+                name = decomposed[0] + ACCENT_NAMES[ord(decomposed[1])]
+    if name is None or glyph_code_point(name) != code_point:
+        name = f'uni{code_point:04X}'
+    return name
+
+
+def write_afm(out, font, code_points, font_name, family_name, comments=()):
+    """
+    Write the advance widths and kerning pairs of a font, restricted to the given
+    characters, as an AFM file that AfmMetrics reads back. Glyphs are named after their
+    characters, and the metrics are scaled to the 1000 units per em of AFM.
+    """
+    scale = 1000 / font.units_per_em
+    characters = [code_point for code_point in code_points if code_point in font.cmap]
+    kerning = {
+        pair: round(value * scale)
+        for pair, value in sorted(font.kerning_pairs(characters).items())
+        if round(value * scale)
+    }
+    out.write('StartFontMetrics 2.0\n')
+    for comment in comments:
+        out.write(f'Comment {comment}\n')
+    out.write(f'FontName {font_name}\n')
+    out.write(f'FamilyName {family_name}\n')
+    out.write('Weight Medium\n')
+    out.write('IsFixedPitch false\n')
+    out.write('EncodingScheme FontSpecific\n')
+    out.write(f'StartCharMetrics {len(characters) + 1}\n')
+    out.write(f'C -1 ; WX {round(font.missing_advance * scale)} ; N .notdef ;\n')
+    for code_point in characters:
+        code = code_point if code_point < 0x100 else -1
+        out.write(f'C {code} ; WX {round(font.advance(code_point) * scale)} ; N {glyph_name(code_point)} ;\n')
+    out.write('EndCharMetrics\n')
+    out.write('StartKernData\n')
+    out.write(f'StartKernPairs {len(kerning)}\n')
+    for (left, right), value in kerning.items():
+        out.write(f'KPX {glyph_name(left)} {glyph_name(right)} {value}\n')
+    out.write('EndKernPairs\n')
+    out.write('EndKernData\n')
+    out.write('EndFontMetrics\n')
+
+
+class AfmMetrics:
+    """
+    The advance widths and kerning pairs of an Adobe Font Metrics file, with the
+    interface of FontMetrics. Glyphs are mapped to characters by their names; glyphs
+    whose names are not known are left out. The missing glyph advances like .notdef, or
+    like the average glyph if the file has no .notdef.
+    """
+
+    def __init__(self, text):
+        self.units_per_em = 1000
+        self.widths = {}
+        self.cmap = {}
+        self.kerning = {}
+        notdef = None
+        section = None
+        for line in text.splitlines():
+            keyword, _, rest = line.strip().partition(' ')
+            if keyword in ('StartCharMetrics', 'StartKernPairs', 'StartKernPairs0'):
+                section = keyword
+            elif keyword in ('EndCharMetrics', 'EndKernPairs'):
+                section = None
+            elif section == 'StartCharMetrics' and keyword == 'C':
+                fields = dict(
+                    field.strip().split(' ', 1) for field in line.split(';') if ' ' in field.strip()
+                )
+                if 'N' not in fields or 'WX' not in fields:
+                    raise FontError(f"Character metrics without a name or width: {line.strip()}")
+                name, width = fields['N'].strip(), round(float(fields['WX']))
+                if name == '.notdef':
+                    notdef = width
+                    continue
+                self.widths[name] = width
+                code_point = glyph_code_point(name)
+                if code_point is not None:
+                    self.cmap[code_point] = name
+            elif section and section.startswith('StartKernPairs') and keyword in ('KPX', 'KP'):
+                left, right, value = rest.split()[:3]
+                self.kerning[left, right] = round(float(value))
+        if not self.widths:
+            raise FontError('No character metrics')
+        self.missing_advance = (
+            notdef if notdef is not None else round(sum(self.widths.values()) / len(self.widths))
+        )
+
+    @classmethod
+    def from_file(cls, path):
+        """Read the metrics of an AFM file."""
+        with open(path, 'r', encoding='latin-1') as f:
+            return cls(f.read())
+
+    def advance(self, code_point):
+        """Return the advance width of a character, or of the missing glyph if the font has none."""
+        name = self.cmap.get(code_point)
+        return self.widths[name] if name is not None else self.missing_advance
+
+    def kerning_pairs(self, code_points):
+        """Return {(left code point, right code point): adjustment} for pairs of the given characters."""
+        names = {}
+        for code_point in code_points:
+            if code_point in self.cmap:
+                names.setdefault(self.cmap[code_point], []).append(code_point)
+        pairs = {}
+        for (left, right), value in self.kerning.items():
+            if left in names and right in names:
+                for left_code_point in names[left]:
+                    for right_code_point in names[right]:
+                        pairs[left_code_point, right_code_point] = value
+        return pairs
+
+
+def load_font_metrics(path, face_index=0):
+    """Read the metrics of a font file, or of an AFM file if the name ends with .afm."""
+    if path.lower().endswith('.afm'):
+        return AfmMetrics.from_file(path)
+    return FontMetrics.from_file(path, face_index)
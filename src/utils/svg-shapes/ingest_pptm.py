@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+Ingest the stencils straight from the ArchiMate stencil deck (.pptm).
+
+The deck is the origin of every icon; convert.py only reads the SVG files that were
+exported from it by hand, one shape at a time. This script opens the deck as a zip
+file and streams the slide XML member by member in presentation order. Every
+top-level shape or group whose name is a stencil name (e.g. "business-actor") is
+converted from DrawingML into the all-shapes.json schema in the same pass. Custom
+geometry paths (moveTo, lnTo, cubicBezTo, quadBezTo, arcTo, close) and the rect,
+ellipse and line presets are supported. Fills and lines are resolved from the
+shape properties, the group fill and the theme, as PowerPoint's SVG export does.
+A stencil that occurs on several slides is taken from its last occurrence.
+
+The elements are normalized and coalesced by the same functions as convert.py. With
+--check, every ingested stencil is compared with the conversion of its exported SVG,
+as convert.py writes it to all-shapes.json: element counts, types and styles must be
+equal, coordinates, aligned at the top-left corner of the bounds, must agree within
+--tolerance pixels and the canvas sizes within --size-tolerance pixels. The SVG export
+snaps shapes to half pixels and some points to whole pixels, so deviations of up to
+about 2 pixels are expected, and it rounds the canvas outwards by up to a pixel.
+
+Usage:
+    python ingest_pptm.py [--source "source/ArchiMate 3.2 stencils.pptm"] [--output all-shapes.json]
+    python ingest_pptm.py --check source [--tolerance 2.0] [--size-tolerance 1.0]
+"""
+
+import argparse
+import colorsys
+import json
+import math
+import os
+import posixpath
+import re
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+
+from convert import (
+    geometry_metadata, get_fill_color, normalize_path_attributes, normalize_rect_attributes,
+    process_svg_file, union_bounds,
+)
+from optimize import coalesce_style_runs
+from path_data import IDENTITY, PathData, apply_to_point, multiply, scale, translate
+from shape_records import GEOMETRY_KEYS
+
+# DrawingML lengths are in EMU; the SVG export uses 96 pixels per inch
+EMU_PER_PIXEL = 9525
+# Angles are in 60000ths of a degree, percentages in 1000ths of a percent
+ANGLE_UNIT = 60000
+PERCENT_UNIT = 100000
+
+A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+P = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+# Names of the shapes and groups that are stencils, as opposed to "Shape 12" or "TextBox 3"
+STENCIL_NAME_RE = re.compile(r'^[a-z]+(?:-[a-z]+)*$')
+
+# Color map of a master without a <p:clrMap>
+DEFAULT_COLOR_MAP = {'bg1': 'lt1', 'tx1': 'dk1', 'bg2': 'lt2', 'tx2': 'dk2'}
+
+LINE_CAPS = {'rnd': 'round', 'sq': 'square'}
+LINE_JOINS = {A + 'round': 'round', A + 'bevel': 'bevel'}
+# The SVG export writes this miter limit along with round and bevel joins
+DEFAULT_MITER_LIMIT = '10'
+# and leaves out black fills, which are the SVG default
+BLACK = '#000000'
+
+
+def read_relationships(archive, part):
+    """Return {relationship id: (type, target part)} of a part of the package."""
+    directory, name = posixpath.split(part)
+    try:
+        root = ET.fromstring(archive.read(posixpath.join(directory, '_rels', name + '.rels')))
+    except KeyError:
+        return {}
+    return {
+        rel.get('Id'): (rel.get('Type').rsplit('/', 1)[-1], posixpath.normpath(posixpath.join(directory, rel.get('Target'))))
+        for rel in root.iter(RELATIONSHIP)
+    }
+
+
+def related_part(archive, part, relationship_type):
+    """Return the first part related to part with the given relationship type, or None."""
+    for rel_type, target in read_relationships(archive, part).values():
+        if rel_type == relationship_type:
+            return target
+    return None
+
+
+def slide_parts(archive):
+    """Return the slide parts of the deck in presentation order."""
+    presentation = 'ppt/presentation.xml'
+    relationships = read_relationships(archive, presentation)
+    slide_ids = ET.fromstring(archive.read(presentation)).find(P + 'sldIdLst')
+    if slide_ids is None:
+        return []
+    return [relationships[slide_id.get(R + 'id')][1] for slide_id in slide_ids]
+
+
+class Theme:
+    """The colors and line styles that shape styles refer to, as seen by one slide master."""
+
+    def __init__(self, colors, color_map, line_styles):
+        self.colors = colors
+        self.color_map = color_map
+        self.line_styles = line_styles
+
+    @classmethod
+    def for_slide(cls, archive, slide_part, cache):
+        """Load the theme of a slide through its layout and master; themes are cached per master."""
+        layout = related_part(archive, slide_part, 'slideLayout')
+        master = related_part(archive, layout, 'slideMaster') if layout else None
+        if master in cache:
+            return cache[master]
+        colors, color_map, line_styles = {}, dict(DEFAULT_COLOR_MAP), []
+        if master:
+            master_root = ET.fromstring(archive.read(master))
+            clr_map = master_root.find(P + 'clrMap')
+            if clr_map is not None:
+                color_map = dict(clr_map.attrib)
+            theme_part = related_part(archive, master, 'theme')
+            if theme_part:
+                theme_root = ET.fromstring(archive.read(theme_part))
+                scheme = theme_root.find(f'.//{A}clrScheme')
+                for entry in (scheme if scheme is not None else []):
+                    if len(entry):
+                        colors[entry.tag[len(A):]] = entry[0]
+                line_list = theme_root.find(f'.//{A}lnStyleLst')
+                line_styles = list(line_list) if line_list is not None else []
+        theme = cache[master] = cls(colors, color_map, line_styles)
+        return theme
+
+    def scheme_color(self, name):
+        """Return the color element of a scheme color name such as tx1 or accent2, or None."""
+        return self.colors.get(self.color_map.get(name, name))
+
+    def line_style(self, index):
+        """Return the <a:ln> of a 1-based line style reference, or None."""
+        return self.line_styles[index - 1] if 0 < index <= len(self.line_styles) else None
+
+
+def _to_linear(channel):
+    return channel / 12.92 if channel <= 0.04045 else ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _to_srgb(channel):
+    channel = min(max(channel, 0.0), 1.0)
+    return channel * 12.92 if channel <= 0.0031308 else 1.055 * channel ** (1 / 2.4) - 0.055
+
+
+def resolve_color(element, theme, placeholder=None):
+    """
+    Return the color of a DrawingML color element (srgbClr, schemeClr, sysClr) as
+    "#RRGGBB" with its alpha, shade, tint and luminance modifiers applied, "none" if it
+    is fully transparent, or None if it cannot be resolved.
+    """
+    tag = element.tag[len(A):]
+    if tag == 'srgbClr':
+        value = element.get('val')
+    elif tag == 'sysClr':
+        value = element.get('lastClr')
+    elif tag == 'schemeClr':
+        name = element.get('val')
+        base = placeholder if name == 'phClr' else theme.scheme_color(name)
+        if base is None:
+            return None
+        value = resolve_color(base, theme)
+        if value in (None, 'none'):
+            return value
+        value = value[1:]
+    else:
+        return None
+    if not value:
+        return None
+
+    red, green, blue = (int(value[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    for modifier in element:
+        name = modifier.tag[len(A):]
+        amount = int(modifier.get('val', '0')) / PERCENT_UNIT
+        if name == 'alpha' and amount == 0:
+            return 'none'
+        if name == 'shade':
+            red, green, blue = (_to_srgb(_to_linear(c) * amount) for c in (red, green, blue))
+        elif name == 'tint':
+            red, green, blue = (_to_srgb(1 - (1 - _to_linear(c)) * amount) for c in (red, green, blue))
+        elif name in ('lumMod', 'lumOff'):
+            hue, lightness, saturation = colorsys.rgb_to_hls(red, green, blue)
+            lightness = lightness * amount if name == 'lumMod' else lightness + amount
+            red, green, blue = colorsys.hls_to_rgb(hue, min(max(lightness, 0.0), 1.0), saturation)
+    return '#' + ''.join(f'{round(c * 255):02X}' for c in (red, green, blue))
+
+
+def _first_color(element, theme, placeholder=None):
+    """Return the resolved color of the first color child of element, or None."""
+    for child in element:
+        color = resolve_color(child, theme, placeholder)
+        if color is not None:
+            return color
+    return None
+
+
+def fill_value(properties, style, theme, group_fill):
+    """Return the SVG fill of a shape: a color, "none", or None if it has no fill."""
+    for child in properties:
+        tag = child.tag[len(A):]
+        if tag == 'noFill':
+            return 'none'
+        if tag == 'solidFill':
+            return _first_color(child, theme)
+        if tag == 'grpFill':
+            return group_fill
+        if tag == 'gradFill':
+            # The SVG has no gradients; use the first stop like a flat rendering would
+            stop = child.find(f'{A}gsLst/{A}gs')
+            return _first_color(stop, theme) if stop is not None else None
+    fill_ref = style.find(A + 'fillRef') if style is not None else None
+    if fill_ref is not None:
+        return 'none' if fill_ref.get('idx') == '0' else _first_color(fill_ref, theme)
+    return None
+
+
+def line_attributes(properties, style, theme):
+    """Return the SVG stroke attributes of a shape, or {} if it has no line."""
+    line = properties.find(A + 'ln')
+    line_ref = style.find(A + 'lnRef') if style is not None else None
+    reference_index = int(line_ref.get('idx', '0')) if line_ref is not None else 0
+    theme_line = theme.line_style(reference_index)
+    placeholder = line_ref[0] if line_ref is not None and len(line_ref) else None
+
+    color = None
+    for source in (line, theme_line):
+        if source is None:
+            continue
+        if source.find(A + 'noFill') is not None:
+            return {}
+        solid = source.find(A + 'solidFill')
+        if solid is not None:
+            color = _first_color(solid, theme, placeholder)
+            break
+    if color is None:
+        if reference_index == 0 or placeholder is None:
+            return {}
+        color = resolve_color(placeholder, theme)
+    if color in (None, 'none'):
+        return {}
+
+    def line_property(name, default=None):
+        for source in (line, theme_line):
+            if source is not None and source.get(name) is not None:
+                return source.get(name)
+        return default
+
+    attributes = {
+        'stroke': color,
+        'stroke-width': f"{int(line_property('w', '0')) / EMU_PER_PIXEL:g}",
+    }
+    cap = LINE_CAPS.get(line_property('cap'))
+    if cap:
+        attributes['stroke-linecap'] = cap
+    for source in (line, theme_line):
+        join = None if source is None else next((child for child in source if child.tag in (
+            A + 'round', A + 'bevel', A + 'miter')), None)
+        if join is not None:
+            if join.tag in LINE_JOINS:
+                attributes['stroke-linejoin'] = LINE_JOINS[join.tag]
+                attributes['stroke-miterlimit'] = DEFAULT_MITER_LIMIT
+            elif join.get('lim') is not None:
+                attributes['stroke-miterlimit'] = f"{int(join.get('lim')) / PERCENT_UNIT:g}"
+            break
+    return attributes
+
+
+def transform_matrix(xfrm, group=False):
+    """
+    Return the matrix of an <a:xfrm> that maps the shape box (or for a group the child
+    coordinate space) to the coordinates of the parent, in EMU.
+    """
+    if xfrm is None:
+        return IDENTITY
+    off = xfrm.find(A + 'off')
+    ext = xfrm.find(A + 'ext')
+    x, y = (float(off.get('x', 0)), float(off.get('y', 0))) if off is not None else (0.0, 0.0)
+    cx, cy = (float(ext.get('cx', 0)), float(ext.get('cy', 0))) if ext is not None else (0.0, 0.0)
+    matrix = IDENTITY
+    if group:
+        ch_off = xfrm.find(A + 'chOff')
+        ch_ext = xfrm.find(A + 'chExt')
+        if ch_off is not None:
+            matrix = translate(-float(ch_off.get('x', 0)), -float(ch_off.get('y', 0)))
+        if ch_ext is not None:
+            ch_cx, ch_cy = float(ch_ext.get('cx', 0)), float(ch_ext.get('cy', 0))
+            matrix = multiply(scale(cx / ch_cx if ch_cx else 1.0, cy / ch_cy if ch_cy else 1.0), matrix)
+    # Flips and rotation are about the center of the box
+    center_x, center_y = cx / 2, cy / 2
+    if xfrm.get('flipH') == '1' or xfrm.get('flipV') == '1':
+        flip = (-1.0 if xfrm.get('flipH') == '1' else 1.0, -1.0 if xfrm.get('flipV') == '1' else 1.0)
+        matrix = multiply(translate(center_x, center_y), multiply(scale(*flip), multiply(translate(-center_x, -center_y), matrix)))
+    if xfrm.get('rot'):
+        angle = math.radians(int(xfrm.get('rot')) / ANGLE_UNIT)
+        cos, sin = math.cos(angle), math.sin(angle)
+        rotation = (cos, sin, -sin, cos, 0.0, 0.0)
+        matrix = multiply(translate(center_x, center_y), multiply(rotation, multiply(translate(-center_x, -center_y), matrix)))
+    return multiply(translate(x, y), matrix)
+
+
+def _box_size(xfrm):
+    ext = xfrm.find(A + 'ext') if xfrm is not None else None
+    return (float(ext.get('cx', 0)), float(ext.get('cy', 0))) if ext is not None else (0.0, 0.0)
+
+
+def _point(element, sx, sy):
+    point = element.find(A + 'pt')
+    return float(point.get('x', 0)) * sx, float(point.get('y', 0)) * sy
+
+
+def _arc_point(radius_x, radius_y, angle):
+    """Return the point of an ellipse at a DrawingML angle, which is measured visually."""
+    theta = math.atan2(radius_x * math.sin(angle), radius_y * math.cos(angle))
+    return radius_x * math.cos(theta), radius_y * math.sin(theta)
+
+
+def custom_paths(geometry, width, height):
+    """
+    Yield (d, filled, stroked) for every path of an <a:custGeom>, with the
+    coordinates scaled from the path space to the shape box.
+    """
+    path_list = geometry.find(A + 'pathLst')
+    for path in (path_list if path_list is not None else []):
+        path_width, path_height = float(path.get('w', 0)), float(path.get('h', 0))
+        sx = width / path_width if path_width else 1.0
+        sy = height / path_height if path_height else 1.0
+        parts = []
+        current = start = (0.0, 0.0)
+        for segment in path:
+            tag = segment.tag[len(A):]
+            if tag == 'moveTo':
+                current = start = _point(segment, sx, sy)
+                parts.append(f'M{current[0]} {current[1]}')
+            elif tag == 'lnTo':
+                current = _point(segment, sx, sy)
+                parts.append(f'L{current[0]} {current[1]}')
+            elif tag in ('cubicBezTo', 'quadBezTo'):
+                points = [(float(pt.get('x', 0)) * sx, float(pt.get('y', 0)) * sy) for pt in segment.iter(A + 'pt')]
+                current = points[-1]
+                parts.append(('C' if tag == 'cubicBezTo' else 'Q') + ' '.join(f'{x} {y}' for x, y in points))
+            elif tag == 'arcTo':
+                radius_x = float(segment.get('wR', 0)) * sx
+                radius_y = float(segment.get('hR', 0)) * sy
+                start_angle = math.radians(int(segment.get('stAng', 0)) / ANGLE_UNIT)
+                sweep = int(segment.get('swAng', 0)) / ANGLE_UNIT
+                # The current point lies on the ellipse at the start angle
+                offset_x, offset_y = _arc_point(radius_x, radius_y, start_angle)
+                center = (current[0] - offset_x, current[1] - offset_y)
+                end_x, end_y = _arc_point(radius_x, radius_y, start_angle + math.radians(sweep))
+                current = (center[0] + end_x, center[1] + end_y)
+                parts.append(f'A{radius_x} {radius_y} 0 {int(abs(sweep) > 180)} {int(sweep > 0)} {current[0]} {current[1]}')
+            elif tag == 'close':
+                parts.append('Z')
+                current = start
+        if parts:
+            yield ''.join(parts), path.get('fill') != 'none', path.get('stroke') != '0'
+
+
+def preset_paths(geometry, width, height):
+    """Yield (d, filled, stroked) for the supported preset geometries."""
+    preset = geometry.get('prst')
+    if preset == 'rect':
+        yield f'M0 0L{width} 0L{width} {height}L0 {height}Z', True, True
+    elif preset == 'ellipse':
+        rx, ry = width / 2, height / 2
+        yield f'M0 {ry}A{rx} {ry} 0 1 1 {width} {ry}A{rx} {ry} 0 1 1 0 {ry}Z', True, True
+    elif preset in ('line', 'straightConnector1'):
+        yield f'M0 0L{width} {height}', False, True
+    else:
+        raise ValueError(f"Unsupported preset geometry '{preset}'")
+
+
+class StencilBuilder:
+    """Collects the SVG-like elements of one stencil while its shape tree is walked."""
+
+    def __init__(self, name, theme):
+        self.name = name
+        self.theme = theme
+        # (tag, attributes, PathData or rect) in document order, in pixels
+        self.elements = []
+
+    def add_group(self, group, matrix, group_fill=None):
+        properties = group.find(P + 'grpSpPr')
+        xfrm = properties.find(A + 'xfrm') if properties is not None else None
+        matrix = multiply(matrix, transform_matrix(xfrm, group=True))
+        if properties is not None:
+            fill = fill_value(properties, None, self.theme, group_fill)
+            group_fill = fill if fill is not None else group_fill
+        for child in group:
+            if child.tag == P + 'grpSp':
+                self.add_group(child, matrix, group_fill)
+            elif child.tag in (P + 'sp', P + 'cxnSp'):
+                self.add_shape(child, matrix, group_fill)
+
+    def add_shape(self, shape, matrix, group_fill=None):
+        properties = shape.find(P + 'spPr')
+        if properties is None:
+            return
+        style = shape.find(P + 'style')
+        xfrm = properties.find(A + 'xfrm')
+        width, height = _box_size(xfrm)
+        matrix = multiply(matrix, transform_matrix(xfrm))
+
+        fill = fill_value(properties, style, self.theme, group_fill)
+        line = line_attributes(properties, style, self.theme)
+        custom = properties.find(A + 'custGeom')
+        preset = properties.find(A + 'prstGeom')
+        if custom is not None:
+            paths = custom_paths(custom, width, height)
+        elif preset is not None:
+            # Unfilled, unstroked rectangles are text boxes
+            if preset.get('prst') == 'rect' and fill in (None, 'none') and not line:
+                return
+            if preset.get('prst') == 'rect' and matrix[1] == matrix[2] == 0:
+                x, y = apply_to_point(matrix, 0, 0)
+                attributes = dict(line)
+                if fill is not None and fill != BLACK:
+                    attributes['fill'] = fill
+                self.elements.append(('rect', attributes, (x, y, width * matrix[0], height * matrix[3])))
+                return
+            paths = preset_paths(preset, width, height)
+        else:
+            return
+
+        for d, filled, stroked in paths:
+            attributes = dict(line) if stroked else {}
+            # The SVG export gives stroke-only paths the fill of their shape as well, except
+            # for shapes without area, which are lines
+            path_fill = fill if width and height else 'none'
+            if not attributes and (not filled or path_fill in (None, 'none')):
+                continue
+            if path_fill != BLACK:
+                attributes['fill'] = path_fill if path_fill is not None else 'none'
+            attributes['fill-rule'] = 'evenodd'
+            self.elements.append(('path', attributes, PathData.parse(d).transform(matrix)))
+
+    def shape(self):
+        """Return the stencil in the all-shapes.json schema, on the smallest whole-pixel canvas around its strokes."""
+        # The canvas encloses the strokes, each of which extends by half its width
+        boxes = []
+        for tag, attributes, geometry in self.elements:
+            if tag == 'rect':
+                x, y, width, height = geometry
+                box = (x, y, x + width, y + height)
+            else:
+                box = geometry.bounds()
+            if box is not None:
+                extent = float(attributes.get('stroke-width', 0)) / 2
+                boxes.append((box[0] - extent, box[1] - extent, box[2] + extent, box[3] + extent))
+        box = union_bounds(boxes)
+        if box is None:
+            left = top = canvas_width = canvas_height = 0
+        else:
+            left, top = math.floor(box[0]), math.floor(box[1])
+            canvas_width = math.ceil(box[2]) - left
+            canvas_height = math.ceil(box[3]) - top
+        to_canvas = translate(-left, -top)
+
+        fill_color = get_fill_color(self.name)
+        elements = []
+        metadata_boxes = []
+        for tag, attributes, geometry in self.elements:
+            source = ET.Element(tag, attributes)
+            if tag == 'rect':
+                x, y = apply_to_point(to_canvas, geometry[0], geometry[1])
+                element = {
+                    'type': 'rect',
+                    'x': round(x, 2),
+                    'y': round(y, 2),
+                    'width': round(geometry[2], 2),
+                    'height': round(geometry[3], 2),
+                }
+                metadata_boxes.append((x, y, x + geometry[2], y + geometry[3]))
+                normalize_rect_attributes(source, element, fill_color)
+            else:
+                path = geometry.transform(to_canvas)
+                metadata_boxes.append(path.bounds())
+                element = {'type': 'path', 'd': path.format(2)}
+                normalize_path_attributes(source, element)
+            elements.append(element)
+
+        shape = {
+            'name': self.name,
+            'width': canvas_width,
+            'height': canvas_height,
+            'elements': elements,
+        }
+        box = union_bounds(metadata_boxes)
+        if box is not None:
+            shape.update(geometry_metadata(box))
+        return shape
+
+
+def iter_stencils(pptm_path):
+    """
+    Yield (slide part, shape) for every stencil of the deck in presentation order. Each
+    slide is parsed incrementally, and its top-level shapes are released as soon as
+    they have been converted.
+    """
+    themes = {}
+    with zipfile.ZipFile(pptm_path) as archive:
+        for slide_part in slide_parts(archive):
+            theme = Theme.for_slide(archive, slide_part, themes)
+            depth = 0
+            shape_tree_depth = None
+            with archive.open(slide_part) as member:
+                for event, element in ET.iterparse(member, events=('start', 'end')):
+                    if event == 'start':
+                        depth += 1
+                        if element.tag == P + 'spTree' and shape_tree_depth is None:
+                            shape_tree_depth = depth
+                        continue
+                    depth -= 1
+                    if shape_tree_depth is None or depth != shape_tree_depth:
+                        continue
+                    # A direct child of the shape tree is complete
+                    if element.tag in (P + 'grpSp', P + 'sp'):
+                        properties = element.find(f'.//{P}cNvPr')
+                        name = properties.get('name', '') if properties is not None else ''
+                        if STENCIL_NAME_RE.match(name):
+                            builder = StencilBuilder(name, theme)
+                            if element.tag == P + 'grpSp':
+                                builder.add_group(element, scale(1 / EMU_PER_PIXEL))
+                            else:
+                                builder.add_shape(element, scale(1 / EMU_PER_PIXEL))
+                            yield slide_part, builder.shape()
+                    element.clear()
+
+
+def ingest(pptm_path):
+    """
+    Return the stencils of the deck as a list of shapes sorted by name, like convert.py
+    sorts the SVG files. Later occurrences of a stencil replace earlier ones.
+    """
+    stencils = {}
+    for _, shape in iter_stencils(pptm_path):
+        stencils[shape['name']] = shape
+    return [stencils[name] for name in sorted(stencils)]
+
+
+def _aligned(element, offset):
+    """Return a rect as (x, y, width, height) or a path as PathData, moved by -offset."""
+    dx, dy = offset
+    if element['type'] == 'rect':
+        return (element['x'] - dx, element['y'] - dy, element['width'], element['height'])
+    return PathData.parse(element['d']).transform(translate(-dx, -dy))
+
+
+def compare_shapes(ingested, exported, tolerance, size_tolerance):
+    """
+    Compare an ingested stencil with the conversion of its exported SVG. The canvases
+    differ, so coordinates are compared after aligning the top-left corners of the bounds.
+    Returns (largest coordinate deviation in pixels, list of problems).
+    """
+    problems = []
+    if (abs(ingested['width'] - exported['width']) > size_tolerance
+            or abs(ingested['height'] - exported['height']) > size_tolerance):
+        problems.append(
+            f"canvas {ingested['width']}x{ingested['height']}, the SVG has {exported['width']}x{exported['height']}"
+        )
+    if len(ingested['elements']) != len(exported['elements']):
+        problems.append(f"{len(ingested['elements'])} elements, the SVG has {len(exported['elements'])}")
+        return None, problems
+    offsets = [
+        (shape['bounds']['x'], shape['bounds']['y']) if 'bounds' in shape else (0.0, 0.0)
+        for shape in (ingested, exported)
+    ]
+    deviation = 0.0
+    for index, (mine, theirs) in enumerate(zip(ingested['elements'], exported['elements'])):
+        style = {key: value for key, value in mine.items() if key not in GEOMETRY_KEYS}
+        expected = {key: value for key, value in theirs.items() if key not in GEOMETRY_KEYS}
+        if style != expected:
+            problems.append(f"element {index}: style {style} differs from {expected}")
+        if mine['type'] != theirs['type']:
+            problems.append(f"element {index}: {mine['type']} instead of {theirs['type']}")
+            continue
+        geometry, expected_geometry = _aligned(mine, offsets[0]), _aligned(theirs, offsets[1])
+        if mine['type'] == 'rect':
+            element_deviation = max(abs(a - b) for a, b in zip(geometry, expected_geometry))
+        else:
+            element_deviation = geometry.max_deviation(expected_geometry)
+        if element_deviation is None:
+            problems.append(f"element {index}: path commands differ")
+        else:
+            deviation = max(deviation, element_deviation)
+    if deviation > tolerance:
+        problems.append(f"coordinates deviate by up to {deviation:.2f} px")
+    return deviation, problems
+
+
+def check(shapes, source_dir, tolerance, size_tolerance, coalesce=True):
+    """
+    Compare every ingested stencil with its exported SVG, converted and, if coalesce is
+    set, coalesced like convert.py does, and print a report. Returns the number of mismatches.
+    """
+    mismatches = 0
+    ingested_names = {shape['name'] for shape in shapes}
+    for shape in shapes:
+        svg_path = os.path.join(source_dir, f"{shape['name']}.svg")
+        if not os.path.exists(svg_path):
+            print(f"{shape['name']}: no exported SVG to compare with")
+            continue
+        exported = process_svg_file(svg_path)
+        if coalesce:
+            coalesce_style_runs(exported)
+        deviation, problems = compare_shapes(shape, exported, tolerance, size_tolerance)
+        size = f"{shape['width']}x{shape['height']}"
+        expected_size = f"{exported['width']}x{exported['height']}"
+        note = '' if size == expected_size else f", canvas {size} vs {expected_size}"
+        if problems:
+            mismatches += 1
+            print(f"{shape['name']}: MISMATCH")
+            for problem in problems:
+                print(f"  {problem}")
+        else:
+            print(f"{shape['name']}: ok, max deviation {deviation:.2f} px{note}")
+    for file in sorted(os.listdir(source_dir)):
+        if file.endswith('.svg') and file[:-4] not in ingested_names:
+            mismatches += 1
+            print(f"{file[:-4]}: MISMATCH, not found in the deck")
+    return mismatches
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(
+        description='Convert the stencils of the ArchiMate .pptm straight to JSON shape definitions'
+    )
+    parser.add_argument(
+        '--source', '-s',
+        default=os.path.join(script_dir, 'source', 'ArchiMate 3.2 stencils.pptm'),
+        help='Stencil deck (default: source/ArchiMate 3.2 stencils.pptm next to this script)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=None,
+        help='Output JSON file path (default: no output; all-shapes.json is written by convert.py)'
+    )
+    parser.add_argument(
+        '--check',
+        default=None,
+        help='Compare the ingested stencils with the exported SVG files in this directory (default: off)'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=2.0,
+        help='Largest coordinate deviation in pixels that --check accepts (default: 2.0)'
+    )
+    parser.add_argument(
+        '--size-tolerance',
+        type=float,
+        default=1.0,
+        help='Largest difference of the canvas width or height in pixels that --check accepts (default: 1.0)'
+    )
+    parser.add_argument(
+        '--no-coalesce',
+        action='store_true',
+        help='Keep every element separate instead of merging same-style elements into compound paths'
+    )
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.source):
+        print(f"Error: Stencil deck '{args.source}' does not exist")
+        return
+
+    try:
+        shapes = ingest(args.source)
+    except (zipfile.BadZipFile, KeyError, ValueError, ET.ParseError) as e:
+        print(f"Error: Cannot read '{args.source}': {e}")
+        sys.exit(1)
+    print(f"Ingested {len(shapes)} stencils from '{os.path.basename(args.source)}'")
+    if not args.no_coalesce:
+        for shape in shapes:
+            coalesce_style_runs(shape)
+
+    if args.check:
+        mismatches = check(shapes, args.check, args.tolerance, args.size_tolerance, not args.no_coalesce)
+        print(f"{len(shapes) - mismatches} of {len(shapes)} stencils match the exported SVGs")
+        if mismatches:
+            sys.exit(1)
+
+    if args.output:
+        with open(args.output, 'w') as out_file:
+            json.dump(shapes, out_file, indent=2)
+        print(f"Saved {len(shapes)} shapes to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
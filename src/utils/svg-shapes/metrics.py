@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Run metrics and profiling for the svg-shapes scripts.
+
+A Metrics object records the wall and CPU time of named stages, counters such as the
+number of elements or output bytes, and one record per processed item (a stencil, a
+shape module or a poster page). The summary lists the items slowest first, so
+pathological source files stand out. NULL_METRICS records nothing and is used when
+no metrics were requested, which keeps the instrumented code paths cheap.
+"""
+
+import cProfile
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class StageRecorder:
+    """Wall and CPU time per stage and counters of a run or of a single item."""
+
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+        self.counts = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Time the body of a with block as the given stage, adding up repeated stages."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def add_stage(self, name, wall, cpu):
+        """Add the wall and CPU seconds of a stage timed elsewhere, such as in a worker process."""
+        totals = self.stages.setdefault(name, [0.0, 0.0])
+        totals[0] += wall
+        totals[1] += cpu
+
+    def count(self, name, amount=1):
+        """Add amount to a counter."""
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def _stage_summary(self):
+        return {
+            name: {'wall_seconds': wall, 'cpu_seconds': cpu}
+            for name, (wall, cpu) in self.stages.items()
+        }
+
+
+class ItemMetrics(StageRecorder):
+    """Metrics of a single item, timed from its creation until finish() is called."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.error = None
+        self._wall, self._cpu = time.perf_counter(), time.process_time()
+
+    def fail(self, error):
+        """Record why the item could not be processed."""
+        self.error = f'{type(error).__name__}: {error}'
+
+    def finish(self):
+        """Stop the clock and return the item as a picklable record."""
+        record = {
+            'name': self.name,
+            'wall_seconds': time.perf_counter() - self._wall,
+            'cpu_seconds': time.process_time() - self._cpu,
+            'stages': self._stage_summary(),
+            'counts': self.counts,
+        }
+        if self.error is not None:
+            record['error'] = self.error
+        return record
+
+
+class Metrics(StageRecorder):
+    """Metrics of a whole run of a script."""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = script
+        self.items = []
+        self._wall, self._cpu = time.perf_counter(), time.process_time()
+
+    def item(self, name):
+        """Start recording an item; pass it to add_item() once it is done."""
+        return ItemMetrics(name)
+
+    def add_item(self, item):
+        """Add an item, or the record of an item processed in another process, to the run."""
+        record = item.finish() if isinstance(item, ItemMetrics) else item
+        self.items.append(record)
+        for name, stage in record['stages'].items():
+            totals = self.stages.setdefault(name, [0.0, 0.0])
+            totals[0] += stage['wall_seconds']
+            totals[1] += stage['cpu_seconds']
+        for name, amount in record['counts'].items():
+            self.count(name, amount)
+
+    def summary(self):
+        """Return the metrics as a JSON-serializable dict with the slowest items first."""
+        items = sorted(self.items, key=lambda record: record['wall_seconds'], reverse=True)
+        return {
+            'script': self.script,
+            'wall_seconds': time.perf_counter() - self._wall,
+            'cpu_seconds': time.process_time() - self._cpu,
+            'stages': self._stage_summary(),
+            'counts': self.counts,
+            'errors': [{'name': record['name'], 'error': record['error']} for record in items if 'error' in record],
+            'items': items,
+        }
+
+    def write(self, path):
+        """Write the summary to a JSON file and print where the time went."""
+        summary = self.summary()
+        with open(path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Metrics written to {path} ({summary['wall_seconds'] * 1000:.1f} ms wall, "
+              f"{summary['cpu_seconds'] * 1000:.1f} ms CPU)")
+        for record in summary['items'][:5]:
+            print(f"  {record['wall_seconds'] * 1000:8.2f} ms  {record['name']}")
+
+
+class NullMetrics:
+    """Stand-in for Metrics and ItemMetrics that records nothing."""
+
+    enabled = False
+
+    def stage(self, name):
+        return nullcontext()
+
+    def add_stage(self, name, wall, cpu):
+        pass
+
+    def count(self, name, amount=1):
+        pass
+
+    def item(self, name):
+        return self
+
+    def fail(self, error):
+        pass
+
+    def add_item(self, item):
+        pass
+
+    def finish(self):
+        return None
+
+
+NULL_METRICS = NullMetrics()
+
+
+def create_metrics(script, metrics_out):
+    """Return a Metrics object if metrics_out is set, otherwise NULL_METRICS."""
+    return Metrics(script) if metrics_out else NULL_METRICS
+
+
+@contextmanager
+def profiled(profile_out):
+    """Run the body of a with block under cProfile and dump the stats to profile_out, if set."""
+    if not profile_out:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_out)
+        print(f"Profile written to {profile_out} (view it with: python -m pstats {profile_out})")
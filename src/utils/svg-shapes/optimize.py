@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Optional optimization stage between convert.py and ts-file-gen.py.
+
+Rewrites the path data in all-shapes.json in its most compact form: coordinates are
+quantized to a configurable precision, every command uses the shorter of its
+absolute or relative encoding, repeated command letters and leading zeros are
+dropped. Each rewritten path is checked against the original geometry before it is
+accepted, and the before/after byte sizes are reported.
+
+With --coalesce, consecutive elements with the same style are first merged into
+compound paths (see coalesce_style_runs(), which convert.py also applies).
+"""
+
+import argparse
+import json
+import math
+import os
+
+from path_data import PathData
+
+# Distance in shape units kept between the elements merged into one path, so that the
+# anti-aliased edges of neighbouring elements never share a pixel at scales up to 1
+COALESCE_MARGIN = 1.0
+
+# Element keys that describe geometry rather than style
+GEOMETRY_KEYS = frozenset(('type', 'd', 'x', 'y', 'width', 'height'))
+
+# Elements of these types with only these keys can be merged; rects are only merged
+# when they have a fill, because renderers give rects and paths different default fills
+MERGEABLE_KEYS = {
+    'path': {'type', 'd', 'stroke', 'strokeWidth', 'strokeLinecap', 'strokeLinejoin',
+             'strokeMiterlimit', 'fill', 'fillRule'},
+    'rect': {'type', 'x', 'y', 'width', 'height', 'stroke', 'strokeWidth', 'fill'},
+}
+
+
+def element_style(element):
+    """Return the style of an element as a hashable tuple of its non-geometry attributes."""
+    return tuple(sorted((key, value) for key, value in element.items() if key not in GEOMETRY_KEYS))
+
+
+def stroke_extent(element):
+    """Return how far the stroke of an element can reach outside of its geometry."""
+    if element.get('stroke') in (None, 'none'):
+        return 0.0
+    half_width = float(element.get('strokeWidth') or 1) / 2
+    # Miter joins reach up to miterlimit half widths out, square caps sqrt(2)
+    if element.get('strokeLinejoin', 'miter') == 'miter':
+        return half_width * max(float(element.get('strokeMiterlimit') or 4), math.sqrt(2))
+    return half_width * math.sqrt(2)
+
+
+def element_path_data(element):
+    """
+    Return the path data of an element as it is written in a compound path, or None if
+    the element cannot be merged. A leading relative moveto is made absolute, as it
+    would otherwise be relative to the end of the previous subpath.
+    """
+    allowed = MERGEABLE_KEYS.get(element['type'])
+    if allowed is None or not set(element) <= allowed:
+        return None
+    if element['type'] == 'rect':
+        if 'fill' not in element:
+            return None
+        x, y = element['x'], element['y']
+        right, bottom = x + element['width'], y + element['height']
+        # The path equivalent of a rect in the SVG specification
+        return PathData.parse(f"M{x} {y}H{right}V{bottom}H{x}Z").format(2)
+    d = element.get('d')
+    if not d:
+        return None
+    if d.lstrip()[0] != 'm':
+        return d
+    path = PathData.parse(d)
+    commands, counts = path.commands, path.counts
+    if counts[0] > 2:
+        # Implicit linetos after the first pair stay relative
+        commands[0:1] = ['M', 'l']
+        counts[0:1] = type(counts)([2, counts[0] - 2])
+    else:
+        commands[0] = 'M'
+    return path.format(2)
+
+
+def _padded_bounds(element, d):
+    """Return the bounds of an element's geometry grown by its stroke and COALESCE_MARGIN."""
+    bounds = PathData.parse(d).bounds()
+    if bounds is None:
+        return None
+    pad = stroke_extent(element) + COALESCE_MARGIN
+    return bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad
+
+
+def _overlaps(box, other):
+    return box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]
+
+
+def coalesce_style_runs(shape):
+    """
+    Merge consecutive elements of a shape that have the same style into compound paths,
+    in place. Elements are only merged while their padded bounds are disjoint, so the
+    fills and strokes of merged elements never paint over each other and the result
+    renders the same as the separate elements.
+    Returns (element_count_before, element_count_after).
+    """
+    elements = shape['elements']
+    merged = []
+    # Elements of the compound path being built: (element, path data, padded bounds)
+    group = []
+
+    def flush():
+        if len(group) == 1:
+            merged.append(group[0][0])
+        elif group:
+            compound = {'type': 'path', 'd': ''.join(d for _, d, _ in group)}
+            compound.update((key, value) for key, value in group[0][0].items() if key not in GEOMETRY_KEYS)
+            merged.append(compound)
+        group.clear()
+
+    for element in elements:
+        d = element_path_data(element)
+        box = _padded_bounds(element, d) if d is not None else None
+        if box is None:
+            flush()
+            merged.append(element)
+            continue
+        if group and (element_style(element) != element_style(group[0][0])
+                      or any(_overlaps(box, other) for _, _, other in group)):
+            flush()
+        group.append((element, d, box))
+    flush()
+
+    shape['elements'] = merged
+    return len(elements), len(merged)
+
+
+def optimize_shape(shape, precision):
+    """
+    Optimize the elements of a shape in place.
+    Returns (path_bytes_before, path_bytes_after).
+    """
+    tolerance = 0.5 * 10 ** -precision + 1e-9
+    before = after = 0
+    for element in shape['elements']:
+        if element['type'] == 'path':
+            d = element['d']
+            path = PathData.parse(d)
+            minified = path.minify(precision)
+            deviation = path.max_deviation(PathData.parse(minified))
+            if deviation is None or deviation > tolerance:
+                raise ValueError(
+                    f"Minified path of '{shape['name']}' deviates from the original "
+                    f"geometry (deviation: {deviation}, tolerance: {tolerance})"
+                )
+            before += len(d)
+            after += len(minified)
+            element['d'] = minified
+        elif element['type'] == 'rect':
+            for key in ('x', 'y', 'width', 'height'):
+                if key in element:
+                    element[key] = round(element[key], precision)
+    return before, after
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Minify the path data of JSON shape definitions for ArchiMate Renderer'
+    )
+    parser.add_argument(
+        '--input', '-i',
+        default='all-shapes.json',
+        help='Input JSON file path (default: all-shapes.json)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=None,
+        help='Output JSON file path (default: overwrite the input file)'
+    )
+    parser.add_argument(
+        '--precision', '-p',
+        type=int,
+        default=2,
+        help='Number of decimals kept for coordinates (default: 2)'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Report the path data savings for every shape'
+    )
+    parser.add_argument(
+        '--coalesce',
+        action='store_true',
+        help='Also merge same-style elements into compound paths before minifying'
+    )
+
+    args = parser.parse_args()
+    output = args.output or args.input
+
+    if not os.path.isfile(args.input):
+        print(f"Error: Input file '{args.input}' does not exist")
+        return
+
+    with open(args.input, 'r') as f:
+        shapes = json.load(f)
+    file_before = os.path.getsize(args.input)
+
+    elements_before = elements_after = 0
+    total_before = total_after = 0
+    for shape in shapes:
+        if args.coalesce:
+            before, after = coalesce_style_runs(shape)
+            elements_before += before
+            elements_after += after
+            if args.verbose and after < before:
+                print(f"{shape['name']}: {before} -> {after} elements")
+        before, after = optimize_shape(shape, args.precision)
+        total_before += before
+        total_after += after
+        if args.verbose and before:
+            print(f"{shape['name']}: {before} -> {after} bytes of path data")
+
+    with open(output, 'w') as out_file:
+        json.dump(shapes, out_file, indent=2)
+    file_after = os.path.getsize(output)
+
+    def saving(before, after):
+        return f"{before} -> {after} bytes ({(1 - after / before) * 100 if before else 0:.1f}% smaller)"
+
+    if args.coalesce:
+        print(f"Elements: {elements_before} -> {elements_after}")
+    print(f"Path data: {saving(total_before, total_after)}")
+    print(f"JSON file: {saving(file_before, file_after)}")
+    print(f"Optimized {len(shapes)} shapes and saved to '{output}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Check that render_views.py renders views like ArchiMateRenderer.
+
+render_views.py reimplements renderView() of the TypeScript renderer, so every change
+to either renderer has to be made to both. This script renders every view of a model
+with the render-all command of cli.ts and with render_views.py, with the same options,
+and compares the documents:
+
+- the element tree, where <g> elements without attributes are replaced by their
+  children, as they do not change the rendering
+- the attributes of every element regardless of their order, with the numbers in
+  their values compared to six decimal places
+- the text of every element without surrounding whitespace
+
+The first difference of every view is reported, and the exit status is 1 if any view
+differs or is missing. Options that render_views.py does not support, such as
+orthogonal routing, cannot be checked.
+
+Usage:
+    python parity.py model.xml [--ts-dir rendered] [--cli "node dist/cjs/cli.js"]
+                     [--theme default] [--layer-fills inline]
+"""
+
+import argparse
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+from exchange_model import load_model
+from render_views import (
+    DEFAULT_FONT_FAMILY,
+    DEFAULT_FONT_SIZE,
+    DEFAULT_HEIGHT,
+    DEFAULT_LAYER_FILLS,
+    DEFAULT_WIDTH,
+    render_all,
+    view_tasks,
+)
+from theme import DEFAULT_THEME, LAYER_FILLS
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CLI = 'node ' + os.path.normpath(os.path.join(SCRIPT_DIR, '..', '..', '..', 'dist', 'cjs', 'cli.js'))
+
+NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?', re.IGNORECASE)
+SVG_NAMESPACE = '{http://www.w3.org/2000/svg}'
+
+
+def normalize_value(value):
+    """Round the numbers of an attribute value, so formatting differences do not count."""
+    return NUMBER.sub(lambda m: f'{float(m.group(0)):.6f}'.rstrip('0').rstrip('.'), value.strip())
+
+
+def content(element):
+    """Yield the children of an element, replacing attribute-less groups by their content."""
+    for child in element:
+        if child.tag == SVG_NAMESPACE + 'g' and not child.attrib:
+            yield from content(child)
+        else:
+            yield child
+
+
+def canonical(element):
+    """
+    Return the canonical form of an element: (tag, attributes, text, children).
+    Attribute-less groups are replaced by their children.
+    """
+    children = [canonical(child) for child in content(element)]
+    attributes = tuple(sorted((name, normalize_value(value)) for name, value in element.attrib.items()))
+    return element.tag.replace(SVG_NAMESPACE, ''), attributes, (element.text or '').strip(), children
+
+
+def first_difference(expected, actual, path=''):
+    """Return a description of the first difference of two canonical elements, or None."""
+    tag, attributes, text, children = expected
+    path = f'{path}/{tag}'
+    if tag != actual[0]:
+        return f'{path}: element {actual[0]} instead of {tag}'
+    if attributes != actual[1]:
+        expected_attributes, actual_attributes = dict(attributes), dict(actual[1])
+        for name in sorted(set(expected_attributes) | set(actual_attributes)):
+            if expected_attributes.get(name) != actual_attributes.get(name):
+                return (f'{path}: {name}="{actual_attributes.get(name)}" instead of '
+                        f'"{expected_attributes.get(name)}"')
+    if text != actual[2]:
+        return f'{path}: text {actual[2]!r} instead of {text!r}'
+    for index, (expected_child, actual_child) in enumerate(zip(children, actual[3])):
+        difference = first_difference(expected_child, actual_child, f'{path}[{index}]')
+        if difference:
+            return difference
+    if len(children) != len(actual[3]):
+        return f'{path}: {len(actual[3])} children instead of {len(children)}'
+    return None
+
+
+def compare_file(expected_path, actual_path):
+    """Return the first difference of two SVG documents, or None if they render the same."""
+    expected = canonical(ET.parse(expected_path).getroot())
+    actual = canonical(ET.parse(actual_path).getroot())
+    return first_difference(expected, actual)
+
+
+def render_typescript(cli, model_path, output_dir, options):
+    """Render the views of a model with the render-all command of cli.ts."""
+    command = shlex.split(cli) + [
+        'render-all', model_path, '--output-dir', output_dir,
+        '--width', str(options['width']), '--height', str(options['height']),
+        '--font-family', options['font_family'], '--font-size', str(options['font_size']),
+        '--theme', options['theme'], '--layer-fills', options['layer_fills'],
+    ]
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+def render_python(model, model_path, output_dir, options):
+    """Render the views of a model with render_views.py; return the paths of the documents."""
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = list(view_tasks(model, model_path, output_dir))
+    errors = [(view, error) for view, _, _, error in render_all(tasks, 1, options) if error is not None]
+    for view, error in errors:
+        print(f"Error: render_views.py failed to render view {view.id}: {error}")
+    return [path for _, _, _, path in tasks]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the views rendered by cli.ts render-all and render_views.py'
+    )
+    parser.add_argument('model', help='Open Exchange XML file')
+    parser.add_argument(
+        '--ts-dir', '-d',
+        help='Views already rendered by render-all with the same options (default: run --cli)'
+    )
+    parser.add_argument(
+        '--cli', '-c',
+        default=DEFAULT_CLI,
+        help='Command that runs cli.ts (default: node dist/cjs/cli.js)'
+    )
+    parser.add_argument('--width', '-w', type=int, default=DEFAULT_WIDTH, help=f'SVG width in pixels (default: {DEFAULT_WIDTH})')
+    parser.add_argument('--height', '-H', type=int, default=DEFAULT_HEIGHT, help=f'SVG height in pixels (default: {DEFAULT_HEIGHT})')
+    parser.add_argument('--font-family', '-f', default=DEFAULT_FONT_FAMILY, help=f'Font family (default: {DEFAULT_FONT_FAMILY})')
+    parser.add_argument('--font-size', '-s', type=int, default=DEFAULT_FONT_SIZE, help=f'Font size in pixels (default: {DEFAULT_FONT_SIZE})')
+    parser.add_argument('--theme', '-t', default=DEFAULT_THEME, help=f'Theme of themes.json (default: {DEFAULT_THEME})')
+    parser.add_argument(
+        '--layer-fills', '-l',
+        choices=LAYER_FILLS,
+        default=DEFAULT_LAYER_FILLS,
+        help=f'Layer fills to render with (default: {DEFAULT_LAYER_FILLS})'
+    )
+    args = parser.parse_args()
+
+    options = {
+        'width': args.width,
+        'height': args.height,
+        'font_family': args.font_family,
+        'font_size': args.font_size,
+        'theme': args.theme,
+        'layer_fills': args.layer_fills,
+    }
+    try:
+        model = load_model(args.model)
+    except (OSError, ET.ParseError) as e:
+        print(f"Error: Could not load '{args.model}': {e}")
+        return 1
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        ts_dir = args.ts_dir
+        if ts_dir is None:
+            ts_dir = os.path.join(temp_dir, 'ts')
+            try:
+                render_typescript(args.cli, args.model, ts_dir, options)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"Error: Could not run '{args.cli}': {e}")
+                return 1
+        paths = render_python(model, args.model, os.path.join(temp_dir, 'py'), options)
+
+        differences = 0
+        for path in paths:
+            name = os.path.basename(path)
+            expected = os.path.join(ts_dir, name)
+            if not os.path.isfile(expected):
+                difference = 'not rendered by cli.ts'
+            elif not os.path.isfile(path):
+                difference = 'not rendered by render_views.py'
+            else:
+                difference = compare_file(expected, path)
+            if difference:
+                differences += 1
+                print(f"  {name}: {difference}")
+
+    print(f"{len(paths) - differences} of {len(paths)} views render the same")
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
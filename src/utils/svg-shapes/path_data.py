@@ -0,0 +1,746 @@
+#!/usr/bin/env python3
+"""
+SVG path data engine for the svg-shapes tooling.
+
+Path data is tokenized once into a compact intermediate representation: one
+command letter per segment (implicit command repetitions stay in the same
+segment), the number of coordinates in each segment, a packed array('d') of all
+coordinates and a parallel array of coordinate roles (absolute/relative x or y,
+arc parameters). Transforms are applied to the whole coordinate array in a
+single batched step using the role table, with NumPy when it is installed and
+C-level iterators over array('d') otherwise.
+
+No number is parsed or formatted by Python code: parse() converts the tokens of
+whitespace splits with float() and format() fills a %-template with the whole
+coordinate array. NumPy is not required: without it, the engine is about 1.4x
+faster than the regex rewriting convert.py used before on the stencil-like
+paths of `benchmark.py path-data`.
+"""
+
+import math
+import re
+import sys
+from array import array
+from itertools import repeat
+from operator import add, mod, mul, sub
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array-backed fallbacks are used instead
+    np = None
+
+# Affine matrices are (a, b, c, d, e, f) as in the SVG matrix() transform:
+# x' = a*x + c*y + e, y' = b*x + d*y + f
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Coordinate roles
+X_ABS = 0
+Y_ABS = 1
+X_REL = 2
+Y_REL = 3
+ARC_RX = 4
+ARC_RY = 5
+ARC_ANGLE = 6
+ARC_FLAG = 7
+
+# Number of arguments taken by each command
+ARG_COUNTS = {
+    'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0,
+}
+
+_ARG_MODULI = {}
+for _command, _count in ARG_COUNTS.items():
+    _ARG_MODULI[_command] = _ARG_MODULI[_command.lower()] = _count or sys.maxsize
+
+# Roles of the arguments of one (absolute) command; relative variants are derived below
+_ABS_ROLES = {
+    'M': (X_ABS, Y_ABS),
+    'L': (X_ABS, Y_ABS),
+    'H': (X_ABS,),
+    'V': (Y_ABS,),
+    'C': (X_ABS, Y_ABS) * 3,
+    'S': (X_ABS, Y_ABS) * 2,
+    'Q': (X_ABS, Y_ABS) * 2,
+    'T': (X_ABS, Y_ABS),
+    'A': (ARC_RX, ARC_RY, ARC_ANGLE, ARC_FLAG, ARC_FLAG, X_ABS, Y_ABS),
+    'Z': (),
+}
+_TO_RELATIVE = {X_ABS: X_REL, Y_ABS: Y_REL}
+# Commands whose arguments are all absolute (x, y) pairs
+PAIR_COMMANDS = frozenset('MLCSQTZ')
+
+COMMAND_ROLES = {}
+for _command, _roles in _ABS_ROLES.items():
+    COMMAND_ROLES[_command] = _roles
+    COMMAND_ROLES[_command.lower()] = tuple(_TO_RELATIVE.get(role, role) for role in _roles)
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_SEP = r"[\s,]*"
+NUMBER_RE = re.compile(_NUMBER)
+COMMAND_SPLIT_RE = re.compile(r"([MmZzLlHhVvCcSsQqTtAa])")
+# Characters that can not be part of whitespace-separated numbers, such as the "_" and
+# "inf" that float() accepts
+_NON_NUMBER_RE = re.compile(r"[^\d\s,.eE+\-MmZzLlHhVvCcSsQqTtAa]")
+# Arc flags are single 0/1 characters and may be written without separators ("a5 5 0 0110 10")
+ARC_RE = re.compile(
+    _SEP.join([f"({_NUMBER})"] * 3 + [r"([01])", r"([01])"] + [f"({_NUMBER})"] * 2)
+)
+TRANSFORM_RE = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)")
+
+
+# Command letters that may be omitted after the given command
+_IMPLICIT_FOLLOWERS = {'M': 'L', 'm': 'l'}
+
+
+def _format_number(value, precision):
+    """Format a number as compactly as possible: "0.50" -> ".5", "-0.25" -> "-.25", "3.0" -> "3"."""
+    text = f"{value:.{precision}f}"
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    if text.startswith('0.'):
+        text = text[1:]
+    elif text.startswith('-0.'):
+        text = '-' + text[2:]
+    return '0' if text in ('-0', '') else text
+
+
+def _join_numbers(tokens):
+    """
+    Join command letters and formatted numbers, inserting a separator only where the
+    path grammar needs one (between numbers, unless the next one starts with '-' or is
+    a fraction following a number that already has a decimal point).
+    """
+    parts = []
+    last = None
+    for token in tokens:
+        if last is not None and not token[0].isalpha() and not last[-1].isalpha():
+            if not (token[0] == '-' or (token[0] == '.' and '.' in last)):
+                parts.append(' ')
+        parts.append(token)
+        last = token
+    return ''.join(parts)
+
+
+def multiply(m1, m2):
+    """Return the matrix that applies m2 first and then m1."""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * e2 + c1 * f2 + e1,
+        b1 * e2 + d1 * f2 + f1,
+    )
+
+
+def translate(tx, ty=0.0):
+    """Return a translation matrix."""
+    return (1.0, 0.0, 0.0, 1.0, float(tx), float(ty))
+
+
+def scale(sx, sy=None):
+    """Return a scaling matrix."""
+    sy = sx if sy is None else sy
+    return (float(sx), 0.0, 0.0, float(sy), 0.0, 0.0)
+
+
+def parse_transform(transform_str):
+    """
+    Parse an SVG transform attribute (a list of matrix, translate, scale, rotate,
+    skewX and skewY functions) into a single affine matrix.
+    """
+    matrix = IDENTITY
+    for name, args_str in TRANSFORM_RE.findall(transform_str or ''):
+        args = [float(value) for value in NUMBER_RE.findall(args_str)]
+        if name == 'matrix' and len(args) == 6:
+            step = tuple(args)
+        elif name == 'translate' and args:
+            step = translate(args[0], args[1] if len(args) > 1 else 0.0)
+        elif name == 'scale' and args:
+            step = scale(args[0], args[1] if len(args) > 1 else None)
+        elif name == 'rotate' and args:
+            angle = math.radians(args[0])
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            step = (cos_a, sin_a, -sin_a, cos_a, 0.0, 0.0)
+            if len(args) == 3:
+                cx, cy = args[1], args[2]
+                step = multiply(translate(cx, cy), multiply(step, translate(-cx, -cy)))
+        elif name == 'skewX' and args:
+            step = (1.0, 0.0, math.tan(math.radians(args[0])), 1.0, 0.0, 0.0)
+        elif name == 'skewY' and args:
+            step = (1.0, math.tan(math.radians(args[0])), 0.0, 1.0, 0.0, 0.0)
+        else:
+            raise ValueError(f"Invalid transform: {name}({args_str})")
+        matrix = multiply(matrix, step)
+    return matrix
+
+
+def apply_to_point(matrix, x, y):
+    """Transform a single point."""
+    a, b, c, d, e, f = matrix
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def transform_arc(matrix, rx, ry, angle, large_arc, sweep):
+    """
+    Return the arc parameters (rx, ry, angle, large_arc, sweep) of an elliptical arc
+    after applying the linear part of the matrix.
+    """
+    a, b, c, d = matrix[:4]
+    phi = math.radians(angle)
+    cos_p, sin_p = math.cos(phi), math.sin(phi)
+    # Columns of the transformed ellipse matrix L * R(phi) * diag(rx, ry)
+    m00 = (a * cos_p + c * sin_p) * rx
+    m10 = (b * cos_p + d * sin_p) * rx
+    m01 = (-a * sin_p + c * cos_p) * ry
+    m11 = (-b * sin_p + d * cos_p) * ry
+    # The new semi-axes are the singular values of that matrix
+    s00 = m00 * m00 + m01 * m01
+    s11 = m10 * m10 + m11 * m11
+    s01 = m00 * m10 + m01 * m11
+    mean = (s00 + s11) / 2
+    spread = math.hypot((s00 - s11) / 2, s01)
+    new_rx = math.sqrt(max(mean + spread, 0.0))
+    new_ry = math.sqrt(max(mean - spread, 0.0))
+    new_angle = math.degrees(0.5 * math.atan2(2 * s01, s00 - s11))
+    if a * d - b * c < 0:
+        sweep = 0.0 if sweep else 1.0
+    return new_rx, new_ry, new_angle, large_arc, sweep
+
+
+def cubic_extrema(p0, p1, p2, p3):
+    """Return the parameters in (0, 1) where a cubic Bézier coordinate has a local extremum."""
+    # Roots of the derivative, divided by 3: a*t^2 + b*t + c
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+    if abs(a) < 1e-12:
+        roots = [-c / b] if abs(b) > 1e-12 else []
+    else:
+        discriminant = b * b - 4 * a * c
+        if discriminant < 0:
+            return []
+        root = math.sqrt(discriminant)
+        roots = [(-b + root) / (2 * a), (-b - root) / (2 * a)]
+    return [t for t in roots if 0 < t < 1]
+
+
+def cubic_point(p0, p1, p2, p3, t):
+    """Evaluate a cubic Bézier coordinate at t."""
+    u = 1 - t
+    return u * u * u * p0 + 3 * u * u * t * p1 + 3 * u * t * t * p2 + t * t * t * p3
+
+
+def quadratic_extrema(p0, p1, p2):
+    """Return the parameters in (0, 1) where a quadratic Bézier coordinate has a local extremum."""
+    denominator = p0 - 2 * p1 + p2
+    if abs(denominator) < 1e-12:
+        return []
+    t = (p0 - p1) / denominator
+    return [t] if 0 < t < 1 else []
+
+
+def quadratic_point(p0, p1, p2, t):
+    """Evaluate a quadratic Bézier coordinate at t."""
+    u = 1 - t
+    return u * u * p0 + 2 * u * t * p1 + t * t * p2
+
+
+def arc_extreme_points(x1, y1, rx, ry, angle, large_arc, sweep, x2, y2):
+    """
+    Return the points of an elliptical arc from (x1, y1) to (x2, y2) where x or y is
+    extreme, not counting the end points. Follows the endpoint to center conversion of
+    the SVG specification (appendix F.6.5), including the scaling of too small radii.
+    """
+    rx, ry = abs(rx), abs(ry)
+    if not rx or not ry or (x1 == x2 and y1 == y2):
+        return []
+    phi = math.radians(angle)
+    cos_p, sin_p = math.cos(phi), math.sin(phi)
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cos_p * dx + sin_p * dy
+    y1p = -sin_p * dx + cos_p * dy
+    radii_check = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if radii_check > 1:
+        rx *= math.sqrt(radii_check)
+        ry *= math.sqrt(radii_check)
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coefficient = math.sqrt(max(numerator / denominator, 0.0))
+    if bool(large_arc) == bool(sweep):
+        coefficient = -coefficient
+    cxp = coefficient * rx * y1p / ry
+    cyp = -coefficient * ry * x1p / rx
+    cx = cos_p * cxp - sin_p * cyp + (x1 + x2) / 2
+    cy = sin_p * cxp + cos_p * cyp + (y1 + y2) / 2
+
+    start = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    delta = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - start
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    points = []
+    x_extreme = math.atan2(-ry * sin_p, rx * cos_p)
+    y_extreme = math.atan2(ry * cos_p, rx * sin_p)
+    for t in (x_extreme, x_extreme + math.pi, y_extreme, y_extreme + math.pi):
+        # Angle travelled from the start point to t in the sweep direction
+        travelled = (t - start) % (2 * math.pi) if delta > 0 else (start - t) % (2 * math.pi)
+        if travelled < abs(delta):
+            cos_t, sin_t = math.cos(t), math.sin(t)
+            points.append((
+                cx + rx * cos_p * cos_t - ry * sin_p * sin_t,
+                cy + rx * sin_p * cos_t + ry * cos_p * sin_t,
+            ))
+    return points
+
+
+def fill_format_template(template, coords, precision=2):
+    """Serialize coordinates with a template from PathData.format_template(precision)."""
+    result = template % tuple(coords)
+    # Fixed-point output always has `precision` decimals; strip all but the first zero
+    for _ in range((precision or 1) - 1):
+        result = result.replace('0\x00', '\x00').replace('0\x01', '\x01')
+    return result.replace('\x00', ' ').replace('\x01', '').replace('\x02', ' ')
+
+
+class PathData:
+    """
+    Intermediate representation of SVG path data.
+
+    commands -- one command letter per segment
+    counts   -- array('I') with the number of coordinates in each segment
+    coords   -- packed array('d') with the coordinates of all segments
+    roles    -- array('B') with the role of every coordinate (computed on demand)
+    """
+
+    __slots__ = ('commands', 'counts', 'coords', '_roles')
+
+    def __init__(self, commands=None, counts=None, coords=None):
+        self.commands = commands if commands is not None else []
+        self.counts = counts if counts is not None else array('I')
+        self.coords = coords if coords is not None else array('d')
+        self._roles = None
+
+    @classmethod
+    def parse(cls, d):
+        """Tokenize path data into a PathData instance."""
+        d = d or ''
+        if 'A' in d or 'a' in d:
+            return cls._parse_with_arcs(d)
+        # Segment arguments come from C-level whitespace splits and float(). The number
+        # regex is only used when that fails: for numbers written without separators
+        # (e.g. "1-2" or ".5.5") and for characters float() accepts but paths do not.
+        parts = COMMAND_SPLIT_RE.split(d.replace(',', ' '))
+        if parts[0].strip():
+            raise ValueError(f"Path data must start with a command: {d[:40]!r}")
+        segments = parts[2::2]
+        coords = None
+        if not _NON_NUMBER_RE.search(d):
+            try:
+                coords = array('d', map(float, ' '.join(segments).split()))
+                counts = array('I', map(len, map(str.split, segments)))
+            except ValueError:
+                pass
+        if coords is None:
+            coords = array('d', map(float, NUMBER_RE.findall(d)))
+            counts = array('I', map(len, map(NUMBER_RE.findall, segments)))
+        path = cls(parts[1::2], counts, coords)
+        path._validate()
+        return path
+
+    @classmethod
+    def _parse_with_arcs(cls, d):
+        """Segment-by-segment parser used for paths containing arcs, whose flags need splitting."""
+        path = cls()
+        parts = COMMAND_SPLIT_RE.split(d)
+        if parts[0].strip():
+            raise ValueError(f"Path data must start with a command: {d[:40]!r}")
+        for command, args_str in zip(parts[1::2], parts[2::2]):
+            if command in 'Aa':
+                values = [value for match in ARC_RE.findall(args_str) for value in match]
+            else:
+                values = NUMBER_RE.findall(args_str)
+            path.commands.append(command)
+            path.counts.append(len(values))
+            path.coords.extend(map(float, values))
+        path._validate()
+        return path
+
+    def _validate(self):
+        commands = self.commands
+        counts = self.counts
+        closes = commands.count('Z') + commands.count('z')
+        # Z takes no arguments: its huge modulus turns any argument count into a remainder
+        if any(map(mod, counts, map(_ARG_MODULI.__getitem__, commands))) or counts.count(0) != closes:
+            for command, count in zip(commands, counts):
+                arg_count = ARG_COUNTS[command.upper()]
+                if (count % arg_count if arg_count else count) or (arg_count and not count):
+                    raise ValueError(f"Wrong number of arguments ({count}) for command {command}")
+
+    @property
+    def roles(self):
+        """Role of every coordinate, derived from the segment commands."""
+        if self._roles is None:
+            roles = array('B')
+            for index, (command, count) in enumerate(zip(self.commands, self.counts)):
+                pattern = COMMAND_ROLES[command]
+                if not pattern:
+                    continue
+                repeats = count // len(pattern)
+                if command == 'm' and index == 0:
+                    # A leading relative moveto is absolute; its implicit linetos stay relative
+                    roles.extend(COMMAND_ROLES['M'] + pattern * (repeats - 1))
+                else:
+                    roles.extend(pattern * repeats)
+            self._roles = roles
+        return self._roles
+
+    def copy(self):
+        """Return an independent copy of this path."""
+        return PathData(list(self.commands), array('I', self.counts), array('d', self.coords))
+
+    def has_arcs(self):
+        """Return True if the path contains elliptical arc commands."""
+        return 'A' in self.commands or 'a' in self.commands
+
+    def is_absolute_pairs(self):
+        """Return True if every coordinate belongs to an absolute (x, y) pair."""
+        return not set(self.commands) - PAIR_COMMANDS
+
+    def transform(self, matrix):
+        """
+        Apply an affine matrix to the path in place and return the path.
+
+        Axis-aligned transforms (translate/scale) are applied to all coordinates in one
+        batched step: by stride for paths made only of absolute coordinate pairs and by
+        coordinate role otherwise. Rotations and skews first convert the path to absolute
+        commands, expanding H/V into L, and then transform all coordinate pairs at once.
+        """
+        a, b, c, d, e, f = matrix
+        if (a, b, c, d, e, f) == IDENTITY:
+            return self
+        if b == 0 and c == 0:
+            if self.is_absolute_pairs():
+                self._transform_pairs(a, d, e, f)
+            else:
+                self._transform_by_role(a, d, e, f)
+        else:
+            self._transform_general(matrix)
+        if self.has_arcs() and (a, b, c, d) != (1.0, 0.0, 0.0, 1.0):
+            self._transform_arc_parameters(matrix)
+        return self
+
+    def _transform_pairs(self, sx, sy, tx, ty):
+        coords = self.coords
+        if np is not None:
+            values = np.frombuffer(coords, dtype=np.float64).reshape(-1, 2)
+            result = values * (sx, sy) + (tx, ty)
+            self.coords = array('d', result.tobytes())
+            return
+        for start, factor, offset in ((0, sx, tx), (1, sy, ty)):
+            values = coords[start::2]
+            if factor != 1.0:
+                values = map(mul, values, repeat(factor))
+            if offset != 0.0:
+                values = map(add, values, repeat(offset))
+            coords[start::2] = array('d', values)
+
+    def _transform_by_role(self, sx, sy, tx, ty):
+        mul_table = [sx, sy, sx, sy, 1.0, 1.0, 1.0, 1.0]
+        add_table = [tx, ty, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        roles = self.roles
+        if np is not None:
+            role_index = np.frombuffer(roles, dtype=np.uint8)
+            values = np.frombuffer(self.coords, dtype=np.float64)
+            result = values * np.array(mul_table)[role_index] + np.array(add_table)[role_index]
+            self.coords = array('d', result.tobytes())
+            return
+        values = self.coords
+        if sx != 1.0 or sy != 1.0:
+            values = map(mul, values, map(mul_table.__getitem__, roles))
+        self.coords = array('d', map(add, values, map(add_table.__getitem__, roles)))
+
+    def _transform_general(self, matrix):
+        absolute = self.to_absolute(expand_axis=True)
+        self.commands = absolute.commands
+        self.counts = absolute.counts
+        self._roles = None
+        a, b, c, d, e, f = matrix
+        coords = absolute.coords
+        if np is not None:
+            values = np.frombuffer(coords, dtype=np.float64).copy()
+            xi = np.flatnonzero(np.frombuffer(self.roles, dtype=np.uint8) == X_ABS)
+            xs = values[xi]
+            ys = values[xi + 1]
+            values[xi] = a * xs + c * ys + e
+            values[xi + 1] = b * xs + d * ys + f
+            self.coords = array('d', values.tobytes())
+            return
+        for index in [i for i, role in enumerate(self.roles) if role == X_ABS]:
+            x = coords[index]
+            y = coords[index + 1]
+            coords[index] = a * x + c * y + e
+            coords[index + 1] = b * x + d * y + f
+        self.coords = coords
+
+    def _transform_arc_parameters(self, matrix):
+        coords = self.coords
+        offset = 0
+        for command, count in zip(self.commands, self.counts):
+            if command in 'Aa':
+                for start in range(offset, offset + count, 7):
+                    coords[start:start + 5] = array('d', transform_arc(matrix, *coords[start:start + 5]))
+            offset += count
+
+    def iter_absolute(self):
+        """
+        Yield (command, args, x, y) for every individual command, where args are absolute
+        coordinates and (x, y) is the current point before the command. Commands are
+        upper case; implicit linetos after a moveto are reported as 'L'.
+        """
+        coords = self.coords
+        cx = cy = 0.0
+        start_x = start_y = 0.0
+        offset = 0
+        for command, count in zip(self.commands, self.counts):
+            upper = command.upper()
+            relative = command != upper
+            arg_count = ARG_COUNTS[upper]
+            if arg_count == 0:
+                yield 'Z', (), cx, cy
+                cx, cy = start_x, start_y
+                continue
+            for chunk_start in range(offset, offset + count, arg_count):
+                args = list(coords[chunk_start:chunk_start + arg_count])
+                name = 'L' if upper == 'M' and chunk_start != offset else upper
+                if relative and not (command == 'm' and chunk_start == 0):
+                    if upper == 'H':
+                        args[0] += cx
+                    elif upper == 'V':
+                        args[0] += cy
+                    elif upper == 'A':
+                        args[5] += cx
+                        args[6] += cy
+                    else:
+                        for i in range(0, arg_count, 2):
+                            args[i] += cx
+                            args[i + 1] += cy
+                yield name, args, cx, cy
+                if upper == 'H':
+                    cx = args[0]
+                elif upper == 'V':
+                    cy = args[0]
+                else:
+                    cx, cy = args[-2], args[-1]
+                if name == 'M':
+                    start_x, start_y = cx, cy
+            offset += count
+
+    def bounds(self):
+        """
+        Return the exact geometric bounding box (min_x, min_y, max_x, max_y) of the path,
+        with the extrema of Bézier curves and arcs, or None if the path has no points.
+        Stroke widths are not included.
+        """
+        xs = []
+        ys = []
+        # Control point of the previous curve, reflected by the smooth curve commands
+        last_control = None
+        last_name = None
+        for name, args, cx, cy in self.iter_absolute():
+            control = None
+            if name in 'ML':
+                xs.append(args[0])
+                ys.append(args[1])
+            elif name == 'H':
+                xs.append(args[0])
+                ys.append(cy)
+            elif name == 'V':
+                xs.append(cx)
+                ys.append(args[0])
+            elif name in 'CS':
+                if name == 'C':
+                    x1, y1, x2, y2, x, y = args
+                else:
+                    x2, y2, x, y = args
+                    x1, y1 = (2 * cx - last_control[0], 2 * cy - last_control[1]) if last_name in 'CS' else (cx, cy)
+                for t in cubic_extrema(cx, x1, x2, x):
+                    xs.append(cubic_point(cx, x1, x2, x, t))
+                for t in cubic_extrema(cy, y1, y2, y):
+                    ys.append(cubic_point(cy, y1, y2, y, t))
+                xs.append(x)
+                ys.append(y)
+                control = (x2, y2)
+            elif name in 'QT':
+                if name == 'Q':
+                    x1, y1, x, y = args
+                else:
+                    x, y = args
+                    x1, y1 = (2 * cx - last_control[0], 2 * cy - last_control[1]) if last_name in 'QT' else (cx, cy)
+                for t in quadratic_extrema(cx, x1, x):
+                    xs.append(quadratic_point(cx, x1, x, t))
+                for t in quadratic_extrema(cy, y1, y):
+                    ys.append(quadratic_point(cy, y1, y, t))
+                xs.append(x)
+                ys.append(y)
+                control = (x1, y1)
+            elif name == 'A':
+                for x, y in arc_extreme_points(cx, cy, *args):
+                    xs.append(x)
+                    ys.append(y)
+                xs.append(args[5])
+                ys.append(args[6])
+            last_control = control
+            last_name = name
+        if not xs:
+            return None
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def to_absolute(self, expand_axis=False):
+        """
+        Return a new PathData using only absolute commands. Consecutive commands of the
+        same kind share a segment; with expand_axis, H and V become L.
+        """
+        result = PathData()
+        commands = result.commands
+        counts = result.counts
+        coords = result.coords
+        for name, args, cx, cy in self.iter_absolute():
+            if expand_axis and name == 'H':
+                name, args = 'L', [args[0], cy]
+            elif expand_axis and name == 'V':
+                name, args = 'L', [cx, args[0]]
+            last = commands[-1] if commands else None
+            if name not in 'MZ' and (last == name or (name == 'L' and last == 'M')):
+                counts[-1] += len(args)
+            else:
+                commands.append(name)
+                counts.append(len(args))
+            coords.extend(args)
+        return result
+
+    def format(self, precision=2):
+        """
+        Serialize the path. Numbers are rounded to the given precision (None keeps full
+        precision) and written as in the legacy converter output, e.g. "M1.0 2.5 3.0 4.0Z".
+        """
+        return fill_format_template(self.format_template(precision), self.coords, precision)
+
+    def format_template(self, precision=2):
+        """
+        Return the %-template that format() fills with the coordinates. It only depends
+        on the commands, the counts and the precision, so paths of the same structure
+        can share it (see fill_format_template()).
+        """
+        if precision is None:
+            number = '%r'
+        elif precision == 0:
+            number = '%.0f.0'
+        else:
+            number = f'%.{precision}f'
+        # Every number is followed by a marker: \x00 between numbers, \x01 at the end of a
+        # segment and \x02 after arc flags. The whole path is then formatted with a single
+        # %-operation and the zero padding is stripped with whole-string replacements.
+        if self.has_arcs():
+            markers = ['%d\x02' if role == ARC_FLAG else number + '\x00' for role in self.roles]
+            template = []
+            offset = 0
+            for command, count in zip(self.commands, self.counts):
+                if count:
+                    markers[offset + count - 1] = number + '\x01'
+                template.append(command + ''.join(markers[offset:offset + count]))
+                offset += count
+        else:
+            inner = number + '\x00'
+            last = number + '\x01'
+            template = [command + inner * (count - 1) + last if count else command
+                        for command, count in zip(self.commands, self.counts)]
+        return ''.join(template)
+
+    def minify(self, precision=2):
+        """
+        Return the shortest encoding of the path that this method knows, with all
+        coordinates quantized to the given number of decimals.
+
+        Absolute positions are quantized first and relative offsets are derived from the
+        quantized positions, so rounding errors never accumulate along the path. Each
+        command uses whichever of its absolute or relative form is shorter, lines along an
+        axis become H/V, repeated command letters are dropped and numbers are written
+        without leading zeros or unnecessary separators.
+        """
+        tokens = []
+        previous = None
+        cx = cy = 0.0
+        start_x = start_y = 0.0
+        for name, args, _, _ in self.iter_absolute():
+            if name == 'Z':
+                tokens.append('z')
+                previous = 'z'
+                cx, cy = start_x, start_y
+                continue
+            values = [round(value, precision) for value in args]
+            if name == 'A':
+                values[3] = 1 if values[3] else 0
+                values[4] = 1 if values[4] else 0
+            elif name == 'L' and previous is not None:
+                if values[1] == cy:
+                    name, values = 'H', values[:1]
+                elif values[0] == cx:
+                    name, values = 'V', values[1:]
+
+            relative = list(values)
+            for index, role in enumerate(COMMAND_ROLES[name]):
+                if role == X_ABS:
+                    relative[index] = round(values[index] - cx, precision)
+                elif role == Y_ABS:
+                    relative[index] = round(values[index] - cy, precision)
+            absolute_text = [_format_number(value, precision) for value in values]
+            relative_text = [_format_number(value, precision) for value in relative]
+            if previous is None:
+                # The first command is always an absolute moveto
+                letter, texts = name, absolute_text
+            elif len(_join_numbers(relative_text)) < len(_join_numbers(absolute_text)):
+                letter, texts = name.lower(), relative_text
+            else:
+                letter, texts = name, absolute_text
+
+            implicit = _IMPLICIT_FOLLOWERS.get(previous)
+            if letter == implicit or (letter == previous and letter not in 'Mm'):
+                tokens.extend(texts)
+            else:
+                tokens.append(letter)
+                tokens.extend(texts)
+                previous = letter
+
+            if name == 'H':
+                cx = values[0]
+            elif name == 'V':
+                cy = values[0]
+            else:
+                cx, cy = values[-2], values[-1]
+            if name == 'M':
+                start_x, start_y = cx, cy
+        return _join_numbers(tokens)
+
+    def max_deviation(self, other):
+        """
+        Return the largest coordinate difference between two paths describing the same
+        geometry, or None when their command structure differs.
+        """
+        mine = self.to_absolute(expand_axis=True)
+        theirs = other.to_absolute(expand_axis=True)
+        if mine.commands != theirs.commands or mine.counts != theirs.counts:
+            return None
+        if not mine.coords:
+            return 0.0
+        return max(map(abs, map(sub, mine.coords, theirs.coords)))
+
+    def __str__(self):
+        return self.format(None)
+
+    def __repr__(self):
+        return f"PathData({self.format(None)!r})"
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the stencil toolchain.
+
+Usage:
+    python pipeline.py convert [--source source] [--output all-shapes.json]
+    python pipeline.py gen-ts [--input all-shapes.json] [--split] [--pack all-shapes.pack]
+    python pipeline.py poster [--input all-shapes.json] [--poster poster.svg]
+    python pipeline.py all [--source source] [--split] [--pack all-shapes.pack] [--poster poster.svg]
+
+The shape model (the converted shapes together with the element mappings, the
+ArchiMateElementType names read from types.ts and the layer mapping) is built once
+and handed to every stage in memory. `all` converts the stencils and then writes
+all-shapes.json, shape-data.ts and the poster from the same model; nothing is read
+back from disk. With --jobs above 1 the outputs are written by worker processes, each
+with a pickled copy of the model. Generated files are only replaced when their content
+changes.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from convert import convert_files
+from metrics import create_metrics
+from optimize import coalesce_style_runs
+from poster import layout_poster, load_json_file, open_output, page_path, write_poster_page
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_ts_file_gen():
+    """Import ts-file-gen.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location('ts_file_gen', os.path.join(SCRIPT_DIR, 'ts-file-gen.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ts_file_gen = load_ts_file_gen()
+
+
+class ShapeModel:
+    """The converted shapes and the mappings the generated outputs are built from."""
+
+    def __init__(self, shapes, element_mappings, element_type_to_name_map, layer_mapping):
+        self.shapes = shapes
+        self.element_mappings = element_mappings
+        self.element_type_to_name_map = element_type_to_name_map
+        self.layer_mapping = layer_mapping
+
+    @classmethod
+    def with_shapes(cls, shapes):
+        """Create the model of the given shapes, reading the mappings next to this script."""
+        return cls(
+            shapes,
+            load_json_file(os.path.join(SCRIPT_DIR, 'element-mapping.json')),
+            ts_file_gen.load_element_type_names(os.path.join(SCRIPT_DIR, '..', '..', 'types.ts')),
+            load_json_file(os.path.join(SCRIPT_DIR, 'layer-mapping.json')),
+        )
+
+    @classmethod
+    def from_sources(cls, source_dir, jobs=1, cache_dir=None, coalesce=True):
+        """
+        Convert the SVG files of source_dir and create their model. Same-style elements
+        are merged into compound paths like convert.py does, unless coalesce is False.
+        """
+        # Sort the file list so the output order does not depend on the file system
+        files = sorted(file for file in os.listdir(source_dir) if file.endswith('.svg'))
+        results, _ = convert_files([os.path.join(source_dir, file) for file in files], jobs=jobs, cache_dir=cache_dir)
+        shapes = [shape for shape in results if shape]
+        if coalesce:
+            for shape in shapes:
+                coalesce_style_runs(shape)
+        return cls.with_shapes(shapes)
+
+    @classmethod
+    def from_json(cls, path):
+        """Create the model of the shapes in a previously written all-shapes.json."""
+        return cls.with_shapes(load_json_file(path))
+
+
+def write_shapes_json(model, path):
+    """Write all-shapes.json in the layout of convert.py. Returns (changed, size)."""
+    return ts_file_gen.write_if_changed(path, lambda out: json.dump(model.shapes, out, indent=2))
+
+
+def write_shape_data(model, path, modules_dir=None):
+    """
+    Write shape-data.ts, element-mapping.ts next to it and, if modules_dir is given, the
+    per-shape modules. Returns (changed, size, chunks), where chunks is None without
+    modules_dir.
+    """
+    ts_file_gen.write_if_changed(
+        os.path.join(os.path.dirname(path), 'element-mapping.ts'),
+        lambda out: ts_file_gen.write_element_mapping(
+            out, model.element_mappings, model.element_type_to_name_map
+        ),
+    )
+    changed, size = ts_file_gen.write_if_changed(
+        path, lambda out: ts_file_gen.write_shape_data(out, model.shapes)
+    )
+    chunks = ts_file_gen.write_shape_modules(modules_dir, model.shapes) if modules_dir else None
+    return changed, size, chunks
+
+
+def write_shape_pack(model, path):
+    """Write the shapes and their icon fragments as a binary shape pack. Returns (changed, size)."""
+    return ts_file_gen.write_shape_pack(path, model.shapes)
+
+
+def write_poster(model, path, page_height=None, use_symbols=True):
+    """
+    Write the poster, split into pages if page_height is given.
+    Returns a list of (path, width, height) tuples, one per page.
+    """
+    pages = layout_poster(model.element_mappings, model.shapes, model.layer_mapping, page_height)
+    written = []
+    for page_number, page in enumerate(pages, start=1):
+        page_file = page_path(path, page_number) if page_height else path
+        with open_output(page_file) as out:
+            write_poster_page(out, page, use_symbols)
+        written.append((page_file, page.width, page.height))
+    return written
+
+
+def report_shape_data(model, path, changed, size, chunks):
+    if changed:
+        print(f"Generated {os.path.basename(path)} with {len(model.shapes)} shapes and "
+              f"{len(model.element_mappings)} element mappings ({size} bytes)")
+    else:
+        print(f"{os.path.basename(path)} is up to date ({len(model.shapes)} shapes, "
+              f"{len(model.element_mappings)} element mappings)")
+    if chunks is not None:
+        ts_file_gen.print_chunk_sizes(chunks, size)
+
+
+def report_shape_pack(path, changed, size):
+    print(f"{'Generated' if changed else 'Unchanged'} shape pack {path} ({size} bytes)")
+
+
+def report_poster(pages):
+    for path, width, height in pages:
+        print(f"Poster generated at {path} ({width}x{height}, {os.path.getsize(path)} bytes)")
+
+
+def timed_output(function, function_args):
+    """Write an output, returning (result, error, wall seconds, CPU seconds)."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        result, error = function(*function_args), None
+    except ValueError as e:
+        result, error = None, e
+    return result, error, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def write_outputs(outputs, jobs, metrics):
+    """
+    Write the outputs, a list of (stage, function, args) tuples. The generators are pure
+    Python, so threads would take turns on the GIL; with jobs above 1 the outputs are
+    written by that many worker processes instead. Returns a dict of stage to a function
+    that returns the result of the output or raises its ValueError.
+    """
+    if jobs > 1 and len(outputs) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(outputs))) as executor:
+            futures = [executor.submit(timed_output, function, function_args) for _, function, function_args in outputs]
+            timed = [future.result() for future in futures]
+    else:
+        timed = [timed_output(function, function_args) for _, function, function_args in outputs]
+
+    results = {}
+    for (stage, _, _), (result, error, wall, cpu) in zip(outputs, timed):
+        metrics.add_stage(stage, wall, cpu)
+        results[stage] = partial(output_result, result, error)
+    return results
+
+
+def output_result(result, error):
+    """Return the result of an output, or raise the error it failed with."""
+    if error is not None:
+        raise error
+    return result
+
+
+def run(args, metrics):
+    """Run the requested subcommand with its model built once."""
+    if args.command in ('convert', 'all'):
+        if not os.path.isdir(args.source):
+            print(f"Error: Source directory '{args.source}' does not exist")
+            return
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        with metrics.stage('convert'):
+            model = ShapeModel.from_sources(args.source, jobs, args.cache_dir, not args.no_coalesce)
+        if not model.shapes:
+            print(f"Warning: No SVG files found in '{args.source}'")
+            return
+    else:
+        with metrics.stage('load'):
+            model = ShapeModel.from_json(args.input)
+    metrics.count('shapes', len(model.shapes))
+
+    modules_dir = args.modules_dir if getattr(args, 'split', False) else None
+    pack = getattr(args, 'pack', None)
+    page_height = getattr(args, 'page_height', None)
+    use_symbols = not getattr(args, 'inline', False)
+
+    if args.command == 'convert':
+        with metrics.stage('write_json'):
+            changed, size = write_shapes_json(model, args.output)
+        print(f"{'Saved' if changed else 'Unchanged'} {len(model.shapes)} shapes in '{args.output}' ({size} bytes)")
+    elif args.command == 'gen-ts':
+        with metrics.stage('gen_ts'):
+            result = write_shape_data(model, args.ts_output, modules_dir)
+        report_shape_data(model, args.ts_output, *result)
+        if pack:
+            try:
+                with metrics.stage('pack'):
+                    report_shape_pack(pack, *write_shape_pack(model, pack))
+            except ValueError as e:
+                print(f"Error: Could not write the shape pack: {e}")
+    elif args.command == 'poster':
+        try:
+            with metrics.stage('poster'):
+                pages = write_poster(model, args.poster, page_height, use_symbols)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        report_poster(pages)
+    else:
+        outputs = [
+            ('write_json', write_shapes_json, (model, args.output)),
+            ('gen_ts', write_shape_data, (model, args.ts_output, modules_dir)),
+        ]
+        if pack:
+            outputs.append(('pack', write_shape_pack, (model, pack)))
+        if args.poster:
+            outputs.append(('poster', write_poster, (model, args.poster, page_height, use_symbols)))
+        results = write_outputs(outputs, jobs, metrics)
+
+        changed, size = results['write_json']()
+        print(f"{'Saved' if changed else 'Unchanged'} {len(model.shapes)} shapes in '{args.output}' ({size} bytes)")
+        report_shape_data(model, args.ts_output, *results['gen_ts']())
+        if pack:
+            try:
+                report_shape_pack(pack, *results['pack']())
+            except ValueError as e:
+                print(f"Error: Could not write the shape pack: {e}")
+        if args.poster:
+            try:
+                report_poster(results['poster']())
+            except ValueError as e:
+                print(f"Error: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Convert the stencil SVGs and generate shape-data.ts and the poster in one process'
+    )
+    # Options shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--metrics-out',
+        default=None,
+        help='Write wall/CPU time per stage to this JSON file (default: off)'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_source_arguments(subparser):
+        subparser.add_argument(
+            '--source', '-s',
+            default=os.path.join(SCRIPT_DIR, 'source'),
+            help='Directory containing SVG files (default: source next to this script)'
+        )
+        subparser.add_argument(
+            '--output', '-o',
+            default=os.path.join(SCRIPT_DIR, 'all-shapes.json'),
+            help='Output JSON file path (default: all-shapes.json next to this script)'
+        )
+        subparser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=1,
+            help='Number of worker processes; 0 uses all CPU cores (default: 1)'
+        )
+        subparser.add_argument(
+            '--cache-dir',
+            default=None,
+            help='Directory for the incremental conversion cache (default: no cache)'
+        )
+        subparser.add_argument(
+            '--no-coalesce',
+            action='store_true',
+            help='Keep every element separate instead of merging same-style elements into compound paths'
+        )
+
+    def add_input_argument(subparser):
+        subparser.add_argument(
+            '--input', '-i',
+            default=os.path.join(SCRIPT_DIR, 'all-shapes.json'),
+            help='Shape definitions JSON file (default: all-shapes.json next to this script)'
+        )
+
+    def add_ts_arguments(subparser):
+        subparser.add_argument(
+            '--ts-output',
+            default=os.path.join(SCRIPT_DIR, '..', 'shape-data.ts'),
+            help='Output TypeScript file (default: src/utils/shape-data.ts)'
+        )
+        subparser.add_argument(
+            '--split',
+            action='store_true',
+            help='Also generate one lazily loadable module per shape and report the chunk sizes'
+        )
+        subparser.add_argument(
+            '--modules-dir',
+            default=os.path.join(SCRIPT_DIR, '..', 'shape-modules'),
+            help='Output directory for the shape modules (default: src/utils/shape-modules)'
+        )
+        subparser.add_argument(
+            '--pack',
+            default=None,
+            help='Also write the shapes and icon fragments as a binary shape pack to this file (default: off)'
+        )
+
+    def add_poster_arguments(subparser, default):
+        subparser.add_argument(
+            '--poster',
+            default=default,
+            help='Output SVG file of the poster, gzip-compressed if it ends with .svgz '
+                 f"(default: {'poster.svg next to this script' if default else 'no poster'})"
+        )
+        subparser.add_argument(
+            '--inline',
+            action='store_true',
+            help='Render every shape inline instead of as <use> of a shared <symbol>'
+        )
+        subparser.add_argument(
+            '--page-height',
+            type=int,
+            default=None,
+            help='Split the poster into pages of this height (default: one page sized to its content)'
+        )
+
+    convert_parser = subparsers.add_parser('convert', parents=[common], help='Convert the SVG files to all-shapes.json')
+    add_source_arguments(convert_parser)
+
+    gen_ts_parser = subparsers.add_parser('gen-ts', parents=[common], help='Generate shape-data.ts from all-shapes.json')
+    add_input_argument(gen_ts_parser)
+    add_ts_arguments(gen_ts_parser)
+
+    poster_parser = subparsers.add_parser('poster', parents=[common], help='Generate the poster from all-shapes.json')
+    add_input_argument(poster_parser)
+    add_poster_arguments(poster_parser, os.path.join(SCRIPT_DIR, 'poster.svg'))
+
+    all_parser = subparsers.add_parser(
+        'all', parents=[common], help='Convert the SVG files and generate all-shapes.json, shape-data.ts and the poster'
+    )
+    add_source_arguments(all_parser)
+    add_ts_arguments(all_parser)
+    add_poster_arguments(all_parser, None)
+
+    args = parser.parse_args()
+    metrics = create_metrics(f'pipeline.py {args.command}', args.metrics_out)
+
+    start = time.perf_counter()
+    run(args, metrics)
+    print(f"Finished '{args.command}' in {(time.perf_counter() - start) * 1000:.0f} ms")
+    if args.metrics_out:
+        metrics.write(args.metrics_out)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,18 @@
+import argparse
+import gzip
+import io
 import json
 import os
-from collections import defaultdict
+from collections import ChainMap, defaultdict, namedtuple
+from collections.abc import Mapping
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from metrics import create_metrics, profiled
+from path_data import PathData
+from shape_pack import is_shape_pack, load_shape_library
+from shape_records import Shape, load_shapes
+from theme import load_themes, mapping_layer_color, theme_colors
 
 def create_rectangle_shape(width, height, fill="#FFFFFF", stroke="black", stroke_width=0.67):
     """Create a rectangle shape with the given parameters."""
@@ -103,6 +115,34 @@ def create_chamfered_rectangle_shape(width, height, chamfer_size=5.6, fill="#FFF
         ]
     }
 
+def create_circle_shape(width, height, fill="#FFFFFF", stroke="black", stroke_width=0.67):
+    """Create a circle shape that fits the given size, as used for junctions."""
+    diameter = min(width, height)
+    radius = diameter / 2 - 0.5
+    center = diameter / 2
+    
+    # Two half-circle arcs, as a path can not draw a full circle with a single arc
+    path_data = (
+        f"M{center - radius} {center}"
+        f"A{radius} {radius} 0 1 0 {center + radius} {center}"
+        f"A{radius} {radius} 0 1 0 {center - radius} {center}Z"
+    )
+    
+    return {
+        "name": "circle",
+        "width": diameter,
+        "height": diameter,
+        "elements": [
+            {
+                "type": "path",
+                "d": path_data,
+                "stroke": stroke,
+                "strokeWidth": stroke_width,
+                "fill": fill
+            }
+        ]
+    }
+
 def load_json_file(file_path):
     """Load and return JSON data from a file."""
     with open(file_path, 'r') as f:
@@ -167,8 +207,13 @@ def create_svg_text(x, y, text, font_size=12, text_anchor='middle'):
     """Create an SVG text element."""
     return f'<text x="{x}" y="{y}" font-size="{font_size}" text-anchor="{text_anchor}">{text}</text>'
 
-def render_shape(shape, x, y, scale=1.0, override_fill=None):
-    """Render a shape at the specified position with optional scaling and fill override."""
+def render_shape_elements(shape, override_fill=None, missing_fill=None):
+    """
+    Render the elements of a shape with an optional fill override. Elements without a
+    fill of their own get missing_fill, if given. Shape records render themselves.
+    """
+    if isinstance(shape, Shape):
+        return shape.render_elements(override_fill, missing_fill)
     elements_svg = []
     
     for element in shape['elements']:
@@ -191,6 +236,8 @@ def render_shape(shape, x, y, scale=1.0, override_fill=None):
                 else:
                     path_params['fill'] = override_fill if override_fill is not None else element['fill']
             # If no fill attribute, don't add a fill at all (don't use override_fill)
+            elif missing_fill is not None:
+                path_params['fill'] = missing_fill
                 
             if 'fillRule' in element:
                 path_params['fill_rule'] = element['fillRule']
@@ -227,176 +274,393 @@ def render_shape(shape, x, y, scale=1.0, override_fill=None):
                 else:
                     rect_params['fill'] = override_fill if override_fill is not None else element['fill']
             # If no fill attribute, don't add a fill at all (don't use override_fill)
+            elif missing_fill is not None:
+                rect_params['fill'] = missing_fill
             
             elements_svg.append(create_svg_rect(**rect_params))
     
+    return ''.join(elements_svg)
+
+def render_shape(shape, x, y, scale=1.0, override_fill=None):
+    """Render a shape at the specified position with optional scaling and fill override."""
     # Create a group for the shape with translation
-    return create_svg_group(''.join(elements_svg), {'transform': f'translate({x}, {y}) scale({scale})'})
+    return create_svg_group(render_shape_elements(shape, override_fill), {'transform': f'translate({x}, {y}) scale({scale})'})
 
-def main():
-    # Load the necessary data
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    element_mapping = load_json_file(os.path.join(script_dir, 'element-mapping.json'))
-    all_shapes = load_json_file(os.path.join(script_dir, 'all-shapes.json'))
-    layer_mapping = load_json_file(os.path.join(script_dir, 'layer-mapping.json'))
-    
-    # Create a lookup for shapes by name
-    shapes_by_name = {shape['name']: shape for shape in all_shapes}
-    
-    # Add our generated shapes
-    shapes_by_name['rectangle'] = create_rectangle_shape(112, 46)
-    shapes_by_name['rounded-rectangle'] = create_rounded_rectangle_shape(111, 46)
-    shapes_by_name['chamfered-rectangle'] = create_chamfered_rectangle_shape(114, 46)
-    
-    # Create a lookup for layer information by element name
-    layer_by_element = {item['element']: {'layer': item['layer'], 'color': item['color']} for item in layer_mapping}
+def compact_number(value, precision):
+    """Format a number rounded to the given decimals without trailing zeros, e.g. 90.0 -> "90"."""
+    text = f"{value:.{precision}f}".rstrip('0').rstrip('.')
+    return '0' if text in ('-0', '') else text
+
+@lru_cache(maxsize=None)
+def symbol_path_data(d):
+    """Return the minified path data of a symbol; shapes repeat on every page, so it is cached."""
+    return PathData.parse(d).minify(SYMBOL_PRECISION)
+
+def symbol_geometry(shape, inherit_fill):
+    """
+    Return a copy of a shape for a <symbol>: path data is minified, and with
+    inherit_fill the elements with a fill of their own drop it, so they inherit the
+    fill of the <use> element. Elements without a fill must not inherit it, so they
+    get the SVG default.
+    """
+    elements = []
+    for element in shape['elements']:
+        element = dict(element)
+        if element['type'] == 'path':
+            element['d'] = symbol_path_data(element['d'])
+        if inherit_fill:
+            if 'fill' not in element:
+                element['fill'] = 'black'
+            elif element['fill'] != 'none':
+                del element['fill']
+        elements.append(element)
+    return {'name': shape['name'], 'width': shape['width'], 'height': shape['height'], 'elements': elements}
+
+class SymbolLibrary:
+    """
+    Renders every distinct shape geometry only once, as a <symbol> in the <defs> of the
+    poster, and places it with <use> elements.
+
+    Symbols are keyed by their rendered geometry alone: the position and scale of a
+    shape are set by the transform of the <use> element, and fill overrides are set on
+    it and inherited by the symbol, so a shape drawn at several sizes and in several
+    layer colors still shares a single symbol.
+    """
+
+    def __init__(self):
+        self.symbol_ids = {}
+        self.symbols = []
+        # Symbol id by shape name and size, so every shape is rendered only once
+        self.ids_by_shape = {}
+
+    def symbol_id(self, shape, inherit_fill):
+        """Return the id of the symbol for a shape, rendering it on first use."""
+        shape_key = (shape['name'], shape['width'], shape['height'], inherit_fill)
+        symbol_id = self.ids_by_shape.get(shape_key)
+        if symbol_id is None:
+            content = render_shape_elements(symbol_geometry(shape, inherit_fill))
+            symbol_id = self.symbol_ids.get(content)
+            if symbol_id is None:
+                # The shape name is kept as the id, numbered if another geometry has it
+                symbol_id = shape['name']
+                if symbol_id in self.symbol_ids.values():
+                    symbol_id = f"{shape['name']}-{len(self.symbol_ids) + 1}"
+                self.symbol_ids[content] = symbol_id
+                self.symbols.append(f'<symbol id="{symbol_id}" overflow="visible">{content}</symbol>')
+            self.ids_by_shape[shape_key] = symbol_id
+        return symbol_id
+
+    def render_shape(self, shape, x, y, scale=1.0, override_fill=None):
+        """Place a shape like render_shape() does, as a <use> of its symbol."""
+        symbol_id = self.symbol_id(shape, override_fill is not None)
+        fill = f' fill="{override_fill}"' if override_fill is not None else ''
+        transform = f'translate({compact_number(x, 2)} {compact_number(y, 2)}) scale({compact_number(scale, 4)})'
+        return f'<use xlink:href="#{symbol_id}" transform="{transform}"{fill}/>'
+
+    def defs(self):
+        """Return the <defs> element with all symbols rendered so far."""
+        return f'<defs>{"".join(self.symbols)}</defs>'
+
+# Generated base shapes, sized to the poster grid cell when they are drawn
+BASE_SHAPE_FACTORIES = {
+    'rectangle': create_rectangle_shape,
+    'rounded-rectangle': create_rounded_rectangle_shape,
+    'chamfered-rectangle': create_chamfered_rectangle_shape,
+    'circle': create_circle_shape,
+}
+
+# Decimals of the path data of symbols, which are scaled down on the poster
+SYMBOL_PRECISION = 2
+
+# Order of the layers on the poster
+LAYER_ORDER = [
+    'Motivation', 
+    'Strategy', 
+    'Business', 
+    'Application', 
+    'Technology', 
+    'Implementation and Migration', 
+    'Composite',
+    'Other'
+]
+
+# Theme of themes.json the layers are colored in, the colors of the ArchiMate notation
+POSTER_THEME = 'archimate'
+
+# Poster dimensions and layout parameters
+POSTER_WIDTH = 1400
+MARGIN = 50
+TITLE_HEIGHT = 80
+LAYER_TITLE_HEIGHT = 40
+SHAPE_WIDTH = 200
+SHAPE_HEIGHT = 80
+SHAPES_PER_ROW = 6
+ROW_HEIGHT = 120
+ICON_SCALE_FACTOR = 0.2  # Icons fit in 20% of the shape width/height
+ICON_PADDING_X = 5  # Padding from the right edge in pixels
+ICON_PADDING_Y = 5  # Padding from the top edge in pixels
+
+# Layout records produced by the first pass and rendered by the second
+PosterPage = namedtuple('PosterPage', 'width height items')
+PosterText = namedtuple('PosterText', 'x y text font_size attributes')
+PosterCell = namedtuple('PosterCell', 'x y label placements')
+
+def group_elements_by_layer(element_mapping, layer_mapping, colors):
+    """
+    Return (layer, [(element_info, layer_color), ...]) pairs in poster order. The
+    layers of layer-mapping.json are colored like the theme layer they name, composite
+    elements take the composite color of the theme and other elements its background.
+    """
+    # Create a lookup for the layer by element name
+    layer_by_element = {item['element']: item['layer'] for item in layer_mapping}
     
     # Group elements by layer
     elements_by_layer = defaultdict(list)
     for element_info in element_mapping:
-        element_name = element_info['element']
-        layer_info = layer_by_element.get(element_name, {'layer': 'Other', 'color': '#FFFFFF'})
-        element_info['layer_color'] = layer_info['color']  # Add color to element info
-        elements_by_layer[layer_info['layer']].append(element_info)
-    
-    # Sort layers in a specific order
-    layer_order = [
-        'Motivation', 
-        'Strategy', 
-        'Business', 
-        'Application', 
-        'Technology', 
-        'Implementation and Migration', 
-        'Composite',
-        'Other'
-    ]
+        layer = layer_by_element.get(element_info['element'], 'Other')
+        elements_by_layer[layer].append((element_info, mapping_layer_color(colors, layer)))
+    
+    return [(layer, elements_by_layer[layer]) for layer in LAYER_ORDER if elements_by_layer.get(layer)]
+
+def layout_cell(x, y, element_info, layer_color, shapes_by_name, cell_base_shapes):
+    """
+    Compute where the shapes of one element are drawn in its grid cell.
+    Returns a PosterCell whose placements are (shape, x, y, scale, fill) tuples.
+    """
+    icon_name = element_info['icon']
+    base_name = element_info['base']
+    placements = []
+    
+    base_shape = cell_base_shapes.get(base_name)
+    if base_shape is not None:
+        # Scale factor to fit within our grid
+        scale_x = (SHAPE_WIDTH * 0.8) / base_shape['width']
+        scale_y = (SHAPE_HEIGHT * 0.6) / base_shape['height']
+        scale = min(scale_x, scale_y)
+        
+        # Center the shape in its cell, using the layer color for the base shape
+        center_x = x + SHAPE_WIDTH / 2 - (base_shape['width'] * scale) / 2
+        center_y = y + SHAPE_HEIGHT / 2 - (base_shape['height'] * scale) / 2
+        placements.append((base_shape, center_x, center_y, scale, layer_color))
+        
+        # Add the icon shape if it exists and is different from the base
+        if icon_name != base_name and icon_name in shapes_by_name:
+            icon_shape = shapes_by_name[icon_name]
+            # Fit the geometric bounds of the icon computed by convert.py, or its
+            # nominal size for shapes converted without them
+            bounds = icon_shape.get('bounds') or {'x': 0, 'y': 0, 'width': icon_shape['width'], 'height': icon_shape['height']}
+            icon_scale_x = (SHAPE_WIDTH * ICON_SCALE_FACTOR) / bounds['width']
+            icon_scale_y = (SHAPE_HEIGHT * ICON_SCALE_FACTOR) / bounds['height']
+            icon_scale = min(icon_scale_x, icon_scale_y)
+            
+            # Place the icon in the top right corner of the scaled base shape
+            icon_x = center_x + base_shape['width'] * scale - (bounds['x'] + bounds['width']) * icon_scale - ICON_PADDING_X
+            icon_y = center_y + ICON_PADDING_Y - bounds['y'] * icon_scale
+            placements.append((icon_shape, icon_x, icon_y, icon_scale, layer_color))
+    
+    return PosterCell(x, y, element_info['element'], placements)
+
+def layout_poster(element_mapping, all_shapes, layer_mapping, page_height=None, theme=POSTER_THEME):
+    """
+    First pass: compute the position of every title and element without rendering
+    anything. Without page_height a single page is returned that is exactly as tall as
+    its content, otherwise the elements are split over pages of that height. The
+    layers are colored with a theme of themes.json.
+    Returns a list of PosterPage records.
+    """
+    colors = theme_colors(theme)
+    
+    # The generated base shapes only depend on the cell size, so build them once. The
+    # layer color is applied as a fill override when they are rendered.
+    cell_base_shapes = {
+        name: factory(SHAPE_WIDTH, SHAPE_HEIGHT) for name, factory in BASE_SHAPE_FACTORIES.items()
+    }
+    
+    # Look shapes up by name; a shape pack is already a mapping and is not copied
+    if not isinstance(all_shapes, Mapping):
+        all_shapes = {shape['name']: shape for shape in all_shapes}
+    shapes_by_name = ChainMap(cell_base_shapes, all_shapes)
+    
+    min_page_height = MARGIN + TITLE_HEIGHT + LAYER_TITLE_HEIGHT + ROW_HEIGHT + MARGIN
+    if page_height is not None and page_height < min_page_height:
+        raise ValueError(f"Page height must be at least {min_page_height} to fit one row of elements")
     
-    # Define poster dimensions and layout parameters
-    poster_width = 1400
-    poster_height = 2400  # Increased from 1800 to 2400 to ensure all elements are visible
-    margin = 50
-    title_height = 80
-    layer_title_height = 40
-    shape_width = 200
-    shape_height = 80
-    shapes_per_row = 6
-    row_height = 120
-    
-    # Start building the SVG content
-    svg_content = [
-        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
-        f'<svg width="{poster_width}" height="{poster_height}" xmlns="http://www.w3.org/2000/svg">',
-        # Add a white background
-        f'<rect width="{poster_width}" height="{poster_height}" fill="white"/>',
-        # Add poster title
-        f'<text x="{poster_width/2}" y="{margin + 40}" font-size="32" font-weight="bold" text-anchor="middle">ArchiMate Element Shapes</text>'
+    pages = []
+    items = [
+        PosterText(POSTER_WIDTH / 2, MARGIN + 40, 'ArchiMate Element Shapes', 32, 'font-weight="bold" text-anchor="middle"'),
     ]
     
     # Current y position for layout
-    current_y = margin + title_height
-    
-    # Process each layer
-    for layer in layer_order:
-        if layer in elements_by_layer and elements_by_layer[layer]:
-            # Add layer title
-            svg_content.append(
-                f'<text x="{margin}" y="{current_y + 30}" font-size="24" font-weight="bold" font-family="Arial, Helvetica, sans-serif">{layer} Layer</text>'
-            )
-            current_y += layer_title_height
-            
-            # Process elements in this layer
-            elements = elements_by_layer[layer]
-            for i, element_info in enumerate(elements):
-                row = i // shapes_per_row
-                col = i % shapes_per_row
-                
-                x = margin + col * shape_width
-                y = current_y + row * row_height
-                
-                # Get the icon and base shapes
-                icon_name = element_info['icon']
-                base_name = element_info['base']
-                layer_color = element_info['layer_color']
-                
-                # If the base shape is one of our generated shapes, create it with the layer color
-                if base_name in ["rectangle", "rounded-rectangle", "chamfered-rectangle"]:
-                    if base_name == "rectangle":
-                        base_shape = create_rectangle_shape(shape_width, shape_height, fill=layer_color)
-                    elif base_name == "rounded-rectangle":
-                        base_shape = create_rounded_rectangle_shape(shape_width, shape_height, fill=layer_color)
-                    elif base_name == "chamfered-rectangle":
-                        base_shape = create_chamfered_rectangle_shape(shape_width, shape_height, fill=layer_color)
-                
-                # Render the base shape if it exists
-                if base_name in shapes_by_name:
-                    # Scale factor to fit within our grid
-                    scale_x = (shape_width * 0.8) / base_shape['width']
-                    scale_y = (shape_height * 0.6) / base_shape['height']
-                    scale = min(scale_x, scale_y)
-                    
-                    # Center the shape in its cell
-                    center_x = x + shape_width / 2 - (base_shape['width'] * scale) / 2
-                    center_y = y + shape_height / 2 - (base_shape['height'] * scale) / 2
-                    
-                    # Use the layer color for the base shape
-                    svg_content.append(render_shape(base_shape, center_x, center_y, scale, layer_color))
-                
-                # Render the icon shape if it exists and is different from the base
-                if icon_name != base_name and icon_name in shapes_by_name:
-                    icon_shape = shapes_by_name[icon_name]
-                    # Scale factor for the icon - make it smaller (10% of shape width/height)
-                    icon_scale_factor = 0.2
-                    icon_scale_x = (shape_width * icon_scale_factor) / icon_shape['width']
-                    icon_scale_y = (shape_height * icon_scale_factor) / icon_shape['height']
-                    icon_scale = min(icon_scale_x, icon_scale_y)
-                    
-                    # Calculate the scaled dimensions of the base shape
-                    scaled_base_width = base_shape['width'] * scale
-                    
-                    # Calculate the scaled dimensions of the icon
-                    scaled_icon_width = icon_shape['width'] * icon_scale
-                    
-                    # Define padding constants for x and y directions
-                    icon_padding_x = 5  # Padding from the right edge in pixels
-                    icon_padding_y = 5  # Padding from the top edge in pixels
-                    
-                    # First, render the base shape
-                    base_svg = render_shape(base_shape, 0, 0, scale, layer_color)
-                    
-                    # For the x-coordinate, position based on scaled base width and icon width
-                    # Place the icon at (scaled_base_width - scaled_icon_width - padding_x)
-                    icon_x_relative = scaled_base_width - scaled_icon_width - icon_padding_x
-                    
-                    # For the y-coordinate, position with a fixed padding from the top
-                    icon_y_relative = icon_padding_y
-                    
-                    # Render the icon at the calculated position
-                    icon_svg = render_shape(icon_shape, icon_x_relative, icon_y_relative, icon_scale, layer_color)
-                    
-                    # Create a combined SVG group
-                    combined_svg = f'<g transform="translate({center_x}, {center_y})">{base_svg}{icon_svg}</g>'
-                    
-                    # Add the combined SVG to the content
-                    svg_content.append(combined_svg)
-                
-                # Add element name as a separate text element outside of any groups
-                # Position it below the shape with enough padding to be visible
-                text_y = y + shape_height + 4
-                element_text = f'<text x="{x + shape_width/2}" y="{text_y}" font-size="12" font-weight="bold" text-anchor="middle" fill="black">{element_info["element"]}</text>'
-                svg_content.append(element_text)
+    current_y = MARGIN + TITLE_HEIGHT
+    
+    def layer_title(layer, y, continued=False):
+        text = f'{layer} Layer (continued)' if continued else f'{layer} Layer'
+        return PosterText(MARGIN, y + 30, text, 24, 'font-weight="bold" font-family="Arial, Helvetica, sans-serif"')
+    
+    for layer, elements in group_elements_by_layer(element_mapping, layer_mapping, colors):
+        # Start a new page if the layer title and its first row do not fit anymore
+        if page_height is not None and current_y + LAYER_TITLE_HEIGHT + ROW_HEIGHT > page_height - MARGIN:
+            pages.append(PosterPage(POSTER_WIDTH, page_height, items))
+            items = []
+            current_y = MARGIN
+        items.append(layer_title(layer, current_y))
+        current_y += LAYER_TITLE_HEIGHT
+        
+        for row_start in range(0, len(elements), SHAPES_PER_ROW):
+            # Continue the layer on a new page if the row does not fit anymore
+            if page_height is not None and current_y + ROW_HEIGHT > page_height - MARGIN:
+                pages.append(PosterPage(POSTER_WIDTH, page_height, items))
+                items = [layer_title(layer, MARGIN, continued=True)]
+                current_y = MARGIN + LAYER_TITLE_HEIGHT
             
-            # Update current_y for the next layer
-            rows_in_layer = (len(elements) + shapes_per_row - 1) // shapes_per_row
-            current_y += rows_in_layer * row_height + margin
+            for col, (element_info, layer_color) in enumerate(elements[row_start:row_start + SHAPES_PER_ROW]):
+                x = MARGIN + col * SHAPE_WIDTH
+                items.append(layout_cell(x, current_y, element_info, layer_color, shapes_by_name, cell_base_shapes))
+            current_y += ROW_HEIGHT
+        
+        # Leave a margin before the next layer
+        current_y += MARGIN
+    
+    pages.append(PosterPage(POSTER_WIDTH, page_height or current_y, items))
+    return pages
+
+def write_poster_page(out, page, use_symbols=True):
+    """
+    Second pass: stream the SVG document of a page to a text file object.
+    With use_symbols, every distinct shape geometry is defined once as a <symbol> and
+    placed with <use>, otherwise every shape is rendered inline.
+    """
+    library = SymbolLibrary() if use_symbols else None
+    place_shape = library.render_shape if use_symbols else render_shape
     
-    # Close the SVG
-    svg_content.append('</svg>')
+    out.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
+    out.write(f'<svg width="{page.width}" height="{page.height}" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">\n')
+    
+    if library is not None:
+        # Collect the symbols of the page so they are defined before they are used
+        for item in page.items:
+            if isinstance(item, PosterCell):
+                for shape, _, _, _, fill in item.placements:
+                    library.symbol_id(shape, fill is not None)
+        out.write(library.defs() + '\n')
+    
+    # Add a white background
+    out.write(f'<rect width="{page.width}" height="{page.height}" fill="white"/>\n')
+    
+    for item in page.items:
+        if isinstance(item, PosterText):
+            out.write(f'<text x="{item.x}" y="{item.y}" font-size="{item.font_size}" {item.attributes}>{escape(item.text)}</text>\n')
+            continue
+        
+        if item.placements:
+            out.write(''.join(place_shape(*placement) for placement in item.placements) + '\n')
+        
+        # Add element name as a separate text element outside of any groups
+        # Position it below the shape with enough padding to be visible
+        text_y = item.y + SHAPE_HEIGHT + 4
+        out.write(f'<text x="{item.x + SHAPE_WIDTH / 2}" y="{text_y}" font-size="12" font-weight="bold" text-anchor="middle" fill="black">{escape(item.label)}</text>\n')
+    
+    out.write('</svg>\n')
+
+def open_output(path):
+    """Open a poster file for writing text, gzip-compressed if it ends with .svgz."""
+    if path.endswith('.svgz'):
+        # A fixed mtime keeps the compressed output reproducible
+        return io.TextIOWrapper(gzip.GzipFile(path, 'wb', mtime=0), encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')
+
+def page_path(path, page_number):
+    """Return the file name of a tiled page, e.g. poster-002.svg."""
+    root, ext = os.path.splitext(path)
+    return f'{root}-{page_number:03d}{ext}'
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(
+        description='Generate a poster of all ArchiMate element shapes'
+    )
+    parser.add_argument(
+        '--input', '-i',
+        default=os.path.join(script_dir, 'all-shapes.json'),
+        help='Shape definitions JSON file or shape pack (default: all-shapes.json next to this script)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(script_dir, 'poster.svg'),
+        help='Output SVG file, gzip-compressed if it ends with .svgz (default: poster.svg next to this script)'
+    )
+    parser.add_argument(
+        '--inline',
+        action='store_true',
+        help='Render every shape inline instead of as <use> of a shared <symbol>'
+    )
+    parser.add_argument(
+        '--shape-records',
+        action='store_true',
+        help='Load the shapes as compact records of shape_records.py instead of dicts (JSON input only)'
+    )
+    parser.add_argument(
+        '--theme', '-t',
+        default=POSTER_THEME,
+        help=f'Theme of themes.json to color the layers with (default: {POSTER_THEME})'
+    )
+    parser.add_argument(
+        '--page-height',
+        type=int,
+        default=None,
+        help='Split the poster into pages of this height, written as <output>-001.svg, ... (default: one page sized to its content)'
+    )
+    parser.add_argument(
+        '--metrics-out',
+        default=None,
+        help='Write wall/CPU time per stage and per page, counts and output sizes to this JSON file (default: off)'
+    )
+    parser.add_argument(
+        '--profile',
+        default=None,
+        help='Write cProfile stats of the layout and rendering to this file (default: off)'
+    )
+    args = parser.parse_args()
+    if args.theme not in load_themes():
+        print(f"Error: Unknown theme '{args.theme}'")
+        return
+    if args.shape_records and is_shape_pack(args.input):
+        print("Error: --shape-records needs an all-shapes.json file, not a shape pack")
+        return
+    metrics = create_metrics('poster.py', args.metrics_out)
+
+    # Load the necessary data
+    with metrics.stage('load'):
+        element_mapping = load_json_file(os.path.join(script_dir, 'element-mapping.json'))
+        all_shapes = load_shapes(args.input) if args.shape_records else load_shape_library(args.input)
+        layer_mapping = load_json_file(os.path.join(script_dir, 'layer-mapping.json'))
     
-    # Write the SVG to a file
-    with open(os.path.join(script_dir, 'poster.svg'), 'w') as f:
-        f.write('\n'.join(svg_content))
+    with profiled(args.profile):
+        try:
+            with metrics.stage('layout'):
+                pages = layout_poster(element_mapping, all_shapes, layer_mapping, args.page_height, args.theme)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        
+        # Stream every page to its file
+        for page_number, page in enumerate(pages, start=1):
+            path = page_path(args.output, page_number) if args.page_height else args.output
+            item = metrics.item(os.path.basename(path))
+            with item.stage('write'):
+                with open_output(path) as out:
+                    write_poster_page(out, page, use_symbols=not args.inline)
+            size = os.path.getsize(path)
+            cells = [cell for cell in page.items if isinstance(cell, PosterCell)]
+            item.count('cells', len(cells))
+            item.count('placements', sum(len(cell.placements) for cell in cells))
+            item.count('output_bytes', size)
+            metrics.add_item(item)
+            print(f"Poster generated at {path} ({page.width}x{page.height}, {size} bytes)")
     
-    print(f"Poster generated at {os.path.join(script_dir, 'poster.svg')}")
+    if args.metrics_out:
+        metrics.write(args.metrics_out)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""
+Local HTTP render service for ArchiMate Open Exchange models.
+
+Pages that embed diagrams with confluence-embed.ts download and parse the whole model
+and render the view in the browser every time they are opened. This service loads
+every model once, renders views with the renderer of render_views.py and keeps the
+SVG documents in a bounded LRU cache, so a page only downloads the view it shows.
+It uses the standard library only and never accesses the network beyond its own
+socket.
+
+Models are identified by the first hex digits of the SHA-256 of their content, so
+the URL of a view changes whenever its model does:
+
+    GET  /model/<hash>/view/<id>.svg   A view by identifier or name; the query may set
+                                       width, height, font-family, font-size, theme,
+                                       colors, layer-fills and routing
+    GET  /theme/<name>.css             The stylesheet of a theme, for views rendered
+                                       with layer-fills=external
+    GET  /models                       The loaded models and their views
+    POST /models                       Load the Open Exchange XML in the request body
+    GET  /stats                        Cache, request and render counters
+
+The colors option is a JSON object of layer, background, stroke and text colors
+that replace those of the theme, like the data-custom-colors of confluence-embed.ts.
+Options the renderer of render_views.py cannot reproduce, such as orthogonal routing,
+are answered with 400 Bad Request, so clients can render those views themselves.
+
+Rendered documents are cached by model hash, view and render options. Their ETag is
+derived from the same key and from the renderer and shape data, so a conditional GET
+is answered with 304 Not Modified without rendering the view. Concurrent requests for
+a view that is not cached wait for a single render. Views are rendered in a pool of
+worker processes that load the shape data once.
+
+Usage:
+    python render_service.py [--model model.xml ...] [--port 8765] [--cache-size 64]
+"""
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import urllib.parse
+import xml.etree.ElementTree as ET
+
+from exchange_model import load_model
+from poster import load_json_file
+from render_views import (
+    DEFAULT_FONT_FAMILY,
+    DEFAULT_FONT_SIZE,
+    DEFAULT_HEIGHT,
+    DEFAULT_LAYER_FILLS,
+    DEFAULT_ROUTING,
+    DEFAULT_WIDTH,
+    SCRIPT_DIR,
+    SUPPORTED_ROUTINGS,
+    ViewRenderer,
+    view_references,
+)
+from theme import DEFAULT_THEME, LAYER_FILLS, load_themes, theme_stylesheet
+
+# Hex digits of the SHA-256 of a model that identify it
+MODEL_HASH_LENGTH = 16
+
+# Number of latency samples the percentiles are computed from
+LATENCY_SAMPLES = 1024
+
+STATUS_REASONS = {
+    200: 'OK',
+    201: 'Created',
+    204: 'No Content',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Content Too Large',
+    500: 'Internal Server Error',
+}
+
+# Themes of themes.json by name
+THEMES = load_themes()
+
+
+def one_of(values):
+    """Return a parser of render options that only accepts the given values."""
+    def parse(value):
+        if value not in values:
+            raise ValueError(f"Unknown value: {value}")
+        return value
+    return parse
+
+
+# Colors of the colors option: hex, named and rgb() colors
+COLOR_PATTERN = re.compile(r'#[0-9A-Fa-f]{3,8}|[A-Za-z]+|rgba?\([0-9.,%\s]+\)')
+
+
+def parse_colors(value):
+    """
+    Parse the colors option, a JSON object of theme colors by key, into sorted
+    (key, color) pairs.
+    """
+    try:
+        colors = json.loads(value)
+    except json.JSONDecodeError:
+        raise ValueError("colors is not valid JSON")
+    if not isinstance(colors, dict):
+        raise ValueError("colors is not a JSON object")
+    for key, color in colors.items():
+        if key not in THEMES[DEFAULT_THEME]:
+            raise ValueError(f"Unknown color: {key}")
+        if not isinstance(color, str) or not COLOR_PATTERN.fullmatch(color):
+            raise ValueError(f"Invalid color for {key}: {color}")
+    return tuple(sorted(colors.items()))
+
+
+def parse_routing(value):
+    """Accept the routings render_views.py implements, and reject the others as unsupported."""
+    if value not in SUPPORTED_ROUTINGS:
+        raise ValueError(f"Routing is not supported by this service: {value}")
+    return value
+
+
+# Render options that can be set in the query string, with their parser and default
+RENDER_OPTIONS = {
+    'width': ('width', int, DEFAULT_WIDTH),
+    'height': ('height', int, DEFAULT_HEIGHT),
+    'font-family': ('font_family', str, DEFAULT_FONT_FAMILY),
+    'font-size': ('font_size', int, DEFAULT_FONT_SIZE),
+    'theme': ('theme', one_of(THEMES), DEFAULT_THEME),
+    'colors': ('colors', parse_colors, ()),
+    'layer-fills': ('layer_fills', one_of(LAYER_FILLS), DEFAULT_LAYER_FILLS),
+    'routing': ('routing', parse_routing, DEFAULT_ROUTING),
+}
+
+
+def model_hash(data):
+    """Return the identifier of a model: the start of the SHA-256 of its content."""
+    return hashlib.sha256(data).hexdigest()[:MODEL_HASH_LENGTH]
+
+
+def renderer_fingerprint(shapes_dir=SCRIPT_DIR):
+    """
+    Return a digest of the renderer and the shape data it uses. It is part of every
+    ETag, so documents cached by clients are not reused after either changes.
+    """
+    digest = hashlib.sha256()
+    for path in (os.path.join(SCRIPT_DIR, 'render_views.py'),
+                 os.path.join(SCRIPT_DIR, 'theme.py'),
+                 os.path.join(SCRIPT_DIR, 'themes.json'),
+                 os.path.join(SCRIPT_DIR, 'font-metrics-data.json'),
+                 os.path.join(shapes_dir, 'all-shapes.json'),
+                 os.path.join(shapes_dir, 'element-mapping.json')):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def render_options(query):
+    """
+    Return the render options of a query string as a sorted tuple of (name, value)
+    pairs, so equal options give equal cache keys. Raises ValueError for bad values.
+    """
+    parameters = urllib.parse.parse_qs(query)
+    options = {}
+    for parameter, (name, parse, default) in RENDER_OPTIONS.items():
+        values = parameters.get(parameter)
+        value = parse(values[-1]) if values else default
+        if parse is int and not 0 < value <= 100000:
+            raise ValueError(f"{parameter} is out of range: {value}")
+        options[name] = value
+    return tuple(sorted(options.items()))
+
+
+# ===== Worker processes =====
+
+# Shape data of a worker process, loaded once by init_worker()
+_worker_shapes = None
+# Renderers of a worker process by render options
+_worker_renderers = {}
+
+
+def init_worker(shapes_dir):
+    """Load the shape data of a worker process."""
+    global _worker_shapes
+    _worker_shapes = (
+        load_json_file(os.path.join(shapes_dir, 'all-shapes.json')),
+        load_json_file(os.path.join(shapes_dir, 'element-mapping.json')),
+    )
+
+
+def render_svg(view, elements, relationships, options):
+    """Render a view in a worker process with the given render options."""
+    renderer = _worker_renderers.get(options)
+    if renderer is None:
+        renderer = ViewRenderer(*_worker_shapes, **dict(options))
+        _worker_renderers[options] = renderer
+    return renderer.render_view(view, elements, relationships)
+
+
+# ===== Cache and counters =====
+
+class SvgCache:
+    """LRU cache of rendered documents, bounded by the total size of the documents."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached (document, ETag) of a key and mark it recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, svg, etag):
+        """Cache a document, evicting the least recently used ones that no longer fit."""
+        data = svg.encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous[0])
+        self._entries[key] = (data, etag)
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+
+class LatencyStats:
+    """Count, mean and percentiles of durations, over the most recent samples."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._samples = collections.deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self._samples.append(ms)
+
+    def summary(self):
+        samples = sorted(self._samples)
+
+        def percentile(fraction):
+            return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 3) if samples else 0.0
+
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(self.max_ms, 3),
+        }
+
+
+# ===== HTTP =====
+
+class HttpError(Exception):
+    """An error that is answered with its status code and message."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class RenderService:
+    """The loaded models, the SVG cache and the HTTP handler of the service."""
+
+    def __init__(self, executor, cache_bytes, max_models, max_upload, shapes_dir=SCRIPT_DIR, verbose=False):
+        self.executor = executor
+        self.cache = SvgCache(cache_bytes)
+        self.max_models = max_models
+        self.max_upload = max_upload
+        self.fingerprint = renderer_fingerprint(shapes_dir)
+        self.verbose = verbose
+        # ExchangeModel by model hash, least recently used first
+        self.models = collections.OrderedDict()
+        # Future of every render in progress by cache key
+        self.pending = {}
+        self.counters = collections.Counter()
+        self.request_latency = LatencyStats()
+        self.render_latency = LatencyStats()
+
+    def add_model(self, data):
+        """Load a model from its XML content unless it is loaded already. Returns its hash."""
+        key = model_hash(data)
+        if key in self.models:
+            self.models.move_to_end(key)
+            return key
+        self.models[key] = load_model(io.BytesIO(data))
+        while len(self.models) > self.max_models:
+            self.models.popitem(last=False)
+        return key
+
+    def model_summary(self, key):
+        model = self.models[key]
+        return {
+            'hash': key,
+            'name': model.name,
+            'views': [{'id': view.id, 'name': view.name} for view in model.views.values()],
+        }
+
+    def stats(self):
+        lookups = self.counters['hits'] + self.counters['coalesced'] + self.counters['misses']
+        return {
+            'models': len(self.models),
+            'cache': {
+                'entries': len(self.cache),
+                'bytes': self.cache.size,
+                'max_bytes': self.cache.max_bytes,
+                'evictions': self.cache.evictions,
+                'hits': self.counters['hits'],
+                'coalesced': self.counters['coalesced'],
+                'misses': self.counters['misses'],
+                'hit_rate': round(self.counters['hits'] / lookups, 4) if lookups else 0.0,
+                'not_modified': self.counters['not_modified'],
+            },
+            'requests': {
+                'total': self.counters['requests'],
+                'errors': self.counters['errors'],
+                'latency': self.request_latency.summary(),
+            },
+            'renders': self.render_latency.summary(),
+        }
+
+    async def render_view(self, model_key, view_id, query, if_none_match):
+        """Return (status, document or None, ETag) for a view, rendering it on a cache miss."""
+        model = self.models.get(model_key)
+        if model is None:
+            raise HttpError(404, f"Unknown model: {model_key}")
+        self.models.move_to_end(model_key)
+        view = model.get_view(view_id)
+        if view is None:
+            raise HttpError(404, f"Unknown view: {view_id}")
+        try:
+            options = render_options(query)
+        except ValueError as e:
+            raise HttpError(400, f"Invalid render options: {e}")
+
+        key = (model_key, view.id, options)
+        etag = '"' + hashlib.sha256(repr((self.fingerprint, key)).encode('utf-8')).hexdigest()[:32] + '"'
+        if if_none_match and (if_none_match.strip() == '*' or etag in (tag.strip() for tag in if_none_match.split(','))):
+            self.counters['not_modified'] += 1
+            return 304, None, etag
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.counters['hits'] += 1
+            return 200, entry[0], etag
+
+        # Wait for a render of the same view that is already in progress
+        future = self.pending.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+            return 200, await asyncio.shield(future), etag
+
+        self.counters['misses'] += 1
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending[key] = future
+        try:
+            elements, relationships = view_references(model, view)
+            start = time.perf_counter()
+            svg = await loop.run_in_executor(self.executor, render_svg, view, elements, relationships, options)
+            self.render_latency.record((time.perf_counter() - start) * 1000)
+            self.cache.put(key, svg, etag)
+            data = svg.encode('utf-8')
+            future.set_result(data)
+            return 200, data, etag
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody may be waiting for the render; mark the exception as retrieved
+            future.exception()
+            raise
+        finally:
+            del self.pending[key]
+            if not future.done():
+                # This request was cancelled, as when its client went away; answer the
+                # requests that wait for its render instead of leaving them hanging
+                future.set_exception(HttpError(503, f"Render of view {view.id} was cancelled"))
+                future.exception()
+
+    async def dispatch(self, method, target, headers, body):
+        """Return (status, content type, body, extra headers) for a request."""
+        path, _, query = target.partition('?')
+        parts = [urllib.parse.unquote(part) for part in path.split('/')[1:]]
+
+        if method == 'OPTIONS':
+            return 204, None, b'', {}
+
+        if len(parts) == 4 and parts[0] == 'model' and parts[2] == 'view' and parts[3].endswith('.svg'):
+            if method not in ('GET', 'HEAD'):
+                raise HttpError(405, f"Method not allowed: {method}")
+            status, data, etag = await self.render_view(parts[1], parts[3][:-len('.svg')], query,
+                                                        headers.get('if-none-match'))
+            return status, 'image/svg+xml; charset=utf-8', data or b'', {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+        if parts == ['models']:
+            if method == 'POST':
+                loop = asyncio.get_running_loop()
+                try:
+                    # Parsing takes a while for large models, so it does not block other requests
+                    key = await loop.run_in_executor(None, self.add_model, body)
+                except ET.ParseError as e:
+                    raise HttpError(400, f"Invalid model XML: {e}")
+                return 201, 'application/json', json.dumps(self.model_summary(key)).encode('utf-8'), {}
+            if method in ('GET', 'HEAD'):
+                summaries = [self.model_summary(key) for key in self.models]
+                return 200, 'application/json', json.dumps(summaries).encode('utf-8'), {}
+            raise HttpError(405, f"Method not allowed: {method}")
+
+        if len(parts) == 2 and parts[0] == 'theme' and parts[1].endswith('.css') and method in ('GET', 'HEAD'):
+            colors = THEMES.get(parts[1][:-len('.css')])
+            if colors is None:
+                raise HttpError(404, f"Theme not found: {parts[1]}")
+            stylesheet = theme_stylesheet(colors, THEMES[DEFAULT_THEME]) + '\n'
+            return 200, 'text/css; charset=utf-8', stylesheet.encode('utf-8'), {}
+
+        if parts == ['stats'] and method in ('GET', 'HEAD'):
+            return 200, 'application/json', json.dumps(self.stats()).encode('utf-8'), {}
+
+        raise HttpError(404, f"Not found: {path}")
+
+    async def read_request(self, reader):
+        """Read a request. Returns (method, target, version, headers, body), or None at the end of the stream."""
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(400, 'Malformed request line')
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, separator, value = line.decode('latin-1').partition(':')
+            if not separator:
+                raise HttpError(400, 'Malformed header')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HttpError(400, 'Malformed Content-Length')
+        if length > self.max_upload:
+            raise HttpError(413, f"Request body is larger than {self.max_upload} bytes")
+        body = await reader.readexactly(length) if length > 0 else b''
+        return method, target, version, headers, body
+
+    def write_response(self, writer, method, status, content_type, body, extra_headers, keep_alive):
+        headers = {
+            'Content-Length': str(len(body)),
+            'Connection': 'keep-alive' if keep_alive else 'close',
+            # Pages on other hosts embed the views
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': 'GET, HEAD, POST, OPTIONS',
+            'Access-Control-Allow-Headers': 'Content-Type, If-None-Match',
+            'Access-Control-Expose-Headers': 'ETag',
+        }
+        if content_type and status != 304:
+            headers['Content-Type'] = content_type
+        headers.update(extra_headers)
+        if status == 304:
+            del headers['Content-Length']
+        head = f"HTTP/1.1 {status} {STATUS_REASONS.get(status, '')}\r\n"
+        head += ''.join(f"{name}: {value}\r\n" for name, value in headers.items()) + '\r\n'
+        writer.write(head.encode('latin-1'))
+        if method != 'HEAD' and status not in (204, 304):
+            writer.write(body)
+
+    async def handle_connection(self, reader, writer):
+        """Serve the requests of a connection until the client closes it."""
+        try:
+            while True:
+                start = time.perf_counter()
+                request = None
+                method = 'GET'
+                keep_alive = True
+                try:
+                    request = await self.read_request(reader)
+                    if request is None:
+                        break
+                    method, target, version, headers, body = request
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+                    status, content_type, body, extra_headers = await self.dispatch(method, target, headers, body)
+                except HttpError as e:
+                    status, content_type, body, extra_headers = e.status, 'text/plain; charset=utf-8', str(e).encode('utf-8'), {}
+                    # The rest of a malformed request cannot be told apart from the next one
+                    keep_alive = keep_alive and e.status not in (400, 413)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:  # Answer the request and keep serving the others
+                    status, content_type, body, extra_headers = 500, 'text/plain; charset=utf-8', str(e).encode('utf-8'), {}
+                if status >= 500:
+                    self.counters['errors'] += 1
+                self.counters['requests'] += 1
+                self.write_response(writer, method, status, content_type, body, extra_headers, keep_alive)
+                await writer.drain()
+                elapsed = (time.perf_counter() - start) * 1000
+                self.request_latency.record(elapsed)
+                if self.verbose:
+                    print(f"{status} {method} {request[1] if request else ''} {elapsed:.2f} ms")
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service, host, port):
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving on http://{address[0]}:{address[1]}/")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve the views of ArchiMate Open Exchange models as SVG documents'
+    )
+    parser.add_argument(
+        '--model', '-m',
+        action='append',
+        default=[],
+        help='Open Exchange XML file to load at startup; can be repeated'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', '-p', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument(
+        '--cache-size', '-c',
+        type=int,
+        default=64,
+        help='Size of the SVG cache in MB (default: 64)'
+    )
+    parser.add_argument(
+        '--max-models',
+        type=int,
+        default=16,
+        help='Number of models kept loaded; the least recently used is dropped (default: 16)'
+    )
+    parser.add_argument(
+        '--max-upload',
+        type=int,
+        default=64,
+        help='Largest model that can be posted to /models in MB (default: 64)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help='Number of render worker processes (default: number of CPUs, at most 4)'
+    )
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log every request with its latency')
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return
+    if args.max_models < max(1, len(args.model)):
+        print("Error: --max-models must be at least 1 and the number of --model files")
+        return
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=args.jobs, initializer=init_worker, initargs=(SCRIPT_DIR,)
+    )
+    service = RenderService(executor, args.cache_size * 1024 * 1024, args.max_models,
+                            args.max_upload * 1024 * 1024, verbose=args.verbose)
+    for path in args.model:
+        try:
+            with open(path, 'rb') as f:
+                key = service.add_model(f.read())
+        except (OSError, ET.ParseError) as e:
+            print(f"Error: Could not load '{path}': {e}")
+            return
+        model = service.models[key]
+        print(f"{key}  {path} ({len(model.views)} views)")
+
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    main()
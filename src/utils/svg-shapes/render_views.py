@@ -0,0 +1,909 @@
+#!/usr/bin/env python3
+"""
+Batch renderer for the views of an ArchiMate Open Exchange model.
+
+This is the Python counterpart of the render-all command of cli.ts. It renders every
+view the way ArchiMateRenderer.renderView() does: element shapes with the icons from
+all-shapes.json mapped through element-mapping.json, wrapped labels, and connections
+clipped to the element bounds with their arrow heads and line styles.
+
+Views are distributed over a pool of worker processes. Every worker loads the shape
+data once when it starts and then only receives the views it renders, together with
+the elements and relationships they refer to.
+
+Layer colors come from a theme of themes.json. They are baked into the shapes, or with
+--layer-fills classes or external, set by the layer classes of theme.py. Labels are
+measured with the tables of font-metrics-data.json, like text-wrapper.ts measures them.
+
+Connections are drawn along their bendpoints only: the orthogonal routing of
+connection-router.ts is not implemented, so --routing only offers direct instead of
+rendering orthogonal routes differently. parity.py checks that both renderers give the same
+documents for the options render_views.py supports.
+"""
+
+import argparse
+import concurrent.futures
+import math
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+from containment import ContainmentIndex
+from exchange_model import load_model
+from poster import create_svg_element, create_svg_path, load_json_file, render_shape
+from shape_records import load_shapes
+from theme import (
+    DEFAULT_THEME,
+    LAYER_FILL,
+    LAYER_FILLS,
+    element_layer,
+    layer_class,
+    layer_color,
+    load_themes,
+    theme_stylesheet,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Renderer defaults, as in ArchiMateRenderer and the render-all command
+DEFAULT_WIDTH = 1200
+DEFAULT_HEIGHT = 800
+DEFAULT_FONT_FAMILY = 'Arial, sans-serif'
+DEFAULT_FONT_SIZE = 12
+DEFAULT_LAYER_FILLS = 'inline'
+
+# Routings of the routing option of ArchiMateRenderer that are implemented here
+SUPPORTED_ROUTINGS = ('direct',)
+DEFAULT_ROUTING = 'direct'
+
+# Icon placement, as in icon-renderer.ts
+ICON_PADDING = 5
+ICON_SIZE = 15
+MIN_SHAPE_SIZE_FOR_ICON = 10
+
+# Label layout, as in text-wrapper.ts
+LINE_HEIGHT = 1.2
+TEXT_TOP_PADDING = 3
+TEXT_SIDE_PADDING = 5
+
+# Arrow head sizes, as in arrow-heads.ts
+ARROW_HEAD_SIZE = 10
+DIAMOND_SIZE = 15
+CIRCLE_SIZE = 6
+
+XML_ESCAPES = {'"': '&quot;', "'": '&apos;'}
+
+
+def js_number(value):
+    """Format a number the way JavaScript template literals do (60.0 becomes 60)."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def escape_xml(text):
+    """Escape text like escapeXml() in text-wrapper.ts."""
+    return escape(text, XML_ESCAPES) if text else ''
+
+
+def sanitize_filename(name):
+    """Turn a view name into a file name like sanitizeFilename() in cli.ts."""
+    return re.sub(r'[^a-z0-9]', '_', name, flags=re.IGNORECASE).lower()
+
+
+def element_type_name(element_type):
+    """Convert an element type to its element-mapping.json name (BusinessActor -> Business Actor)."""
+    name = re.sub(r'([a-z])([A-Z])', r'\1 \2', element_type)
+    return re.sub(r'([A-Z])([A-Z][a-z])', r'\1 \2', name)
+
+
+# ===== Labels =====
+
+FONT_METRICS_PATH = os.path.join(SCRIPT_DIR, 'font-metrics-data.json')
+
+# Tables of font-metrics-data.json keyed by the lowercase family name, read on first use
+_font_metrics = None
+# Font tables keyed by the font-family value they were resolved for, as in text-wrapper.ts
+_font_tables = {}
+
+
+class FontTable:
+    """The advance widths and kerning pairs of a font, as getFontTable() in text-wrapper.ts builds them."""
+
+    def __init__(self, metrics):
+        self.units_per_em = metrics['unitsPerEm']
+        self.missing_advance = metrics['missingAdvance']
+        self.advances = {}
+        for first, *widths in metrics['advances']:
+            for index, width in enumerate(widths):
+                self.advances[first + index] = width
+        self.kerning = metrics['kerning']
+        self.space_width = self.advances.get(32, self.missing_advance)
+        self.word_widths = {}
+
+    def char_width(self, previous, char):
+        """Return the advance of a character plus the kerning after the previous one, in font units."""
+        width = self.advances.get(ord(char), self.missing_advance)
+        if previous:
+            width += self.kerning.get(previous + char, 0)
+        return width
+
+    def word_width(self, word):
+        """Return the width of a word in font units."""
+        width = self.word_widths.get(word)
+        if width is None:
+            width = sum(self.char_width(word[i - 1] if i else '', char) for i, char in enumerate(word))
+            self.word_widths[word] = width
+        return width
+
+
+def font_table(font_family):
+    """Return the table of the first family in a CSS font-family list that has metrics, or None."""
+    global _font_metrics
+    if font_family in _font_tables:
+        return _font_tables[font_family]
+    if _font_metrics is None:
+        _font_metrics = load_json_file(FONT_METRICS_PATH) if os.path.isfile(FONT_METRICS_PATH) else {}
+    table = None
+    for family in font_family.split(','):
+        metrics = _font_metrics.get(re.sub(r'^["\']|["\']$', '', family.strip()).lower())
+        if metrics:
+            table = FontTable(metrics)
+            break
+    _font_tables[font_family] = table
+    return table
+
+
+class TextMeasure:
+    """
+    Measures text in one font at one size like createTextMeasure() in text-wrapper.ts:
+    with the tables of font-metrics-data.json, or with characters estimated to be 0.6
+    times as wide as the font size if the font has no metrics.
+    """
+
+    def __init__(self, font_family, font_size):
+        self.table = font_table(font_family)
+        if self.table:
+            self.scale = font_size / self.table.units_per_em
+        else:
+            self.char_width = font_size * 0.6
+
+    def width(self, text):
+        """Return the width of a line in pixels."""
+        if not self.table:
+            return len(text) * self.char_width
+        words = text.split(' ')
+        width = sum(self.table.word_width(word) for word in words) + self.table.space_width * (len(words) - 1)
+        return width * self.scale
+
+    def fitting_length(self, word, max_width):
+        """Return the number of leading characters of a word that fit in max_width, at least 1."""
+        if not self.table:
+            return max(1, math.floor(max_width / self.char_width))
+        width = 0
+        length = 0
+        for i, char in enumerate(word):
+            width += self.table.char_width(word[i - 1] if i else '', char)
+            if width * self.scale > max_width:
+                break
+            length += 1
+        return max(1, length)
+
+
+def wrap_text(text, max_width, font_size, font_family=DEFAULT_FONT_FAMILY):
+    """Break a label into lines that fit max_width, splitting words that are too long."""
+    if not text or not text.strip():
+        return []
+
+    measure = TextMeasure(font_family, font_size)
+    lines = []
+    current_line = ''
+
+    for word in re.split(r'\s+', text):
+        test_line = f'{current_line} {word}' if current_line else word
+        if measure.width(test_line) <= max_width:
+            current_line = test_line
+            continue
+
+        if current_line:
+            lines.append(current_line)
+
+        if measure.width(word) > max_width:
+            while word:
+                length = measure.fitting_length(word, max_width)
+                lines.append(word[:length])
+                word = word[length:]
+            current_line = ''
+        else:
+            current_line = word
+
+    if current_line:
+        lines.append(current_line)
+    return lines
+
+
+def wrapped_text(x, y, text, max_width, max_height, style, dominant_baseline='hanging'):
+    """Render a label as a <text> with one <tspan> per line, like generateWrappedText()."""
+    font_size = style['fontSize']
+    lines = wrap_text(text, max_width, font_size, style['fontFamily'])
+    if not lines:
+        return ''
+
+    line_height = font_size * LINE_HEIGHT
+    if style.get('isCompound'):
+        # Compound elements keep their label at the top, clear of their children
+        text_y = y + TEXT_TOP_PADDING
+    elif max_height:
+        text_y = y + max_height / 2 - len(lines) * line_height / 2
+    else:
+        text_y = y
+
+    tx = js_number(x)
+    tspans = ''.join(
+        f'<tspan x="{tx}" dy="{js_number(line_height) if i else 0}">{escape_xml(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    return (
+        f'<text x="{tx}" y="{js_number(text_y)}" font-family="{style["fontFamily"]}" '
+        f'font-size="{font_size}" text-anchor="middle" dominant-baseline="{dominant_baseline}" '
+        f'fill="{style["textColor"]}">{tspans}</text>'
+    )
+
+
+# ===== Base shapes =====
+# Every base shape returns its content relative to the top-left corner of the element.
+
+def _label(width, height, label, style):
+    """Label of a box-shaped element, centered or at the top for compound elements."""
+    return wrapped_text(width / 2, 0, label, width - 2 * TEXT_SIDE_PADDING, height, style)
+
+
+def _box_attributes(style):
+    return f'fill="{style["fillColor"]}" stroke="{style["strokeColor"]}" stroke-width="1" opacity="{style.get("opacity", 1)}"'
+
+
+def rectangle_shape(width, height, label, style, corner_radius=0):
+    """Rectangle, as in rectangle-shapes.ts."""
+    return (
+        f'<rect width="{width}" height="{height}" rx="{corner_radius}" ry="{corner_radius}" {_box_attributes(style)} />'
+        + _label(width, height, label, style)
+    )
+
+
+def rounded_rectangle_shape(width, height, label, style):
+    """Rounded rectangle, as in rounded-rectangle-shapes.ts."""
+    return rectangle_shape(width, height, label, style, corner_radius=style.get('cornerRadius', 10))
+
+
+def chamfered_rectangle_shape(width, height, label, style):
+    """Rectangle with cut corners, as in chamfered-rectangle-shapes.ts."""
+    c = style.get('chamferSize', 10)
+    d = (
+        f'M {c},0 L {width - c},0 L {width},{c} L {width},{height - c} '
+        f'L {width - c},{height} L {c},{height} L 0,{height - c} L 0,{c} Z'
+    )
+    return f'<path d="{d}" {_box_attributes(style)} />' + _label(width, height, label, style)
+
+
+def circle_shape(width, height, label, style):
+    """Circle, as in circle-shapes.ts."""
+    cx = js_number(width / 2)
+    cy = js_number(height / 2)
+    return (
+        f'<circle cx="{cx}" cy="{cy}" r="{js_number(min(width, height) / 2)}" {_box_attributes(style)} />'
+        + wrapped_text(width / 2, height / 2, label, width - 2 * TEXT_SIDE_PADDING, height, style, 'middle')
+    )
+
+
+BASE_SHAPES = {
+    'rectangle': rectangle_shape,
+    'rounded-rectangle': rounded_rectangle_shape,
+    'chamfered-rectangle': chamfered_rectangle_shape,
+    'circle': circle_shape,
+}
+
+
+# ===== Line styles and arrow heads =====
+
+def line_path(d, style, dash_array=None):
+    """The path of a connection, solid or with a dash pattern."""
+    return create_svg_element('path', {
+        'd': d,
+        'fill': 'none',
+        'stroke': style['strokeColor'],
+        'stroke-width': style.get('strokeWidth', 1),
+        'stroke-dasharray': dash_array,
+    })
+
+
+def solid_line(d, style):
+    return line_path(d, style)
+
+
+def dashed_line(d, style):
+    return line_path(d, style, '5,5')
+
+
+def dotted_line(d, style):
+    return line_path(d, style, '1,3')
+
+
+def _rotated(x, y, angle, content):
+    return f'<g transform="translate({js_number(x)}, {js_number(y)}) rotate({js_number(angle)})">{content}</g>'
+
+
+def _triangle(x, y, angle, style, fill):
+    s = ARROW_HEAD_SIZE
+    points = f'0,0 -{s},-{js_number(s / 2)} -{s},{js_number(s / 2)}'
+    return _rotated(x, y, angle, create_svg_element(
+        'polygon', {'points': points, 'fill': fill, 'stroke': style['strokeColor'], 'stroke-width': 1}
+    ))
+
+
+def standard_arrow_head(x, y, angle, style):
+    return _triangle(x, y, angle, style, '#000000')
+
+
+def outline_arrow_head(x, y, angle, style):
+    return _triangle(x, y, angle, style, '#FFFFFF')
+
+
+def open_arrow_head(x, y, angle, style):
+    s = ARROW_HEAD_SIZE
+    d = f'M 0,0 L -{s},-{js_number(s / 2)} M 0,0 L -{s},{js_number(s / 2)}'
+    return _rotated(x, y, angle, create_svg_path(d, stroke=style['strokeColor'], stroke_width=1, fill='none'))
+
+
+def _diamond(x, y, angle, style, fill):
+    s = DIAMOND_SIZE
+    points = f'{s},0 {js_number(s / 2)},-{js_number(s / 3)} 0,0 {js_number(s / 2)},{js_number(s / 3)}'
+    return _rotated(x, y, angle, create_svg_element(
+        'polygon', {'points': points, 'fill': fill, 'stroke': style['strokeColor'], 'stroke-width': 1}
+    ))
+
+
+def diamond_arrow_head(x, y, angle, style):
+    return _diamond(x, y, angle, style, '#FFFFFF')
+
+
+def filled_diamond_arrow_head(x, y, angle, style):
+    return _diamond(x, y, angle, style, '#000000')
+
+
+def filled_circle_arrow_head(x, y, angle, style):
+    return create_svg_element('circle', {
+        'cx': js_number(x), 'cy': js_number(y), 'r': js_number(CIRCLE_SIZE / 2),
+        'fill': '#000000', 'stroke': style['strokeColor'], 'stroke-width': 1,
+    })
+
+
+# Line style and target arrow head of every relationship type, as in shape-templates.ts
+LINE_STYLES = {
+    'Realization': dotted_line,
+    'Access': dotted_line,
+    'Influence': dashed_line,
+    'Flow': dashed_line,
+}
+
+TARGET_ARROW_HEADS = {
+    'Composition': filled_diamond_arrow_head,
+    'Aggregation': diamond_arrow_head,
+    'Assignment': standard_arrow_head,
+    'Realization': outline_arrow_head,
+    'Serving': open_arrow_head,
+    'Access': open_arrow_head,
+    'Influence': open_arrow_head,
+    'Triggering': standard_arrow_head,
+    'Flow': standard_arrow_head,
+    'Specialization': outline_arrow_head,
+}
+
+
+def arrow_head_placement(rel_type, access_type=None):
+    """Return (source, target) flags telling which ends of a relationship get an arrow head."""
+    if rel_type in ('Composition', 'Aggregation'):
+        return True, False
+    if rel_type == 'Assignment':
+        return True, True
+    if rel_type == 'Association':
+        return False, False
+    if rel_type == 'Access':
+        if access_type == 'Read':
+            return True, False
+        if access_type == 'ReadWrite':
+            return True, True
+    return False, True
+
+
+def source_arrow_head(rel_type, access_type=None):
+    """Return the arrow head generator for the source end of a relationship, or None."""
+    if rel_type == 'Assignment':
+        return filled_circle_arrow_head
+    if rel_type == 'Access' and access_type in ('Read', 'ReadWrite'):
+        return open_arrow_head
+    if rel_type == 'Composition':
+        return filled_diamond_arrow_head
+    if rel_type == 'Aggregation':
+        return diamond_arrow_head
+    return None
+
+
+def source_arrow_head_offset(rel_type):
+    """Distance between the source end of a connection and its arrow head."""
+    if rel_type == 'Assignment':
+        # The filled circle sits just outside the source element
+        return CIRCLE_SIZE / 2 * 1.1
+    if rel_type in ('Composition', 'Aggregation'):
+        return DIAMOND_SIZE
+    return ARROW_HEAD_SIZE
+
+
+# ===== Connection geometry =====
+
+def segment_intersection(p1, p2, p3, p4):
+    """Return the intersection of the segments p1-p2 and p3-p4, or None."""
+    a1 = p2[1] - p1[1]
+    b1 = p1[0] - p2[0]
+    c1 = a1 * p1[0] + b1 * p1[1]
+    a2 = p4[1] - p3[1]
+    b2 = p3[0] - p4[0]
+    c2 = a2 * p3[0] + b2 * p3[1]
+
+    determinant = a1 * b2 - a2 * b1
+    if determinant == 0:
+        return None
+
+    x = (b2 * c1 - b1 * c2) / determinant
+    y = (a1 * c2 - a2 * c1) / determinant
+    for start, end in ((p1, p2), (p3, p4)):
+        if not (min(start[0], end[0]) <= x <= max(start[0], end[0])
+                and min(start[1], end[1]) <= y <= max(start[1], end[1])):
+            return None
+    return x, y
+
+
+def rectangle_intersection(start, end, node):
+    """Return the intersection of the segment start-end with the border of a node closest to start."""
+    left, top = node.x, node.y
+    right, bottom = node.x + node.width, node.y + node.height
+    edges = (
+        ((left, top), (right, top)),
+        ((right, top), (right, bottom)),
+        ((right, bottom), (left, bottom)),
+        ((left, bottom), (left, top)),
+    )
+
+    closest = None
+    min_distance = math.inf
+    for edge_start, edge_end in edges:
+        point = segment_intersection(start, end, edge_start, edge_end)
+        if point is not None:
+            distance = math.hypot(point[0] - start[0], point[1] - start[1])
+            if distance < min_distance:
+                min_distance = distance
+                closest = point
+    return closest
+
+
+def snap_to_edge(point, node):
+    """Move a point onto the nearest border of a node."""
+    x, y = point
+    right, bottom = node.x + node.width, node.y + node.height
+    distances = (abs(y - node.y), abs(x - right), abs(y - bottom), abs(x - node.x))
+    edge = distances.index(min(distances))
+    if edge == 0:
+        return max(node.x, min(right, x)), node.y
+    if edge == 1:
+        return right, max(node.y, min(bottom, y))
+    if edge == 2:
+        return max(node.x, min(right, x)), bottom
+    return node.x, max(node.y, min(bottom, y))
+
+
+def connection_points(source, target, bendpoints):
+    """
+    Return the points of a connection between two nodes, like
+    generateConnectionWithRectangles(): through the bendpoints if there are any,
+    otherwise straight between the facing sides of the nodes.
+    """
+    source_center = (source.x + source.width / 2, source.y + source.height / 2)
+    target_center = (target.x + target.width / 2, target.y + target.height / 2)
+
+    if bendpoints:
+        start = rectangle_intersection(source_center, bendpoints[0], source) or snap_to_edge(source_center, source)
+        end = rectangle_intersection(bendpoints[-1], target_center, target) or snap_to_edge(target_center, target)
+        points = [start, *bendpoints, end]
+    elif source.x < target.x + target.width and source.x + source.width > target.x:
+        # The nodes overlap horizontally, so connect them vertically
+        source_y = source.y if source.y > target.y else source.y + source.height
+        target_y = target.y if target.y > source.y else target.y + target.height
+        mid_x = (max(source.x, target.x) + min(source.x + source.width, target.x + target.width)) / 2
+        points = [(mid_x, source_y), (mid_x, target_y)]
+    elif source.y < target.y + target.height and source.y + source.height > target.y:
+        # The nodes overlap vertically, so connect them horizontally
+        source_x = source.x if source.x > target.x else source.x + source.width
+        target_x = target.x if target.x > source.x else target.x + target.width
+        mid_y = (max(source.y, target.y) + min(source.y + source.height, target.y + target.height)) / 2
+        points = [(source_x, mid_y), (target_x, mid_y)]
+    else:
+        points = [
+            rectangle_intersection(source_center, target_center, source) or source_center,
+            rectangle_intersection(source_center, target_center, target) or target_center,
+        ]
+
+    # Remove duplicate adjacent points
+    return [p for i, p in enumerate(points) if i == 0 or p != points[i - 1]]
+
+
+def path_data(points):
+    return 'M ' + ' L '.join(f'{js_number(x)} {js_number(y)}' for x, y in points)
+
+
+def render_connection(source, target, relationship, bendpoints, style):
+    """Render a relationship between two view nodes with its arrow heads and label."""
+    rel_type = relationship.type
+    access_type = relationship.access_type
+    points = connection_points(source, target, bendpoints)
+
+    # The label goes at the middle of the path
+    mid = len(points) // 2
+    if len(points) % 2 == 0:
+        label_x = (points[mid - 1][0] + points[mid][0]) / 2
+        label_y = (points[mid - 1][1] + points[mid][1]) / 2
+    else:
+        label_x, label_y = points[mid]
+
+    draw_source, draw_target = arrow_head_placement(rel_type, access_type)
+    if len(points) < 2:
+        # A connection without length has no direction to draw arrow heads in
+        draw_source = draw_target = False
+
+    parts = []
+    if draw_source:
+        (x1, y1), (x2, y2) = points[0], points[1]
+        dx, dy = x2 - x1, y2 - y1
+        distance = math.hypot(dx, dy)
+        offset = source_arrow_head_offset(rel_type)
+        source_x = x1 + dx / distance * offset
+        source_y = y1 + dy / distance * offset
+        if rel_type != 'Assignment':
+            # Start the line at the arrow head rather than inside it
+            points[0] = (source_x, source_y)
+        generator = source_arrow_head(rel_type, access_type)
+        if generator is not None:
+            parts.append(generator(source_x, source_y, math.degrees(math.atan2(dy, dx)) + 180, style))
+
+    if draw_target:
+        (x1, y1), (x2, y2) = points[-2], points[-1]
+        generator = TARGET_ARROW_HEADS.get(rel_type)
+        if generator is not None:
+            parts.append(generator(x2, y2, math.degrees(math.atan2(y2 - y1, x2 - x1)), style))
+
+    line = LINE_STYLES.get(rel_type, solid_line)(path_data(points), style)
+    label = ''
+    if relationship.name:
+        label = (
+            f'<text x="{js_number(label_x)}" y="{js_number(label_y - 5)}" font-family="{style["fontFamily"]}" '
+            f'font-size="{style["fontSize"]}" text-anchor="middle" fill="{style["textColor"]}">'
+            f'{escape_xml(relationship.name)}</text>'
+        )
+    return f'<g>{line}{"".join(parts)}{label}</g>'
+
+
+# ===== Views =====
+
+def compound_node_refs(nodes):
+    """Return the element references of nodes that wholly contain another node."""
+    return ContainmentIndex(nodes).compound_refs
+
+
+def style_overrides(style):
+    """Return the style properties set on a view node or connection."""
+    if style is None:
+        return {}
+    overrides = {
+        'fillColor': style.fill_color,
+        'strokeColor': style.stroke_color,
+        'strokeWidth': style.stroke_width,
+        'fontFamily': style.font_family,
+        'fontSize': style.font_size,
+    }
+    return {key: value for key, value in overrides.items() if value is not None}
+
+
+class ViewRenderer:
+    """Renders views with the shapes of all-shapes.json and element-mapping.json."""
+
+    def __init__(self, all_shapes, element_mapping, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+                 font_family=DEFAULT_FONT_FAMILY, font_size=DEFAULT_FONT_SIZE, theme=DEFAULT_THEME,
+                 layer_fills=DEFAULT_LAYER_FILLS, routing=DEFAULT_ROUTING, colors=()):
+        if routing not in SUPPORTED_ROUTINGS:
+            raise ValueError(f"Unsupported routing: {routing}")
+        self.shapes_by_name = {shape['name']: shape for shape in all_shapes}
+        self.mapping_by_name = {item['element']: item for item in element_mapping}
+        self.width = width
+        self.height = height
+        self.font_family = font_family
+        self.font_size = font_size
+        themes = load_themes()
+        if theme not in themes:
+            raise ValueError(f"Unknown theme: {theme}")
+        if layer_fills not in LAYER_FILLS:
+            raise ValueError(f"Unknown layer fills: {layer_fills}")
+        self.defaults = themes[DEFAULT_THEME]
+        # Colors of the theme, with the (key, color) pairs of colors replacing theirs
+        self.colors = {**themes[theme], **dict(colors)}
+        self.layer_fills = layer_fills
+        # (base shape function, icon shape or None) for every element type seen so far
+        self.element_shapes = {}
+        # Rendered icons keyed by icon name and fill color
+        self.icon_cache = {}
+
+    def element_shape(self, element_type):
+        """Return the base shape function and icon shape of an element type."""
+        shape = self.element_shapes.get(element_type)
+        if shape is None:
+            mapping = self.mapping_by_name.get(element_type_name(element_type))
+            if mapping is None or mapping['base'] not in BASE_SHAPES:
+                shape = (rectangle_shape, None)
+            else:
+                icon = self.shapes_by_name.get(mapping['icon']) if mapping['icon'] != mapping['base'] else None
+                shape = (BASE_SHAPES[mapping['base']], icon)
+            self.element_shapes[element_type] = shape
+        return shape
+
+    def render_icon(self, icon, width, fill):
+        """Render an icon in the top-right corner of an element of the given width."""
+        key = (icon['name'], width, fill)
+        svg = self.icon_cache.get(key)
+        if svg is None:
+            unit = icon.get('unitTransform')
+            if unit is not None:
+                # Fit the geometric bounds of the icon, as getIconPlacement() does
+                scale = ICON_SIZE * unit['scale']
+                x = width - (ICON_PADDING + ICON_SIZE * (unit['width'] - unit['x']))
+                y = ICON_PADDING + ICON_SIZE * unit['y']
+            else:
+                scale = ICON_SIZE / max(icon['width'], icon['height'])
+                x = width - (ICON_PADDING + icon['width'] * scale)
+                y = ICON_PADDING
+            svg = render_shape(icon, js_number(x), js_number(y), js_number(scale), fill)
+            self.icon_cache[key] = svg
+        return svg
+
+    def color(self, key):
+        """Return a color of the theme, falling back to the default theme."""
+        return self.colors.get(key) or self.defaults[key]
+
+    def render_node(self, node, element, is_compound):
+        """Render a view node as its element shape."""
+        layer = element_layer(element.type)
+        layer_classes = self.layer_fills != 'inline'
+        style = {
+            'fillColor': LAYER_FILL if layer_classes else layer_color(self.colors, layer, self.defaults),
+            'strokeColor': self.color('stroke'),
+            'textColor': self.color('text'),
+            'fontSize': self.font_size,
+            'fontFamily': self.font_family,
+            **style_overrides(node.style),
+        }
+        if is_compound:
+            style['isCompound'] = True
+
+        base_shape, icon = self.element_shape(element.type)
+        if element.type == 'OrJunction':
+            style['fillColor'] = '#FFFFFF'
+
+        content = base_shape(node.width, node.height, element.name or '', style)
+        if icon is not None and node.width >= MIN_SHAPE_SIZE_FOR_ICON and node.height >= MIN_SHAPE_SIZE_FOR_ICON:
+            content += self.render_icon(icon, node.width, style['fillColor'])
+        svg = f'<g transform="translate({node.x}, {node.y})">{content}</g>'
+        return f'<g class="{layer_class(layer)}">{svg}</g>' if layer_classes else svg
+
+    def render_view(self, view, elements, relationships):
+        """Render a view to an SVG document, given the elements and relationships it refers to."""
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}">',
+        ]
+        if self.layer_fills == 'classes':
+            parts.append(f'<style>\n{theme_stylesheet(self.colors, self.defaults)}\n</style>')
+        parts.append(f'<rect width="100%" height="100%" fill="{self.color("background")}"/>')
+
+        compound = compound_node_refs(view.nodes)
+        for node in view.nodes:
+            element = elements.get(node.element_ref)
+            if element is not None:
+                parts.append(self.render_node(node, element, node.element_ref in compound))
+
+        # Connections attach to the first node of their source and target elements
+        nodes_by_ref = {}
+        for node in view.nodes:
+            nodes_by_ref.setdefault(node.element_ref, node)
+
+        for connection in view.connections:
+            relationship = relationships.get(connection.relationship_ref)
+            if relationship is None:
+                continue
+            source = nodes_by_ref.get(relationship.source)
+            target = nodes_by_ref.get(relationship.target)
+            if source is None or target is None:
+                continue
+            style = {
+                'strokeColor': self.color('stroke'),
+                'textColor': self.color('text'),
+                'fontSize': self.font_size - 2,
+                'fontFamily': self.font_family,
+                **style_overrides(connection.style),
+            }
+            parts.append(render_connection(source, target, relationship, connection.bendpoints or [], style))
+
+        parts.append('</svg>')
+        return '\n'.join(parts)
+
+
+# ===== Process pool =====
+
+# The renderer of a worker process, created once by init_worker()
+_worker_renderer = None
+
+
+def init_worker(shapes_dir, options, shape_records=False):
+    """Load the shape data of a worker process, as dicts or as shape records."""
+    global _worker_renderer
+    shapes_path = os.path.join(shapes_dir, 'all-shapes.json')
+    _worker_renderer = ViewRenderer(
+        load_shapes(shapes_path) if shape_records else load_json_file(shapes_path),
+        load_json_file(os.path.join(shapes_dir, 'element-mapping.json')),
+        **options,
+    )
+
+
+def render_task(task):
+    """
+    Render one view in a worker process and write it to its output file.
+    Returns (view, path, milliseconds, error message or None).
+    """
+    view, elements, relationships, path = task
+    start = time.perf_counter()
+    try:
+        svg = _worker_renderer.render_view(view, elements, relationships)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(svg)
+    except Exception as e:  # Report the failure and carry on with the other views
+        return view, path, (time.perf_counter() - start) * 1000, str(e)
+    return view, path, (time.perf_counter() - start) * 1000, None
+
+
+def view_references(model, view):
+    """Return the (elements, relationships) of a model that a view refers to, by identifier."""
+    elements = {}
+    for node in view.nodes:
+        element = model.elements.get(node.element_ref)
+        if element is not None:
+            elements[node.element_ref] = element
+    relationships = {}
+    for connection in view.connections:
+        relationship = model.relationships.get(connection.relationship_ref)
+        if relationship is not None:
+            relationships[connection.relationship_ref] = relationship
+    return elements, relationships
+
+
+def view_tasks(model, model_path, output_dir):
+    """Yield a render task per view with only the elements and relationships it refers to."""
+    base_name = os.path.splitext(os.path.basename(model_path))[0]
+    for view in model.views.values():
+        elements, relationships = view_references(model, view)
+        path = os.path.join(output_dir, f'{base_name}_{sanitize_filename(view.name or view.id)}.svg')
+        yield view, elements, relationships, path
+
+
+def render_all(tasks, jobs, options, shapes_dir=SCRIPT_DIR, shape_records=False):
+    """
+    Render the tasks with a pool of jobs worker processes, or in this process if jobs is 1.
+    With shape_records, the workers load the shapes as records of shape_records.py.
+    Yields the result of every task in order.
+    """
+    if jobs == 1:
+        init_worker(shapes_dir, options, shape_records)
+        yield from map(render_task, tasks)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(shapes_dir, options, shape_records)
+    ) as executor:
+        # Hand out views in small batches to limit the inter-process traffic
+        chunk_size = max(1, len(tasks) // (jobs * 8))
+        yield from executor.map(render_task, tasks, chunksize=chunk_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render all views of an ArchiMate Open Exchange model as SVG files'
+    )
+    parser.add_argument('model', help='Open Exchange XML file')
+    parser.add_argument(
+        '--output-dir', '-o',
+        default='./output',
+        help='Output directory for SVG files (default: ./output)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes (default: number of CPUs)'
+    )
+    parser.add_argument('--width', '-w', type=int, default=DEFAULT_WIDTH, help=f'SVG width in pixels (default: {DEFAULT_WIDTH})')
+    parser.add_argument('--height', '-H', type=int, default=DEFAULT_HEIGHT, help=f'SVG height in pixels (default: {DEFAULT_HEIGHT})')
+    parser.add_argument('--font-family', '-f', default=DEFAULT_FONT_FAMILY, help=f'Font family (default: {DEFAULT_FONT_FAMILY})')
+    parser.add_argument('--font-size', '-s', type=int, default=DEFAULT_FONT_SIZE, help=f'Font size in pixels (default: {DEFAULT_FONT_SIZE})')
+    parser.add_argument('--theme', '-t', default=DEFAULT_THEME, help=f'Theme of themes.json (default: {DEFAULT_THEME})')
+    parser.add_argument(
+        '--layer-fills', '-l',
+        choices=LAYER_FILLS,
+        default=DEFAULT_LAYER_FILLS,
+        help='Bake layer colors into the shapes, or set them with layer classes and an embedded '
+             f'or external theme stylesheet (default: {DEFAULT_LAYER_FILLS})'
+    )
+    parser.add_argument(
+        '--routing', '-r',
+        choices=SUPPORTED_ROUTINGS,
+        default=DEFAULT_ROUTING,
+        help='Routing of connections without bendpoints; only direct is supported, use the '
+             f'render-all command of cli.ts for orthogonal routing (default: {DEFAULT_ROUTING})'
+    )
+    parser.add_argument(
+        '--shape-records',
+        action='store_true',
+        help='Load the shapes as compact records of shape_records.py instead of dicts'
+    )
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return
+    if args.theme not in load_themes():
+        print(f"Error: Unknown theme '{args.theme}'")
+        return
+
+    start = time.perf_counter()
+    try:
+        model = load_model(args.model)
+    except (OSError, ET.ParseError) as e:
+        print(f"Error: Could not load '{args.model}': {e}")
+        return
+    if not model.views:
+        print("No views found in the model.")
+        return
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    tasks = list(view_tasks(model, args.model, args.output_dir))
+    options = {
+        'width': args.width,
+        'height': args.height,
+        'font_family': args.font_family,
+        'font_size': args.font_size,
+        'theme': args.theme,
+        'layer_fills': args.layer_fills,
+    }
+    jobs = min(args.jobs, len(tasks))
+    print(f"Rendering {len(tasks)} views with {jobs} worker{'s' if jobs > 1 else ''}...")
+
+    rendered = 0
+    for view, path, ms, error in render_all(tasks, jobs, options, shape_records=args.shape_records):
+        if error is not None:
+            print(f"  Error rendering view {view.id}: {error}")
+            continue
+        rendered += 1
+        print(f"  {ms:8.2f} ms  {path}")
+
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {rendered} of {len(tasks)} views to {args.output_dir} in {elapsed:.2f} s "
+          f"({rendered / elapsed:.1f} views/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+Binary shape pack: the shape definitions of all-shapes.json in a format that can be
+memory-mapped and queried without parsing the whole file.
+
+Loading all-shapes.json means parsing every shape and building a lookup table before
+the first one can be used. A pack is opened in constant time instead: ShapePack maps
+the file, reads its fixed-size header and finds shapes by binary search in a sorted
+name index. Shapes are decoded on first access only. shape-pack.ts decodes the same
+format from an ArrayBuffer for the TypeScript renderer.
+
+Layout (all numbers little-endian, offsets are absolute byte offsets):
+
+    header      HEADER, see below
+    strings     string_count + 1 uint32 offsets into the UTF-8 data that follows
+    styles      style_count uint32 offsets of the style records
+    index       shape_count (name string, shape record offset) uint32 pairs, sorted
+                by the UTF-8 bytes of the name
+    records     one shape record per shape, in library order
+    coords      the coordinates of all paths and rects as float32, or as float64 if
+                FLAG_FLOAT64 is set
+
+Shape names, element types, style keys and values, path templates and icon fragments
+are interned in the string table, and equal styles share one style record. A path is
+stored as a template (its command letters with a marker per coordinate, see
+PathData.format_template()) and a slice of the coordinate block. Coordinates are
+only written as float32 when every one of them reads back as the same shortest
+decimal; otherwise the whole block is written as float64. build_shape_pack()
+rejects shapes that a pack can not reproduce exactly, so a pack always reproduces
+the all-shapes.json it was built from.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+from path_data import PathData, fill_format_template
+
+MAGIC = b'ASPK'
+VERSION = 1
+
+# Flags of the header
+FLAG_FLOAT64 = 1
+
+# Flags of a shape record
+SHAPE_INT_WIDTH = 1
+SHAPE_INT_HEIGHT = 2
+SHAPE_BOUNDS = 4
+SHAPE_UNIT_TRANSFORM = 8
+SHAPE_FRAGMENT = 16
+
+# Tags of style values
+VALUE_STRING = 0
+VALUE_FLOAT = 1
+VALUE_INT = 2
+
+# Stands for "no string", e.g. the template of a rect or a null default fill
+NO_STRING = 0xFFFFFFFF
+
+# magic, version, flags, shape_count, string_count, style_count,
+# strings_offset, styles_offset, index_offset, coords_offset
+HEADER = struct.Struct('<4sHHIIIIIII')
+# name, flags, element_count, width, height
+SHAPE = struct.Struct('<IBxHdd')
+# type, style, template, first coordinate, coordinate count
+ELEMENT = struct.Struct('<IIIII')
+INDEX_ENTRY = struct.Struct('<II')
+STYLE_ENTRY = struct.Struct('<IB')
+BOUNDS = struct.Struct('<4d')
+UNIT_TRANSFORM = struct.Struct('<5d')
+FRAGMENT = struct.Struct('<II')
+UINT32 = struct.Struct('<I')
+UINT16 = struct.Struct('<H')
+FLOAT64 = struct.Struct('<d')
+
+# Keys of an element dict that are stored as geometry rather than as style
+RECT_KEYS = ('x', 'y', 'width', 'height')
+GEOMETRY_KEYS = frozenset(('type', 'd') + RECT_KEYS)
+BOUNDS_KEYS = ('x', 'y', 'width', 'height')
+UNIT_TRANSFORM_KEYS = ('scale', 'x', 'y', 'width', 'height')
+
+# Coordinate markers of a pack template and the %-format they stand for
+TEMPLATE_MARKERS = {'\x00': '%r\x00', '\x01': '%r\x01', '\x02': '%d\x02'}
+
+
+def short_float32(value):
+    """Return the shortest decimal that reads back as the float32 nearest to value."""
+    return float(f'{value:.7g}')
+
+
+class _Interner:
+    """Assigns consecutive ids to distinct values in the order they are first seen."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def __call__(self, value):
+        return self.ids.setdefault(value, len(self.ids))
+
+
+def _check_numbers(shape_name, entry, values, keys):
+    """Raise ValueError unless the values of keys are floats, which a pack stores exactly."""
+    if list(values) != list(keys):
+        raise ValueError(f"Unsupported {entry} of shape '{shape_name}': keys must be {', '.join(keys)}")
+    for key in keys:
+        if type(values[key]) is not float:
+            raise ValueError(f"Unsupported {entry} of shape '{shape_name}': '{key}' must be a float")
+
+
+def _check_shape(shape):
+    """
+    Raise ValueError for shapes that a pack can not reproduce exactly: decoding writes
+    the keys of shapes and elements in a fixed order and rect coordinates as floats,
+    and only knows path and rect elements.
+    """
+    name = shape.get('name')
+    optional = [key for key in ('bounds', 'unitTransform') if key in shape]
+    if list(shape) != ['name', 'width', 'height', 'elements'] + optional:
+        raise ValueError(f"Unsupported keys of shape '{name}': {', '.join(shape)}")
+    if not isinstance(name, str):
+        raise ValueError(f"Unsupported shape name: {name!r}")
+    for key in ('width', 'height'):
+        if type(shape[key]) not in (int, float):
+            raise ValueError(f"Unsupported {key} of shape '{name}': {shape[key]!r}")
+    if 'bounds' in shape:
+        _check_numbers(name, 'bounds', shape['bounds'], BOUNDS_KEYS)
+    if 'unitTransform' in shape:
+        _check_numbers(name, 'unitTransform', shape['unitTransform'], UNIT_TRANSFORM_KEYS)
+    for element in shape['elements']:
+        element_type = element.get('type')
+        geometry = [key for key in element if key in GEOMETRY_KEYS]
+        if element_type == 'rect':
+            if list(element)[:5] != geometry or geometry[1:] != list(RECT_KEYS):
+                raise ValueError(f"Unsupported rect of shape '{name}': type, x, y, width and height must come first")
+            _check_numbers(name, 'rect', {key: element[key] for key in RECT_KEYS}, RECT_KEYS)
+        elif element_type == 'path':
+            if list(element)[:2] != geometry or geometry != ['type', 'd'] or not isinstance(element['d'], str):
+                raise ValueError(f"Unsupported path of shape '{name}': type and d must come first")
+        else:
+            raise ValueError(f"Unsupported element type in shape '{name}': {element_type!r}")
+
+
+def build_shape_pack(shapes, icon_fragments=None):
+    """
+    Serialize shape dicts in the all-shapes.json schema into a pack. icon_fragments
+    maps shape names to the {'svg', 'defaultFill'} fragments of ts-file-gen.py.
+    Returns the pack as bytes. Raises ValueError for shapes that the pack would not
+    reproduce exactly, such as path numbers that are not written the way convert.py
+    writes them (e.g. "1e-7"), or element types other than path and rect.
+    """
+    icon_fragments = icon_fragments or {}
+    string_id = _Interner()
+    style_id = _Interner()
+    coords = []
+    records = []
+
+    for shape in shapes:
+        _check_shape(shape)
+        name_id = string_id(shape['name'])
+        flags = 0
+        if isinstance(shape['width'], int):
+            flags |= SHAPE_INT_WIDTH
+        if isinstance(shape['height'], int):
+            flags |= SHAPE_INT_HEIGHT
+        extra = bytearray()
+        if 'bounds' in shape:
+            flags |= SHAPE_BOUNDS
+            extra += BOUNDS.pack(*(shape['bounds'][key] for key in BOUNDS_KEYS))
+        if 'unitTransform' in shape:
+            flags |= SHAPE_UNIT_TRANSFORM
+            extra += UNIT_TRANSFORM.pack(*(shape['unitTransform'][key] for key in UNIT_TRANSFORM_KEYS))
+        fragment = icon_fragments.get(shape['name'])
+        if fragment is not None:
+            flags |= SHAPE_FRAGMENT
+            default_fill = fragment['defaultFill']
+            extra += FRAGMENT.pack(
+                string_id(fragment['svg']), NO_STRING if default_fill is None else string_id(default_fill)
+            )
+
+        elements = bytearray()
+        for element in shape['elements']:
+            style = []
+            for key, value in element.items():
+                if key in GEOMETRY_KEYS:
+                    continue
+                if isinstance(value, str):
+                    style.append((string_id(key), VALUE_STRING, string_id(value)))
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    style.append((string_id(key), VALUE_INT if isinstance(value, int) else VALUE_FLOAT, value))
+                else:
+                    raise ValueError(f"Unsupported value of '{key}' in shape '{shape['name']}': {value!r}")
+            start = len(coords)
+            if element['type'] == 'rect':
+                coords.extend(float(element[key]) for key in RECT_KEYS)
+                template = NO_STRING
+            else:
+                path = PathData.parse(element['d'])
+                format_template = path.format_template(None)
+                # Numbers are decoded as repr() writes them, and shape-pack.ts writes
+                # them the same way only for numbers without an exponent
+                if (fill_format_template(format_template, path.coords, None) != element['d']
+                        or 'e' in element['d']):
+                    raise ValueError(
+                        f"Unsupported path data in shape '{shape['name']}', not written as "
+                        f"convert.py writes it: {element['d'][:40]!r}"
+                    )
+                coords.extend(path.coords)
+                template = string_id(format_template.replace('%r', '').replace('%d', ''))
+            elements += ELEMENT.pack(
+                string_id(element['type']), style_id(tuple(style)), template, start, len(coords) - start
+            )
+
+        records.append((shape['name'], name_id, flags, len(shape['elements']), shape['width'], shape['height'],
+                        bytes(extra + elements)))
+
+    # float32 halves the coordinate block, but only if it loses nothing
+    packed = array('f', coords)
+    flags = 0
+    if any(short_float32(value) != original for value, original in zip(packed, coords)):
+        packed = array('d', coords)
+        flags |= FLAG_FLOAT64
+    if sys.byteorder == 'big':
+        packed.byteswap()
+
+    strings = [value.encode('utf-8') for value in string_id.ids]
+    styles = list(style_id.ids)
+
+    out = bytearray(HEADER.size)
+    strings_offset = len(out)
+    position = 0
+    for data in strings:
+        out += UINT32.pack(position)
+        position += len(data)
+    out += UINT32.pack(position)
+    for data in strings:
+        out += data
+
+    styles_offset = len(out)
+    out += bytes(UINT32.size * len(styles))
+    for number, style in enumerate(styles):
+        UINT32.pack_into(out, styles_offset + number * UINT32.size, len(out))
+        out += UINT16.pack(len(style))
+        for key, tag, value in style:
+            out += STYLE_ENTRY.pack(key, tag)
+            out += UINT32.pack(value) if tag == VALUE_STRING else FLOAT64.pack(value)
+
+    index_offset = len(out)
+    out += bytes(INDEX_ENTRY.size * len(records))
+    index = []
+    for name, name_id, shape_flags, element_count, width, height, body in records:
+        index.append((name.encode('utf-8'), name_id, len(out)))
+        out += SHAPE.pack(name_id, shape_flags, element_count, width, height)
+        out += body
+    index.sort()
+    for number, (_, name_id, offset) in enumerate(index):
+        INDEX_ENTRY.pack_into(out, index_offset + number * INDEX_ENTRY.size, name_id, offset)
+
+    # Aligned, so readers can view the block as a typed array without copying
+    out += bytes(-len(out) % 8)
+    coords_offset = len(out)
+    out += packed.tobytes()
+
+    HEADER.pack_into(out, 0, MAGIC, VERSION, flags, len(records), len(strings), len(styles),
+                     strings_offset, styles_offset, index_offset, coords_offset)
+    return bytes(out)
+
+
+class ShapePack(Mapping):
+    """
+    Read-only mapping from shape names to shape dicts, backed by a memory-mapped pack.
+    Shapes are decoded when they are first looked up and cached afterwards.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._data) < HEADER.size:
+            self.close()
+            raise ValueError(f"'{path}' is not a shape pack")
+        (magic, version, self._flags, self._shape_count, self._string_count, _,
+         self._strings_offset, self._styles_offset, self._index_offset,
+         self._coords_offset) = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a shape pack")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported shape pack version {version} in '{path}'")
+        self._string_data = self._strings_offset + (self._string_count + 1) * UINT32.size
+        self._strings = {}
+        self._styles = {}
+        self._templates = {}
+        self._shapes = {}
+
+    def close(self):
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _string_bytes(self, number):
+        start, end = struct.unpack_from('<II', self._data, self._strings_offset + number * UINT32.size)
+        return self._data[self._string_data + start:self._string_data + end]
+
+    def _string(self, number):
+        value = self._strings.get(number)
+        if value is None:
+            value = self._strings[number] = self._string_bytes(number).decode('utf-8')
+        return value
+
+    def _index_entry(self, position):
+        return INDEX_ENTRY.unpack_from(self._data, self._index_offset + position * INDEX_ENTRY.size)
+
+    def _find(self, name):
+        """Return the record offset of a shape by binary search in the name index, or None."""
+        key = name.encode('utf-8')
+        low, high = 0, self._shape_count
+        while low < high:
+            middle = (low + high) // 2
+            name_id, offset = self._index_entry(middle)
+            candidate = self._string_bytes(name_id)
+            if candidate == key:
+                return offset
+            if candidate < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _style(self, number):
+        style = self._styles.get(number)
+        if style is None:
+            offset = UINT32.unpack_from(self._data, self._styles_offset + number * UINT32.size)[0]
+            count = UINT16.unpack_from(self._data, offset)[0]
+            offset += UINT16.size
+            style = []
+            for _ in range(count):
+                key, tag = STYLE_ENTRY.unpack_from(self._data, offset)
+                offset += STYLE_ENTRY.size
+                if tag == VALUE_STRING:
+                    value = self._string(UINT32.unpack_from(self._data, offset)[0])
+                    offset += UINT32.size
+                else:
+                    value = FLOAT64.unpack_from(self._data, offset)[0]
+                    offset += FLOAT64.size
+                    if tag == VALUE_INT:
+                        value = int(value)
+                style.append((self._string(key), value))
+            style = self._styles[number] = tuple(style)
+        return style
+
+    def _template(self, number):
+        template = self._templates.get(number)
+        if template is None:
+            template = self._string(number)
+            for marker, placeholder in TEMPLATE_MARKERS.items():
+                template = template.replace(marker, placeholder)
+            self._templates[number] = template
+        return template
+
+    def _coords(self, start, count):
+        float64 = self._flags & FLAG_FLOAT64
+        itemsize = 8 if float64 else 4
+        offset = self._coords_offset + start * itemsize
+        values = array('d' if float64 else 'f', self._data[offset:offset + count * itemsize])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return list(values) if float64 else [short_float32(value) for value in values]
+
+    def _decode(self, offset):
+        name_id, flags, element_count, width, height = SHAPE.unpack_from(self._data, offset)
+        offset += SHAPE.size
+        shape = {
+            'name': self._string(name_id),
+            'width': int(width) if flags & SHAPE_INT_WIDTH else width,
+            'height': int(height) if flags & SHAPE_INT_HEIGHT else height,
+            'elements': [],
+        }
+        bounds = unit_transform = None
+        if flags & SHAPE_BOUNDS:
+            bounds = dict(zip(BOUNDS_KEYS, BOUNDS.unpack_from(self._data, offset)))
+            offset += BOUNDS.size
+        if flags & SHAPE_UNIT_TRANSFORM:
+            unit_transform = dict(zip(UNIT_TRANSFORM_KEYS, UNIT_TRANSFORM.unpack_from(self._data, offset)))
+            offset += UNIT_TRANSFORM.size
+        if flags & SHAPE_FRAGMENT:
+            offset += FRAGMENT.size
+        for _ in range(element_count):
+            type_id, style_id, template_id, start, count = ELEMENT.unpack_from(self._data, offset)
+            offset += ELEMENT.size
+            element = {'type': self._string(type_id)}
+            coords = self._coords(start, count)
+            if template_id == NO_STRING:
+                element.update(zip(RECT_KEYS, coords))
+            else:
+                element['d'] = fill_format_template(self._template(template_id), coords, None)
+            element.update(self._style(style_id))
+            shape['elements'].append(element)
+        if bounds is not None:
+            shape['bounds'] = bounds
+        if unit_transform is not None:
+            shape['unitTransform'] = unit_transform
+        return shape
+
+    def __getitem__(self, name):
+        shape = self._shapes.get(name)
+        if shape is None:
+            offset = self._find(name)
+            if offset is None:
+                raise KeyError(name)
+            shape = self._shapes[name] = self._decode(offset)
+        return shape
+
+    def __contains__(self, name):
+        return name in self._shapes or (isinstance(name, str) and self._find(name) is not None)
+
+    def __len__(self):
+        return self._shape_count
+
+    def __iter__(self):
+        """Iterate over the shape names in index order."""
+        for position in range(self._shape_count):
+            yield self._string(self._index_entry(position)[0])
+
+    def icon_fragment(self, name):
+        """Return the {'svg', 'defaultFill'} icon fragment of a shape, or None if it has none."""
+        offset = self._find(name)
+        if offset is None:
+            raise KeyError(name)
+        flags = SHAPE.unpack_from(self._data, offset)[1]
+        if not flags & SHAPE_FRAGMENT:
+            return None
+        offset += SHAPE.size
+        if flags & SHAPE_BOUNDS:
+            offset += BOUNDS.size
+        if flags & SHAPE_UNIT_TRANSFORM:
+            offset += UNIT_TRANSFORM.size
+        svg_id, default_fill_id = FRAGMENT.unpack_from(self._data, offset)
+        return {
+            'svg': self._string(svg_id),
+            'defaultFill': None if default_fill_id == NO_STRING else self._string(default_fill_id),
+        }
+
+    def shapes(self):
+        """Return all shapes in library order, i.e. the order of all-shapes.json."""
+        entries = sorted((self._index_entry(position) for position in range(self._shape_count)),
+                         key=lambda entry: entry[1])
+        return [self[self._string(name_id)] for name_id, _ in entries]
+
+
+def is_shape_pack(path):
+    """Return whether the file at path starts with the shape pack magic."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_shape_library(path):
+    """
+    Open a shape library: a ShapePack for a pack, otherwise the list of shape dicts of
+    an all-shapes.json file.
+    """
+    if is_shape_pack(path):
+        return ShapePack(path)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(
+        description='Convert between all-shapes.json and the binary shape pack'
+    )
+    parser.add_argument(
+        '--input', '-i',
+        default=os.path.join(script_dir, 'all-shapes.json'),
+        help='Shape definitions JSON file or shape pack (default: all-shapes.json next to this script)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(script_dir, 'all-shapes.pack'),
+        help='Output file; a pack is written for JSON input and JSON for a pack (default: all-shapes.pack next to this script)'
+    )
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.input):
+        print(f"Error: Input file '{args.input}' does not exist")
+        return
+
+    if is_shape_pack(args.input):
+        with ShapePack(args.input) as pack:
+            shapes = pack.shapes()
+        with open(args.output, 'w') as f:
+            json.dump(shapes, f, indent=2)
+        print(f"Unpacked {len(shapes)} shapes to '{args.output}' ({os.path.getsize(args.output)} bytes)")
+        return
+
+    with open(args.input, 'r') as f:
+        shapes = json.load(f)
+    try:
+        data = build_shape_pack(shapes)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    with open(args.output, 'wb') as f:
+        f.write(data)
+    print(f"Packed {len(shapes)} shapes to '{args.output}' ({len(data)} bytes, "
+          f"{os.path.getsize(args.input)} bytes as JSON)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory records for the shape definitions of all-shapes.json.
+
+In the JSON schema every shape is a dict with a list of element dicts, and path
+data are strings that have to be parsed again by every consumer. Shape and
+ShapeElement are __slots__ records instead:
+
+- the coordinates of all paths and rects of a shape are packed into a single
+  array('d') per shape (np.frombuffer(shape.coords) gives a zero-copy NumPy view),
+  and every element refers to its slice of it;
+- path commands and coordinate counts are kept per element as the PathData engine
+  tokenizes them, so paths are never parsed twice;
+- styles are tuples of (key, value) pairs in document order, interned so that all
+  elements with the same style share one tuple, as do equal command strings and
+  coordinate counts.
+
+The bounds and unit transform that convert.py computes are kept as tuples of
+floats. Shapes convert to and from the JSON schema. Paths are serialized the way
+convert.py writes them, so loading and dumping all-shapes.json reproduces it.
+
+poster.py and render_views.py load the records instead of the dicts with
+--shape-records. A shape reads like its dict, and the markup of its elements is
+formatted on its first rendering only, so rendering it again in another fill does
+not format its numbers again.
+"""
+
+import json
+from array import array
+
+from path_data import PathData, fill_format_template
+
+# Keys of an element dict that are stored as geometry rather than as style
+RECT_KEYS = ('x', 'y', 'width', 'height')
+GEOMETRY_KEYS = frozenset(('type', 'd') + RECT_KEYS)
+
+# Keys of the "bounds" and "unitTransform" entries of a shape
+BOUNDS_KEYS = ('x', 'y', 'width', 'height')
+UNIT_TRANSFORM_KEYS = ('scale', 'x', 'y', 'width', 'height')
+
+# Style attributes in the order poster.py writes them, with their SVG names
+PATH_ATTRIBUTES = (
+    ('stroke', 'stroke'), ('strokeWidth', 'stroke-width'), ('fill', 'fill'), ('fillRule', 'fill-rule'),
+    ('strokeLinecap', 'stroke-linecap'), ('strokeLinejoin', 'stroke-linejoin'),
+    ('strokeMiterlimit', 'stroke-miterlimit'),
+)
+RECT_ATTRIBUTES = (('stroke', 'stroke'), ('strokeWidth', 'stroke-width'), ('fill', 'fill'))
+
+_interned = {}
+_render_templates = {}
+_format_templates = {}
+
+
+def intern_value(value):
+    """Return the shared instance of a hashable value, e.g. a style tuple."""
+    try:
+        return _interned.setdefault(value, value)
+    except TypeError:  # Unhashable values (lists in hand-edited JSON) are kept as they are
+        return value
+
+
+def render_template(element_type, style):
+    """
+    Return (before_fill, has_fill, fill, after_fill) for an element type and style:
+    the attributes written before and after the fill, whether the style has a fill,
+    and its value. Templates are cached per interned style.
+    """
+    key = (element_type, style)
+    template = _render_templates.get(key)
+    if template is None:
+        values = dict(style)
+        attributes = PATH_ATTRIBUTES if element_type == 'path' else RECT_ATTRIBUTES
+        before, after = [], []
+        target = before
+        for name, svg_name in attributes:
+            if name == 'fill':
+                target = after
+            elif values.get(name) is not None:
+                target.append(f' {svg_name}="{values[name]}"')
+        template = (''.join(before), 'fill' in values, values.get('fill'), ''.join(after))
+        _render_templates[key] = template
+    return template
+
+
+class ShapeElement:
+    """
+    A path or rect of a shape. start and end delimit its coordinates in the coords
+    array of the shape: the path coordinates, or x, y, width and height of a rect.
+    """
+    __slots__ = ('type', 'commands', 'counts', 'start', 'end', 'style')
+
+    def __init__(self, type, start, end, style, commands=None, counts=None):
+        self.type = type
+        self.start = start
+        self.end = end
+        self.style = style
+        self.commands = commands
+        self.counts = counts
+
+    def get(self, key, default=None):
+        """Return a style value, like dict.get() on the element dict."""
+        for name, value in self.style:
+            if name == key:
+                return value
+        return default
+
+
+class Shape:
+    """
+    A shape with its elements and the packed coordinates of all of them. bounds and
+    unit_transform are tuples in the order of BOUNDS_KEYS and UNIT_TRANSFORM_KEYS, or
+    None for shapes converted before they were computed.
+    """
+    __slots__ = ('name', 'width', 'height', 'elements', 'coords', 'bounds', 'unit_transform', '_markup')
+
+    def __init__(self, name, width, height, elements=None, coords=None, bounds=None, unit_transform=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.elements = elements if elements is not None else []
+        self.coords = coords if coords is not None else array('d')
+        self.bounds = bounds
+        self.unit_transform = unit_transform
+        self._markup = None
+
+    def __getitem__(self, key):
+        """
+        Return an entry of the shape dict in the all-shapes.json schema, so the records
+        can be used where poster.py and render_views.py read the dicts.
+        """
+        if key in ('name', 'width', 'height'):
+            return getattr(self, key)
+        if key == 'bounds' and self.bounds is not None:
+            return dict(zip(BOUNDS_KEYS, self.bounds))
+        if key == 'unitTransform' and self.unit_transform is not None:
+            return dict(zip(UNIT_TRANSFORM_KEYS, self.unit_transform))
+        if key == 'elements':
+            return [self.element_dict(element) for element in self.elements]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        """Return an entry of the shape dict, like dict.get()."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a shape from its dict in the all-shapes.json schema."""
+        shape = cls(data['name'], data['width'], data['height'])
+        if 'bounds' in data:
+            shape.bounds = tuple(data['bounds'][key] for key in BOUNDS_KEYS)
+        if 'unitTransform' in data:
+            shape.unit_transform = tuple(data['unitTransform'][key] for key in UNIT_TRANSFORM_KEYS)
+        coords = []
+        for element in data['elements']:
+            style = intern_value(tuple(
+                (key, intern_value(value)) for key, value in element.items() if key not in GEOMETRY_KEYS
+            ))
+            element_type = intern_value(element['type'])
+            start = len(coords)
+            if element_type == 'rect':
+                coords.extend(float(element[key]) for key in RECT_KEYS)
+                shape.elements.append(ShapeElement(element_type, start, start + 4, style))
+                continue
+            path = PathData.parse(element.get('d'))
+            coords.extend(path.coords)
+            shape.elements.append(ShapeElement(
+                element_type, start, len(coords), style,
+                intern_value(''.join(path.commands)), intern_value(tuple(path.counts)),
+            ))
+        # Built in one go, so the array is not over-allocated
+        shape.coords = array('d', coords)
+        return shape
+
+    def path_data(self, element):
+        """Return the path of an element as a PathData instance."""
+        return PathData(list(element.commands), array('I', element.counts), self.coords[element.start:element.end])
+
+    def rect(self, element):
+        """Return (x, y, width, height) of a rect element."""
+        return tuple(self.coords[element.start:element.end])
+
+    def path_d(self, element, precision=None):
+        """
+        Return the path data string of an element. The format template is shared by all
+        paths with the same commands and counts.
+        """
+        key = (element.commands, element.counts, precision)
+        template = _format_templates.get(key)
+        if template is None:
+            template = self.path_data(element).format_template(precision)
+            _format_templates[key] = template
+        return fill_format_template(template, self.coords[element.start:element.end], precision)
+
+    def element_dict(self, element, precision=None):
+        """Return an element as a dict in the all-shapes.json schema."""
+        data = {'type': element.type}
+        if element.type == 'rect':
+            data.update(zip(RECT_KEYS, self.coords[element.start:element.end]))
+        else:
+            data['d'] = self.path_d(element, precision)
+        data.update(element.style)
+        return data
+
+    def to_dict(self, precision=None):
+        """
+        Return the shape as a dict in the all-shapes.json schema. Path numbers are
+        written with full precision by default, which reproduces the converter output.
+        """
+        data = {
+            'name': self.name,
+            'width': self.width,
+            'height': self.height,
+            'elements': [self.element_dict(element, precision) for element in self.elements],
+        }
+        if self.bounds is not None:
+            data['bounds'] = dict(zip(BOUNDS_KEYS, self.bounds))
+        if self.unit_transform is not None:
+            data['unitTransform'] = dict(zip(UNIT_TRANSFORM_KEYS, self.unit_transform))
+        return data
+
+    def markup(self):
+        """
+        Return the rendered elements as (head, has_fill, fill, tail) tuples: the markup
+        before and after the fill attribute, and the fill of the style. The numbers of a
+        shape are formatted once, on its first rendering; later renderings only fill in
+        the fill attributes.
+        """
+        if self._markup is None:
+            coords = self.coords
+            markup = []
+            for element in self.elements:
+                before, has_fill, fill, after = render_template(element.type, element.style)
+                if element.type == 'path':
+                    head = f'<path d="{self.path_d(element)}"{before}'
+                elif element.type == 'rect':
+                    x, y, width, height = coords[element.start:element.end]
+                    head = f'<rect x="{x}" y="{y}" width="{width}" height="{height}"{before}'
+                else:
+                    continue
+                markup.append((head, has_fill, fill, f'{after} />'))
+            self._markup = tuple(markup)
+        return self._markup
+
+    def render_elements(self, override_fill=None, missing_fill=None):
+        """
+        Render the elements like poster.render_shape_elements() does for the shape dict,
+        with the style attributes taken from per-style templates.
+        """
+        parts = []
+        for head, has_fill, fill, tail in self.markup():
+            if has_fill:
+                if fill != 'none' and override_fill is not None:
+                    fill = override_fill
+            else:
+                fill = missing_fill
+            parts.append(head)
+            if fill is not None:
+                parts.append(f' fill="{fill}"')
+            parts.append(tail)
+        return ''.join(parts)
+
+
+def load_shapes(path):
+    """Load all-shapes.json as a list of Shape records."""
+    with open(path, 'r') as f:
+        return [Shape.from_dict(data) for data in json.load(f)]
+
+
+def dump_shapes(shapes, out):
+    """Write Shape records to a text file object in the layout of convert.py."""
+    json.dump([shape.to_dict() for shape in shapes], out, indent=2)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Generate theme-data.ts and a stylesheet per theme from themes.json.
+
+Views rendered with layer classes (the layerFills option of ArchiMateRenderer, or
+--layer-fills of render_views.py) draw the shapes of every layer in currentColor, and
+the stylesheet of a theme sets the color of each layer class (see theme.py). Pages
+that embed views rendered with external layer fills link one of the generated
+stylesheets and switch themes by linking another one.
+
+theme-data.ts exports the same themes, so they can be passed as the colors option of
+ArchiMateRenderer.
+
+Usage:
+    python theme-gen.py [--themes themes.json] [--output ../theme-data.ts] [--css-dir themes]
+"""
+
+import argparse
+import importlib.util
+import os
+
+from theme import DEFAULT_THEME, THEMES_PATH, load_themes, theme_stylesheet
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FILE_HEADER = """/**
+ * Theme Data
+ *
+ * This file exports the named layer color themes. A theme can be passed as the colors
+ * option of ArchiMateRenderer, and generateThemeStylesheet() in theme.ts turns it into
+ * the stylesheet of views rendered with layer classes.
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/theme-gen.py to regenerate this file
+ */
+"""
+
+CSS_HEADER = """/*
+ * ArchiMate layer theme: {name}
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/theme-gen.py to regenerate this file
+ */
+"""
+
+
+def load_ts_file_gen():
+    """Import ts-file-gen.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location('ts_file_gen', os.path.join(SCRIPT_DIR, 'ts-file-gen.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_theme_data(out, themes, ts_key, ts_string):
+    """Write the theme-data.ts module."""
+    out.write(FILE_HEADER)
+    out.write(f'\nexport const DEFAULT_THEME = {ts_string(DEFAULT_THEME)};\n')
+    out.write('\n// Colors keyed by layer, plus the background, stroke and text colors\n')
+    out.write('export const themeData: Record<string, Record<string, string>> = {\n')
+    for name, colors in themes.items():
+        out.write(f'  {ts_key(name)}: {{\n')
+        for key, color in colors.items():
+            out.write(f'    {ts_key(key)}: {ts_string(color)},\n')
+        out.write('  },\n')
+    out.write('};\n')
+
+
+def write_theme_css(out, name, colors, defaults):
+    """Write the stylesheet of a theme."""
+    out.write(CSS_HEADER.format(name=name))
+    out.write('\n' + theme_stylesheet(colors, defaults) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate theme-data.ts and a stylesheet per theme from themes.json'
+    )
+    parser.add_argument(
+        '--themes', '-t',
+        default=THEMES_PATH,
+        help='Named themes (default: themes.json next to this script)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(SCRIPT_DIR, '..', 'theme-data.ts'),
+        help='Output TypeScript file (default: src/utils/theme-data.ts)'
+    )
+    parser.add_argument(
+        '--css-dir', '-c',
+        default=os.path.join(SCRIPT_DIR, 'themes'),
+        help='Output directory for the stylesheets (default: themes next to this script)'
+    )
+    args = parser.parse_args()
+
+    themes = load_themes(args.themes)
+    if DEFAULT_THEME not in themes:
+        print(f"Error: '{args.themes}' has no '{DEFAULT_THEME}' theme")
+        return
+    defaults = themes[DEFAULT_THEME]
+
+    ts_file_gen = load_ts_file_gen()
+    changed, size = ts_file_gen.write_if_changed(
+        args.output, lambda out: write_theme_data(out, themes, ts_file_gen.ts_key, ts_file_gen.ts_string)
+    )
+    state = 'Generated' if changed else 'Unchanged'
+    print(f"{state} {os.path.basename(args.output)} with {len(themes)} themes ({size} bytes)")
+
+    os.makedirs(args.css_dir, exist_ok=True)
+    for name, colors in themes.items():
+        path = os.path.join(args.css_dir, f'{name}.css')
+        changed, size = ts_file_gen.write_if_changed(
+            path, lambda out: write_theme_css(out, name, colors, defaults)
+        )
+        state = 'Generated' if changed else 'Unchanged'
+        print(f"{state} {os.path.basename(path)} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
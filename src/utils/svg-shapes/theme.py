@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Layer themes: the colors that elements are filled with by layer.
+
+With inline layer fills, every element shape carries the fill color of its layer, and
+icons are rendered once per icon and color. With layer classes, shapes are filled with
+currentColor and the group of every element gets the class of its layer; a stylesheet
+sets the color of each class. A view then carries every color once, the icon fragments
+are the same in every layer, and a page switches themes by swapping the stylesheet
+instead of rendering the view again.
+
+themes.json holds the named themes in the form of the colors option of
+ArchiMateRenderer. theme-gen.py writes them to theme-data.ts and writes a stylesheet
+per theme; theme.ts builds the same stylesheet in TypeScript. It is the only place
+layer colors are defined: the stencil fills of convert.py (the stencil theme), the
+poster (the archimate theme) and the theme presets of confluence-embed.ts all take
+their colors from it.
+"""
+
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+THEMES_PATH = os.path.join(SCRIPT_DIR, 'themes.json')
+DEFAULT_THEME = 'default'
+
+# Layers picked by the first name found in the element type, as in ArchiMateRenderer.renderView()
+LAYERS = ['business', 'application', 'technology', 'motivation', 'implementation', 'strategy', 'physical']
+# Elements of no layer, such as junctions and groupings, take the background color
+OTHER_LAYER = 'other'
+
+# Layer of layer-mapping.json of Grouping and Location. Themes can color it apart from
+# the background with a 'composite' color, which only the stencils and the poster use
+COMPOSITE_LAYER = 'Composite'
+
+LAYER_CLASS_PREFIX = 'archimate-layer-'
+# Fill of the shapes drawn with layer classes, set by the color of the class
+LAYER_FILL = 'currentColor'
+
+# How layer colors are applied: baked into the shapes, by classes with the theme
+# stylesheet embedded in the document, or by classes styled by the embedding page
+LAYER_FILLS = ('inline', 'classes', 'external')
+
+
+def load_themes(path=THEMES_PATH):
+    """Return the themes of a themes.json file by name."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def theme_colors(name, path=THEMES_PATH):
+    """
+    Return the colors of a named theme, with the colors it leaves out taken from the
+    default theme. Raises ValueError for unknown themes.
+    """
+    themes = load_themes(path)
+    if name not in themes:
+        raise ValueError(f"Unknown theme: {name}")
+    return {**themes[DEFAULT_THEME], **themes[name]}
+
+
+def element_layer(element_type):
+    """Return the layer of an element type, or OTHER_LAYER."""
+    for layer in LAYERS:
+        if layer.capitalize() in element_type:
+            return layer
+    return OTHER_LAYER
+
+
+def layer_class(layer):
+    """Return the CSS class of a layer."""
+    return LAYER_CLASS_PREFIX + layer
+
+
+def layer_color(colors, layer, defaults):
+    """Return the fill color of a layer in a theme, falling back to the default theme."""
+    key = 'background' if layer == OTHER_LAYER else layer
+    return colors.get(key) or defaults[key]
+
+
+def mapping_layer_color(colors, layer):
+    """
+    Return the fill color of a layer of layer-mapping.json, such as "Business" or
+    "Composite", in a theme merged with theme_colors().
+    """
+    if layer == COMPOSITE_LAYER and colors.get('composite'):
+        return colors['composite']
+    return layer_color(colors, element_layer(layer), colors)
+
+
+def theme_stylesheet(colors, defaults):
+    """Return the stylesheet that sets the color of every layer class, one rule per line."""
+    return '\n'.join(
+        f'.{layer_class(layer)} {{ color: {layer_color(colors, layer, defaults)}; }}'
+        for layer in LAYERS + [OTHER_LAYER]
+    )
@@ -3,89 +3,102 @@
 Generate shape-data.ts file from JSON data files.
 
 This script reads the all-shapes.json and element-mapping.json files,
-and generates a complete shape-data.ts file with all shape definitions
-and mappings for ArchiMate elements.
+and generates a shape-data.ts file with all shape definitions, and an
+element-mapping.ts file with the shape interfaces and the mappings for
+ArchiMate elements. shape-data.ts re-exports element-mapping.ts; the icon
+renderer only imports the latter, so entry points that load shapes on demand
+never parse the stencil geometry.
+
+Every icon is also pre-serialized into a compact SVG fragment in which each
+overridable fill is replaced by a placeholder, so the renderer only has to
+substitute the fill color instead of building the markup element by element.
+
+With --split, one module per shape is generated as well, together with a small
+index of dynamic import loaders, so bundlers can split the stencils into chunks
+that are only loaded for the element types a view actually uses. With --pack, the
+shapes and their icon fragments are also written as a binary shape pack (see
+shape_pack.py) that the renderer can decode lazily from an ArrayBuffer.
+
+The TypeScript literals are written straight to the output in a single streaming
+pass. The output is hashed while it is written and the existing shape-data.ts is
+only replaced when its content changes, so identical regenerations do not trigger
+watch-mode rebuilds.
 """
 
+import argparse
+import gzip
+import hashlib
 import json
 import os
 import re
 
-def camel_to_space_case(camel_case):
-    """Convert camelCase or PascalCase to 'Space Case'."""
-    # Add space before capital letters and then capitalize the first letter
-    s = re.sub(r'([a-z])([A-Z])', r'\1 \2', camel_case)
-    # Handle consecutive capital letters (like 'ID' in 'UserID')
-    s = re.sub(r'([A-Z])([A-Z][a-z])', r'\1 \2', s)
-    return s
+from metrics import NULL_METRICS, create_metrics, profiled
+from shape_pack import build_shape_pack
 
-def json_with_single_quotes(obj):
-    """Convert JSON to string with single quotes instead of double quotes and add trailing commas."""
-    # Convert object to JSON string with double quotes
-    json_str = json.dumps(obj, indent=2)
-    
-    # Replace double quotes with single quotes, but be careful with escape sequences
-    # This converts "key": "value" to 'key': 'value'
-    # First, replace escaped double quotes with a temporary marker
-    temp_marker = "%%TEMP_ESCAPED_QUOTE%%"
-    json_str = json_str.replace('\\"', temp_marker)
-    # Now replace unescaped double quotes with single quotes
-    json_str = json_str.replace('"', "'")
-    # Finally, restore the escaped quotes (now as escaped single quotes)
-    json_str = json_str.replace(temp_marker, "\\'")
-    
-    # Add trailing commas for arrays and objects for ESLint compliance
-    # For objects: replace "}" with ",}" if preceded by a value or closing bracket
-    json_str = re.sub(r'(\w|\'|\]|\})(\s*\})', r'\1,\2', json_str)
-    # For arrays: replace "]" with ",]" if preceded by a value or closing brace
-    json_str = re.sub(r'(\w|\'|\}|\])(\s*\])', r'\1,\2', json_str)
-    
-    return json_str
+IDENTIFIER_RE = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
 
-def main():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Load the shape definitions
-    with open(os.path.join(script_dir, 'all-shapes.json'), 'r') as f:
-        all_shapes = json.load(f)
-    
-    # Load the element mappings
-    with open(os.path.join(script_dir, 'element-mapping.json'), 'r') as f:
-        element_mappings = json.load(f)
-    
-    # Create a mapping from ArchiMateElementType to element name
-    # This is based on the types.ts file
-    element_type_to_name_map = {}
-    
-    # Read the types.ts file to extract ArchiMateElementType enum values
-    types_path = os.path.join(script_dir, '..', '..', 'types.ts')
-    with open(types_path, 'r') as f:
-        types_content = f.read()
-    
-    # Extract enum values using regex
-    enum_pattern = r'export enum ArchiMateElementType \{([\s\S]*?)\}'
-    enum_match = re.search(enum_pattern, types_content)
-    
-    if enum_match:
-        enum_content = enum_match.group(1)
-        # Extract each enum entry
-        enum_entries = re.findall(r'(\w+)\s*=\s*[\'"](\w+)[\'"]', enum_content)
-        
-        # Create the mapping
-        for enum_name, enum_value in enum_entries:
-            # Convert enum name to space-separated words (e.g., BusinessActor -> Business Actor)
-            element_name = camel_to_space_case(enum_name)
-            element_type_to_name_map[enum_value] = element_name
-    
-    # Generate the TypeScript file content
-    ts_content = """/**
+# Characters that need escaping inside a single-quoted TypeScript string
+STRING_ESCAPES = {
+    '\\': '\\\\',
+    "'": "\\'",
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029',
+}
+
+# Characters that need escaping inside a double-quoted XML attribute
+XML_ATTRIBUTE_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Substituted with the fill color when an icon fragment is rendered
+ICON_FILL_PLACEHOLDER = '{{fill}}'
+
+# SVG attributes written by the icon renderer, in the order it writes them
+PATH_ATTRIBUTES = [
+    ('d', 'd'),
+    ('stroke', 'stroke'),
+    ('strokeWidth', 'stroke-width'),
+    ('strokeLinecap', 'stroke-linecap'),
+    ('strokeLinejoin', 'stroke-linejoin'),
+    ('strokeMiterlimit', 'stroke-miterlimit'),
+]
+RECT_ATTRIBUTES = [
+    ('x', 'x'),
+    ('y', 'y'),
+    ('width', 'width'),
+    ('height', 'height'),
+    ('stroke', 'stroke'),
+    ('strokeWidth', 'stroke-width'),
+]
+RECT_GEOMETRY = ('x', 'y', 'width', 'height')
+
+FILE_HEADER = """/**
  * Shape Data
- * 
- * This file exports the shape definitions and element mappings as TypeScript objects.
+ *
+ * This file exports the shape definitions and their icon fragments as TypeScript objects.
  * This approach is more compatible with various build systems than importing JSON directly.
- * 
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py to regenerate this file
+ */
+
+import type { IIconFragment, IShapeDefinition } from './element-mapping';
+
+// The interfaces and element mappings are kept apart, so that code which loads the
+// shapes on demand does not have to import this module
+export * from './element-mapping';
+"""
+
+MAPPING_HEADER = """/**
+ * Element Mapping
+ *
+ * This file exports the shape interfaces and the mapping of ArchiMate element types to
+ * their base shapes and icons. It holds no stencil geometry, so the icon renderer can
+ * import it without pulling in shape-data.ts.
+ *
  * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
- * Use generate_shape_data.py to regenerate this file
+ * Use src/utils/svg-shapes/ts-file-gen.py to regenerate this file
  */
 
 import { ArchiMateElementType } from '../types';
@@ -108,11 +121,32 @@ export interface ISvgElement {
   [key: string]: unknown; // Additional properties depend on the element type
 }
 
+// Geometric bounding box of the elements of a shape
+export interface IShapeBounds {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+// Transform that moves the bounds of a shape to the origin and scales their longer side
+// to 1 (x' = scale * x + this.x, y' = scale * y + this.y); width and height are the size
+// of the transformed bounds
+export interface IUnitTransform {
+  scale: number;
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
 export interface IShapeDefinition {
   name: string;
   width: number;
   height: number;
   elements: ISvgElement[];
+  bounds?: IShapeBounds;
+  unitTransform?: IUnitTransform;
 }
 
 export interface IElementMapping {
@@ -121,38 +155,448 @@ export interface IElementMapping {
   base: string;
 }
 
-// All shape definitions
-export const allShapesData: IShapeDefinition[] = """
-    
-    # Add the shape definitions as JSON with single quotes
-    ts_content += json_with_single_quotes(all_shapes)
-    
-    # Add the element mappings
-    ts_content += """;
-
-// Element mappings
-export const elementMappingData: IElementMapping[] = """
-    
-    ts_content += json_with_single_quotes(element_mappings)
-    
-    # Add the element type to name mapping
-    ts_content += """;
-
-// Create a mapping from ArchiMateElementType to element name
-export const elementTypeToNameMap: Record<string, string> = {
+export interface IIconFragment {
+  svg: string; // Serialized <g> element with ICON_FILL_PLACEHOLDER for every overridable fill
+  defaultFill: string | null; // Fill used without an override, null if the elements differ
+}
 """
-    
-    # Add each mapping entry with single quotes
+
+MODULE_HEADER = """/**
+ * Shape Module: {title}
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/ts-file-gen.py --split to regenerate this file
+ */
+"""
+
+# Marker used to recognize generated modules before removing stale ones
+GENERATED_MARKER = 'THIS FILE IS GENERATED AUTOMATICALLY'
+
+def camel_to_space_case(camel_case):
+    """Convert camelCase or PascalCase to 'Space Case'."""
+    # Add space before capital letters and then capitalize the first letter
+    s = re.sub(r'([a-z])([A-Z])', r'\1 \2', camel_case)
+    # Handle consecutive capital letters (like 'ID' in 'UserID')
+    s = re.sub(r'([A-Z])([A-Z][a-z])', r'\1 \2', s)
+    return s
+
+def ts_string(value):
+    """Return a single-quoted TypeScript string literal."""
+    escaped = []
+    for char in value:
+        if char in STRING_ESCAPES:
+            escaped.append(STRING_ESCAPES[char])
+        elif char < ' ':
+            escaped.append(f'\\x{ord(char):02x}')
+        else:
+            escaped.append(char)
+    return "'" + ''.join(escaped) + "'"
+
+def ts_key(key):
+    """Return an object key, quoted only when it is not a valid identifier."""
+    return key if IDENTIFIER_RE.match(key) else ts_string(key)
+
+def ts_scalar(value):
+    """Return the TypeScript literal for a string, number, boolean or null."""
+    if isinstance(value, str):
+        return ts_string(value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, (int, float)):
+        return json.dumps(value)
+    raise TypeError(f"Cannot write {type(value).__name__} as a TypeScript literal")
+
+def write_ts_literal(out, value, indent=0):
+    """
+    Write a value as a TypeScript literal with single-quoted strings, unquoted keys
+    and trailing commas in multi-line objects and arrays.
+    """
+    if isinstance(value, dict):
+        if not value:
+            out.write('{}')
+            return
+        inner = '  ' * (indent + 1)
+        out.write('{\n')
+        for key, item in value.items():
+            out.write(f'{inner}{ts_key(key)}: ')
+            write_ts_literal(out, item, indent + 1)
+            out.write(',\n')
+        out.write('  ' * indent + '}')
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            out.write('[]')
+            return
+        inner = '  ' * (indent + 1)
+        out.write('[\n')
+        for item in value:
+            out.write(inner)
+            write_ts_literal(out, item, indent + 1)
+            out.write(',\n')
+        out.write('  ' * indent + ']')
+    else:
+        out.write(ts_scalar(value))
+
+def svg_attribute_value(value):
+    """Return an attribute value the way a JavaScript template literal renders it."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).translate(XML_ATTRIBUTE_ESCAPES)
+
+def svg_attributes(element, attributes, keep_falsy=()):
+    """
+    Serialize the attributes of an element that the icon renderer would write.
+    Like the renderer, falsy values are skipped unless their key is in keep_falsy.
+    """
+    parts = []
+    for key, name in attributes:
+        value = element.get(key)
+        if value or (value is not None and key in keep_falsy):
+            parts.append(f' {name}="{svg_attribute_value(value)}"')
+    return ''.join(parts)
+
+def icon_fragment(shape):
+    """
+    Pre-serialize the elements of a shape into an SVG fragment.
+    Returns None if the shape contains an element the renderer does not support.
+    """
+    markup = []
+    default_fills = set()
+    for element in shape['elements']:
+        if element['type'] == 'path':
+            fill = ''
+            if 'fill' in element:
+                if element['fill'] == 'none':
+                    fill = ' fill="none"'
+                else:
+                    fill = f' fill="{ICON_FILL_PLACEHOLDER}"'
+                    default_fills.add(element['fill'])
+            fill_rule = f' fill-rule="{svg_attribute_value(element["fillRule"])}"' if element.get('fillRule') else ''
+            markup.append(f'<path{svg_attributes(element, PATH_ATTRIBUTES)}{fill}{fill_rule}/>')
+        elif element['type'] == 'rect':
+            if element.get('fill') == 'none':
+                fill = 'none'
+            else:
+                fill = ICON_FILL_PLACEHOLDER
+                default_fills.add(element.get('fill') or '#FFFFFF')
+            markup.append(f'<rect{svg_attributes(element, RECT_ATTRIBUTES, RECT_GEOMETRY)} fill="{fill}"/>')
+        else:
+            return None
+
+    default_fill = None
+    if len(default_fills) <= 1:
+        default_fill = svg_attribute_value(next(iter(default_fills), ''))
+    return {
+        'svg': '<g>' + ''.join(markup) + '</g>',
+        'defaultFill': default_fill,
+    }
+
+class HashingWriter:
+    """File-like writer that hashes everything written to the underlying file."""
+
+    def __init__(self, file):
+        self.file = file
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, text):
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        self.digest.update(data)
+        self.size += len(data)
+        self.file.write(data)
+
+    def tell(self):
+        """Return the number of bytes written so far."""
+        return self.size
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+def write_if_changed(path, write_content):
+    """
+    Stream content produced by write_content(out) to a temporary file and move it over
+    path only if the content hash differs from the existing file.
+    Returns (changed, size_in_bytes).
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            out = HashingWriter(f)
+            write_content(out)
+        if out.digest.hexdigest() == file_digest(path):
+            return False, out.size
+        os.replace(tmp_path, path)
+        return True, out.size
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_element_type_names(types_path):
+    """
+    Create a mapping from ArchiMateElementType values to element names
+    by reading the ArchiMateElementType enum from types.ts.
+    """
+    element_type_to_name_map = {}
+    with open(types_path, 'r') as f:
+        types_content = f.read()
+
+    # Extract enum values using regex
+    enum_pattern = r'export enum ArchiMateElementType \{([\s\S]*?)\}'
+    enum_match = re.search(enum_pattern, types_content)
+
+    if enum_match:
+        enum_content = enum_match.group(1)
+        # Extract each enum entry
+        enum_entries = re.findall(r'(\w+)\s*=\s*[\'"](\w+)[\'"]', enum_content)
+
+        # Create the mapping
+        for enum_name, enum_value in enum_entries:
+            # Convert enum name to space-separated words (e.g., BusinessActor -> Business Actor)
+            element_name = camel_to_space_case(enum_name)
+            element_type_to_name_map[enum_value] = element_name
+    return element_type_to_name_map
+
+def write_element_mapping(out, element_mappings, element_type_to_name_map):
+    """Write the element-mapping.ts module with the interfaces and element mappings."""
+    out.write(MAPPING_HEADER)
+
+    # Element mappings
+    out.write('\n// Element mappings\nexport const elementMappingData: IElementMapping[] = ')
+    write_ts_literal(out, element_mappings)
+
+    # Element type to name mapping
+    out.write(';\n\n// Create a mapping from ArchiMateElementType to element name\n')
+    out.write('export const elementTypeToNameMap: Record<string, string> = {\n')
     for enum_value, element_name in element_type_to_name_map.items():
-        ts_content += f"  [ArchiMateElementType.{enum_value}]: '{element_name}',\n"
-    
-    ts_content += '};\n'
-    
-    # Write the TypeScript file
-    with open(os.path.join(script_dir, '../shape-data.ts'), 'w') as f:
-        f.write(ts_content)
-    
-    print(f"Generated shape-data.ts with {len(all_shapes)} shapes and {len(element_mappings)} element mappings")
+        out.write(f'  [ArchiMateElementType.{enum_value}]: {ts_string(element_name)},\n')
+    out.write('};\n')
+
+    out.write('\n// Placeholder substituted with the fill color when an icon fragment is rendered\n')
+    out.write(f'export const ICON_FILL_PLACEHOLDER = {ts_string(ICON_FILL_PLACEHOLDER)};\n')
+
+def write_shape_data(out, all_shapes, metrics=NULL_METRICS):
+    """
+    Write the shape-data.ts module. The time spent serializing every shape and its icon
+    fragment, and the bytes written for it, are recorded in metrics.
+    """
+    out.write(FILE_HEADER)
+
+    # All shape definitions, written one by one so every shape can be measured. The
+    # icon fragments are built along the way and written at the end of the module.
+    out.write('\n// All shape definitions\nexport const allShapesData: IShapeDefinition[] = ')
+    out.write('[\n' if all_shapes else '[]')
+    fragments = {}
+    for shape in all_shapes:
+        item = metrics.item(shape['name'])
+        start = out.tell()
+        with item.stage('serialize'):
+            out.write('  ')
+            write_ts_literal(out, shape, 1)
+            out.write(',\n')
+        with item.stage('fragment'):
+            fragment = icon_fragment(shape)
+        if fragment is not None:
+            fragments[shape['name']] = fragment
+        item.count('elements', len(shape['elements']))
+        item.count('output_bytes', out.tell() - start)
+        metrics.add_item(item)
+    if all_shapes:
+        out.write(']')
+
+    # Pre-serialized icon fragments
+    out.write(';\n\n// Pre-serialized SVG fragments for every icon shape\n')
+    out.write('export const iconFragmentData: Record<string, IIconFragment> = ')
+    start = out.tell()
+    with metrics.stage('fragments'):
+        write_ts_literal(out, fragments)
+    metrics.count('fragment_bytes', out.tell() - start)
+    out.write(';\n')
+
+def write_shape_module(out, shape):
+    """Write the module of a single shape with its shape definition and icon fragment."""
+    out.write(MODULE_HEADER.format(title=shape['name']))
+    out.write("\nimport type { IIconFragment, IShapeDefinition } from '../element-mapping';\n")
+    out.write('\nexport const shape: IShapeDefinition = ')
+    write_ts_literal(out, shape)
+    out.write(';\n\nexport const iconFragment: IIconFragment | null = ')
+    write_ts_literal(out, icon_fragment(shape))
+    out.write(';\n')
+
+def write_shape_module_index(out, shape_names):
+    """Write the index module that maps every shape name to a dynamic import of its module."""
+    out.write(MODULE_HEADER.format(title='index'))
+    out.write("\nimport type { IIconFragment, IShapeDefinition } from '../element-mapping';\n")
+    out.write('\nexport interface IShapeModule {\n')
+    out.write('  shape: IShapeDefinition;\n')
+    out.write('  iconFragment: IIconFragment | null;\n')
+    out.write('}\n')
+    out.write('\n// Loaders for the shape modules, keyed by shape name\n')
+    out.write('export const shapeModuleLoaders: Record<string, () => Promise<IShapeModule>> = {\n')
+    for name in shape_names:
+        out.write(f"  {ts_key(name)}: () => import({ts_string('./' + name)}),\n")
+    out.write('};\n')
+
+def write_shape_modules(modules_dir, all_shapes, metrics=NULL_METRICS):
+    """
+    Write one module per shape and the loader index to modules_dir, and remove the
+    generated modules of shapes that no longer exist. Every module is added to metrics
+    as an item.
+    Returns a list of (file_name, size, gzip_size, changed) tuples.
+    """
+    os.makedirs(modules_dir, exist_ok=True)
+    chunks = []
+
+    def write_chunk(file_name, write_content):
+        path = os.path.join(modules_dir, file_name)
+        item = metrics.item(f'shape-modules/{file_name}')
+        with item.stage('write'):
+            changed, size = write_if_changed(path, write_content)
+        with item.stage('compress'):
+            with open(path, 'rb') as f:
+                gzip_size = len(gzip.compress(f.read(), mtime=0))
+        item.count('module_bytes', size)
+        item.count('gzip_bytes', gzip_size)
+        metrics.add_item(item)
+        chunks.append((file_name, size, gzip_size, changed))
+
+    for shape in all_shapes:
+        write_chunk(f"{shape['name']}.ts", lambda out, shape=shape: write_shape_module(out, shape))
+    shape_names = [shape['name'] for shape in all_shapes]
+    write_chunk('index.ts', lambda out: write_shape_module_index(out, shape_names))
+
+    expected = {file_name for file_name, _, _, _ in chunks}
+    for file_name in sorted(os.listdir(modules_dir)):
+        path = os.path.join(modules_dir, file_name)
+        if file_name.endswith('.ts') and file_name not in expected:
+            with open(path, 'r') as f:
+                if GENERATED_MARKER in f.read(512):
+                    os.remove(path)
+                    print(f"Removed stale shape module {file_name}")
+    return chunks
+
+def write_shape_pack(path, all_shapes, metrics=NULL_METRICS):
+    """
+    Write the shapes and their icon fragments as a binary shape pack.
+    Returns (changed, size_in_bytes).
+    """
+    with metrics.stage('pack'):
+        fragments = {}
+        for shape in all_shapes:
+            fragment = icon_fragment(shape)
+            if fragment is not None:
+                fragments[shape['name']] = fragment
+        data = build_shape_pack(all_shapes, fragments)
+    return write_if_changed(path, lambda out: out.write(data))
+
+def print_chunk_sizes(chunks, monolithic_size):
+    """Report the size of every shape module, largest first."""
+    print(f"{'Module':<32} {'Bytes':>8} {'Gzip':>8}")
+    for file_name, size, gzip_size, changed in sorted(chunks, key=lambda chunk: -chunk[1]):
+        marker = ' (updated)' if changed else ''
+        print(f"{file_name:<32} {size:>8} {gzip_size:>8}{marker}")
+    total = sum(chunk[1] for chunk in chunks)
+    total_gzip = sum(chunk[2] for chunk in chunks)
+    print(f"{'Total':<32} {total:>8} {total_gzip:>8}")
+    print(f"{len(chunks) - 1} shape modules, largest {max(chunk[1] for chunk in chunks[:-1])} bytes, "
+          f"monolithic shape-data.ts {monolithic_size} bytes")
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(
+        description='Generate shape-data.ts from the JSON shape definitions'
+    )
+    parser.add_argument(
+        '--input', '-i',
+        default=os.path.join(script_dir, 'all-shapes.json'),
+        help='Shape definitions JSON file (default: all-shapes.json next to this script)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(script_dir, '..', 'shape-data.ts'),
+        help='Output TypeScript file (default: src/utils/shape-data.ts)'
+    )
+    parser.add_argument(
+        '--mapping-output',
+        default=os.path.join(script_dir, '..', 'element-mapping.ts'),
+        help='Output TypeScript file for the interfaces and element mappings (default: src/utils/element-mapping.ts)'
+    )
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help='Also generate one lazily loadable module per shape and report the chunk sizes'
+    )
+    parser.add_argument(
+        '--modules-dir',
+        default=os.path.join(script_dir, '..', 'shape-modules'),
+        help='Output directory for the shape modules (default: src/utils/shape-modules)'
+    )
+    parser.add_argument(
+        '--pack',
+        default=None,
+        help='Also write the shapes and icon fragments as a binary shape pack to this file (default: off)'
+    )
+    parser.add_argument(
+        '--metrics-out',
+        default=None,
+        help='Write wall/CPU time per stage and per shape, counts and output sizes to this JSON file (default: off)'
+    )
+    parser.add_argument(
+        '--profile',
+        default=None,
+        help='Write cProfile stats of the generation to this file (default: off)'
+    )
+    args = parser.parse_args()
+    metrics = create_metrics('ts-file-gen.py', args.metrics_out)
+
+    with metrics.stage('load'):
+        # Load the shape definitions
+        with open(args.input, 'r') as f:
+            all_shapes = json.load(f)
+
+        # Load the element mappings
+        with open(os.path.join(script_dir, 'element-mapping.json'), 'r') as f:
+            element_mappings = json.load(f)
+
+        # Read the ArchiMateElementType enum from the types.ts file
+        types_path = os.path.join(script_dir, '..', '..', 'types.ts')
+        element_type_to_name_map = load_element_type_names(types_path)
+
+    with profiled(args.profile):
+        write_if_changed(
+            args.mapping_output,
+            lambda out: write_element_mapping(out, element_mappings, element_type_to_name_map),
+        )
+        changed, size = write_if_changed(args.output, lambda out: write_shape_data(out, all_shapes, metrics))
+        chunks = write_shape_modules(args.modules_dir, all_shapes, metrics) if args.split else None
+        try:
+            pack = write_shape_pack(args.pack, all_shapes, metrics) if args.pack else None
+        except ValueError as e:
+            print(f"Error: Could not write the shape pack: {e}")
+            pack = None
+    metrics.count('shape_data_bytes', size)
+
+    if changed:
+        print(f"Generated shape-data.ts with {len(all_shapes)} shapes and {len(element_mappings)} element mappings ({size} bytes)")
+    else:
+        print(f"shape-data.ts is up to date ({len(all_shapes)} shapes, {len(element_mappings)} element mappings)")
+
+    if chunks is not None:
+        print_chunk_sizes(chunks, size)
+    if pack is not None:
+        metrics.count('pack_bytes', pack[1])
+        print(f"{'Generated' if pack[0] else 'Unchanged'} shape pack {args.pack} ({pack[1]} bytes)")
+    if args.metrics_out:
+        metrics.write(args.metrics_out)
 
 if __name__ == "__main__":
     main()
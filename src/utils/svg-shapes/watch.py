@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Watch the stencil sources and keep the generated files up to date.
+
+The source directory is polled for SVG files whose modification time or size
+changed. Only those files are converted again with process_svg_file and patched
+into the in-memory shape table, after which all-shapes.json, shape-data.ts, the
+per-shape modules (and optionally the shape pack and the poster) are regenerated from
+the table, so the TypeScript outputs never disagree. Changes are debounced, so an
+editor that writes a file in several steps triggers a single regeneration, and
+generated files are only replaced when their content changes.
+
+Usage:
+    python watch.py [--source source] [--pack all-shapes.pack] [--poster poster.svg]
+"""
+
+import argparse
+import os
+import time
+
+from convert import convert_files, process_svg_file
+from optimize import coalesce_style_runs
+from pipeline import (
+    SCRIPT_DIR,
+    ShapeModel,
+    write_poster,
+    write_shape_data,
+    write_shape_pack,
+    write_shapes_json,
+)
+
+
+def convert_shape(shape):
+    """Merge the same-style elements of a converted shape like convert.py does; None is passed through."""
+    if shape:
+        coalesce_style_runs(shape)
+    return shape
+
+
+def scan_sources(source_dir):
+    """Return a {file_name: (mtime_ns, size)} signature of the SVG files in source_dir."""
+    signatures = {}
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.svg') and entry.is_file():
+                stat = entry.stat()
+                signatures[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+class StencilWatcher:
+    """The converted shapes of a source directory and the files generated from them."""
+
+    def __init__(self, source_dir, output, ts_output, modules_dir, pack_output=None, poster_output=None,
+                 jobs=1, cache_dir=None):
+        self.source_dir = source_dir
+        self.output = output
+        self.ts_output = ts_output
+        self.modules_dir = modules_dir
+        self.pack_output = pack_output
+        self.poster_output = poster_output
+        self.jobs = jobs
+        self.cache_dir = cache_dir
+        self.signatures = {}
+        # Converted shape per source file name, None if the file could not be converted
+        self.shapes = {}
+
+    def load(self):
+        """Convert all source files and generate the outputs."""
+        self.signatures = scan_sources(self.source_dir)
+        files = sorted(self.signatures)
+        file_paths = [os.path.join(self.source_dir, file) for file in files]
+        results, _ = convert_files(file_paths, jobs=self.jobs, cache_dir=self.cache_dir)
+        self.shapes = {file: convert_shape(shape) for file, shape in zip(files, results)}
+        return self.regenerate()
+
+    def poll(self):
+        """Return the names of the source files added, modified or removed since the last poll."""
+        signatures = scan_sources(self.source_dir)
+        changed = {
+            file for file in signatures.keys() | self.signatures.keys()
+            if signatures.get(file) != self.signatures.get(file)
+        }
+        self.signatures = signatures
+        return changed
+
+    def update(self, files):
+        """Convert the given source files again, drop the removed ones and regenerate the outputs."""
+        for file in files:
+            file_path = os.path.join(self.source_dir, file)
+            if os.path.exists(file_path):
+                self.shapes[file] = convert_shape(process_svg_file(file_path))
+            else:
+                self.shapes.pop(file, None)
+        return self.regenerate()
+
+    def regenerate(self):
+        """
+        Write all-shapes.json, shape-data.ts, the shape modules, the shape pack and the
+        poster from the shape table. Returns the paths of the files whose content changed.
+        """
+        # Same order as convert.py, so both produce identical files. The mappings are
+        # small, so they are read again to pick up edits to them too.
+        model = ShapeModel.with_shapes([self.shapes[file] for file in sorted(self.shapes) if self.shapes[file]])
+        changed = []
+
+        if write_shapes_json(model, self.output)[0]:
+            changed.append(self.output)
+        ts_changed, _, chunks = write_shape_data(model, self.ts_output, self.modules_dir)
+        if ts_changed:
+            changed.append(self.ts_output)
+        changed.extend(
+            os.path.join(self.modules_dir, file_name) for file_name, _, _, chunk_changed in chunks if chunk_changed
+        )
+        if self.pack_output and write_shape_pack(model, self.pack_output)[0]:
+            changed.append(self.pack_output)
+        if self.poster_output:
+            changed.extend(path for path, _, _ in write_poster(model, self.poster_output))
+
+        return changed
+
+    def run(self, interval=0.1, debounce=0.2):
+        """
+        Poll every interval seconds and update the outputs once no further change was
+        seen for debounce seconds. Runs until interrupted.
+        """
+        pending = set()
+        last_change = 0.0
+        while True:
+            changed = self.poll()
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= debounce:
+                start = time.perf_counter()
+                outputs = self.update(pending)
+                elapsed = time.perf_counter() - start
+                names = ', '.join(sorted(pending))
+                written = ', '.join(os.path.basename(path) for path in outputs) or 'no output changed'
+                print(f"Updated {names} in {elapsed * 1000:.0f} ms ({written})", flush=True)
+                pending = set()
+            time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Watch the stencil SVGs and regenerate all-shapes.json, shape-data.ts and the shape modules on changes'
+    )
+    parser.add_argument(
+        '--source', '-s',
+        default=os.path.join(SCRIPT_DIR, 'source'),
+        help='Directory containing SVG files (default: source next to this script)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(SCRIPT_DIR, 'all-shapes.json'),
+        help='Output JSON file path (default: all-shapes.json next to this script)'
+    )
+    parser.add_argument(
+        '--ts-output',
+        default=os.path.join(SCRIPT_DIR, '..', 'shape-data.ts'),
+        help='Output TypeScript file (default: src/utils/shape-data.ts)'
+    )
+    parser.add_argument(
+        '--modules-dir',
+        default=os.path.join(SCRIPT_DIR, '..', 'shape-modules'),
+        help='Output directory for the per-shape modules (default: src/utils/shape-modules)'
+    )
+    parser.add_argument(
+        '--pack',
+        default=None,
+        help='Also regenerate the binary shape pack at this path (default: off)'
+    )
+    parser.add_argument(
+        '--poster',
+        default=None,
+        help='Also regenerate the poster at this path (default: off)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes for the initial conversion; 0 uses all CPU cores (default: 1)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the incremental conversion cache used at startup (default: no cache)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.1,
+        help='Seconds between two polls of the source directory (default: 0.1)'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.2,
+        help='Seconds without further changes before the outputs are regenerated (default: 0.2)'
+    )
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source):
+        print(f"Error: Source directory '{args.source}' does not exist")
+        return
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    watcher = StencilWatcher(
+        args.source, args.output, args.ts_output, args.modules_dir, args.pack, args.poster, jobs, args.cache_dir
+    )
+
+    start = time.perf_counter()
+    outputs = watcher.load()
+    converted = sum(1 for shape in watcher.shapes.values() if shape)
+    print(f"Converted {converted} shapes in {(time.perf_counter() - start) * 1000:.0f} ms"
+          f" ({', '.join(os.path.basename(path) for path in outputs) or 'outputs up to date'})")
+    print(f"Watching '{args.source}' for changes, press Ctrl+C to stop", flush=True)
+
+    try:
+        watcher.run(args.interval, args.debounce)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+
+
+if __name__ == "__main__":
+    main()
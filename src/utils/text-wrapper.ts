@@ -3,9 +3,14 @@
  * Text Wrapper Utility
  *
  * This module provides utilities for wrapping text in SVG elements
- * to fit within specified dimensions.
+ * to fit within specified dimensions. Text is measured with the advance widths and
+ * kerning pairs that src/utils/svg-shapes/font-metrics-gen.py generates into
+ * font-metrics.ts; fonts without metrics are measured with an estimated average
+ * character width.
  */
 
+import { fontMetricsData } from './font-metrics';
+
 /**
  * Escape special XML characters in a string
  * @param text Text to escape
@@ -79,6 +84,154 @@ function estimateCharWidth(fontSize: number): number {
   return fontSize * 0.6;
 }
 
+/**
+ * Measures text in one font at one size
+ */
+interface ITextMeasure {
+  /** Width of a line in pixels */
+  width(text: string): number;
+  /** Number of leading characters of a word that fit in maxWidth, at least 1 */
+  fittingLength(word: string, maxWidth: number): number;
+}
+
+/**
+ * Advance widths and kerning of a font from font-metrics.ts, as lookup tables
+ */
+interface IFontTable {
+  unitsPerEm: number;
+  missingAdvance: number;
+  advances: Map<number, number>;
+  kerning: Map<string, number>;
+  // Widths of words in font units, which do not depend on the font size
+  wordWidths: Map<string, number>;
+}
+
+// Words remembered per font before the cache is cleared
+const WORD_CACHE_LIMIT = 10000;
+
+// Font tables keyed by the font-family value they were resolved for; null if no
+// family of the value has metrics
+const fontTables = new Map<string, IFontTable | null>();
+
+/**
+ * Find the table of the first family in a CSS font-family list that has metrics
+ * @param fontFamily Font family list, e.g. "Arial, sans-serif"
+ * @returns The font table or null if no family has metrics
+ */
+function getFontTable(fontFamily: string): IFontTable | null {
+  let table = fontTables.get(fontFamily);
+  if (table !== undefined) {
+    return table;
+  }
+  table = null;
+  for (const family of fontFamily.split(',')) {
+    const metrics = fontMetricsData[family.trim().replace(/^["']|["']$/g, '').toLowerCase()];
+    if (metrics) {
+      const advances = new Map<number, number>();
+      for (const [first, ...widths] of metrics.advances) {
+        widths.forEach((width, index) => advances.set(first + index, width));
+      }
+      table = {
+        unitsPerEm: metrics.unitsPerEm,
+        missingAdvance: metrics.missingAdvance,
+        advances,
+        kerning: new Map(Object.entries(metrics.kerning)),
+        wordWidths: new Map(),
+      };
+      break;
+    }
+  }
+  fontTables.set(fontFamily, table);
+  return table;
+}
+
+/**
+ * Sum the advances and kerning of the characters of a word in font units
+ */
+function wordWidth(table: IFontTable, word: string): number {
+  let width = table.wordWidths.get(word);
+  if (width === undefined) {
+    width = 0;
+    let previous = '';
+    for (const char of word) {
+      width += table.advances.get(char.codePointAt(0)!) ?? table.missingAdvance;
+      if (previous) {
+        width += table.kerning.get(previous + char) ?? 0;
+      }
+      previous = char;
+    }
+    if (table.wordWidths.size >= WORD_CACHE_LIMIT) {
+      table.wordWidths.clear();
+    }
+    table.wordWidths.set(word, width);
+  }
+  return width;
+}
+
+/**
+ * Create the text measure for a font family and size. Families without generated
+ * metrics are measured with the estimated average character width.
+ * @param fontFamily Font family list
+ * @param fontSize Font size in pixels
+ * @returns The text measure
+ */
+function createTextMeasure(fontFamily: string, fontSize: number): ITextMeasure {
+  const table = getFontTable(fontFamily);
+  if (!table) {
+    const avgCharWidth = estimateCharWidth(fontSize);
+    return {
+      width: (text) => text.length * avgCharWidth,
+      fittingLength: (_word, maxWidth) => Math.max(1, Math.floor(maxWidth / avgCharWidth)),
+    };
+  }
+
+  const scale = fontSize / table.unitsPerEm;
+  const spaceWidth = table.advances.get(32) ?? table.missingAdvance;
+  return {
+    width: (text) => {
+      // Lines are measured word by word, so every word is only summed once
+      let width = 0;
+      let first = true;
+      for (const word of text.split(' ')) {
+        width += (first ? 0 : spaceWidth) + wordWidth(table, word);
+        first = false;
+      }
+      return width * scale;
+    },
+    fittingLength: (word, maxWidth) => {
+      const chars = Array.from(word);
+      let width = 0;
+      let length = 0;
+      for (let i = 0; i < chars.length; i++) {
+        width += table.advances.get(chars[i].codePointAt(0)!) ?? table.missingAdvance;
+        if (i > 0) {
+          width += table.kerning.get(chars[i - 1] + chars[i]) ?? 0;
+        }
+        if (width * scale > maxWidth) {
+          break;
+        }
+        length += chars[i].length;
+      }
+      return Math.max(chars[0]?.length ?? 1, length);
+    },
+  };
+}
+
+/**
+ * Measure the width of a single line of text
+ * @param text Text to measure
+ * @param fontSize Font size in pixels
+ * @param fontFamily Font family list, e.g. "Arial, sans-serif"
+ * @returns Width of the text in pixels
+ */
+export function measureTextWidth(
+  text: string,
+  fontSize: number = defaultOptions.fontSize!,
+  fontFamily: string = defaultOptions.fontFamily!,
+): number {
+  return createTextMeasure(fontFamily, fontSize).width(text);
+}
+
 /**
  * Wrap text to fit within specified width
  * @param text Text to wrap
@@ -89,6 +242,7 @@ function wrapText(text: string, options: ITextWrapOptions): string[] {
   const {
     maxWidth,
     fontSize = defaultOptions.fontSize,
+    fontFamily = defaultOptions.fontFamily,
     maxLines = defaultOptions.maxLines || 0,
   } = options;
 
@@ -97,8 +251,8 @@ function wrapText(text: string, options: ITextWrapOptions): string[] {
     return [];
   }
 
-  // Estimate characters per line based on font size and max width
-  const avgCharWidth = estimateCharWidth(fontSize!);
+  // Measure with the font metrics, or estimate if the font has none
+  const measure = createTextMeasure(fontFamily!, fontSize!);
 
   // Split text into words
   const words = text.split(/\s+/);
@@ -109,7 +263,7 @@ function wrapText(text: string, options: ITextWrapOptions): string[] {
   for (const word of words) {
     // Check if adding this word would exceed the line width
     const testLine = currentLine ? `${currentLine} ${word}` : word;
-    const testLineWidth = testLine.length * avgCharWidth;
+    const testLineWidth = measure.width(testLine);
 
     if (testLineWidth <= maxWidth) {
       // Word fits on current line
@@ -132,12 +286,12 @@ function wrapText(text: string, options: ITextWrapOptions): string[] {
 
       // Start new line with current word
       // If the word itself is too long for a line, split it
-      if (word.length * avgCharWidth > maxWidth) {
-        // Determine how many characters can fit on a line
-        const charsPerLine = Math.max(1, Math.floor(maxWidth / avgCharWidth));
+      if (measure.width(word) > maxWidth) {
         let remainingWord = word;
 
         while (remainingWord.length > 0) {
+          // Determine how many characters can fit on a line
+          const charsPerLine = measure.fittingLength(remainingWord, maxWidth);
           const chunk = remainingWord.substring(0, charsPerLine);
           lines.push(chunk);
           remainingWord = remainingWord.substring(charsPerLine);
@@ -293,8 +447,11 @@ export function calculateWrappedTextDimensions(
     ...options,
   };
 
-  const { fontSize = defaultOptions.fontSize, lineHeight = defaultOptions.lineHeight } =
-    mergedOptions;
+  const {
+    fontSize = defaultOptions.fontSize,
+    fontFamily = defaultOptions.fontFamily,
+    lineHeight = defaultOptions.lineHeight,
+  } = mergedOptions;
 
   // Wrap the text
   const lines = wrapText(text, mergedOptions);
@@ -311,8 +468,8 @@ export function calculateWrappedTextDimensions(
   const height = lines.length * lineHeightPx;
 
   // Calculate maximum line width
-  const avgCharWidth = estimateCharWidth(fontSize!);
-  const width = Math.max(...lines.map((line) => line.length * avgCharWidth));
+  const measure = createTextMeasure(fontFamily!, fontSize!);
+  const width = Math.max(...lines.map((line) => measure.width(line)));
 
   return { width, height };
 }
@@ -0,0 +1,78 @@
+/**
+ * Theme Data
+ *
+ * This file exports the named layer color themes. A theme can be passed as the colors
+ * option of ArchiMateRenderer, and generateThemeStylesheet() in theme.ts turns it into
+ * the stylesheet of views rendered with layer classes.
+ *
+ * THIS FILE IS GENERATED AUTOMATICALLY - DO NOT EDIT MANUALLY
+ * Use src/utils/svg-shapes/theme-gen.py to regenerate this file
+ */
+
+export const DEFAULT_THEME = 'default';
+
+// Colors keyed by layer, plus the background, stroke and text colors
+export const themeData: Record<string, Record<string, string>> = {
+  default: {
+    application: '#85C1E9',
+    business: '#F9E79F',
+    technology: '#ABEBC6',
+    motivation: '#D7BDE2',
+    implementation: '#F5CBA7',
+    strategy: '#F1948A',
+    physical: '#D5DBDB',
+    background: '#FFFFFF',
+    stroke: '#000000',
+    text: '#000000',
+  },
+  archimate: {
+    application: '#AEFFFF',
+    business: '#FFFFAE',
+    technology: '#AEFFAE',
+    motivation: '#CCCCFF',
+    implementation: '#FFDFDF',
+    strategy: '#F5DEAA',
+    physical: '#AEFFAE',
+    composite: '#EED1E3',
+    background: '#FFFFFF',
+    stroke: '#000000',
+    text: '#000000',
+  },
+  dark: {
+    application: '#61AFEF',
+    business: '#E5C07B',
+    technology: '#98C379',
+    motivation: '#C678DD',
+    implementation: '#E06C75',
+    strategy: '#D19A66',
+    physical: '#56B6C2',
+    background: '#282C34',
+    stroke: '#FFFFFF',
+    text: '#FFFFFF',
+  },
+  colorful: {
+    application: '#3498DB',
+    business: '#F1C40F',
+    technology: '#2ECC71',
+    motivation: '#9B59B6',
+    implementation: '#E67E22',
+    strategy: '#E74C3C',
+    physical: '#1ABC9C',
+    background: '#FFFFFF',
+    stroke: '#2C3E50',
+    text: '#2C3E50',
+  },
+  stencil: {
+    application: '#0000FF',
+    business: '#FFFF00',
+    technology: '#008000',
+    motivation: '#800080',
+    implementation: '#FFC0CB',
+    strategy: '#A52A2A',
+    physical: '#008000',
+    composite: '#808080',
+    background: '#FFFFFF',
+    stroke: '#000000',
+    text: '#000000',
+  },
+};
@@ -0,0 +1,83 @@
+/**
+ * Layer Themes
+ *
+ * This module assigns elements to layers and builds the stylesheet of a theme. With
+ * layer classes, element shapes are filled with currentColor and the group of every
+ * element gets the class of its layer, so the colors of a view are set once by the
+ * stylesheet and icon fragments are rendered once for all layers.
+ * theme.py in svg-shapes implements the same classes and stylesheet.
+ */
+
+import { DEFAULT_THEME, themeData } from './theme-data';
+
+/**
+ * How layer colors are applied:
+ * - inline: every shape carries the fill color of its layer
+ * - classes: shapes use layer classes and the theme stylesheet is embedded in the document
+ * - external: shapes use layer classes and the embedding page provides the stylesheet
+ */
+export type LayerFills = 'inline' | 'classes' | 'external';
+
+// Layers picked by the first name found in the element type
+export const LAYERS = [
+  'business',
+  'application',
+  'technology',
+  'motivation',
+  'implementation',
+  'strategy',
+  'physical',
+];
+
+// Elements of no layer, such as junctions and groupings, take the background color
+export const OTHER_LAYER = 'other';
+
+export const LAYER_CLASS_PREFIX = 'archimate-layer-';
+
+// Fill of the shapes drawn with layer classes, set by the color of the class
+export const LAYER_FILL = 'currentColor';
+
+/**
+ * Get the layer of an element type
+ * @param elementType The ArchiMate element type
+ * @returns The layer name, or OTHER_LAYER
+ */
+export function getElementLayer(elementType: string): string {
+  for (const layer of LAYERS) {
+    if (elementType.includes(layer.charAt(0).toUpperCase() + layer.slice(1))) {
+      return layer;
+    }
+  }
+  return OTHER_LAYER;
+}
+
+/**
+ * Get the CSS class of a layer
+ * @param layer The layer name
+ * @returns The class name
+ */
+export function getLayerClass(layer: string): string {
+  return LAYER_CLASS_PREFIX + layer;
+}
+
+/**
+ * Get the fill color of a layer
+ * @param colors The colors of the theme; missing colors are taken from the default theme
+ * @param layer The layer name
+ * @returns The fill color
+ */
+export function getLayerColor(colors: Record<string, string> | undefined, layer: string): string {
+  const key = layer === OTHER_LAYER ? 'background' : layer;
+  return colors?.[key] || themeData[DEFAULT_THEME][key];
+}
+
+/**
+ * Generate the stylesheet that sets the color of every layer class
+ * @param colors The colors of the theme, such as an entry of themeData
+ * @returns The stylesheet, one rule per line
+ */
+export function generateThemeStylesheet(colors?: Record<string, string>): string {
+  return [...LAYERS, OTHER_LAYER]
+    .map((layer) => `.${getLayerClass(layer)} { color: ${getLayerColor(colors, layer)}; }`)
+    .join('\n');
+}